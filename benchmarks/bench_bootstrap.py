@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark: dashboard cold load, individual fetches vs /api/bootstrap.
+
+Starts the dashboard server in-process on a free port, then simulates a
+cold page load the way a browser would (6 parallel connections, gzip,
+server caches cleared before every run):
+
+  before  /api/data, /api/wisdom, 3 planning files and the 10 masters
+          fetches fired by loadEnhancedMastersData
+  after   a single /api/bootstrap request
+
+Loopback numbers hide the cost of round trips, so each run is also
+reported with a simulated link (per-request RTT plus transfer time at a
+fixed bandwidth), applied client-side on top of the measured time.
+
+Usage:
+    python benchmarks/bench_bootstrap.py [runs] [rtt_ms] [mbps]
+"""
+import os
+import sys
+import time
+import threading
+import statistics
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import server  # noqa: E402
+
+BEFORE_URLS = (
+    ['/api/data', '/api/wisdom']
+    + ['/data/' + name for name in server._PLANNING_FILES]
+    + ['/knowledge_base/masters/' + f for f in server._DASHBOARD_MASTERS.values()]
+)
+AFTER_URLS = ['/api/bootstrap']
+
+
+def clear_server_caches():
+    server._json_cache.clear()
+    server._gzip_cache.clear()
+    server._default_tenant.reset_wisdom()
+
+
+def fetch(port, url, rtt_s=0.0, bytes_per_s=0.0):
+    conn = http.client.HTTPConnection('localhost', port)
+    conn.request('GET', url, headers={'Accept-Encoding': 'gzip'})
+    resp = conn.getresponse()
+    body = resp.read()
+    conn.close()
+    if rtt_s or bytes_per_s:
+        time.sleep(rtt_s + (len(body) / bytes_per_s if bytes_per_s else 0))
+    return len(body)
+
+
+def cold_load(port, urls, rtt_s=0.0, bytes_per_s=0.0):
+    clear_server_caches()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        sizes = list(pool.map(lambda u: fetch(port, u, rtt_s, bytes_per_s), urls))
+    return (time.perf_counter() - start) * 1000, sum(sizes)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rtt_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 40.0
+    mbps = float(sys.argv[3]) if len(sys.argv) > 3 else 20.0
+    links = (
+        ('loopback', 0.0, 0.0),
+        (f'{rtt_ms:g}ms/{mbps:g}Mbps', rtt_ms / 1000, mbps * 1_000_000 / 8),
+    )
+    os.chdir(server.BASE_PATH)
+    httpd = ThreadingHTTPServer(('localhost', 0), server.DashboardHandler)
+    port = httpd.server_address[1]
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    try:
+        cold_load(port, BEFORE_URLS + AFTER_URLS)  # warm up imports / sockets
+        for link, rtt_s, bytes_per_s in links:
+            print(f"[{link}]")
+            for label, urls in (('before', BEFORE_URLS), ('after', AFTER_URLS)):
+                timings = []
+                for _ in range(runs):
+                    ms, nbytes = cold_load(port, urls, rtt_s, bytes_per_s)
+                    timings.append(ms)
+                print(f"  {label:>6}: {len(urls):2d} requests  "
+                      f"median {statistics.median(timings):7.1f} ms  "
+                      f"p90 {sorted(timings)[max(int(runs * 0.9) - 1, 0)]:7.1f} ms  "
+                      f"{nbytes / 1024:7.1f} KB on the wire")
+    finally:
+        httpd.shutdown()
+
+
+if __name__ == '__main__':
+    main()
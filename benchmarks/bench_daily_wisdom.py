@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: daily wisdom throughput.
+
+  build        WisdomEngine.build_daily_wisdom() for distinct users and dates
+               (no package cache), i.e. the picks themselves
+  cached       get_daily_wisdom() answered from the wisdom cache
+  teaching     one teaching pick: the pre-indexed Sampler vs rebuilding the
+               candidate list from the masters data on every call
+
+The target is 10k calls/s for the cached path and the build path on one core.
+
+Usage:
+    python benchmarks/bench_daily_wisdom.py [calls]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from data_manager import DataManager  # noqa: E402
+from wisdom_engine import WisdomEngine, wisdom_seed  # noqa: E402
+from wisdom_pools import sampler  # noqa: E402
+
+FOCUS = ["sales", "productivity", "health"]
+
+
+def rate(fn, calls):
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return calls / (time.perf_counter() - start)
+
+
+def rebuilt_teaching(engine, rng):
+    """A teaching pick that rebuilds its candidates from the masters data."""
+    candidates = [(module, master, principle)
+                  for module in FOCUS
+                  for master in engine.kb.get(module, "masters", default=[])
+                  for principle in master.get("key_principles") or []]
+    return rng.choice(candidates)
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as tmp:
+        os.mkdir(os.path.join(tmp, 'data'))
+        engine = WisdomEngine(DataManager(tmp, kb_path=os.path.join(ROOT, 'knowledge_base')))
+        engine.build_daily_wisdom("2026-01-01", FOCUS, wisdom_seed("2026-01-01", "warm", FOCUS))
+
+        def build(i):
+            date = f"2026-{1 + i % 12:02d}-{1 + i % 28:02d}"
+            engine.build_daily_wisdom(date, FOCUS, wisdom_seed(date, f"user{i}", FOCUS))
+
+        engine.profile["focus_modules"] = FOCUS
+        engine.get_daily_wisdom("2026-01-01")
+        rng = random.Random(1)
+        at = lambda i: sampler(engine.kb, "principle", FOCUS).at(i % 100)  # noqa: E731
+
+        print(f"{calls} calls, focus modules {', '.join(FOCUS)}")
+        print(f"  build (uncached)     {rate(build, calls):10,.0f} calls/s")
+        print(f"  cached               {rate(lambda i: engine.get_daily_wisdom('2026-01-01'), calls):10,.0f} calls/s")
+        print(f"  teaching, sampler    {rate(lambda i: sampler(engine.kb, 'principle', FOCUS).pick(rng), calls):10,.0f} picks/s")
+        print(f"  teaching, at(i)      {rate(at, calls):10,.0f} picks/s")
+        print(f"  teaching, rebuilt    {rate(lambda i: rebuilt_teaching(engine, rng), calls):10,.0f} picks/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CLI time-to-first-wisdom with and without background prefetch.
+
+Each measurement runs in a fresh interpreter and follows what main.py does:
+create the DataManager, optionally start WisdomEngine.prefetch(), wait
+``think`` ms (the menu on screen before the user picks an option), then
+either:
+
+  wisdom    build today's package (build_daily_wisdom, so the on-disk wisdom
+            cache cannot answer it)
+  library   the masters-library first screen (get_module_masters for every
+            module in MODULE_NAMES)
+
+The time reported is that call's latency, what the user waits for after
+choosing. think=0 is `python main.py wisdom`, where nothing can overlap
+(so main.py prefetches only behind the main menu and the masters library).
+
+Usage:
+    python benchmarks/bench_first_wisdom.py [runs] [think_ms]
+"""
+import os
+import sys
+import json
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r'''
+import sys, time, json
+sys.path.insert(0, "src")
+from data_manager import DataManager
+from utils import MODULE_NAMES
+from wisdom_engine import WisdomEngine, wisdom_seed
+prefetch, what, think = sys.argv[1] == "on", sys.argv[2], float(sys.argv[3])
+dm = DataManager()
+if prefetch:
+    WisdomEngine(dm).prefetch()
+time.sleep(think / 1000)
+start = time.perf_counter()
+engine = WisdomEngine(dm)
+if what == "wisdom":
+    modules = engine._focus_modules()
+    engine.build_daily_wisdom("2026-01-01", modules, wisdom_seed("2026-01-01", "default", modules))
+else:
+    [engine.get_module_masters(m) for m in MODULE_NAMES]
+print(json.dumps((time.perf_counter() - start) * 1000))
+'''
+
+
+def measure(prefetch, what, think, runs):
+    times = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', PROBE, prefetch, what, str(think)], cwd=ROOT,
+                             capture_output=True, text=True, check=True).stdout
+        times.append(json.loads(out))
+    return statistics.median(times)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    thinks = [float(sys.argv[2])] if len(sys.argv) > 2 else [0, 50]
+    print(f"median of {runs} fresh processes")
+    for think in thinks:
+        for what in ("wisdom", "library"):
+            off = measure("off", what, think, runs)
+            on = measure("on", what, think, runs)
+            print(f"  {what:<8} after {think:4.0f} ms   no prefetch {off:6.2f} ms   "
+                  f"prefetch {on:6.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Python heap held by the loaded knowledge base, before and after
+interning (see src/kb_intern.py).
+
+Each figure is the tracemalloc-traced memory still held once the structure
+is built (after gc), measured in a fresh interpreter:
+
+  modules        every module file: plain json.load vs KnowledgeBase.modules()
+  search docs    the search index's document table: as decoded vs compacted
+  server state   what a server worker holds for /api/masters and the KB:
+                 before, the modules plus a MastersIndex over a second parse
+                 of the bundle; after, the modules plus masters_index(), which
+                 shares the modules' records
+
+Usage:
+    python benchmarks/bench_kb_memory.py
+"""
+import os
+import sys
+import json
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r'''
+import gc, glob, json, sys, tracemalloc
+sys.path.insert(0, "src")
+from kb_intern import compact
+from kb_search import _HEADER
+from knowledge_base import KnowledgeBase, MastersIndex
+what, after = sys.argv[1], sys.argv[2] == "after"
+files = sorted(glob.glob("knowledge_base/masters/*_masters.json"))
+bundle = glob.glob("knowledge_base/build/masters.*.json")[0]
+with open("knowledge_base/build/search.kbi", "rb") as f:
+    data = f.read()
+    meta = data[_HEADER.size:_HEADER.size + _HEADER.unpack_from(data, 0)[2]]
+del data
+
+def plain_modules():
+    modules = {}
+    for file in files:
+        with open(file, encoding="utf-8") as f:
+            modules[file] = json.load(f)
+    return modules
+
+gc.collect()
+tracemalloc.start()
+kb = KnowledgeBase("knowledge_base/masters")
+if what == "modules":
+    held = kb.modules() if after else plain_modules()
+elif what == "docs":
+    docs = json.loads(meta)["docs"]
+    held = compact(docs) if after else docs
+    del docs
+elif after:
+    held = (kb.modules(), kb.masters_index())
+else:
+    with open(bundle, "rb") as f:
+        held = (plain_modules(), MastersIndex(json.loads(f.read())["modules"]))
+gc.collect()
+print(json.dumps(tracemalloc.get_traced_memory()[0] / 1024))
+'''
+
+
+def measure(what, when):
+    out = subprocess.run([sys.executable, '-c', PROBE, what, when], cwd=ROOT,
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out)
+
+
+def main():
+    for what, label in (("modules", "modules"), ("docs", "search docs"), ("server", "server state")):
+        before, after = measure(what, "before"), measure(what, "after")
+        print(f"  {label:<13} before {before:7.0f} KB   after {after:7.0f} KB   "
+              f"saved {100 * (1 - after / before):4.1f}%")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: knowledge-base access with and without the compiled snapshot.
+
+Each measurement runs in a fresh interpreter (so nothing is cached in
+memory) and times, after imports:
+
+  first principles   one master's key_principles (kb.get)
+  skill challenge    WisdomEngine(dm)._get_skill_challenge(focus modules)
+  masters_data       every module, fully parsed
+
+"json" disables the snapshot (KnowledgeBase(..., snapshot=False)), which is
+how every lookup used to parse whole module files. Both modes reuse an
+up-to-date snapshot built before timing starts.
+
+Usage:
+    python benchmarks/bench_kb_snapshot.py [runs]
+"""
+import os
+import sys
+import json
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from kb_snapshot import open_snapshot  # noqa: E402
+
+PROBE = r'''
+import sys, time, json
+sys.path.insert(0, "src")
+from knowledge_base import KnowledgeBase
+from data_manager import DataManager
+import wisdom_engine
+mode, what = sys.argv[1], sys.argv[2]
+start = time.perf_counter()
+kb = KnowledgeBase("knowledge_base/masters", snapshot=(mode == "snapshot"))
+KnowledgeBase._shared[kb.masters_path.resolve()] = kb
+if what == "principles":
+    kb.get("sales", "masters", 0, "key_principles")
+elif what == "challenge":
+    wisdom_engine.WisdomEngine(DataManager()).\
+        _get_skill_challenge(["sales", "mindset", "productivity"])
+else:
+    kb.modules()
+print(json.dumps((time.perf_counter() - start) * 1000))
+'''
+
+
+def measure(mode, what, runs):
+    times = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', PROBE, mode, what], cwd=ROOT,
+                             capture_output=True, text=True, check=True).stdout
+        times.append(json.loads(out))
+    return statistics.median(times)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    snap = open_snapshot(os.path.join(ROOT, 'knowledge_base', 'masters'))
+    print(f"snapshot {snap.size / 1024:.0f} KB, {len(snap.sources)} modules; "
+          f"median of {runs} fresh processes")
+    for what, label in (("principles", "first principles"), ("challenge", "skill challenge"),
+                        ("all", "masters_data")):
+        json_ms = measure("json", what, runs)
+        snap_ms = measure("snapshot", what, runs)
+        print(f"  {label:<17} json {json_ms:7.2f} ms   snapshot {snap_ms:7.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CLI masters library time-to-menu with a cold knowledge base.
+
+Each measurement runs in a fresh interpreter (no prefetch, nothing parsed
+yet) and times, after imports, until the first library menu is written
+(to /dev/null):
+
+  eager   the previous screen: every module loaded in full
+          (WisdomEngine.masters_data) to print three names per module,
+          one print per line
+  lazy    main.show_masters_library: names from the master directory,
+          read through the snapshot, rendered as one buffered write
+
+Usage:
+    python benchmarks/bench_masters_library.py [runs]
+"""
+import os
+import sys
+import json
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r'''
+import json, os, sys, time
+sys.path.insert(0, "src")
+import main
+from data_manager import DataManager
+from utils import MODULE_NAMES, Colors, print_header
+from wisdom_engine import WisdomEngine
+dm = DataManager()
+main.get_input = lambda *args, **kwargs: "0"
+sys.stdout = open(os.devnull, "w")
+start = time.perf_counter()
+if sys.argv[1] == "lazy":
+    main.show_masters_library(dm)
+else:
+    modules = WisdomEngine(dm).masters_data
+    print_header("MASTERS LIBRARY")
+    listed = [(m, modules[m]["masters"]) for m in MODULE_NAMES if modules.get(m, {}).get("masters")]
+    for i, (module, masters) in enumerate(listed, 1):
+        print(f"  [{i}] {MODULE_NAMES[module]}")
+        print(f"      {Colors.DIM}{', '.join(m['name'] for m in masters[:3])}{Colors.ENDC}")
+elapsed = (time.perf_counter() - start) * 1000
+sys.stdout = sys.__stdout__
+print(json.dumps(elapsed))
+'''
+
+
+def measure(mode, runs):
+    times = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', PROBE, mode], cwd=ROOT,
+                             capture_output=True, text=True, check=True).stdout
+        times.append(json.loads(out))
+    return statistics.median(times)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    eager, lazy = measure("eager", runs), measure("lazy", runs)
+    print(f"time-to-menu, median of {runs} fresh processes")
+    print(f"  eager (all modules parsed)   {eager:7.2f} ms")
+    print(f"  lazy (master directory)      {lazy:7.2f} ms   {eager / lazy:5.1f}x faster")
+
+
+if __name__ == '__main__':
+    main()
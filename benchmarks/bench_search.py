@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: BM25 query latency over the whole masters knowledge base.
+
+Opens the compiled search index (rebuilding it first if stale), then runs a
+fixed set of queries many times, unfiltered and with a one-module filter,
+and reports p50 / p99 / max latency per query. The one-off cost of opening
+the index (what the first /api/search or `main.py search` pays) is shown
+separately.
+
+Usage:
+    python benchmarks/bench_search.py [rounds]
+"""
+import os
+import sys
+import time
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from kb_search import SearchIndex, open_search_index, search_path_for  # noqa: E402
+
+MASTERS = os.path.join(ROOT, 'knowledge_base', 'masters')
+
+QUERIES = [
+    "cold calling objections",
+    "morning routine",
+    "fear of rejection",
+    "compound interest investing",
+    "deep work focus without distraction",
+    "negotiate salary raise",
+    "sleep and energy",
+    "how to start a conversation with a stranger",
+    "habit",
+    "build trust listen",
+]
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def run(index, rounds, modules=None):
+    times = []
+    for _ in range(rounds):
+        for query in QUERIES:
+            start = time.perf_counter()
+            index.search(query, modules=modules)
+            times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    index = open_search_index(MASTERS)
+
+    start = time.perf_counter()
+    SearchIndex(search_path_for(MASTERS))
+    open_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{len(index)} documents, {len(index.terms)} terms, {len(index.modules)} modules; "
+          f"index open {open_ms:.2f} ms (once per process)")
+    print(f"{len(QUERIES)} queries x {rounds} rounds")
+    for label, modules in (("all modules", None), ("module=sales", ["sales"])):
+        times = run(index, rounds, modules)
+        print(f"  {label:<13} p50 {statistics.median(times):.3f} ms  "
+              f"p99 {percentile(times, 99):.3f} ms  max {max(times):.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: situation -> module matching throughput.
+
+Compares the previous approach (an `any(kw in text ...)` scan per module
+over the hard-coded keyword dict, first match wins) with the compiled
+Aho-Corasick SituationMatcher, which scores every module in one pass with
+~850 patterns. Also times the full get_master_advice_for_situation call
+(match + BM25 principle/practice ranking), and reports how many situations
+in the test corpus each approach routes to the expected module.
+
+Usage:
+    python benchmarks/bench_situation_matcher.py [seconds]
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, ROOT)
+
+from data_manager import DataManager  # noqa: E402
+from knowledge_base import KnowledgeBase  # noqa: E402
+from situation_matcher import build_matcher  # noqa: E402
+from wisdom_engine import WisdomEngine  # noqa: E402
+from tests.fixtures.mock_situations import SITUATION_CORPUS as CORPUS  # noqa: E402
+
+# The keyword table get_master_advice_for_situation used before
+OLD_KEYWORDS = {
+    "money": ["money", "income", "salary", "wealth", "earn", "rich", "broke"],
+    "sales": ["sell", "close", "pitch", "client", "deal", "reject", "cold call", "outreach"],
+    "finance": ["save", "invest", "budget", "debt", "expense", "retire"],
+    "dating": ["social", "date", "friend", "relationship", "confidence", "approach", "talk to"],
+    "mindset": ["fear", "anxiety", "stress", "doubt", "mindset", "belief", "mental", "stuck"],
+    "productivity": ["focus", "distract", "procrastinate", "productive", "time", "busy", "work"],
+    "business": ["business", "startup", "idea", "launch", "customer", "product"],
+    "lifestyle": ["habit", "routine", "environment", "clutter", "phone", "social media"],
+}
+
+
+def old_match(situation):
+    lower = situation.lower()
+    for module, keywords in OLD_KEYWORDS.items():
+        if any(kw in lower for kw in keywords):
+            return module
+    return None
+
+
+def rate(fn, seconds):
+    texts = [text for text, _ in CORPUS]
+    done = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for text in texts:
+            fn(text)
+        done += len(texts)
+    return done / seconds
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    kb = KnowledgeBase.shared(os.path.join(ROOT, 'knowledge_base', 'masters'))
+    start = time.perf_counter()
+    matcher = kb.derived("situation_matcher", build_matcher)
+    build_ms = (time.perf_counter() - start) * 1000
+    engine = WisdomEngine(DataManager(ROOT))
+
+    old_hits = sum(old_match(text) == module for text, module in CORPUS)
+    new_hits = sum(matcher.best(text) == module for text, module in CORPUS)
+    print(f"{len(CORPUS)} corpus situations, {len(matcher.weights)} patterns "
+          f"(matcher built in {build_ms:.1f} ms, once per KB generation)")
+    print(f"  keyword scan      {rate(old_match, seconds):10.0f} situations/s   "
+          f"{old_hits}/{len(CORPUS)} routed correctly")
+    print(f"  Aho-Corasick      {rate(matcher.scores, seconds):10.0f} situations/s   "
+          f"{new_hits}/{len(CORPUS)} routed correctly")
+    print(f"  full advice call  {rate(engine.get_master_advice_for_situation, seconds):10.0f} situations/s")
+
+
+if __name__ == '__main__':
+    main()
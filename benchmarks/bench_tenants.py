@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory of the multi-tenant server with many users.
+
+Creates N synthetic users (profile, habits, goals and a week of logs each)
+under a temporary tenants root, starts the dashboard server in-process and
+requests a tenant-scoped route for every user in turn. Python heap
+(tracemalloc) is sampled every 100 users, once with the default bounded
+tenant pool and once with an effectively unbounded pool for comparison.
+
+Usage:
+    python benchmarks/bench_tenants.py [users] [route]
+"""
+import os
+import sys
+import json
+import shutil
+import tempfile
+import threading
+import tracemalloc
+import http.client
+from datetime import datetime, timedelta
+from http.server import ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import server  # noqa: E402
+from tenants import TenantPool, DEFAULT_MAX_TENANTS  # noqa: E402
+
+
+def make_users(root, count):
+    today = datetime.now()
+    for i in range(count):
+        data = os.path.join(root, f"user{i:04d}", "data")
+        os.makedirs(os.path.join(data, "logs"))
+        files = {
+            "user_profile.json": {"name": f"User {i}", "focus_modules": ["sales", "mindset"]},
+            "habits.json": {
+                "habits": [{"id": f"h{j}", "name": f"Habit {j}", "current_streak": j} for j in range(8)],
+                "completions": {},
+            },
+            "goals.json": {"quarterly_goals": {"q": f"goal {i}"}},
+            "vision.json": {"statement": "x" * 2000},
+        }
+        for day in range(7):
+            date = (today - timedelta(days=day)).strftime("%Y-%m-%d")
+            files[f"logs/{date}.json"] = {
+                "date": date,
+                "am_checkin": {"energy_level": 7, "sleep_hours": 7},
+                "metrics": {"deep_work_hours": 3},
+            }
+        for name, content in files.items():
+            with open(os.path.join(data, name), "w") as f:
+                json.dump(content, f)
+
+
+def run(root, users, route, max_tenants):
+    server._tenants = TenantPool(root, kb_path=server.dm.kb_path, max_tenants=max_tenants)
+    httpd = ThreadingHTTPServer(('localhost', 0), server.DashboardHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    port = httpd.server_address[1]
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    samples = []
+    try:
+        for i in range(users):
+            conn = http.client.HTTPConnection('localhost', port)
+            conn.request('GET', f"/u/user{i:04d}{route}")
+            resp = conn.getresponse()
+            resp.read()
+            conn.close()
+            assert resp.status == 200, resp.status
+            if (i + 1) % 100 == 0:
+                samples.append((i + 1, tracemalloc.get_traced_memory()[0] - baseline))
+    finally:
+        tracemalloc.stop()
+        httpd.shutdown()
+        httpd.server_close()
+    return samples, server._tenants.stats()
+
+
+def main():
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    route = sys.argv[2] if len(sys.argv) > 2 else '/api/bootstrap?exclude=masters,wisdom'
+    root = tempfile.mkdtemp(prefix="tenants-")
+    try:
+        make_users(root, users)
+        print(f"{users} users, GET /u/<user>{route}, Python heap growth (tracemalloc)")
+        for label, max_tenants in (("bounded", DEFAULT_MAX_TENANTS), ("unbounded", users + 1)):
+            samples, stats = run(root, users, route, max_tenants)
+            print(f"  {label} pool (max_tenants={max_tenants}): "
+                  f"{stats['tenants']} live, {stats['evictions']} evicted")
+            for n, heap in samples:
+                print(f"    after {n:5d} users  {heap / 1024 / 1024:7.2f} MB")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark: TF-IDF reflection -> teaching matching.
+
+Builds the teaching vectors from the compiled search index (what the first
+caller in each knowledge-base generation pays), then scores batches of
+reflection-sized queries, one query at a time and as one batch, with the
+NumPy matrix product and with the pure-Python fallback. The nightly
+precompute scores every reflection in batches like these.
+
+Usage:
+    python benchmarks/bench_vectors.py [batch size]
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from kb_search import open_search_index  # noqa: E402
+from kb_vectors import HAS_NUMPY, VectorIndex  # noqa: E402
+
+MASTERS = os.path.join(ROOT, 'knowledge_base', 'masters')
+
+REFLECTIONS = [
+    "Got distracted by email mid-morning. Turn off notifications during deep work blocks",
+    "Didn't handle one objection well on sales call. Need to practice price objection responses",
+    "Slept badly and had no energy for the workout. Go to bed before eleven",
+    "Avoided approaching someone interesting at the event because of fear of rejection",
+    "Overspent on takeout again, budget blown for the week. Meal prep on Sunday",
+    "Procrastinated on the launch plan and scrolled my phone for an hour",
+    "Snapped at a colleague when I felt overwhelmed. Pause before reacting",
+]
+
+
+def timed(fn, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    batch = int(sys.argv[1]) if len(sys.argv) > 1 else 365
+    queries = (REFLECTIONS * (batch // len(REFLECTIONS) + 1))[:batch]
+    index = open_search_index(MASTERS)
+
+    build_ms = timed(lambda: VectorIndex.from_search_index(index))
+    backends = [("python", False)] + ([("numpy", True)] if HAS_NUMPY else [])
+    print(f"{len(index)} search docs; vectors build {build_ms:.1f} ms (once per KB generation)")
+    print(f"{batch} reflections, top 10 each")
+    for label, use_numpy in backends:
+        vectors = VectorIndex.from_search_index(index, use_numpy=use_numpy)
+        one_ms = timed(lambda: [vectors.top_k([q], 10) for q in queries])
+        batch_ms = timed(lambda: vectors.top_k(queries, 10))
+        print(f"  {label:<7} one at a time {one_ms:8.1f} ms   batched {batch_ms:8.1f} ms   "
+              f"({batch_ms * 1000 / batch:.0f} us/reflection)")
+    if not HAS_NUMPY:
+        print("  numpy   not installed (pip install numpy for the matrix path)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: WisdomEngine cold start and per-instance memory.
+
+Compares engines that share the process-wide KnowledgeBase with engines that
+each parse the masters files themselves (simulated by dropping the shared
+instance before every construction, which is what every engine used to do).
+
+  cold start   construct an engine and call get_daily_wisdom() (median)
+  memory       Python heap held per live engine, over N engines (tracemalloc)
+
+Usage:
+    python benchmarks/bench_wisdom_engine.py [engines]
+"""
+import os
+import sys
+import time
+import statistics
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from data_manager import DataManager  # noqa: E402
+from wisdom_engine import WisdomEngine  # noqa: E402
+from knowledge_base import KnowledgeBase  # noqa: E402
+
+
+def unshared():
+    KnowledgeBase._shared.clear()
+
+
+def cold_start(dm, reset, runs=20):
+    times = []
+    for _ in range(runs):
+        reset()
+        start = time.perf_counter()
+        WisdomEngine(dm).get_daily_wisdom()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def memory_per_engine(dm, reset, count):
+    reset()
+    WisdomEngine(dm).masters_data  # warm the shared case so only per-engine state is counted
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    engines = []
+    for _ in range(count):
+        reset()
+        engine = WisdomEngine(dm)
+        engine.masters_data
+        engines.append(engine)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    dm = DataManager(ROOT)
+    cases = (("per-instance parse", unshared), ("shared KnowledgeBase", lambda: None))
+    print(f"WisdomEngine over {len(KnowledgeBase.shared(dm.kb_path / 'masters').module_names())} modules")
+    for label, reset in cases:
+        cold = cold_start(dm, reset)
+        mem = memory_per_engine(dm, reset, count)
+        print(f"  {label:22s} construct+get_daily_wisdom {cold:7.2f} ms   "
+              f"{mem / 1024:9.1f} KB per engine")
+
+
+if __name__ == '__main__':
+    main()
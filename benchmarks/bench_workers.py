@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark: throughput of server.py --workers N.
+
+For each worker count, starts `python server.py PORT --workers N` as a
+subprocess, warms it up, then drives a CPU-bound route (default
+/api/bootstrap: JSON encoding + gzip) from several client processes for a
+fixed duration and reports requests/second and speed-up over one worker.
+
+Client load runs in separate processes so the client is not the GIL
+bottleneck. Scaling is bounded by the machine's core count (the client
+processes share those cores too), so run this on a box with spare cores.
+
+Usage:
+    python benchmarks/bench_workers.py [max_workers] [seconds] [route]
+"""
+import os
+import sys
+import time
+import socket
+import signal
+import subprocess
+import http.client
+from multiprocessing import Pool
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLIENTS = 8
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('localhost', 0))
+        return s.getsockname()[1]
+
+
+def wait_ready(port, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection('localhost', port, timeout=1)
+            conn.request('GET', '/api/data')
+            conn.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def client(args):
+    """Issue requests until the deadline; returns the number completed."""
+    port, route, deadline = args
+    done = 0
+    while time.time() < deadline:
+        conn = http.client.HTTPConnection('localhost', port)
+        conn.request('GET', route, headers={'Accept-Encoding': 'gzip'})
+        resp = conn.getresponse()
+        resp.read()
+        conn.close()
+        if resp.status == 200:
+            done += 1
+    return done
+
+
+def measure(workers, seconds, route):
+    port = free_port()
+    env = dict(os.environ, SELF_MASTERY_METRICS='0')
+    proc = subprocess.Popen(
+        [sys.executable, 'server.py', str(port), '--workers', str(workers)],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_ready(port)
+        with Pool(CLIENTS) as pool:
+            pool.map(client, [(port, route, time.time() + 1.0)] * CLIENTS)  # warm-up
+            deadline = time.time() + seconds
+            total = sum(pool.map(client, [(port, route, deadline)] * CLIENTS))
+        return total / seconds
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=15)
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    route = sys.argv[3] if len(sys.argv) > 3 else '/api/bootstrap'
+
+    counts = sorted({1, 2, 4, 8, max_workers} & set(range(1, max_workers + 1)))
+    print(f"{route}, {seconds:.0f}s per run, {CLIENTS} client processes, "
+          f"{os.cpu_count()} CPUs")
+    base = None
+    for workers in counts:
+        rps = measure(workers, seconds, route)
+        base = base or rps
+        print(f"  workers={workers:<2}  {rps:8.1f} req/s  x{rps / base:.2f}")
+
+
+if __name__ == '__main__':
+    main()
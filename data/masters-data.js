@@ -2,49 +2,96 @@
 // These data structures are loaded before the main application script.
 
 
+// BEGIN GENERATED: mastersData (src/kb_bundle.py, bundle 0a6b57b35a837912) - do not edit by hand
 const mastersData = {
     money: [
-        { name: "Naval Ravikant", expertise: "Wealth creation, leverage, startups", principles: ["Seek wealth, not money or status. Wealth is having assets that earn while you sleep.", "You're not going to get rich renting out your time. You must own equity.", "Arm yourself with specific knowledge, accountability, and leverage.", "Code and media are permissionless leverage. They're the leverage of the new rich."], practices: ["Spend 1 hour learning something that compounds", "Build something that can work without you"] },
-        { name: "Alex Hormozi", expertise: "Business scaling, offers, value creation", principles: ["The goal is to make your offer so good people feel stupid saying no.", "Volume negates luck. Do more.", "Skills are the only assets that can't be taken from you.", "The fastest way to get rich is to solve a painful problem for people who can pay."], practices: ["Do 100 outreach touches", "Improve your offer daily"] },
-        { name: "Charlie Munger", expertise: "Mental models, decision-making", principles: ["Spend each day trying to be a little wiser than you were when you woke up.", "Invert, always invert. Turn a situation or problem upside down.", "Knowing what you don't know is more useful than being brilliant."], practices: ["Read across disciplines", "Invert problems to find solutions"] }
+        { name: "Naval Ravikant", expertise: "Wealth creation, leverage, startups", principles: ["Seek wealth, not money or status. Wealth is having assets that earn while you sleep.", "You're not going to get rich renting out your time. You must own equity.", "Arm yourself with specific knowledge, accountability, and leverage.", "Code and media are permissionless leverage. They're the leverage of the new rich.", "Play long-term games with long-term people.", "Pick an industry where you can play long-term games with long-term people.", "The Internet has massively broadened the possible space of careers. Most people haven't figured this out yet."], practices: ["Spend 1 hour learning something that compounds", "Build something that can work without you", "Invest in relationships with high-integrity people"] },
+        { name: "Alex Hormozi", expertise: "Business scaling, offers, value creation", principles: ["The goal is to make your offer so good people feel stupid saying no.", "Volume negates luck. Do more.", "Skills are the only assets that can't be taken from you.", "The fastest way to get rich is to solve a painful problem for people who can pay.", "Price is what you pay, value is what you get. Increase the gap.", "Most businesses fail because of obscurity, not because the product sucks.", "Discipline is choosing between what you want now and what you want most."], practices: ["Do 100 outreach touches", "Improve your offer daily", "Stack skills that multiply each other"] },
+        { name: "Warren Buffett", expertise: "Investing, compounding, value", principles: ["The most important investment you can make is in yourself.", "Risk comes from not knowing what you're doing.", "It's better to hang out with people better than you.", "The difference between successful people and really successful people is that really successful people say no to almost everything.", "Someone is sitting in the shade today because someone planted a tree a long time ago.", "Price is what you pay. Value is what you get."], practices: ["Read 500 pages a day", "Think in decades, not days", "Say no to protect your time for what matters"] },
+        { name: "Charlie Munger", expertise: "Mental models, decision-making, multidisciplinary thinking", principles: ["Spend each day trying to be a little wiser than you were when you woke up.", "The best thing a human can do is to help another human know more.", "Invert, always invert. Turn a situation or problem upside down.", "You don't have to be brilliant, only a little bit wiser than the other guys, on average, for a long time.", "Knowing what you don't know is more useful than being brilliant.", "Take a simple idea and take it seriously."], practices: ["Read across disciplines", "Invert problems to find solutions", "Avoid stupidity rather than seeking brilliance"] },
+        { name: "MrBeast (Jimmy Donaldson)", expertise: "Content leverage, virality, reinvestment", principles: ["Reinvest everything back into getting better.", "Study your craft obsessively. Watch 1000 videos, analyze what works.", "The first 100 videos will suck. Make them anyway.", "Optimize for the long term. Short-term thinking kills businesses.", "Surround yourself with people who are obsessed like you.", "Every video should be better than the last."], practices: ["Study your industry obsessively", "Reinvest in your skills and assets", "Get 1% better every single day"] },
+        { name: "Brandon Turner", expertise: "Real estate investing, BiggerPockets methodology, rental properties", principles: ["House hacking: Live in one unit, rent the others. Your tenant pays your mortgage.", "The 1% rule: Monthly rent should be at least 1% of purchase price for good cash flow.", "BRRRR method: Buy, Rehab, Rent, Refinance, Repeat - infinite returns possible.", "Real estate creates wealth through four ways: cash flow, appreciation, tax benefits, and loan paydown.", "Start small, learn cheap. Your first deal doesn't have to be perfect.", "Location, location, location is wrong. Cash flow, cash flow, cash flow is right."], practices: ["Analyze one property deal daily - build your evaluation muscle", "Network with real estate investors regularly", "Study market trends in your target areas"] },
+        { name: "Nic Carter", expertise: "Bitcoin, crypto fundamentals, monetary theory, digital assets", principles: ["Bitcoin is digital scarcity - the first time in history we can prove ownership of digital assets.", "Not your keys, not your coins. Self-custody is fundamental to crypto ownership.", "Bitcoin is a hedge against monetary debasement and currency devaluation.", "Most altcoins are securities or outright scams. Bitcoin is the only truly decentralized crypto.", "Crypto is about separating money from state - it's a political statement, not just technology.", "Time preference: Bitcoin teaches you to think long-term, not trade for quick gains."], practices: ["Dollar-cost average into Bitcoin consistently", "Learn about self-custody and security best practices", "Study monetary history and why Bitcoin matters"] }
     ],
     sales: [
-        { name: "Jordan Belfort", expertise: "Straight line persuasion, tonality", principles: ["The only thing standing between you and your goal is the story you keep telling yourself.", "Sales is a transfer of emotion. You must believe before they can.", "Tonality is 90% of communication."], practices: ["Practice your pitch with power and conviction", "Handle 10 objections out loud daily"] },
-        { name: "Grant Cardone", expertise: "10X action, massive outreach", principles: ["10X your goals and 10X your actions.", "Success is your duty, obligation, and responsibility.", "The fortune is in the follow-up."], practices: ["Make 10X the calls you think you need", "Never lower your target, increase your actions"] },
-        { name: "Chris Voss", expertise: "FBI negotiation, tactical empathy", principles: ["Never split the difference.", "Tactical empathy is understanding the feelings and mindset of another.", "No is the start of the negotiation, not the end."], practices: ["Use mirroring in 3 conversations today", "Label someone's emotion out loud"] }
+        { name: "Jordan Belfort", expertise: "Straight line persuasion, tonality, closing", principles: ["The only thing standing between you and your goal is the story you keep telling yourself.", "Sales is a transfer of emotion. You must believe before they can.", "Tonality is 90% of communication. Words are just 10%.", "Every sale has five basic obstacles: no need, no money, no hurry, no desire, no trust.", "Act as if you're a wealthy person, and you'll become one.", "Logic makes people think. Emotion makes people act."], practices: ["Practice your pitch with power and conviction", "Record yourself and analyze your tonality", "Handle 10 objections out loud daily"] },
+        { name: "Grant Cardone", expertise: "10X action, massive outreach, follow-up", principles: ["10X your goals and 10X your actions.", "Success is your duty, obligation, and responsibility.", "Most people fail because they're not taking enough action.", "Be obsessed or be average.", "The fortune is in the follow-up. Follow up until they buy or die.", "Never lower your target. Increase your actions."], practices: ["Make 10X the calls you think you need", "Follow up with every lead at least 5 times", "Treat every 'no' as 'not yet'"] },
+        { name: "Chris Voss", expertise: "FBI negotiation, tactical empathy, hostage techniques", principles: ["Never split the difference. Fight for the best outcome.", "Tactical empathy is understanding the feelings and mindset of another.", "No is the start of the negotiation, not the end.", "Mirror words to build rapport and get more information.", "Label emotions: 'It seems like...' 'It sounds like...'", "The person who has learned to disagree without being disagreeable has the upper hand."], practices: ["Use mirroring in 3 conversations today", "Label someone's emotion out loud", "Ask 'How am I supposed to do that?' instead of saying no"] },
+        { name: "Zig Ziglar", expertise: "Relationship selling, motivation, ethics", principles: ["You can have everything in life you want, if you help enough other people get what they want.", "Stop selling. Start helping.", "Every sale has five obstacles: no need, no money, no hurry, no desire, no trust.", "People don't buy for logical reasons. They buy for emotional reasons.", "You don't have to be great to start, but you have to start to be great.", "F.E.A.R. has two meanings: Forget Everything And Run, or Face Everything And Rise."], practices: ["Find out what your prospect really wants", "Focus on serving, not selling", "Build genuine relationships before asking for anything"] },
+        { name: "Jeb Blount", expertise: "Fanatical prospecting, pipeline, rejection-proof mindset", principles: ["The enduring mantra of all top salespeople is: One more call.", "Prospecting is the lifeblood of sales success.", "Rejection is not failure. It's just part of the process.", "The three Ps: Protect prime selling time, Prioritize prospects, Push through resistance.", "The more you prospect, the luckier you get.", "Your pipeline is your lifeline. Never stop filling it."], practices: ["Protect your first 2 hours for outreach only", "Make prospecting non-negotiable daily", "Aim for 'nos' - they lead to 'yeses'"] },
+        { name: "Jill Konrath", expertise: "Complex sales, enterprise selling, decision-makers", principles: ["Selling is about creating value, not pitching products.", "Buyers are crazy-busy. Respect their time or lose the deal.", "Be a resource, not a pest. Bring insights, not brochures.", "Get to the decision-maker fast. Don't get stuck in gatekeepers.", "Your job is to make it easy for them to buy, not hard for them to say no.", "Complex sales require mapping the buying process, not just pushing your sales process."], practices: ["Research prospects deeply before reaching out", "Lead with insights and value, not product features", "Focus on the business problem, not your solution"] },
+        { name: "Aaron Ross", expertise: "Predictable revenue, outbound prospecting, sales systems", principles: ["Predictable Revenue: Separate prospecting from closing. Specialists beat generalists.", "Cold calling 2.0: Target the right people at the right companies, not spray and pray.", "Seed, Net, Spear: Three types of leads require three different motions.", "Your sales team should never prospect. Have dedicated SDRs (Sales Development Reps).", "Measure activity, not just results. Track calls, emails, conversations.", "Build a machine, not a hero culture. Systems beat rock stars."], practices: ["Separate prospecting from closing in your calendar", "Track leading indicators (activity) not just lagging (deals closed)", "Focus on ideal customer profile, not any customer"] }
     ],
     mindset: [
-        { name: "David Goggins", expertise: "Mental toughness, extreme accountability", principles: ["You are in danger of living a life so comfortable that you will die without ever realizing your potential.", "Most people stop at 40% of their capacity. The brain lies to protect you.", "Callus your mind. Embrace the suck."], practices: ["Do something that sucks every day", "When your mind says stop, do 10 more"] },
-        { name: "Jocko Willink", expertise: "Extreme ownership, discipline", principles: ["Discipline equals freedom.", "Extreme ownership: There are no bad teams, only bad leaders.", "Default aggressive. When in doubt, take action."], practices: ["Wake up early. Win the first battle.", "Take ownership of every problem in your life"] },
-        { name: "Marcus Aurelius", expertise: "Stoicism, self-discipline", principles: ["You have power over your mind, not outside events.", "The happiness of your life depends upon the quality of your thoughts.", "Waste no more time arguing about what a good man should be. Be one."], practices: ["Morning reflection on what's in your control", "Practice accepting what you cannot change"] },
-        { name: "Bruce Lee", expertise: "Martial arts philosophy, adaptability, self-expression", principles: ["Be water, my friend. Empty your mind, be formless, shapeless.", "I fear not the man who has practiced 10,000 kicks once, but the man who has practiced one kick 10,000 times.", "Absorb what is useful, discard what is useless, add what is uniquely your own.", "The key to immortality is first living a life worth remembering.", "Knowing is not enough, we must apply. Willing is not enough, we must do."], practices: ["Practice until the technique becomes part of you", "Question every tradition - keep only what works for YOU", "Train the mind as hard as the body"] },
-        { name: "Benjamin Franklin", expertise: "Self-improvement, virtue ethics, practical wisdom", principles: ["An investment in knowledge pays the best interest.", "By failing to prepare, you are preparing to fail.", "Well done is better than well said.", "Energy and persistence conquer all things.", "Never leave that till tomorrow which you can do today."], practices: ["Track 13 virtues weekly", "Ask each morning: What good shall I do today?", "Ask each evening: What good have I done today?"] },
-        { name: "Epictetus", expertise: "Stoicism, freedom through acceptance, the dichotomy of control", principles: ["It's not what happens to you, but how you react to it that matters.", "We cannot choose our external circumstances, but we can choose how we respond.", "Wealth consists not in having great possessions, but in having few wants.", "First say to yourself what you would be; then do what you have to do.", "No man is free who is not master of himself."], practices: ["Each morning, remind yourself what is in your control and what is not", "When disturbed, ask: Is this within my power or not?", "Practice voluntary discomfort to build resilience"] },
-        { name: "Socrates", expertise: "Self-examination, questioning assumptions, pursuit of wisdom", principles: ["The unexamined life is not worth living.", "I know that I know nothing.", "To find yourself, think for yourself.", "Strong minds discuss ideas, average minds discuss events, weak minds discuss people.", "Be kind, for everyone you meet is fighting a hard battle."], practices: ["Question your deepest assumptions", "Seek to understand before seeking to be understood", "Admit ignorance as the first step to knowledge"] }
+        { name: "Marcus Aurelius", expertise: "Stoicism, self-discipline, duty", principles: ["You have power over your mind, not outside events. Realize this, and you will find strength.", "The happiness of your life depends upon the quality of your thoughts.", "Waste no more time arguing about what a good man should be. Be one.", "Very little is needed to make a happy life; it is all within yourself.", "The best revenge is not to be like your enemy.", "When you arise in the morning think of what a privilege it is to be alive."], practices: ["Morning reflection on what's in your control", "Evening review of your actions and thoughts", "Practice accepting what you cannot change"] },
+        { name: "David Goggins", expertise: "Mental toughness, extreme accountability, embracing suffering", principles: ["You are in danger of living a life so comfortable and soft that you will die without ever realizing your potential.", "The only way to grow is to go to that dark place and get after it.", "Most people stop at 40% of their capacity. The brain lies to protect you.", "Suffering is a test. How you handle it determines who you become.", "Nobody cares what you did yesterday. What are you doing today?", "Callus your mind. Embrace the suck."], practices: ["Do something that sucks every single day", "When your mind says stop, do 10 more", "Hold yourself accountable with radical honesty"] },
+        { name: "Jocko Willink", expertise: "Extreme ownership, discipline, leadership", principles: ["Discipline equals freedom.", "Extreme ownership: There are no bad teams, only bad leaders.", "Don't let your ego get in the way of learning.", "Prioritize and execute. Focus on the biggest problem first.", "Default aggressive. When in doubt, take action.", "Check the ego. The moment you think you know everything, you know nothing."], practices: ["Wake up early. Win the first battle.", "Take ownership of every problem in your life", "Make discipline your identity, not a chore"] },
+        { name: "Carol Dweck", expertise: "Growth mindset, learning, resilience", principles: ["In a growth mindset, challenges are exciting rather than threatening.", "Becoming is better than being.", "The passion for stretching yourself and sticking to it, even when it's not going well, is the hallmark of the growth mindset.", "No matter what your ability is, effort is what ignites that ability and turns it into accomplishment.", "Just because some people can do something with little or no training doesn't mean others can't do it with training.", "Effort is one of those things that gives meaning to life."], practices: ["Add 'yet' to any 'I can't' statement", "Celebrate effort, not just results", "Seek challenges that stretch you"] },
+        { name: "Ryan Holiday", expertise: "Stoicism, obstacle as the way, ego management", principles: ["The obstacle is the way. What stands in the way becomes the way.", "Ego is the enemy. It's the voice that tells you you're special, you're better.", "Stillness is the key. In stillness, we find clarity.", "You don't control events, but you control how you respond.", "Perception, action, will. That's the stoic formula.", "Alive time or dead time. You choose."], practices: ["Reframe every obstacle as an opportunity", "Practice stillness for 10 minutes daily", "Journal about your perceptions and responses"] },
+        { name: "Nassim Taleb", expertise: "Antifragility, uncertainty, skin in the game", principles: ["Antifragile: Some things benefit from shocks; they thrive and grow when exposed to volatility.", "Wind extinguishes a candle and energizes fire. Be the fire.", "The best way to verify that you are alive is by checking if you like variations.", "If you want to accelerate someone's death, give them a personal doctor.", "Never trust anyone who doesn't have skin in the game.", "The three most harmful addictions are heroin, carbohydrates, and a monthly salary."], practices: ["Expose yourself to small stressors daily", "Build redundancy and options in your life", "Avoid fragile dependencies"] },
+        { name: "Alan Watts", expertise: "Eastern philosophy, Zen, living in the present", principles: ["You are the universe experiencing itself.", "The meaning of life is just to be alive. It is so plain and obvious.", "We suffer because we cling to what is impermanent.", "The only way to make sense out of change is to plunge into it, move with it, and join the dance.", "Life is not a problem to be solved, but a reality to be experienced.", "Trying to define yourself is like trying to bite your own teeth."], practices: ["Spend 10 minutes in pure observation - no judgment, just presence", "Notice when you're resisting what is, and let go", "Ask: 'Am I living, or just thinking about living?'"] },
+        { name: "Carl Jung", expertise: "Depth psychology, shadow work, archetypes, individuation", principles: ["Until you make the unconscious conscious, it will direct your life and you will call it fate.", "The shadow is the person you'd rather not be. Integrate it or it will sabotage you.", "We meet ourselves time and again in a thousand disguises on the path of life.", "The meeting of two personalities is like the contact of two chemical substances: if there is any reaction, both are transformed.", "Your vision will become clear only when you look into your heart. Who looks outside, dreams. Who looks inside, awakens.", "I am not what happened to me, I am what I choose to become."], practices: ["Shadow journaling: What did I judge harshly today? That's my shadow.", "Notice projections: What I criticize in others lives in me", "Active imagination: Dialogue with the parts of yourself you reject"] }
     ],
     productivity: [
-        { name: "Cal Newport", expertise: "Deep work, digital minimalism", principles: ["Deep work is the ability to focus without distraction on a cognitively demanding task.", "If you don't produce, you won't thrive.", "The ability to perform deep work is becoming increasingly rare and valuable."], practices: ["Schedule 3-4 hours of uninterrupted deep work", "Embrace boredom—don't fill every moment"] },
-        { name: "James Clear", expertise: "Atomic habits, behavior change", principles: ["You do not rise to the level of your goals. You fall to the level of your systems.", "Every action is a vote for the type of person you wish to become.", "Habits are the compound interest of self-improvement."], practices: ["Stack new habits onto existing ones", "Track habits visually—never break the chain"] }
+        { name: "Cal Newport", expertise: "Deep work, digital minimalism, focus", principles: ["Deep work is the ability to focus without distraction on a cognitively demanding task.", "Clarity about what matters provides clarity about what does not.", "If you don't produce, you won't thrive—no matter how skilled or talented you are.", "The ability to perform deep work is becoming increasingly rare and increasingly valuable.", "What we choose to focus on and what we choose to ignore—plays in defining the quality of our life.", "Two core abilities for thriving: mastering hard things quickly and producing at an elite level."], practices: ["Schedule 3-4 hours of uninterrupted deep work", "Quit social media or severely limit it", "Embrace boredom—don't fill every moment"] },
+        { name: "James Clear", expertise: "Atomic habits, behavior change, 1% improvement", principles: ["You do not rise to the level of your goals. You fall to the level of your systems.", "Every action is a vote for the type of person you wish to become.", "Habits are the compound interest of self-improvement.", "Make it obvious, attractive, easy, and satisfying.", "The task of building a good habit is like cultivating a delicate flower one day at a time.", "Success is the product of daily habits, not once-in-a-lifetime transformations."], practices: ["Stack new habits onto existing ones", "Make good habits obvious and easy", "Track habits visually—never break the chain"] },
+        { name: "Tim Ferriss", expertise: "80/20, lifestyle design, meta-learning", principles: ["Focus on being productive instead of busy.", "Pareto principle: 80% of outputs come from 20% of inputs.", "What we fear doing most is usually what we most need to do.", "The question isn't 'What do I want?' It's 'What would excite me?'", "Lack of time is lack of priorities.", "The opposite of happiness is not sadness—it's boredom."], practices: ["Identify the 20% of activities producing 80% of results", "Batch similar tasks together", "Do the most important task before 11am"] },
+        { name: "David Allen", expertise: "GTD, stress-free productivity, capture systems", principles: ["Your mind is for having ideas, not holding them.", "You can do anything, but not everything.", "The two-minute rule: If it takes less than two minutes, do it now.", "Your brain is a terrible office—get everything out of it.", "Review is the secret sauce of GTD.", "You don't manage time. You manage your actions within time."], practices: ["Capture everything into a trusted system", "Process inbox to zero daily", "Weekly review: get clear, get current, get creative"] },
+        { name: "Nir Eyal", expertise: "Indistractable, attention management, triggers", principles: ["The opposite of distraction is not focus. It's traction.", "Time management is pain management.", "You can't call something a distraction unless you know what it's distracting you from.", "Master internal triggers. Discomfort drives distraction.", "Make time for traction. Plan your day in timeboxes.", "Hack back external triggers. Remove what doesn't serve you."], practices: ["Timebox your entire day", "Identify internal triggers driving distraction", "Create barriers to distraction tech"] }
     ],
     business: [
-        { name: "Elon Musk", expertise: "First principles, moonshots", principles: ["First principles thinking: Boil things down to fundamental truths.", "Failure is an option here. If things are not failing, you are not innovating enough.", "Work like hell. 80-100 hour weeks."], practices: ["Question every assumption", "Move fast and iterate constantly"] },
-        { name: "Jeff Bezos", expertise: "Long-term thinking, customer obsession", principles: ["Focus on customers, not competitors.", "It's always Day 1. Day 2 is stasis, followed by death.", "Make high-velocity decisions."], practices: ["Start with the customer and work backwards", "Think in 5-7 year time horizons"] },
-        { name: "Napoleon Hill", expertise: "Success philosophy, the power of thought, achievement principles", principles: ["Whatever the mind can conceive and believe, it can achieve.", "The starting point of all achievement is desire.", "Strength and growth come only through continuous effort and struggle.", "A quitter never wins and a winner never quits.", "Set your mind on a definite goal and observe how quickly the world stands aside to let you pass."], practices: ["Write your definite major purpose and read it daily", "Form a mastermind alliance with people who want you to succeed", "Transmute energy into creative achievement"] },
-        { name: "Alexander the Great", expertise: "Conquest, bold action, leading from the front", principles: ["There is nothing impossible to him who will try.", "I am not afraid of an army of lions led by a sheep; I am afraid of an army of sheep led by a lion.", "Remember: upon the conduct of each depends the fate of all.", "A tomb now suffices him for whom the whole world was not sufficient.", "I would rather live a short life of glory than a long one of obscurity."], practices: ["Lead from the front - never ask others to do what you won't", "Move with speed and decisiveness when opportunity appears", "Share hardships with your team"] },
-        { name: "King Leonidas", expertise: "Courage, sacrifice, unwavering commitment", principles: ["Come back with your shield, or on it.", "Spartans! Ready your breakfast and eat hearty, for tonight we dine in hell!", "The world will know that free men stood against a tyrant.", "Give them nothing, but take from them everything.", "A Spartan's true strength is the warrior next to him."], practices: ["Prepare for the hardest possible scenario", "Your word is your bond - death before dishonor", "Train relentlessly - excellence is a habit, not an act"] }
+        { name: "Elon Musk", expertise: "First principles thinking, moonshots, execution", principles: ["First principles thinking: Boil things down to fundamental truths and reason up from there.", "If something is important enough, you do it even if the odds are not in your favor.", "Failure is an option here. If things are not failing, you are not innovating enough.", "Work like hell. 80-100 hour weeks every week.", "When something is important enough, you do it even if the odds are not in your favor.", "Constantly think about how you could be doing things better."], practices: ["Question every assumption", "Work on the hardest problem first", "Move fast and iterate constantly"] },
+        { name: "Jeff Bezos", expertise: "Long-term thinking, customer obsession, Day 1 mentality", principles: ["Focus on customers, not competitors.", "It's always Day 1. Day 2 is stasis, followed by death.", "Make high-velocity decisions. Most decisions are reversible.", "Invent on behalf of customers. They won't tell you what they need.", "Your margin is my opportunity.", "If you never want to be criticized, for goodness' sake don't do anything new."], practices: ["Start with the customer and work backwards", "Make decisions with 70% of information needed", "Think in 5-7 year time horizons"] },
+        { name: "Peter Thiel", expertise: "Contrarian thinking, monopolies, zero to one", principles: ["Competition is for losers. Build a monopoly.", "The best investment in a portfolio equals or outperforms the rest combined.", "What important truth do very few people agree with you on?", "Going from 0 to 1 is harder and more valuable than 1 to N.", "A startup messed up at its foundation cannot be fixed.", "The most contrarian thing is not to oppose the crowd but to think for yourself."], practices: ["Ask: What's a belief I hold that most people disagree with?", "Build something 10x better, not incrementally better", "Focus resources on the one thing that matters most"] },
+        { name: "Paul Graham", expertise: "Startups, Y Combinator, building", principles: ["Make something people want.", "Launch fast and iterate.", "Talk to users. Build what they need.", "Do things that don't scale in the beginning.", "The best founders have a chip on their shoulder.", "If you're not embarrassed by your first version, you launched too late."], practices: ["Talk to at least one user/customer today", "Ship something, even if small", "Focus on making something people actually want"] },
+        { name: "Sam Altman", expertise: "Startups, scale, exponential thinking", principles: ["Compounding is magic. Long-term thinking wins.", "It's easier to do a hard startup than an easy startup.", "The most important thing is to build something people want.", "Great execution is at least 10x more important than a great idea.", "Hire slowly, fire quickly.", "Focus is a force multiplier."], practices: ["Work on high-leverage activities only", "Make yourself a force multiplier for your team", "Think about what compounds"] }
     ],
     finance: [
-        { name: "Morgan Housel", expertise: "Psychology of money", principles: ["Wealth is what you don't see.", "Saving is the gap between your ego and your income.", "Compounding works best when you give it decades."], practices: ["Automate savings before spending", "Think in decades, not days"] }
+        { name: "Dave Ramsey", expertise: "Debt elimination, budgeting, financial peace", principles: ["Live like no one else so later you can live like no one else.", "Debt is dumb. Cash is king.", "A budget is telling your money where to go instead of wondering where it went.", "The paid-off home mortgage has replaced the BMW as the status symbol of choice.", "You must gain control over your money or the lack of it will forever control you.", "Act your wage."], practices: ["Check your budget daily", "Use cash for discretionary spending", "Say no to debt, always"] },
+        { name: "Morgan Housel", expertise: "Psychology of money, behavioral finance, long-term thinking", principles: ["Wealth is what you don't see. It's the cars not bought, the diamonds not purchased.", "Saving is the gap between your ego and your income.", "Compounding works best when you give it decades.", "Getting money and keeping money are two different skills.", "Reasonable is more realistic than rational.", "Room for error is the most important part of any financial plan."], practices: ["Automate savings before spending", "Think in decades, not days", "Build a margin of safety in all decisions"] },
+        { name: "JL Collins", expertise: "Simple investing, FIRE, index funds", principles: ["The stock market is the most powerful wealth-building tool ever created.", "Spend less than you earn. Invest the surplus. Avoid debt.", "F-you money is the most important money you'll ever have.", "Nobody can consistently predict what the market will do.", "Your savings rate is more important than your investment returns.", "VTSAX and chill. Keep it simple."], practices: ["Automate investments into index funds", "Ignore market news", "Focus on increasing savings rate"] },
+        { name: "Ramit Sethi", expertise: "Conscious spending, automation, big wins", principles: ["Focus on Big Wins, not small details like lattes.", "Spend extravagantly on things you love, cut mercilessly on things you don't.", "Automate everything. Remove yourself from the equation.", "The best time to negotiate your salary was 3 years ago. The second best time is now.", "There's a limit to how much you can cut, but no limit to how much you can earn.", "Make your money invisible. Automate savings before you see it."], practices: ["Focus on earning more, not just cutting", "Automate bills, savings, investments", "Negotiate one thing this week"] },
+        { name: "Ray Dalio", expertise: "Principles-based investing, macro cycles, risk parity", principles: ["Pain + Reflection = Progress", "He who lives by the crystal ball will eat shattered glass.", "Diversification is the only free lunch in investing.", "The biggest mistake investors make is to believe that what happened in the recent past is likely to persist.", "Don't confuse what you wish were true with what is true.", "Time is like a river that carries us forward into encounters with reality."], practices: ["Write down your investment principles", "Diversify across uncorrelated assets", "Review decisions to learn from mistakes"] }
     ],
     dating: [
-        { name: "Dale Carnegie", expertise: "Winning friends, influence", principles: ["You can make more friends in two months by becoming interested in other people than in two years trying to get people interested in you.", "A person's name is the sweetest sound.", "Make the other person feel important—sincerely."], practices: ["Remember and use people's names", "Ask questions and truly listen"] }
+        { name: "Dale Carnegie", expertise: "Winning friends, influence, likeability", principles: ["You can make more friends in two months by becoming interested in other people than in two years trying to get people interested in you.", "A person's name is to that person the sweetest sound in any language.", "Talk in terms of the other person's interests.", "Make the other person feel important—and do it sincerely.", "Be a good listener. Encourage others to talk about themselves.", "The only way to get the best of an argument is to avoid it."], practices: ["Remember and use people's names", "Ask questions and truly listen to answers", "Give genuine appreciation daily"] },
+        { name: "Robert Greene", expertise: "Power dynamics, seduction, mastery", principles: ["Never outshine the master.", "Always say less than necessary.", "Make other people come to you—use bait if necessary.", "Learn to keep people dependent on you.", "Avoid the unhappy and unlucky.", "Win through your actions, never through argument."], practices: ["Observe social dynamics before acting", "Speak less, listen more", "Create value that makes others seek you out"] },
+        { name: "Chris Voss", expertise: "Tactical empathy, negotiation, connection", principles: ["Empathy is not about agreeing—it's about understanding.", "The fastest way to build rapport is to make the other person feel heard.", "Labeling emotions defuses them.", "Mirroring creates connection without effort.", "Never be mean to someone who could hurt you by doing nothing.", "The key to gaining the upper hand is giving the other side the illusion of control."], practices: ["Mirror someone's last 3 words in conversation", "Label emotions: 'It seems like you...'", "Aim to understand before being understood"] },
+        { name: "Vanessa Van Edwards", expertise: "People science, charisma, body language", principles: ["Charisma is a learnable skill, not a born trait.", "First impressions are made in 7 seconds and are very hard to change.", "Facial expressions are the most powerful communication tool.", "Warmth + competence = the charisma formula.", "Hand gestures increase trust and understanding by 60%.", "Vocal power matters: lower pitch conveys confidence."], practices: ["Use hand gestures when speaking", "Triple your nods—it encourages others to talk", "Make eye contact for 60-70% of conversation"] },
+        { name: "Mark Manson", expertise: "Honesty, boundaries, authentic connection", principles: ["The only way to be truly confident is to simply become comfortable with being unconfident.", "You are defined by what you're willing to struggle for.", "Healthy relationships are built on boundaries, not neediness.", "Rejection is just information, not a verdict on your worth.", "Stop looking for the right person. Become the right person.", "Vulnerability is not weakness—it's the birthplace of connection."], practices: ["Express your genuine opinion, even if unpopular", "Set and maintain clear boundaries", "Be vulnerable—share real thoughts and feelings"] },
+        { name: "John Gottman", expertise: "Relationship science, conflict resolution, Four Horsemen", principles: ["The Four Horsemen of relationship apocalypse: Criticism, Contempt, Defensiveness, Stonewalling.", "The antidotes: Gentle start-up, Build culture of appreciation, Take responsibility, Self-soothe.", "The magic ratio is 5:1 - five positive interactions for every negative one.", "Successful couples turn toward each other's bids for attention, not away.", "69% of relationship conflict is perpetual - not solvable. Learn to manage it.", "Small things often: Regular positive moments matter more than grand gestures."], practices: ["Make a bid for connection daily: Share something, ask a question, invite interaction", "Respond to partner's bids: Turn toward, not away or against", "Five-to-one rule: Five positives for every negative interaction"] },
+        { name: "Esther Perel", expertise: "Intimacy, desire, modern relationships", principles: ["The quality of your relationships determines the quality of your life.", "Desire needs mystery, but love needs closeness. The tension between them is healthy.", "Erotic intimacy isn't about how often, but about presence and attention.", "Affairs happen in good relationships too - they're about seeking a new version of self.", "The secret to desire: Maintain separateness, autonomy, and individual identity.", "Conflict is inevitable. Repair is everything."], practices: ["Create space for both closeness and autonomy in relationships", "Be present - put down devices, make eye contact, really see your partner", "Cultivate individual interests and friendships outside the relationship"] }
     ],
     lifestyle: [
-        { name: "Tim Ferriss", expertise: "Lifestyle design, optimization", principles: ["Focus on being productive instead of busy.", "What we fear doing most is usually what we most need to do.", "Lack of time is lack of priorities."], practices: ["Define the worst case—it's usually not that bad", "Eliminate before optimizing"] }
+        { name: "Tim Ferriss", expertise: "Lifestyle design, 4-hour philosophy, optimization", principles: ["The goal is not to simply eliminate the bad, but to pursue and experience the best.", "Life doesn't have to be so hard. Most people choose to make it hard.", "What we fear doing most is usually what we most need to do.", "Being busy is a form of laziness—lazy thinking and indiscriminate action.", "Focus on being productive instead of busy.", "People will choose unhappiness over uncertainty."], practices: ["Define the worst case—it's usually not that bad", "Design your ideal day, then engineer it", "Eliminate before optimizing"] },
+        { name: "Essentialism (Greg McKeown)", expertise: "Less but better, disciplined pursuit of less", principles: ["Less but better.", "If it isn't a clear yes, then it's a clear no.", "Essentialism is not about how to get more things done; it's about how to get the right things done.", "The pursuit of success can be a catalyst for failure.", "You cannot overestimate the unimportance of practically everything.", "If you don't prioritize your life, someone else will."], practices: ["Say no to anything that isn't essential", "Create space to think and reflect", "Do fewer things better"] },
+        { name: "Marie Kondo", expertise: "Decluttering, spark joy, intentional living", principles: ["The space in which we live should be for the person we are becoming now.", "Keep only those things that speak to the heart and discard items that no longer spark joy.", "Tidying is a celebration, a grand send-off for those things that served their purpose.", "When you put your house in order, you put your affairs and your past in order too.", "The question of what you want to own is actually the question of how you want to live your life.", "Life truly begins after you have put your house in order."], practices: ["Before buying, ask: Does this spark joy?", "Return everything to its home after use", "Regularly purge what no longer serves you"] },
+        { name: "James Clear (on environment)", expertise: "Environment design, behavior architecture", principles: ["Environment is the invisible hand that shapes behavior.", "Make the cues of good habits obvious in your environment.", "Reduce the friction associated with good behaviors.", "Increase the friction associated with bad behaviors.", "People often choose products not because of what they are, but because of where they are.", "Redesign your environment rather than relying on willpower."], practices: ["Design your environment for success", "Remove friction from good habits", "Add friction to bad habits"] },
+        { name: "Cal Newport (on digital life)", expertise: "Digital minimalism, intentional tech use", principles: ["Digital minimalism: A philosophy of technology use based on understanding the value of each tool.", "The key is to see solitude as a positive state—not loneliness but a gift.", "The cost of a thing is the amount of life you exchange for it.", "Clutter is the enemy of clarity.", "High-quality leisure beats digital distraction every time.", "Reclaim your attention as your most valuable resource."], practices: ["No phone for first and last hour of day", "Schedule social media, don't react to it", "Replace low-quality digital with high-quality analog"] }
     ],
     health: [
-        { name: "Andrew Huberman", expertise: "Neuroscience, protocols, optimization", principles: ["Morning sunlight exposure is the most powerful tool for optimizing circadian rhythm.", "Non-sleep deep rest (NSDR) can restore focus and energy.", "Cold exposure triggers dopamine release that lasts for hours."], practices: ["Get sunlight within 30-60 minutes of waking", "Practice NSDR or meditation daily"] },
-        { name: "Peter Attia", expertise: "Longevity, healthspan, medicine 3.0", principles: ["The goal is to die young as old as possible.", "Zone 2 cardio is the foundation of metabolic health.", "Stability and mobility are non-negotiable as you age."], practices: ["150+ minutes of Zone 2 cardio weekly", "Train for the Centenarian Decathlon"] }
+        { name: "Andrew Huberman", expertise: "Neuroscience, sleep optimization, protocols", principles: ["Get sunlight in your eyes within the first hour of waking. It sets your circadian rhythm.", "Avoid bright lights between 10pm and 4am. It suppresses melatonin and disrupts sleep.", "Non-sleep deep rest (NSDR) is a powerful tool for recovery and focus.", "Cold exposure increases dopamine by 250% for hours. It builds resilience.", "Caffeine should be delayed 90-120 minutes after waking for optimal energy.", "Exercise is the most powerful tool we have for brain health and neuroplasticity."], practices: ["Morning sunlight exposure (10-30 min)", "Cold shower or cold exposure", "Delay caffeine 90 min after waking"] },
+        { name: "Matthew Walker", expertise: "Sleep science, recovery, performance", principles: ["Sleep is the single most effective thing you can do to reset your brain and body.", "Routinely sleeping less than 6 hours a night weakens your immune system substantially.", "The shorter your sleep, the shorter your life.", "There is no major organ in the body or brain that isn't enhanced by sleep.", "REM sleep is critical for emotional regulation and creativity.", "Alcohol is one of the most powerful suppressors of REM sleep."], practices: ["Keep a consistent sleep schedule, even weekends", "Keep bedroom cool (65-68°F / 18-20°C)", "Avoid alcohol and caffeine before bed"] },
+        { name: "Peter Attia", expertise: "Longevity, metabolic health, performance", principles: ["The four horsemen of chronic disease: heart disease, cancer, neurodegenerative disease, metabolic disease.", "Zone 2 cardio is the foundation of metabolic health and longevity.", "Muscle is the organ of longevity. Preserve and build it.", "Stability and mobility decline with age unless actively maintained.", "What you do in your 40s determines your health in your 80s.", "Emotional health is the fifth horseman. Don't neglect it."], practices: ["Zone 2 cardio (3-4 hours per week)", "Strength training to maintain muscle", "Focus on stability and mobility, not just strength"] },
+        { name: "Rhonda Patrick", expertise: "Nutrition, longevity, micronutrients", principles: ["Time-restricted eating can improve metabolic health significantly.", "Sulforaphane (from broccoli sprouts) is one of the most powerful natural compounds.", "Omega-3 fatty acids are critical for brain health and reducing inflammation.", "Heat shock proteins from sauna use improve cardiovascular and brain health.", "Vitamin D deficiency is widespread and linked to many chronic diseases.", "Exercise creates new brain cells. It's the closest thing to a fountain of youth."], practices: ["Eat nutrient-dense whole foods", "Consider time-restricted eating (10-12 hour window)", "Prioritize omega-3s and vitamin D"] },
+        { name: "Wim Hof", expertise: "Cold exposure, breathing, mental resilience", principles: ["The cold is your warm friend.", "Breathwork can directly influence your autonomic nervous system.", "We can consciously influence our immune response through practice.", "Discomfort is the way. Embrace it.", "The mind is the master. The body will follow.", "Go into the cold. It will show you who you really are."], practices: ["End showers with 30-60 seconds of cold", "Practice breathwork (Wim Hof method)", "Embrace discomfort as training"] }
+    ]
+};
+// END GENERATED: mastersData
+
+// Hand-curated masters that are not in knowledge_base/masters.
+// The dashboard merges these into mastersData at startup.
+const supplementalMasters = {
+    mindset: [
+        { name: "Bruce Lee", expertise: "Martial arts philosophy, adaptability, self-expression", principles: ["Be water, my friend. Empty your mind, be formless, shapeless.", "I fear not the man who has practiced 10,000 kicks once, but the man who has practiced one kick 10,000 times.", "Absorb what is useful, discard what is useless, add what is uniquely your own.", "The key to immortality is first living a life worth remembering.", "Knowing is not enough, we must apply. Willing is not enough, we must do."], practices: ["Practice until the technique becomes part of you", "Question every tradition - keep only what works for YOU", "Train the mind as hard as the body"] },
+        { name: "Benjamin Franklin", expertise: "Self-improvement, virtue ethics, practical wisdom", principles: ["An investment in knowledge pays the best interest.", "By failing to prepare, you are preparing to fail.", "Well done is better than well said.", "Energy and persistence conquer all things.", "Never leave that till tomorrow which you can do today."], practices: ["Track 13 virtues weekly", "Ask each morning: What good shall I do today?", "Ask each evening: What good have I done today?"] },
+        { name: "Epictetus", expertise: "Stoicism, freedom through acceptance, the dichotomy of control", principles: ["It's not what happens to you, but how you react to it that matters.", "We cannot choose our external circumstances, but we can choose how we respond.", "Wealth consists not in having great possessions, but in having few wants.", "First say to yourself what you would be; then do what you have to do.", "No man is free who is not master of himself."], practices: ["Each morning, remind yourself what is in your control and what is not", "When disturbed, ask: Is this within my power or not?", "Practice voluntary discomfort to build resilience"] },
+        { name: "Socrates", expertise: "Self-examination, questioning assumptions, pursuit of wisdom", principles: ["The unexamined life is not worth living.", "I know that I know nothing.", "To find yourself, think for yourself.", "Strong minds discuss ideas, average minds discuss events, weak minds discuss people.", "Be kind, for everyone you meet is fighting a hard battle."], practices: ["Question your deepest assumptions", "Seek to understand before seeking to be understood", "Admit ignorance as the first step to knowledge"] }
+    ],
+    business: [
+        { name: "Napoleon Hill", expertise: "Success philosophy, the power of thought, achievement principles", principles: ["Whatever the mind can conceive and believe, it can achieve.", "The starting point of all achievement is desire.", "Strength and growth come only through continuous effort and struggle.", "A quitter never wins and a winner never quits.", "Set your mind on a definite goal and observe how quickly the world stands aside to let you pass."], practices: ["Write your definite major purpose and read it daily", "Form a mastermind alliance with people who want you to succeed", "Transmute energy into creative achievement"] },
+        { name: "Alexander the Great", expertise: "Conquest, bold action, leading from the front", principles: ["There is nothing impossible to him who will try.", "I am not afraid of an army of lions led by a sheep; I am afraid of an army of sheep led by a lion.", "Remember: upon the conduct of each depends the fate of all.", "A tomb now suffices him for whom the whole world was not sufficient.", "I would rather live a short life of glory than a long one of obscurity."], practices: ["Lead from the front - never ask others to do what you won't", "Move with speed and decisiveness when opportunity appears", "Share hardships with your team"] },
+        { name: "King Leonidas", expertise: "Courage, sacrifice, unwavering commitment", principles: ["Come back with your shield, or on it.", "Spartans! Ready your breakfast and eat hearty, for tonight we dine in hell!", "The world will know that free men stood against a tyrant.", "Give them nothing, but take from them everything.", "A Spartan's true strength is the warrior next to him."], practices: ["Prepare for the hardest possible scenario", "Your word is your bond - death before dishonor", "Train relentlessly - excellence is a habit, not an act"] }
     ]
 };
 
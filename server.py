@@ -5,32 +5,155 @@ Serves the web dashboard with live data from your profile.
 Optimized: gzip compression, cache headers, parallel I/O, pre-serialized JSON.
 """
 import os
+import posixpath
 import sys
 import json
 import gzip
 import io
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+import hashlib
+import re
+import signal
+import socket
+import argparse
+import traceback
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from urllib.parse import urlsplit, parse_qs, unquote
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from data_manager import DataManager
+from data_manager import DAILY_METRICS
 from wisdom_engine import WisdomEngine
+from write_queue import WriteQueue
+import kb_bundle
+from kb_graph import DEFAULT_RELATED, MAX_RELATED
+from kb_search import MAX_LIMIT as MAX_SEARCH_LIMIT
+from knowledge_base import KnowledgeBase, MAX_PAGE_SIZE
+from lru_cache import LRUCache
+from tenants import Tenant, TenantPool, tenants_root
+from static_files import StaticFileCache, parse_range, send_file
+from metrics import REGISTRY
+from nightly import schedule_nightly
+import tracing
+from tracing import span
 
 BASE_PATH = os.path.dirname(os.path.abspath(__file__))
-dm = DataManager(BASE_PATH)
+
+# Parsed JSON files (path -> data), validated by mtime/size and bounded by
+# approximate memory; shared by read_json_cached and the DataManager
+_json_cache = LRUCache(max_bytes=32 * 1024 * 1024, max_entries=1024)
+
+# The server owner's data (requests without a user); dm is its DataManager
+_default_tenant = Tenant("default", BASE_PATH, cache=_json_cache)
+dm = _default_tenant.dm
+
+# Team members: /u/<user>/... or an X-User header selects <tenants root>/<user>/ (see tenants_root)
+_tenants = TenantPool(tenants_root(BASE_PATH), kb_path=dm.kb_path)
+_USER_HEADER = 'X-User'
+_USER_PREFIX_RE = re.compile(r'^/u/([^/]+)(/.*)?$')
+
+# Single writer for all mutations (coalesces bursts of habit toggles)
+_write_queue = WriteQueue(on_flush=dm.bump_data_version)
+
+# Pre-fork mode (--workers N): set in each worker process
+_multiprocess = False
+_WRITE_LOCK_PATH = os.path.join(BASE_PATH, 'data', '.write.lock')
+
+# Largest POST body accepted by the API
+_MAX_BODY_BYTES = 64 * 1024
 
 # Thread pool for parallel file reads
 _executor = ThreadPoolExecutor(max_workers=4)
 
-# Simple caching for wisdom data (cached by date)
-_wisdom_cache = {}
-_wisdom_cache_date = None
+# Entity tags in an If-None-Match list (opaque part, without any W/ prefix)
+_ETAG_RE = re.compile(r'(?:W/)?("[^"]*")')
+
+# Gzipped bodies of recent ETagged responses (etag -> bytes); shared by request threads
+_gzip_cache = LRUCache(max_bytes=8 * 1024 * 1024, max_entries=16)
+
+# Bodies above this size are gzipped at a faster level (ratio differs by ~5%)
+_GZIP_FAST_THRESHOLD = 64 * 1024
+
+# Compiled knowledge-base bundle (see src/kb_bundle.py): {"manifest", "body", "gzip"},
+# replaced whole by rebuild_kb_bundle when the KB watch reloads the sources
+_kb_state = None
+_kb_lock = threading.Lock()
+_KB_BUILD_LOCK_PATH = os.path.join(BASE_PATH, 'data', '.kb_build.lock')
+_KB_BUNDLE_RE = re.compile(r'^/api/kb/bundle/(masters\.[0-9a-f]+\.json)$')
+
+# Planning files: filename -> response key
+_PLANNING_FILES = {
+    'vision.json': 'vision',
+    'quarterly_okrs.json': 'quarterlyokrs',
+    'weekly_plans.json': 'weeklyplans',
+}
+
+# Knowledge-base modules the dashboard loads (dashboard key -> file)
+_DASHBOARD_MASTERS = {
+    'money': 'money_masters.json',
+    'sales': 'sales_masters.json',
+    'finance': 'finance_masters.json',
+    'productivity': 'productivity_masters.json',
+    'business': 'business_masters.json',
+    'mindset': 'mindset_masters.json',
+    'social': 'social_masters.json',
+    'dating': 'social_masters.json',
+    'lifestyle': 'lifestyle_masters.json',
+    'health': 'health_masters.json',
+}
 
-# File read cache (path -> (mtime, data))
-_file_cache = {}
+# Open fds + stat results for static assets (served with os.sendfile)
+_static_files = StaticFileCache()
+
+# Metrics (exposed at /metrics; SELF_MASTERY_METRICS=0 disables collection)
+_HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total", "HTTP requests handled", ("method", "route", "status")
+)
+_HTTP_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds", "HTTP request handling latency", ("method", "route")
+)
+_RESPONSE_BYTES = REGISTRY.counter(
+    "http_response_bytes_total", "Response body bytes written", ("route",)
+)
+_CACHE_REQUESTS = REGISTRY.counter(
+    "cache_requests_total", "In-process cache lookups", ("cache", "result")
+)
+_GZIP_SECONDS = REGISTRY.histogram("gzip_seconds", "Time spent gzip-compressing responses")
+_CACHE_ENTRIES = REGISTRY.gauge("cache_entries", "Entries held by in-process caches", ("cache",))
+_CACHE_ENTRIES.set_function(lambda: len(_json_cache), cache="file")
+_CACHE_ENTRIES.set_function(lambda: len(_gzip_cache), cache="gzip")
+_CACHE_ENTRIES.set_function(lambda: _static_files.stats()["open_files"], cache="static")
+_CACHE_BYTES = REGISTRY.gauge("json_cache_bytes", "Approximate size of cached parsed JSON")
+_CACHE_BYTES.set_function(lambda: _json_cache.bytes)
+_CACHE_EVICTIONS = REGISTRY.gauge("json_cache_evictions", "Entries evicted from the JSON cache")
+_CACHE_EVICTIONS.set_function(lambda: _json_cache.stats()["evictions"])
+_TENANT_REQUESTS = REGISTRY.counter(
+    "tenant_requests_total", "Requests per user (default = server owner)", ("tenant",)
+)
+_TENANT_POOL = REGISTRY.gauge("tenant_pool", "Live tenant pool state", ("stat",))
+for _stat in ("tenants", "loads", "evictions", "cache_bytes"):
+    _TENANT_POOL.set_function(lambda stat=_stat: _tenants.stats()[stat], stat=_stat)
+
+# Request tracing (SELF_MASTERY_TRACE* env vars; X-Trace: 1 only with
+# SELF_MASTERY_TRACE_REQUESTS=1; see src/tracing.py)
+_tracer = tracing.Tracer.from_env(os.path.join(BASE_PATH, 'logs', 'traces.jsonl'))
+
+# API routes reported under their own label; everything else is grouped
+_API_ROUTES = frozenset((
+    '/api/data', '/api/wisdom', '/api/habits', '/api/planning', '/api/bootstrap',
+    '/api/masters', '/api/search', '/api/connections', '/api/kb/manifest', '/api/stats', '/api/metrics',
+    '/metrics',
+))
+
+# Static files the dashboard loads (paths under BASE_PATH). Nothing else is
+# served: user data, tenants, logs and build output live in the same tree
+_STATIC_FILES = frozenset(('/dashboard.html', '/manifest.json', '/sw.js', '/data/masters-data.js'))
+_STATIC_DIRS = frozenset(('/icons',))
 
 # MIME type overrides for common static files
 _MIME_TYPES = {
@@ -45,18 +168,307 @@ _MIME_TYPES = {
 }
 
 
-def read_json_cached(filepath):
-    """Read a JSON file with mtime-based caching."""
+def read_json_cached(filepath, cache=None):
+    """Read a JSON file through an mtime/size-validated LRU (default: the shared one)."""
+    cache = _json_cache if cache is None else cache
     try:
-        mtime = os.path.getmtime(filepath)
-        if filepath in _file_cache and _file_cache[filepath][0] == mtime:
-            return _file_cache[filepath][1]
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        _file_cache[filepath] = (mtime, data)
+        st = os.stat(filepath)
+        stamp = (st.st_mtime_ns, st.st_size)
+        data = cache.get(filepath, stamp)
+        if data is not None:
+            _CACHE_REQUESTS.inc(cache="file", result="hit")
+            return data
+        with span("read", file=os.path.basename(filepath)):
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        cache.put(filepath, data, stamp)
+        _CACHE_REQUESTS.inc(cache="file", result="miss")
         return data
     except (OSError, json.JSONDecodeError):
+        _CACHE_REQUESTS.inc(cache="file", result="error")
+        return None
+
+
+def _reject_constant(name):
+    """json parse_constant hook: NaN and +/-Infinity are not JSON."""
+    raise ValueError(f"{name} is not valid JSON")
+
+
+def static_path(route):
+    """Filesystem path of the allowlisted static file for ``route``, or None."""
+    route = posixpath.normpath(unquote(route))
+    if '\x00' in route:
+        return None
+    if route not in _STATIC_FILES and posixpath.dirname(route) not in _STATIC_DIRS:
         return None
+    return os.path.join(BASE_PATH, *route.split('/')[1:])
+
+
+def route_label(route):
+    """Bounded metrics label for a request path."""
+    if route in _API_ROUTES:
+        return route
+    if route.startswith('/api/kb/bundle/'):
+        return '/api/kb/bundle'
+    if route.startswith('/api/'):
+        return '/api/other'
+    if route.startswith('/data/') and route.endswith('.json'):
+        return '/data/*.json'
+    return 'static'
+
+
+def record_bytes(route, nbytes):
+    """Count response body bytes served for a route."""
+    _RESPONSE_BYTES.inc(nbytes, route=route)
+
+
+def gzip_bytes(body, level=6):
+    """Gzip-compress a response body."""
+    with _GZIP_SECONDS.time(), span("compress", bytes=len(body), level=level):
+        buf = io.BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=level) as gz:
+            gz.write(body)
+        return buf.getvalue()
+
+
+def load_planning(tenant=None):
+    """Read all planning files in parallel."""
+    tenant = tenant or _default_tenant
+    names = list(_PLANNING_FILES)
+    futures = [
+        _executor.submit(
+            tracing.bind(read_json_cached), str(tenant.dm.data_path / name), tenant.cache
+        )
+        for name in names
+    ]
+    return {
+        _PLANNING_FILES[name]: data
+        for name, data in zip(names, (f.result() for f in futures))
+        if data is not None
+    }
+
+
+def build_dashboard_data(tenant=None):
+    """Assemble the /api/data payload."""
+    dm = (tenant or _default_tenant).dm
+    profile = dm.get_user_profile() or {}
+    habits_data = dm.get_habits()
+    stats = dm.get_stats()
+    goals = dm.get_goals()
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    today_log = dm.get_daily_log(today) or {}
+
+    today_completions = set(habits_data.get("completions", {}).get(today, []))
+    habits_list = [
+        {
+            "id": h["id"],
+            "name": h["name"],
+            "module": h.get("module", "productivity"),
+            "streak": h.get("current_streak", 0),
+            "completed": h["id"] in today_completions
+        }
+        for h in habits_data.get("habits", [])
+    ]
+
+    return {
+        "profile": {
+            "name": profile.get("name", "Boss"),
+            "coaching_style": profile.get("coaching_style", "direct"),
+            "focus_modules": profile.get("focus_modules", [])
+        },
+        "habits": habits_list,
+        "modules": profile.get("module_levels", {}),
+        "goals": goals.get("quarterly_goals", {}),
+        "stats": {
+            "dayStreak": stats.get("total_days_logged", 0),
+            "deepWorkHours": stats.get("total_deep_work_hours", 0),
+            "habitCompletion": round(stats.get("habit_completion_rate", 0)),
+            "avgScore": round(stats.get("avg_day_score", 0), 1)
+        },
+        "todayLog": {
+            "hasAM": bool(today_log.get("am_checkin")),
+            "hasPM": bool(today_log.get("pm_reflection")),
+            "priorities": today_log.get("am_checkin", {}).get("top_3_priorities", []),
+            "energy": today_log.get("am_checkin", {}).get("energy_level", 0)
+        },
+        "version": dm.get_data_version()
+    }
+
+
+def get_daily_wisdom(tenant=None):
+    """Today's wisdom package (cached per user by date)."""
+    tenant = tenant or _default_tenant
+    today = datetime.now().strftime("%Y-%m-%d")
+    if tenant.wisdom_date == today and tenant.wisdom:
+        _CACHE_REQUESTS.inc(cache="wisdom", result="hit")
+        return tenant.wisdom
+    _CACHE_REQUESTS.inc(cache="wisdom", result="miss")
+
+    tenant.wisdom = WisdomEngine(tenant.dm, tenant.user_id).get_daily_wisdom()
+    tenant.wisdom_date = today
+    return tenant.wisdom
+
+
+@contextmanager
+def interprocess_lock(path):
+    """Exclusive flock on ``path`` so worker processes take turns."""
+    import fcntl
+    with open(path, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def interprocess_write_lock():
+    """Exclusive flock on data/.write.lock so worker processes serialize writes."""
+    return interprocess_lock(_WRITE_LOCK_PATH)
+
+
+def sync_data_version(tenant=None):
+    """Drop derived caches after another process bumped ``tenant``'s data version.
+
+    Each tenant tracks its own version file (see Tenant.sync_version); the
+    gzip cache is process-wide, so any change clears it.
+    """
+    if (tenant or _default_tenant).sync_version():
+        _gzip_cache.clear()
+
+
+def shared_kb():
+    """The process-wide KnowledgeBase behind wisdom, search and connections."""
+    return KnowledgeBase.shared(os.path.join(dm.kb_path, 'masters'))
+
+
+def rebuild_kb_bundle():
+    """Rebuild the KB bundle (and masters-data.js) if sources changed and swap it in.
+
+    Runs at startup and from the KB watch after each reload, never per request.
+    Workers share the build directory, so they take turns: the first rebuilds,
+    the rest find it fresh and only load it.
+    """
+    global _kb_state
+    with _kb_lock, (interprocess_lock(_KB_BUILD_LOCK_PATH) if _multiprocess else nullcontext()):
+        manifest = kb_bundle.build_all(BASE_PATH)
+        if _kb_state is None or manifest["hash"] != _kb_state["manifest"]["hash"]:
+            body = kb_bundle.load_bundle(
+                os.path.join(BASE_PATH, 'knowledge_base', 'build'), manifest
+            )
+            _kb_state = {"manifest": manifest, "body": body, "gzip": gzip_bytes(body, 9)}
+    return _kb_state
+
+
+def get_kb_bundle():
+    """Current KB bundle state; only the first call builds it (see rebuild_kb_bundle)."""
+    state = _kb_state
+    return state if state is not None else rebuild_kb_bundle()
+
+    with _kb_lock:
+        if _kb_state["manifest"] is None or now - _kb_state["checked"] >= _KB_CHECK_INTERVAL:
+            manifest = kb_bundle.build_all(BASE_PATH)
+            if _kb_state["manifest"] is None or manifest["hash"] != _kb_state["manifest"]["hash"]:
+                body = kb_bundle.load_bundle(
+                    os.path.join(BASE_PATH, 'knowledge_base', 'build'), manifest
+                )
+                _kb_state.update(
+                    manifest=manifest,
+                    body=body,
+                    gzip=gzip_bytes(body, 9),
+                )
+            _kb_state["checked"] = now
+    return _kb_state
+
+
+def kb_summary():
+    """Bundle URL and per-module hashes for clients that cache the knowledge base."""
+    manifest = get_kb_bundle()["manifest"]
+    return {
+        "hash": manifest["hash"],
+        "bundle": "/api/kb/bundle/" + manifest["bundle"],
+        "modules": {m: info["hash"] for m, info in manifest["modules"].items()},
+    }
+
+
+def etag_matches(header, tag):
+    """True if an If-None-Match ``header`` is ``*`` or lists ``tag`` (weak comparison)."""
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    opaque = tag[2:] if tag.startswith('W/') else tag
+    return opaque in _ETAG_RE.findall(header)
+
+
+def bootstrap_etag(exclude=(), tenant=None):
+    """ETag of build_bootstrap(exclude, tenant), derived without building it.
+
+    Covers the tenant's data version and the mtimes of its data and log
+    directories (every write replaces a file, see DataManager._write_json),
+    the KB generation and bundle, today's date and ``exclude``.
+    """
+    tenant = tenant or _default_tenant
+    stamps = []
+    for path in (tenant.dm.data_path, tenant.dm.logs_path):
+        try:
+            stamps.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamps.append(None)
+    key = repr((
+        tenant.user_id, tenant.dm.get_data_version(), stamps,
+        shared_kb().generation, get_kb_bundle()["manifest"]["hash"],
+        datetime.now().strftime("%Y-%m-%d"), sorted(exclude),
+    ))
+    return 'W/"' + hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest() + '"'
+
+
+def build_bootstrap(exclude=(), tenant=None):
+    """Assemble everything the dashboard needs for first paint with parallel reads.
+
+    ``exclude`` names top-level sections to omit (e.g. ``masters`` when the
+    client already has the knowledge base cached).
+    """
+    tenant = tenant or _default_tenant
+    jobs = {}
+    if 'data' not in exclude:
+        jobs['data'] = _executor.submit(tracing.bind(build_dashboard_data), tenant)
+    if 'wisdom' not in exclude:
+        jobs['wisdom'] = _executor.submit(tracing.bind(get_daily_wisdom), tenant)
+    if 'planning' not in exclude:
+        for name in _PLANNING_FILES:
+            jobs['planning:' + name] = _executor.submit(
+                tracing.bind(read_json_cached), str(tenant.dm.data_path / name), tenant.cache
+            )
+    if 'masters' not in exclude:
+        for filename in set(_DASHBOARD_MASTERS.values()):
+            jobs['masters:' + filename] = _executor.submit(
+                tracing.bind(read_json_cached),
+                os.path.join(BASE_PATH, 'knowledge_base', 'masters', filename)
+            )
+
+    results = {key: future.result() for key, future in jobs.items()}
+
+    payload = {}
+    if 'data' in results:
+        payload['data'] = results['data']
+    if 'wisdom' in results:
+        payload['wisdom'] = results['wisdom']
+    if 'planning' not in exclude:
+        payload['planning'] = {
+            key: results['planning:' + name]
+            for name, key in _PLANNING_FILES.items()
+            if results['planning:' + name] is not None
+        }
+    if 'kb' not in exclude:
+        payload['kb'] = kb_summary()
+    if 'masters' not in exclude:
+        payload['masters'] = {
+            key: results['masters:' + filename]
+            for key, filename in _DASHBOARD_MASTERS.items()
+            if results['masters:' + filename] is not None
+        }
+    return payload
 
 
 class DashboardHandler(SimpleHTTPRequestHandler):
@@ -66,39 +478,198 @@ class DashboardHandler(SimpleHTTPRequestHandler):
     def log_message(self, format, *args):
         pass
 
+    def send_response(self, code, message=None):
+        self.status = code
+        super().send_response(code, message)
+
+    def _observe(self, handler):
+        """Run a request handler, recording its latency, status and (if traced) spans."""
+        self.trace = _tracer.start(
+            f"{self.command} {self.path}",
+            requested=self.headers.get(tracing.TRACE_HEADER) == '1',
+        )
+        if not REGISTRY.enabled and self.trace is None:
+            if self._resolve_tenant():
+                if _multiprocess:
+                    sync_data_version(self.tenant)
+                with shared_kb().pin():
+                    handler()
+            return
+        self.status = 0
+        start = time.perf_counter()
+        try:
+            if self._resolve_tenant():
+                _TENANT_REQUESTS.inc(tenant=self.tenant.user_id)
+                if _multiprocess:
+                    sync_data_version(self.tenant)
+                with shared_kb().pin():  # finish on this KB generation even if a reload lands
+                    handler()
+        finally:
+            label = route_label(getattr(self, 'route', ''))
+            _HTTP_SECONDS.observe(time.perf_counter() - start, method=self.command, route=label)
+            _HTTP_REQUESTS.inc(method=self.command, route=label, status=str(self.status))
+            if self.trace is not None:
+                _tracer.finish(self.trace)
+
+    def _resolve_tenant(self):
+        """Select the user's tenant from a /u/<user> prefix (stripped) or the X-User header.
+
+        Sends a 404 and returns False for unknown users.
+        """
+        user = self.headers.get(_USER_HEADER)
+        match = _USER_PREFIX_RE.match(urlsplit(self.path).path)
+        if match:
+            user = match.group(1)
+            if match.group(2) is None:
+                # /u/alice -> /u/alice/ so relative asset URLs stay under the prefix
+                self.route = ''
+                self.send_response(301)
+                self.send_header('Location', match.group(0) + '/' + self.path[len(match.group(0)):])
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return False
+            self.path = match.group(2) + self.path[len(match.group(0)):]
+        if user is None:
+            self.tenant = _default_tenant
+            return True
+        self.tenant = _tenants.get(user)
+        if self.tenant is None:
+            self.route = ''
+            self.send_error(404, "Unknown user")
+            return False
+        return True
+
     def do_GET(self):
-        if self.path == '/' or self.path == '/dashboard':
-            self.path = '/dashboard.html'
-        elif self.path == '/api/data':
+        self._observe(self._handle_get)
+
+    def do_HEAD(self):
+        self._observe(self._handle_head)
+
+    def do_POST(self):
+        self._observe(self._handle_post)
+
+    def _handle_get(self):
+        url = urlsplit(self.path)
+        route = self.route = url.path
+        self.query = parse_qs(url.query)
+
+        if route == '/' or route == '/dashboard':
+            self.path = self.route = '/dashboard.html'
+        elif route == '/api/data':
             self.send_api_data()
             return
-        elif self.path == '/api/wisdom':
+        elif route == '/api/wisdom':
             self.send_wisdom()
             return
-        elif self.path == '/api/habits':
+        elif route == '/api/habits':
             self.send_habits()
             return
-        elif self.path == '/api/planning':
+        elif route == '/api/planning':
             self.send_planning_data()
             return
-        elif self.path.startswith('/data/') and self.path.endswith('.json'):
+        elif route == '/api/bootstrap':
+            self.send_bootstrap()
+            return
+        elif route == '/api/masters':
+            self.send_masters()
+            return
+        elif route == '/api/search':
+            self.send_search()
+            return
+        elif route == '/api/connections':
+            self.send_connections()
+            return
+        elif route == '/api/kb/manifest':
+            self.send_json(kb_summary(), etag=True)
+            return
+        elif route.startswith('/api/kb/bundle/'):
+            self.send_kb_bundle(route)
+            return
+        elif route == '/api/stats':
+            self.send_server_stats()
+            return
+        elif route == '/metrics':
+            self.send_metrics()
+            return
+        elif route.startswith('/data/') and route.endswith('.json'):
             self.serve_data_file()
             return
 
-        return super().do_GET()
+        self.serve_static()
+
+    def _handle_head(self):
+        self.route = urlsplit(self.path).path
+        if self.route == '/' or self.route == '/dashboard':
+            self.path = self.route = '/dashboard.html'
+        if self.route.startswith('/api/'):
+            self.send_error(405, "Method not allowed")
+            return
+        self.serve_static(head=True)
+
+    def _handle_post(self):
+        self.route = urlsplit(self.path).path
+        if self.route == '/api/habits':
+            self.toggle_habit()
+        elif self.route == '/api/metrics':
+            self.log_metric()
+        else:
+            self.send_error(404, "Not found")
 
     def _accepts_gzip(self):
         return 'gzip' in self.headers.get('Accept-Encoding', '')
 
+    def _read_json_body(self):
+        """Read and parse a JSON request body. Sends an error and returns None if invalid."""
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = -1
+        if length < 0 or length > _MAX_BODY_BYTES:
+            self.send_error(413, "Request body too large")
+            return None
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}', parse_constant=_reject_constant)
+        except ValueError:  # JSONDecodeError, UnicodeDecodeError or a rejected constant
+            self.send_error(400, "Invalid JSON")
+            return None
+        if not isinstance(body, dict):
+            self.send_error(400, "Expected a JSON object")
+            return None
+        return body
+
+    def _query_limit(self, default, maximum):
+        """Parse ?limit= (``default`` if absent). Sends a 400 and returns None if invalid."""
+        raw = self.query.get('limit', [''])[0]
+        if not raw:
+            return default
+        try:
+            limit = int(raw)
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= maximum:
+            self.send_error(400, f"limit must be an integer from 1 to {maximum}")
+            return None
+        return limit
+
+    def _wait_for_write(self, future):
+        """Wait for a queued write. Returns (result, version) or None after sending an error."""
+        try:
+            return future.result(timeout=10)
+        except (KeyError, ValueError) as e:
+            self.send_error(400, str(e).strip("'\""))
+        except Exception:
+            self.send_error(500, "Write failed")
+        return None
+
     def serve_data_file(self):
         """Serve JSON files from the data directory with caching."""
-        filename = self.path.split('/data/')[-1]
+        filename = urlsplit(self.path).path.split('/data/')[-1]
         # Sanitize path to prevent directory traversal
         if '..' in filename or '/' in filename:
             self.send_error(403, "Forbidden")
             return
-        filepath = os.path.join(BASE_PATH, 'data', filename)
-        data = read_json_cached(filepath)
+        filepath = str(self.tenant.dm.data_path / filename)
+        data = read_json_cached(filepath, self.tenant.cache)
         if data is not None:
             self.send_json(data, cache_seconds=60)
         else:
@@ -106,23 +677,32 @@ class DashboardHandler(SimpleHTTPRequestHandler):
 
     def send_planning_data(self):
         """Send all planning data in parallel."""
-        filenames = ['vision.json', 'quarterly_okrs.json', 'weekly_plans.json']
-        filepaths = [os.path.join(BASE_PATH, 'data', f) for f in filenames]
-        keys = [f.replace('.json', '').replace('_', '') for f in filenames]
+        self.send_json(load_planning(self.tenant), cache_seconds=30)
+
+    def _send_not_modified(self, tag):
+        """Send a 304 if the request's If-None-Match matches ``tag``. Returns True if sent."""
+        if not etag_matches(self.headers.get('If-None-Match'), tag):
+            return False
+        self.send_response(304)
+        self.send_header('ETag', tag)
+        self.end_headers()
+        return True
 
-        # Read all files in parallel
-        futures = [_executor.submit(read_json_cached, fp) for fp in filepaths]
-        planning = {}
-        for key, future in zip(keys, futures):
-            data = future.result()
-            if data is not None:
-                planning[key] = data
+    def send_json(self, data, cache_seconds=0, etag=False):
+        """Send JSON response with optional gzip, cache headers and ETag revalidation.
 
-        self.send_json(planning, cache_seconds=30)
+        ``etag``: True to tag the serialized body, or a precomputed tag.
+        """
+        tag = etag if isinstance(etag, str) else None
+        if tag and self._send_not_modified(tag):
+            return
+        with span("serialize"):
+            body = json.dumps(data, separators=(',', ':')).encode('utf-8')
 
-    def send_json(self, data, cache_seconds=0):
-        """Send JSON response with optional gzip and cache headers."""
-        body = json.dumps(data, separators=(',', ':')).encode('utf-8')
+        if etag is True:
+            tag = 'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+            if self._send_not_modified(tag):
+                return
 
         self.send_response(200)
         self.send_header('Content-Type', 'application/json; charset=utf-8')
@@ -132,116 +712,520 @@ class DashboardHandler(SimpleHTTPRequestHandler):
             self.send_header('Cache-Control', f'public, max-age={cache_seconds}')
         else:
             self.send_header('Cache-Control', 'no-cache')
+        if tag:
+            self.send_header('ETag', tag)
+            self.send_header('Vary', 'Accept-Encoding')
 
         # Gzip if client supports it and body is large enough
         if self._accepts_gzip() and len(body) > 512:
-            buf = io.BytesIO()
-            with gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=6) as gz:
-                gz.write(body)
-            body = buf.getvalue()
+            compressed = _gzip_cache.get(tag) if tag else None
+            if compressed is None:
+                level = 4 if len(body) > _GZIP_FAST_THRESHOLD else 6
+                compressed = gzip_bytes(body, level)
+                if tag:
+                    _gzip_cache.put(tag, compressed, size=len(compressed))
+            body = compressed
             self.send_header('Content-Encoding', 'gzip')
 
         self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(body)
+        with span("write", bytes=len(body)):
+            self.wfile.write(body)
+        record_bytes(self.route, len(body))
 
-    def send_api_data(self):
-        """Send all dashboard data."""
-        profile = dm.get_user_profile() or {}
-        habits_data = dm.get_habits()
-        stats = dm.get_stats()
-        goals = dm.get_goals()
+    def serve_static(self, head=False):
+        """Serve an allowlisted static file via the fd cache with sendfile,
+        conditional GET and Range (see static_path); anything else is a 404.
+        """
+        path = static_path(urlsplit(self.path).path)
+        entry = _static_files.open(path) if path is not None else None
+        if entry is None:
+            self.send_error(404, "File not found")
+            return
+        try:
+            self._send_static_entry(entry, head)
+        finally:
+            entry.release()
 
-        today = datetime.now().strftime("%Y-%m-%d")
-        today_log = dm.get_daily_log(today) or {}
+    def _send_static_entry(self, entry, head):
+        # Conditional requests: ETag first, then Last-Modified
+        inm = self.headers.get('If-None-Match')
+        if etag_matches(inm, entry.etag) or \
+                (not inm and self.headers.get('If-Modified-Since') == entry.last_modified):
+            self.send_response(304)
+            self.send_header('ETag', entry.etag)
+            self.end_headers()
+            return
 
-        today_completions = set(habits_data.get("completions", {}).get(today, []))
-        habits_list = [
-            {
-                "id": h["id"],
-                "name": h["name"],
-                "module": h.get("module", "productivity"),
-                "streak": h.get("current_streak", 0),
-                "completed": h["id"] in today_completions
-            }
-            for h in habits_data.get("habits", [])
-        ]
-
-        data = {
-            "profile": {
-                "name": profile.get("name", "Boss"),
-                "coaching_style": profile.get("coaching_style", "direct"),
-                "focus_modules": profile.get("focus_modules", [])
-            },
-            "habits": habits_list,
-            "modules": profile.get("module_levels", {}),
-            "goals": goals.get("quarterly_goals", {}),
-            "stats": {
-                "dayStreak": stats.get("total_days_logged", 0),
-                "deepWorkHours": stats.get("total_deep_work_hours", 0),
-                "habitCompletion": round(stats.get("habit_completion_rate", 0)),
-                "avgScore": round(stats.get("avg_day_score", 0), 1)
+        start, end = 0, entry.size - 1
+        status = 200
+        if_range = self.headers.get('If-Range')
+        if not if_range or if_range in (entry.etag, entry.last_modified):
+            try:
+                byte_range = parse_range(self.headers.get('Range', ''), entry.size)
+            except ValueError:
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{entry.size}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            if byte_range is not None:
+                start, end = byte_range
+                status = 206
+
+        ext = os.path.splitext(entry.path)[1].lower()
+        length = max(end - start + 1, 0)
+        self.send_response(status)
+        self.send_header('Content-Type', _MIME_TYPES.get(ext) or self.guess_type(entry.path))
+        self.send_header('Content-Length', str(length))
+        self.send_header('Last-Modified', entry.last_modified)
+        self.send_header('ETag', entry.etag)
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Cache-Control', 'no-cache')
+        if status == 206:
+            self.send_header('Content-Range', f'bytes {start}-{end}/{entry.size}')
+        self.end_headers()
+
+        if not head and length:
+            self.wfile.flush()
+            with span("write", bytes=length):
+                sent = send_file(self.connection, entry, start, length)
+            record_bytes(self.route, sent)
+
+    def send_server_stats(self):
+        """Send bytes served per route and cache statistics."""
+        route_bytes = {key[0]: n for key, n in sorted(_RESPONSE_BYTES.values().items())}
+        self.send_json({
+            "bytes_served": route_bytes,
+            "static_files": _static_files.stats(),
+            "json_cache": _json_cache.stats(),
+            "tenants": _tenants.stats(),
+            "knowledge_base": {
+                "generation": shared_kb().generation,
+                "errors": shared_kb().errors(),
+                "last_reload_error": shared_kb().last_error,
             },
-            "todayLog": {
-                "hasAM": bool(today_log.get("am_checkin")),
-                "hasPM": bool(today_log.get("pm_reflection")),
-                "priorities": today_log.get("am_checkin", {}).get("top_3_priorities", []),
-                "energy": today_log.get("am_checkin", {}).get("energy_level", 0)
-            }
-        }
+        })
+
+    def send_metrics(self):
+        """Send all metrics in the Prometheus text exposition format."""
+        if not REGISTRY.enabled:
+            self.send_error(404, "Metrics disabled")
+            return
+        body = REGISTRY.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
 
+    def send_api_data(self):
+        """Send all dashboard data."""
+        with span("compute"):
+            data = build_dashboard_data(self.tenant)
         self.send_json(data)
 
     def send_wisdom(self):
         """Send wisdom data (cached by date)."""
-        global _wisdom_cache, _wisdom_cache_date
+        with span("compute"):
+            wisdom = get_daily_wisdom(self.tenant)
+        self.send_json(wisdom, cache_seconds=3600)
 
-        today = datetime.now().strftime("%Y-%m-%d")
+    def send_bootstrap(self):
+        """Send the first-paint bundle: data, wisdom, planning and masters.
+
+        ``?exclude=masters,wisdom`` drops sections the client already has.
+        Responses carry an ETag (see bootstrap_etag), so revalidating an
+        unchanged payload answers 304 without building it.
+        """
+        exclude = set()
+        for value in self.query.get('exclude', []):
+            exclude.update(part.strip() for part in value.split(',') if part.strip())
+        tag = bootstrap_etag(exclude, self.tenant)
+        if self._send_not_modified(tag):
+            return
+        with span("compute"):
+            payload = build_bootstrap(exclude, self.tenant)
+        self.send_json(payload, etag=tag)
+
+    def send_masters(self):
+        """Send a page of masters from the shared knowledge base's index.
+
+        Query: ?module=<name>&fields=name,expertise|*&limit=<n>&cursor=<next_cursor>
+        """
+        q = lambda key: self.query.get(key, [None])[0]
+        fields = [f for f in (q('fields') or '').split(',') if f.strip()]
+        limit = self._query_limit(20, MAX_PAGE_SIZE)
+        if limit is None:
+            return
+        try:
+            page = shared_kb().masters_index().query(
+                module=q('module'),
+                fields=[f.strip() for f in fields],
+                limit=limit,
+                cursor=q('cursor'),
+            )
+        except ValueError as e:
+            self.send_error(400, str(e))
+            return
+        self.send_json(page, cache_seconds=60, etag=True)
+
+    def send_search(self):
+        """Send BM25-ranked teachings from the shared knowledge base.
+
+        Query: ?q=<text>&module=<name>[,<name>...]&limit=<n>
+        """
+        q = lambda key: self.query.get(key, [None])[0]
+        text = (q('q') or '').strip()
+        if not text:
+            self.send_error(400, "Missing query parameter q")
+            return
+        modules = [m.strip() for m in (q('module') or '').split(',') if m.strip()]
+        limit = self._query_limit(10, MAX_SEARCH_LIMIT)
+        if limit is None:
+            return
+        kb = shared_kb()
+        try:
+            with span("compute"):
+                results = kb.search(text, modules=modules, limit=limit)
+        except ValueError as e:
+            self.send_error(400, str(e))
+            return
+        self.send_json({"query": text, "results": results}, cache_seconds=60, etag=True)
+
+    def send_connections(self):
+        """Send modules related to the user's strongest ones, or a learning path.
+
+        Query: ?module=<name>&limit=<n>   (related modules, weighted by module_levels)
+               ?from=<name>&to=<name>     (shortest chain of connected modules)
+        """
+        q = lambda key: self.query.get(key, [None])[0]
+        graph = shared_kb().connection_graph()
+        try:
+            with span("compute"):
+                if q('from') or q('to'):
+                    if not (q('from') and q('to')):
+                        self.send_error(400, "Both from and to are required")
+                        return
+                    payload = {"from": q('from'), "to": q('to'),
+                               "learning_path": graph.learning_path(q('from'), q('to'))}
+                else:
+                    limit = self._query_limit(DEFAULT_RELATED, MAX_RELATED)
+                    if limit is None:
+                        return
+                    profile = self.tenant.dm.get_user_profile() or {}
+                    payload = {"module": q('module'), "related": graph.related(
+                        profile.get("module_levels", {}), k=limit, module=q('module'))}
+        except ValueError as e:
+            self.send_error(400, str(e))
+            return
+        self.send_json(payload, etag=True)
 
-        if _wisdom_cache_date == today and _wisdom_cache:
-            self.send_json(_wisdom_cache, cache_seconds=3600)
+    def send_kb_bundle(self, route):
+        """Serve the content-hashed KB bundle with immutable caching."""
+        match = _KB_BUNDLE_RE.match(route)
+        state = get_kb_bundle()
+        if not match or match.group(1) != state["manifest"]["bundle"]:
+            # Unknown or superseded hash: never cache, point at the current bundle
+            self.send_error(404, "Bundle not found")
             return
 
-        wisdom = WisdomEngine(dm)
-        daily = wisdom.get_daily_wisdom()
-        _wisdom_cache = daily
-        _wisdom_cache_date = today
-        self.send_json(daily, cache_seconds=3600)
+        use_gzip = self._accepts_gzip()
+        body = state["gzip"] if use_gzip else state["body"]
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
+        self.send_header('ETag', '"' + state["manifest"]["hash"] + '"')
+        self.send_header('Vary', 'Accept-Encoding')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        record_bytes('/api/kb/bundle', len(body))
 
     def send_habits(self):
-        """Toggle habit completion."""
-        self.send_json({"status": "ok"})
+        """Send habits with today's completion state."""
+        dm = self.tenant.dm
+        habits_data = dm.get_habits()
+        today = datetime.now().strftime("%Y-%m-%d")
+        today_completions = set(habits_data.get("completions", {}).get(today, []))
+
+        self.send_json({
+            "date": today,
+            "version": dm.get_data_version(),
+            "habits": [
+                {
+                    "id": h["id"],
+                    "name": h["name"],
+                    "module": h.get("module", "productivity"),
+                    "streak": h.get("current_streak", 0),
+                    "completed": h["id"] in today_completions
+                }
+                for h in habits_data.get("habits", [])
+            ]
+        })
+
+    def toggle_habit(self):
+        """Toggle (or explicitly set) a habit's completion via the write queue.
+
+        Body: {"habit_id": str, "date": "YYYY-MM-DD"?, "completed": bool?}
+        Omitting "completed" flips the current state.
+        """
+        body = self._read_json_body()
+        if body is None:
+            return
+
+        habit_id = body.get("habit_id")
+        if not isinstance(habit_id, str) or not habit_id:
+            self.send_error(400, "habit_id is required")
+            return
+        date = body.get("date") or datetime.now().strftime("%Y-%m-%d")
+        try:
+            datetime.strptime(date, "%Y-%m-%d")
+        except (TypeError, ValueError):
+            self.send_error(400, "date must be YYYY-MM-DD")
+            return
+        completed = body.get("completed")
+        if completed is not None and not isinstance(completed, bool):
+            self.send_error(400, "completed must be true, false or null")
+            return
+        dm = self.tenant.dm
+
+        def mutate(habits_data):
+            if not any(h["id"] == habit_id for h in habits_data.get("habits", [])):
+                raise KeyError(f"Unknown habit: {habit_id}")
+            target = completed
+            if target is None:
+                target = habit_id not in habits_data.get("completions", {}).get(date, [])
+            habit = dm.apply_habit_completion(habits_data, habit_id, date, target)
+            return {
+                "habit_id": habit_id,
+                "date": date,
+                "completed": target,
+                "streak": habit.get("current_streak", 0),
+                "best_streak": habit.get("best_streak", 0)
+            }
+
+        outcome = self._wait_for_write(
+            _write_queue.submit(f"{self.tenant.user_id}:habits",
+                                lambda: dm.get_habits(private=True), dm.save_habits,
+                                mutate, flush=dm.bump_data_version)
+        )
+        if outcome is None:
+            return
+        result, version = outcome
+        self.send_json({"status": "ok", **result, "version": version})
+
+    def log_metric(self):
+        """Set (or add to) a daily metric via the write queue.
+
+        Body: {"metric": str, "value": number, "date": "YYYY-MM-DD"?, "add": bool?}
+        """
+        body = self._read_json_body()
+        if body is None:
+            return
+
+        metric = body.get("metric")
+        value = body.get("value")
+        if metric not in DAILY_METRICS:
+            self.send_error(400, f"metric must be one of: {', '.join(DAILY_METRICS)}")
+            return
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            self.send_error(400, "value must be a number")
+            return
+        date = body.get("date") or datetime.now().strftime("%Y-%m-%d")
+        try:
+            datetime.strptime(date, "%Y-%m-%d")
+        except (TypeError, ValueError):
+            self.send_error(400, "date must be YYYY-MM-DD")
+            return
+        add = bool(body.get("add", False))
+        dm = self.tenant.dm
+
+        outcome = self._wait_for_write(_write_queue.submit(
+            f"{self.tenant.user_id}:log:{date}",
+            lambda: dm.get_or_create_daily_log(date, private=True),
+            lambda log: dm.save_daily_log(log, date),
+            lambda log: dm.apply_metric(log, metric, value, add),
+            flush=dm.bump_data_version
+        ))
+        if outcome is None:
+            return
+        new_value, version = outcome
+        self.send_json({
+            "status": "ok",
+            "metric": metric,
+            "value": new_value,
+            "date": date,
+            "version": version
+        })
 
     def end_headers(self):
-        """Add security and performance headers."""
+        """Add security and performance headers (and the trace id of traced requests)."""
+        if getattr(self, 'trace', None) is not None:
+            self.send_header('X-Trace-Id', self.trace[0].id)
         self.send_header('X-Content-Type-Options', 'nosniff')
         self.send_header('Referrer-Policy', 'strict-origin-when-cross-origin')
         super().end_headers()
 
 
-def run_server(port=8080):
-    """Run the dashboard server."""
-    os.chdir(BASE_PATH)
+class WorkerHTTPServer(ThreadingHTTPServer):
+    """Listener bound with SO_REUSEPORT so every worker accepts on the same port.
+
+    Request threads are joined on close, so a stopping worker finishes
+    in-flight requests first.
+    """
+    daemon_threads = False
 
-    server = HTTPServer(('localhost', port), DashboardHandler)
-    url = f'http://localhost:{port}'
+    def server_bind(self):
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
 
+
+def print_banner(url, workers=1):
     print("\n================================================================")
     print("           SELF-MASTERY OS DASHBOARD")
     print("================================================================")
     print(f"  Server running at: {url}")
+    if workers > 1:
+        print(f"  Workers: {workers} (kill -HUP {os.getpid()} for a rolling restart)")
     print("")
     print("  Press Ctrl+C to stop the server")
     print("================================================================\n")
 
+
+def run_server(port=8080, workers=1, nightly_at=None):
+    """Run the dashboard server (pre-forking ``workers`` processes if > 1).
+
+    ``nightly_at`` (HH:MM) also runs src/nightly.py every day at that time.
+    """
+    os.chdir(BASE_PATH)
+    if nightly_at:
+        schedule_nightly(nightly_at)
+
+    if workers > 1:
+        return run_prefork(port, workers)
+
+    server = ThreadingHTTPServer(('localhost', port), DashboardHandler)
+    _write_queue.start()
+    get_kb_bundle()  # Build the KB bundle and sync masters-data.js before serving
+    # Reload edited masters files (and rebuild the bundle) off the request path
+    shared_kb().watch(on_reload=rebuild_kb_bundle)
+    WisdomEngine(dm).prefetch()
+    print_banner(f'http://localhost:{port}')
+
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         print("\nServer stopped.")
         server.shutdown()
+        _write_queue.stop()
         _executor.shutdown(wait=False)
 
 
+def run_worker(port):
+    """Worker process body: serve until SIGTERM, then drain and exit."""
+    global _multiprocess
+    _multiprocess = True
+    _write_queue.lock = interprocess_write_lock
+
+    server = WorkerHTTPServer(('localhost', port), DashboardHandler)
+    stopping = threading.Event()
+
+    def stop(signum, frame):
+        if not stopping.is_set():
+            stopping.set()
+            threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the master handles Ctrl+C
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    _write_queue.start()
+    shared_kb().watch(on_reload=rebuild_kb_bundle)
+    WisdomEngine(dm).prefetch()  # after the fork: threads do not survive it
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()  # joins in-flight request threads
+        _write_queue.stop()
+        _executor.shutdown(wait=True)
+
+
+def spawn_worker(port):
+    """Fork one worker; returns its pid in the master."""
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            run_worker(port)
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        finally:
+            os._exit(code)
+    return pid
+
+
+def run_prefork(port, workers):
+    """Master process: fork workers sharing the port, respawn crashes, roll on SIGHUP."""
+    if not hasattr(os, 'fork') or not hasattr(socket, 'SO_REUSEPORT'):
+        raise SystemExit("--workers needs os.fork and SO_REUSEPORT (Linux, macOS, BSD)")
+
+    # Build shared state once, before any worker exists
+    get_kb_bundle()
+    sync_data_version()
+
+    pids = {spawn_worker(port) for _ in range(workers)}
+    print_banner(f'http://localhost:{port}', workers)
+
+    restart = threading.Event()
+    signal.signal(signal.SIGHUP, lambda signum, frame: restart.set())
+    signal.signal(signal.SIGTERM, signal.default_int_handler)  # stop like Ctrl+C
+
+    try:
+        while True:
+            if restart.is_set():
+                restart.clear()
+                # Rolling restart: start the replacement before draining the old worker
+                for old in list(pids):
+                    pids.add(spawn_worker(port))
+                    os.kill(old, signal.SIGTERM)
+                    os.waitpid(old, 0)
+                    pids.discard(old)
+                print(f"Restarted {workers} workers.")
+                continue
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                pid = 0
+            if pid and pid in pids:
+                # A worker died unexpectedly: replace it
+                pids.discard(pid)
+                pids.add(spawn_worker(port))
+            time.sleep(0.2)
+    except KeyboardInterrupt:
+        print("\nStopping workers...")
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in pids:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        print("Server stopped.")
+
+
 if __name__ == '__main__':
-    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8080
-    run_server(port)
+    parser = argparse.ArgumentParser(description="Self-Mastery OS dashboard server")
+    parser.add_argument('port', nargs='?', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=1,
+                        help="pre-fork N worker processes sharing the port (SO_REUSEPORT)")
+    parser.add_argument('--nightly', metavar='HH:MM',
+                        help="run the nightly jobs (wisdom pre-generation, ...) daily at this time")
+    args = parser.parse_args()
+    run_server(args.port, max(1, args.workers), args.nightly)
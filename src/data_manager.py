@@ -4,15 +4,49 @@ Handles all data persistence using JSON files.
 """
 import os
 import json
+import math
+import threading
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 from pathlib import Path
+from metrics import REGISTRY
+from tracing import span
+from lru_cache import LRUCache
+
+_IO_SECONDS = REGISTRY.histogram(
+    "data_io_seconds", "DataManager JSON file read/write latency", ("op",)
+)
+_IO_ERRORS = REGISTRY.counter(
+    "data_io_errors_total", "DataManager JSON file read/write failures", ("op",)
+)
+
+# Metrics tracked in every daily log (key -> default value)
+DAILY_METRICS = {
+    "deep_work_hours": 0,
+    "workouts": 0,
+    "sales_calls": 0,
+    "social_interactions": 0,
+    "steps": 0,
+    "water_liters": 0
+}
+
+# Days of past daily wisdom packages kept in data/wisdom_cache
+WISDOM_CACHE_DAYS = 7
 
 class DataManager:
     """Manages all data storage and retrieval for Self-Mastery OS."""
 
-    def __init__(self, base_path: str = None):
-        """Initialize data manager with base path."""
+    def __init__(self, base_path: str = None, cache: Optional[LRUCache] = None,
+                 kb_path: str = None):
+        """Initialize data manager with base path.
+
+        ``cache`` (optional) holds parsed files keyed by path and validated
+        against mtime/size, so repeated reads skip disk and JSON parsing.
+        Cached results are shared between callers and must not be mutated;
+        read-modify-write paths load a private copy (``private=True``).
+        ``kb_path`` overrides ``<base_path>/knowledge_base`` so several users'
+        data directories can share one knowledge base.
+        """
         if base_path is None:
             # Default to parent directory of src
             base_path = Path(__file__).parent.parent
@@ -21,7 +55,9 @@ class DataManager:
         self.data_path = self.base_path / "data"
         self.logs_path = self.data_path / "logs"
         self.reviews_path = self.data_path / "reviews"
-        self.kb_path = self.base_path / "knowledge_base"
+        self.wisdom_cache_path = self.data_path / "wisdom_cache"
+        self.kb_path = Path(kb_path) if kb_path else self.base_path / "knowledge_base"
+        self.cache = cache
 
         # Ensure directories exist
         self._ensure_directories()
@@ -31,25 +67,57 @@ class DataManager:
         for path in [self.data_path, self.logs_path, self.reviews_path]:
             path.mkdir(parents=True, exist_ok=True)
 
-    def _read_json(self, filepath: Path) -> Optional[Dict]:
-        """Read JSON file and return data."""
+    def _read_json(self, filepath: Path, private: bool = False) -> Optional[Dict]:
+        """Read JSON file and return data.
+
+        ``private`` reads from disk past the cache, so the caller gets an
+        object nobody else holds and may modify it before saving.
+        """
         try:
             if filepath.exists():
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                stamp = None
+                if self.cache is not None and not private:
+                    st = filepath.stat()
+                    stamp = (st.st_mtime_ns, st.st_size)
+                    data = self.cache.get(str(filepath), stamp)
+                    if data is not None:
+                        return data
+                with _IO_SECONDS.time(op="read"), span("read", file=filepath.name):
+                    with open(filepath, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                if stamp is not None:
+                    self.cache.put(str(filepath), data, stamp)
+                return data
         except (json.JSONDecodeError, IOError) as e:
+            _IO_ERRORS.inc(op="read")
             print(f"Error reading {filepath}: {e}")
         return None
 
     def _write_json(self, filepath: Path, data: Dict) -> bool:
-        """Write data to JSON file."""
+        """Write data to JSON file.
+
+        The data is written to a temporary sibling that then replaces the
+        file, so concurrent readers (request threads, other server workers)
+        see the old or the new contents, never a truncated file.
+        """
+        tmp = filepath.with_name(f"{filepath.name}.{os.getpid()}.{threading.get_ident()}.tmp")
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with _IO_SECONDS.time(op="write"), span("save", file=filepath.name):
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                os.replace(tmp, filepath)
             return True
         except IOError as e:
+            _IO_ERRORS.inc(op="write")
             print(f"Error writing {filepath}: {e}")
             return False
+        finally:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass  # already renamed into place (or never created)
+            if self.cache is not None:
+                self.cache.invalidate(str(filepath))
 
     # ==================== User Profile ====================
 
@@ -68,11 +136,14 @@ class DataManager:
 
     # ==================== Daily Logs ====================
 
-    def get_daily_log(self, date: str = None) -> Optional[Dict]:
-        """Get daily log for specific date (YYYY-MM-DD format)."""
+    def get_daily_log(self, date: str = None, private: bool = False) -> Optional[Dict]:
+        """Get daily log for specific date (YYYY-MM-DD format).
+
+        ``private``: a copy to modify and save (see _read_json).
+        """
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
-        return self._read_json(self.logs_path / f"{date}.json")
+        return self._read_json(self.logs_path / f"{date}.json", private)
 
     def save_daily_log(self, log: Dict, date: str = None) -> bool:
         """Save daily log for specific date."""
@@ -82,12 +153,12 @@ class DataManager:
         log["updated_at"] = datetime.now().isoformat()
         return self._write_json(self.logs_path / f"{date}.json", log)
 
-    def get_or_create_daily_log(self, date: str = None) -> Dict:
-        """Get existing daily log or create new one."""
+    def get_or_create_daily_log(self, date: str = None, private: bool = False) -> Dict:
+        """Get existing daily log or create new one (``private``: see get_daily_log)."""
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
 
-        existing = self.get_daily_log(date)
+        existing = self.get_daily_log(date, private)
         if existing:
             return existing
 
@@ -99,14 +170,7 @@ class DataManager:
             "planned_actions": [],
             "completed_actions": [],
             "pm_reflection": None,
-            "metrics": {
-                "deep_work_hours": 0,
-                "workouts": 0,
-                "sales_calls": 0,
-                "social_interactions": 0,
-                "steps": 0,
-                "water_liters": 0
-            },
+            "metrics": dict(DAILY_METRICS),
             "habits": {},
             "notes": ""
         }
@@ -126,6 +190,10 @@ class DataManager:
 
         return logs
 
+    def get_log_dates(self) -> List[str]:
+        """Dates (YYYY-MM-DD) of every saved daily log, oldest first."""
+        return sorted(f.stem for f in self.logs_path.glob("*.json"))
+
     def get_recent_logs(self, days: int = 7) -> List[Dict]:
         """Get logs for the past N days."""
         end_date = datetime.now()
@@ -153,9 +221,9 @@ class DataManager:
 
     # ==================== Habits ====================
 
-    def get_habits(self) -> Dict:
-        """Get habits data."""
-        data = self._read_json(self.data_path / "habits.json")
+    def get_habits(self, private: bool = False) -> Dict:
+        """Get habits data (``private``: a copy to modify and save, see _read_json)."""
+        data = self._read_json(self.data_path / "habits.json", private)
         if data is None:
             data = {"habits": [], "completions": {}}
         return data
@@ -166,7 +234,7 @@ class DataManager:
 
     def add_habit(self, habit: Dict) -> bool:
         """Add a new habit."""
-        habits_data = self.get_habits()
+        habits_data = self.get_habits(private=True)
 
         # Generate unique ID
         existing_ids = [h.get("id", "") for h in habits_data["habits"]]
@@ -191,25 +259,41 @@ class DataManager:
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
 
-        habits_data = self.get_habits()
+        habits_data = self.get_habits(private=True)
+        self.apply_habit_completion(habits_data, habit_id, date, True)
+        return self.save_habits(habits_data)
 
+    def apply_habit_completion(self, habits_data: Dict, habit_id: str, date: str,
+                               completed: bool) -> Optional[Dict]:
+        """Set a habit's completion state for a date in-memory (no disk I/O).
+
+        Updates completions, total count and streaks on ``habits_data`` and
+        returns the habit dict, or None if the habit is not defined.
+        """
         # Initialize completions dict if needed
-        if "completions" not in habits_data:
-            habits_data["completions"] = {}
-        if date not in habits_data["completions"]:
-            habits_data["completions"][date] = []
-
-        # Add completion if not already recorded
-        if habit_id not in habits_data["completions"][date]:
-            habits_data["completions"][date].append(habit_id)
-
-            # Update streak for the habit
-            for habit in habits_data["habits"]:
-                if habit["id"] == habit_id:
-                    habit["total_completions"] = habit.get("total_completions", 0) + 1
+        completions = habits_data.setdefault("completions", {})
+        day = completions.setdefault(date, [])
+
+        if completed and habit_id not in day:
+            day.append(habit_id)
+            delta = 1
+        elif not completed and habit_id in day:
+            day.remove(habit_id)
+            delta = -1
+        else:
+            delta = 0
+
+        if not day:
+            del completions[date]
+
+        # Update streak for the habit
+        for habit in habits_data.get("habits", []):
+            if habit["id"] == habit_id:
+                if delta:
+                    habit["total_completions"] = max(habit.get("total_completions", 0) + delta, 0)
                     # Recalculate streak
                     completion_dates = [
-                        d for d, ids in habits_data["completions"].items()
+                        d for d, ids in completions.items()
                         if habit_id in ids
                     ]
                     habit["current_streak"] = self._calculate_streak(completion_dates)
@@ -217,9 +301,9 @@ class DataManager:
                         habit.get("best_streak", 0),
                         habit["current_streak"]
                     )
-                    break
+                return habit
 
-        return self.save_habits(habits_data)
+        return None
 
     def _calculate_streak(self, dates: List[str]) -> int:
         """Calculate current streak from dates."""
@@ -243,6 +327,80 @@ class DataManager:
 
         return streak
 
+    # ==================== Metrics ====================
+
+    def apply_metric(self, log: Dict, metric: str, value: float, add: bool = False) -> float:
+        """Set (or add to) a metric on a daily log in-memory. Returns the new value.
+
+        Raises ValueError for unknown metrics and for values (or sums) that
+        are not finite, which JSON cannot represent.
+        """
+        if metric not in DAILY_METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+
+        metrics = log.setdefault("metrics", dict(DAILY_METRICS))
+        if add:
+            value = metrics.get(metric, 0) + value
+        try:
+            finite = math.isfinite(value)
+        except OverflowError:  # an int too large for a float
+            finite = False
+        if not finite:
+            raise ValueError(f"{metric} must be a finite number")
+        metrics[metric] = value
+        return value
+
+    # ==================== Data Version ====================
+
+    def get_data_version(self) -> int:
+        """Get the current data version (bumped on every write batch)."""
+        data = self._read_json(self.data_path / "data_version.json")
+        return data.get("version", 0) if data else 0
+
+    def bump_data_version(self) -> int:
+        """Increment the data version so caches in other processes can invalidate."""
+        version = self.get_data_version() + 1
+        self._write_json(self.data_path / "data_version.json", {
+            "version": version,
+            "updated_at": datetime.now().isoformat()
+        })
+        return version
+
+    # ==================== Wisdom Cache ====================
+
+    def get_cached_wisdom(self, date: str, seed: str) -> Optional[Dict]:
+        """Get the daily wisdom package stored for ``date`` under ``seed``."""
+        data = self._read_json(self.wisdom_cache_path / f"{date}-{seed}.json")
+        return data.get("wisdom") if data and data.get("seed") == seed else None
+
+    def save_cached_wisdom(self, date: str, seed: str, wisdom: Dict) -> bool:
+        """Store a daily wisdom package (replaced atomically, see _write_json);
+        drops packages older than WISDOM_CACHE_DAYS."""
+        self.wisdom_cache_path.mkdir(parents=True, exist_ok=True)
+        filepath = self.wisdom_cache_path / f"{date}-{seed}.json"
+        if not self._write_json(filepath, {"seed": seed, "date": date, "wisdom": wisdom}):
+            return False
+
+        cutoff = (datetime.now() - timedelta(days=WISDOM_CACHE_DAYS)).strftime("%Y-%m-%d")
+        for old in self.wisdom_cache_path.glob("*.json"):
+            if old.name[:10] < cutoff and old != filepath:
+                try:
+                    old.unlink()
+                except OSError:
+                    pass
+        return True
+
+    # ==================== Reflection Teachings ====================
+
+    def get_reflection_teachings(self) -> Dict:
+        """Get the nightly reflection -> teachings matches."""
+        data = self._read_json(self.data_path / "reflection_teachings.json")
+        return data if data else {"kb": "", "reflections": {}}
+
+    def save_reflection_teachings(self, data: Dict) -> bool:
+        """Save the nightly reflection -> teachings matches."""
+        return self._write_json(self.data_path / "reflection_teachings.json", data)
+
     # ==================== Goals ====================
 
     def get_goals(self) -> Dict:
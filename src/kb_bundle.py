@@ -0,0 +1,244 @@
+"""
+Self-Mastery OS - Knowledge Base Bundle Builder
+Compiles knowledge_base/masters/*.json into one minified, content-hashed bundle
+plus a manifest of per-module hashes, and regenerates the browser's
+data/masters-data.js from the same source so the two never drift. The
+server-side snapshot (kb_snapshot) and search index (kb_search) are
+compiled in the same step.
+
+Usage:
+    python src/kb_bundle.py          # Build if sources changed
+    python src/kb_bundle.py --force  # Always rebuild
+"""
+import os
+import sys
+import json
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from kb_schema import validate_module
+from kb_search import SEARCH_NAME, build_search_index
+from kb_snapshot import SNAPSHOT_NAME, build_snapshot
+
+MANIFEST_NAME = "manifest.json"
+
+# Marker lines delimiting the generated block in masters-data.js
+JS_BEGIN = "// BEGIN GENERATED: mastersData"
+JS_END = "// END GENERATED: mastersData"
+
+# Dashboard key -> knowledge-base module, in masters-data.js order
+JS_MODULES = {
+    "money": "money",
+    "sales": "sales",
+    "mindset": "mindset",
+    "productivity": "productivity",
+    "business": "business",
+    "finance": "finance",
+    "dating": "social",
+    "lifestyle": "lifestyle",
+    "health": "health",
+}
+
+
+def _minify(data) -> bytes:
+    """Canonical compact JSON encoding."""
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def source_files(masters_path: Path) -> List[Path]:
+    """All module source files, in a stable order."""
+    return sorted(Path(masters_path).glob("*_masters.json"))
+
+
+def read_manifest(build_path: Path) -> Optional[Dict]:
+    """Read the build manifest, or None if there is no usable build."""
+    try:
+        with open(Path(build_path) / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not (Path(build_path) / manifest.get("bundle", "")).is_file():
+        return None
+    return manifest
+
+
+def bundle_is_stale(masters_path: Path, build_path: Path) -> bool:
+    """True if any source is newer than the manifest, or sources were added/removed."""
+    manifest = read_manifest(build_path)
+    if manifest is None:
+        return True
+    sources = source_files(masters_path)
+    if sorted(f.stem.replace("_masters", "") for f in sources) != sorted(manifest["modules"]):
+        return True
+    built = (Path(build_path) / MANIFEST_NAME).stat().st_mtime
+    return any(f.stat().st_mtime > built for f in sources)
+
+
+def build_bundle(masters_path: Path, build_path: Path) -> Dict:
+    """Compile all module files into ``masters.<hash>.json`` and write the manifest.
+
+    Invalid files (bad JSON or schema problems, see kb_schema) are skipped and
+    listed under ``errors`` in the manifest. Superseded bundles are left in
+    place for pages still loading them; see prune_bundles.
+    Returns the manifest.
+    """
+    masters_path, build_path = Path(masters_path), Path(build_path)
+    build_path.mkdir(parents=True, exist_ok=True)
+
+    modules = {}
+    module_info = {}
+    errors = {}
+    for file in source_files(masters_path):
+        module = file.stem.replace("_masters", "")
+        try:
+            with open(file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            errors[module] = str(e)
+            continue
+        problems = validate_module(data)
+        if problems:
+            errors[module] = "; ".join(problems)
+            continue
+        minified = _minify(data)
+        modules[module] = data
+        module_info[module] = {
+            "hash": _hash(minified),
+            "bytes": len(minified),
+            "source": file.name,
+        }
+
+    body = _minify({"modules": modules})
+    bundle_hash = _hash(body)
+    bundle_name = f"masters.{bundle_hash}.json"
+
+    # Readers (or other workers) only ever see a complete bundle
+    tmp = build_path / f"{bundle_name}.{os.getpid()}.tmp"
+    tmp.write_bytes(body)
+    os.replace(tmp, build_path / bundle_name)
+
+    manifest = {
+        "hash": bundle_hash,
+        "bundle": bundle_name,
+        "bytes": len(body),
+        "built_at": datetime.now().isoformat(),
+        "modules": module_info,
+        "errors": errors,
+    }
+    tmp = build_path / (MANIFEST_NAME + ".tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, build_path / MANIFEST_NAME)
+    return manifest
+
+
+def prune_bundles(build_path: Path, keep: str) -> List[str]:
+    """Delete every ``masters.*.json`` except ``keep``. Returns the names removed.
+
+    Run only once the manifest and masters-data.js point at ``keep``.
+    """
+    removed = []
+    for old in Path(build_path).glob("masters.*.json"):
+        if old.name != keep:
+            try:
+                old.unlink()
+            except FileNotFoundError:
+                continue  # pruned concurrently
+            removed.append(old.name)
+    return removed
+
+
+def ensure_bundle(masters_path: Path, build_path: Path, force: bool = False) -> Dict:
+    """Return the current manifest, rebuilding first if sources changed."""
+    if force or bundle_is_stale(masters_path, build_path):
+        return build_bundle(masters_path, build_path)
+    return read_manifest(build_path)
+
+
+def load_bundle(build_path: Path, manifest: Dict) -> bytes:
+    """Read the raw (minified) bundle bytes named by a manifest."""
+    return (Path(build_path) / manifest["bundle"]).read_bytes()
+
+
+def render_masters_js(modules: Dict[str, Dict], bundle_hash: str) -> str:
+    """Render the generated ``mastersData`` block for masters-data.js."""
+    dumps = lambda v: json.dumps(v, ensure_ascii=False)
+    lines = [
+        f"{JS_BEGIN} (src/kb_bundle.py, bundle {bundle_hash}) - do not edit by hand",
+        "const mastersData = {",
+    ]
+    keys = [k for k, m in JS_MODULES.items() if m in modules]
+    for i, key in enumerate(keys):
+        lines.append(f"    {key}: [")
+        masters = modules[JS_MODULES[key]].get("masters", [])
+        for j, master in enumerate(masters):
+            entry = (
+                f"        {{ name: {dumps(master.get('name', ''))}, "
+                f"expertise: {dumps(master.get('expertise', ''))}, "
+                f"principles: {dumps(master.get('key_principles', []))}, "
+                f"practices: {dumps(master.get('daily_practices', []))} }}"
+            )
+            lines.append(entry + ("," if j < len(masters) - 1 else ""))
+        lines.append("    ]" + ("," if i < len(keys) - 1 else ""))
+    lines.append("};")
+    lines.append(JS_END)
+    return "\n".join(lines)
+
+
+def write_masters_js(js_path: Path, modules: Dict[str, Dict], bundle_hash: str) -> bool:
+    """Replace the generated block in masters-data.js. Returns True if the file changed."""
+    js_path = Path(js_path)
+    text = js_path.read_text(encoding='utf-8')
+    start = text.find(JS_BEGIN)
+    end = text.find(JS_END)
+    if start == -1 or end == -1:
+        raise ValueError(f"{js_path} has no generated mastersData markers")
+    end += len(JS_END)
+
+    block = render_masters_js(modules, bundle_hash)
+    if text[start:end] == block:
+        return False
+    tmp = js_path.with_suffix(js_path.suffix + ".tmp")
+    tmp.write_text(text[:start] + block + text[end:], encoding='utf-8')
+    os.replace(tmp, js_path)
+    return True
+
+
+def build_all(base_path: Path, force: bool = False) -> Dict:
+    """Build the bundle, snapshot and search index (if stale) and sync masters-data.js.
+
+    Superseded bundles are pruned last, once everything points at the new one.
+    """
+    base_path = Path(base_path)
+    masters_path = base_path / "knowledge_base" / "masters"
+    build_path = base_path / "knowledge_base" / "build"
+    js_path = base_path / "data" / "masters-data.js"
+
+    stale = force or bundle_is_stale(masters_path, build_path)
+    manifest = ensure_bundle(masters_path, build_path, stale)
+    for name, build in ((SNAPSHOT_NAME, build_snapshot), (SEARCH_NAME, build_search_index)):
+        if stale or not (build_path / name).is_file():
+            build(masters_path, build_path / name)
+    if js_path.exists():
+        text = js_path.read_text(encoding='utf-8')
+        if JS_BEGIN in text and manifest["hash"] not in text:
+            modules = json.loads(load_bundle(build_path, manifest))["modules"]
+            write_masters_js(js_path, modules, manifest["hash"])
+    if stale:
+        prune_bundles(build_path, manifest["bundle"])
+    return manifest
+
+
+if __name__ == "__main__":
+    base = Path(__file__).parent.parent
+    result = build_all(base, force="--force" in sys.argv)
+    print(f"Bundle {result['bundle']} ({result['bytes'] / 1024:.1f} KB, "
+          f"{len(result['modules'])} modules)")
+    for module, err in result.get("errors", {}).items():
+        print(f"  skipped {module}: {err}")
@@ -0,0 +1,252 @@
+"""
+Self-Mastery OS - Module Connection Graph
+Every module's ``cross_module_connections``, compiled once per
+knowledge-base generation into an adjacency list, for "learning path"
+queries: the shortest chain of connected modules between two modules, and
+the modules most related to the ones a user is strong in.
+
+The module files spell connections three ways (``connected_module``,
+``target_module``, or ``from``/``to`` with file names such as
+``money_masters.json``) and one file declares a module name that differs from
+its file (``social`` declares ``dating``); targets are resolved to knowledge
+base modules and targets outside it are kept in ``unresolved``. Edges are
+treated as undirected for traversal, each weighted by the number of
+connections authored between the two modules.
+
+Breadth-first trees and related-module rankings are memoized on the graph,
+which is rebuilt (with empty memos) when the knowledge base changes.
+
+Usage:
+    python src/kb_graph.py <module>               # connected modules
+    python src/kb_graph.py <from> <to>            # learning path
+"""
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Connection fields naming the target module, in the order they are tried
+TARGET_FIELDS = ("connected_module", "target_module", "to")
+
+# Level assumed for modules missing from module_levels (as in settings)
+DEFAULT_LEVEL = 5
+
+DEFAULT_RELATED = 5
+
+# Largest ``k`` the dashboard API accepts for related()
+MAX_RELATED = 50
+
+# Memoized queries kept per graph before the memo is reset
+MAX_MEMO = 1024
+
+
+def _module_key(name: str) -> str:
+    """``money_masters.json`` / ``Money`` -> ``money``."""
+    name = str(name).strip().lower()
+    if name.endswith(".json"):
+        name = name[:-len(".json")]
+    if name.endswith("_masters"):
+        name = name[:-len("_masters")]
+    return name.replace(" ", "_").replace("-", "_")
+
+
+def _edge(source: str, target: str, connection: Dict) -> Dict:
+    """One authored connection in a single shape."""
+    return {
+        "from": source,
+        "to": target,
+        "type": connection.get("connection_type"),
+        "insight": connection.get("insight") or connection.get("description") or "",
+        "exercise": connection.get("combined_exercise") or connection.get("recommended_practice") or "",
+    }
+
+
+class ConnectionGraph:
+    """Adjacency list of modules linked by their cross-module connections."""
+
+    def __init__(self, connections: Dict[str, List[Dict]], declared: Optional[Dict[str, str]] = None):
+        """``connections`` maps module -> its raw cross_module_connections;
+        ``declared`` maps module -> the module name its file declares."""
+        self.modules = sorted(connections)
+        # module -> the name its file declares (``social`` -> ``dating``)
+        self.names = {m: _module_key((declared or {}).get(m) or m) for m in self.modules}
+        self.aliases = {m: m for m in self.modules}
+        for module, name in self.names.items():
+            self.aliases.setdefault(name, module)
+
+        # module -> neighbour -> connections (either direction) between them
+        self.adjacency: Dict[str, Dict[str, List[Dict]]] = {m: {} for m in self.modules}
+        self.unresolved: Dict[str, List[str]] = {}
+        for source in self.modules:
+            for connection in connections[source] or []:
+                if not isinstance(connection, dict):
+                    continue
+                raw = next((connection[f] for f in TARGET_FIELDS if connection.get(f)), None)
+                if raw is None:
+                    continue
+                target = self.resolve(raw)
+                if target is None:
+                    self.unresolved.setdefault(source, []).append(_module_key(raw))
+                    continue
+                if target == source:
+                    continue
+                edge = _edge(source, target, connection)
+                self.adjacency[source].setdefault(target, []).append(edge)
+                self.adjacency[target].setdefault(source, []).append(edge)
+        self._trees: Dict[str, Dict[str, Optional[str]]] = {}
+        self._related: Dict[tuple, List[Dict]] = {}
+
+    def __len__(self) -> int:
+        return len(self.modules)
+
+    def resolve(self, name: str) -> Optional[str]:
+        """The knowledge-base module for a module name, alias or file name."""
+        return self.aliases.get(_module_key(name))
+
+    def _require(self, name: str) -> str:
+        module = self.resolve(name)
+        if module is None:
+            raise ValueError(f"Unknown module: {name}")
+        return module
+
+    def neighbors(self, module: str) -> List[str]:
+        """Modules directly connected to ``module``, strongest first."""
+        links = self.adjacency[self._require(module)]
+        return sorted(links, key=lambda m: (-len(links[m]), m))
+
+    def weight(self, a: str, b: str) -> int:
+        """Number of connections authored between two modules (0 if none)."""
+        return len(self.adjacency[self._require(a)].get(self._require(b), ()))
+
+    def connections(self, a: str, b: str) -> List[Dict]:
+        return list(self.adjacency[self._require(a)].get(self._require(b), ()))
+
+    def edge_count(self) -> int:
+        return sum(len(links) for links in self.adjacency.values()) // 2
+
+    def _tree(self, start: str) -> Dict[str, Optional[str]]:
+        """Breadth-first parents from ``start`` (memoized per start module)."""
+        tree = self._trees.get(start)
+        if tree is None:
+            tree = {start: None}
+            queue = deque([start])
+            while queue:
+                module = queue.popleft()
+                for neighbor in sorted(self.adjacency[module]):
+                    if neighbor not in tree:
+                        tree[neighbor] = module
+                        queue.append(neighbor)
+            self._trees[start] = tree
+        return tree
+
+    def shortest_path(self, start: str, goal: str) -> Optional[List[str]]:
+        """Fewest-hop chain of modules from ``start`` to ``goal`` (None if unconnected).
+
+        Raises ValueError for an unknown module.
+        """
+        start, goal = self._require(start), self._require(goal)
+        tree = self._tree(start)
+        if goal not in tree:
+            return None
+        path = [goal]
+        while path[-1] != start:
+            path.append(tree[path[-1]])
+        return path[::-1]
+
+    def learning_path(self, start: str, goal: str) -> Optional[Dict]:
+        """``shortest_path`` with the connections behind each step (those
+        authored by the step's origin first)."""
+        path = self.shortest_path(start, goal)
+        if path is None:
+            return None
+        return {
+            "path": path,
+            "steps": [{"from": a, "to": b,
+                       "connections": sorted(self.connections(a, b), key=lambda e: e["from"] != a)}
+                      for a, b in zip(path, path[1:])],
+        }
+
+    def related(self, module_levels: Optional[Dict[str, int]] = None, k: int = DEFAULT_RELATED,
+                module: Optional[str] = None) -> List[Dict]:
+        """Top ``k`` modules related to the user's modules (or to ``module``).
+
+        A candidate scores, for every connected source module, the edge weight
+        times the user's level in the source, divided by one plus the user's
+        own level in the candidate: strengths pull their neighbours up, and
+        modules already mastered rank lower. Raises ValueError for an unknown
+        ``module``.
+        """
+        levels = {}
+        for name, level in (module_levels or {}).items():
+            resolved = self.resolve(name)
+            if resolved is not None:
+                try:
+                    levels[resolved] = max(0, int(level))
+                except (TypeError, ValueError):
+                    continue
+        if module is not None:
+            module = self._require(module)
+            sources = {module: levels.get(module, DEFAULT_LEVEL) or 1}
+        else:
+            sources = levels or {m: DEFAULT_LEVEL for m in self.modules}
+
+        key = (module, k, tuple(sorted(levels.items())))
+        cached = self._related.get(key)
+        if cached is not None:
+            return [dict(r, via=list(r["via"])) for r in cached]
+
+        scores: Dict[str, float] = {}
+        via: Dict[str, Dict[str, float]] = {}
+        for source, level in sources.items():
+            for candidate, links in self.adjacency[source].items():
+                if candidate == module:
+                    continue
+                contribution = len(links) * level
+                scores[candidate] = scores.get(candidate, 0.0) + contribution
+                via.setdefault(candidate, {})[source] = contribution
+        ranked = []
+        for candidate, score in scores.items():
+            score /= 1 + levels.get(candidate, DEFAULT_LEVEL)
+            if score > 0:
+                sources_by_weight = sorted(via[candidate], key=lambda s: (-via[candidate][s], s))
+                ranked.append({"module": candidate, "score": round(score, 3), "via": sources_by_weight})
+        ranked.sort(key=lambda r: (-r["score"], r["module"]))
+        result = ranked[:max(0, k)]
+        if len(self._related) >= MAX_MEMO:
+            self._related.clear()
+        self._related[key] = result
+        return [dict(r, via=list(r["via"])) for r in result]
+
+
+def build_connection_graph(kb) -> ConnectionGraph:
+    """Connection graph of a KnowledgeBase's current modules."""
+    connections, declared = {}, {}
+    for module in kb.module_names():
+        connections[module] = kb.get(module, "cross_module_connections", default=[]) or []
+        declared[module] = kb.get(module, "module")
+    return ConnectionGraph(connections, declared)
+
+
+if __name__ == "__main__":
+    if not 2 <= len(sys.argv) <= 3:
+        print("Usage: python src/kb_graph.py <module> [<to module>]")
+        sys.exit(1)
+    sys.path.insert(0, str(Path(__file__).parent))
+    from knowledge_base import KnowledgeBase
+
+    graph = KnowledgeBase.shared(Path(__file__).parent.parent / "knowledge_base" / "masters").connection_graph()
+    try:
+        if len(sys.argv) == 2:
+            for neighbor in graph.neighbors(sys.argv[1]):
+                print(f"  {neighbor} ({graph.weight(sys.argv[1], neighbor)})")
+        else:
+            result = graph.learning_path(sys.argv[1], sys.argv[2])
+            if result is None:
+                print("No path between these modules.")
+            for step in (result or {}).get("steps", []):
+                print(f"\n{step['from']} -> {step['to']}")
+                for connection in step["connections"]:
+                    print(f"  {connection['insight']}")
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
@@ -0,0 +1,45 @@
+"""
+Self-Mastery OS - Knowledge-Base Interning
+Canonicalises parsed knowledge-base JSON so repeated content is stored once:
+equal strings (module names, difficulty labels, resource types, recurring
+practice text) become one object, and so do identical lists and dicts.
+
+Interning goes through the ``memo`` of one ``compact`` call (or of calls
+sharing it), which is dropped afterwards. Most of the text is unique, so a
+process-wide table (``sys.intern``) would cost more than it saves; only
+dict keys, a small fixed set, are interned process-wide.
+
+The result compares equal to the input but shares structure, so it must be
+treated as read-only, as everything the KnowledgeBase hands out already is.
+"""
+import sys
+from typing import Any, Dict, Optional
+
+_intern = sys.intern
+
+
+def _compact(value: Any, memo: Dict) -> Any:
+    kind = type(value)
+    if kind is str:
+        return memo.setdefault(value, value)
+    if kind is dict:
+        items = {_intern(k): _compact(v, memo) for k, v in value.items()}
+        key = (tuple(items), tuple(map(id, items.values())))
+    elif kind is list:
+        items = [_compact(v, memo) for v in value]
+        key = tuple(map(id, items))
+    else:
+        return value
+    # Children are already canonical, so equal containers have identical
+    # children: keying by id is exact (1, 1.0 and True stay apart), and safe
+    # because the memo keeps every object its keys refer to alive
+    return memo.setdefault(key, items)
+
+
+def compact(value: Any, memo: Optional[Dict] = None) -> Any:
+    """``value`` (parsed JSON) with equal strings and identical containers shared.
+
+    Pass the same ``memo`` to share across several values (e.g. every module
+    of one load); it holds them alive until it is dropped.
+    """
+    return _compact(value, {} if memo is None else memo)
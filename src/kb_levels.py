@@ -0,0 +1,97 @@
+"""
+Self-Mastery OS - Level and Exercise Tables
+Every module's ``level_definitions`` and ``progressive_exercises``, compiled
+once per knowledge-base generation into flat lookup tables keyed by
+``(module, level)`` and ``(module, difficulty)``.
+
+The tables are read through the compiled snapshot (see kb_snapshot), so
+building them never parses whole module files, and a lookup is one dict
+access. Modules are also reachable under the name their file declares
+(``social`` declares ``dating``, the key used in ``module_levels``).
+
+Levels may be sparse: the definition that applies at level n is the highest
+one defined at or below n, and the next one is the lowest above n.
+"""
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+
+def _level_number(level) -> Optional[int]:
+    try:
+        return int(level)
+    except (TypeError, ValueError):
+        return None
+
+
+class LevelTables:
+    """Direct lookups for level definitions and progressive exercises."""
+
+    def __init__(self, modules: Dict[str, Tuple[Dict, Dict]], declared: Optional[Dict[str, str]] = None):
+        """``modules`` maps module -> (level_definitions, progressive_exercises);
+        ``declared`` maps module -> the module name its file declares."""
+        self.levels: Dict[Tuple[str, int], Dict] = {}
+        self.exercises: Dict[Tuple[str, str], List[Dict]] = {}
+        # module -> its defined level numbers, ascending
+        self.level_numbers: Dict[str, List[int]] = {}
+
+        for module, (definitions, exercises) in modules.items():
+            names = {module}
+            if (declared or {}).get(module):
+                names.add(declared[module])
+            numbers = []
+            for key, definition in (definitions or {}).items() if isinstance(definitions, dict) else ():
+                number = _level_number(key)
+                if number is None or not isinstance(definition, dict):
+                    continue
+                numbers.append(number)
+                for name in names:
+                    self.levels[(name, number)] = definition
+            for difficulty, items in (exercises or {}).items() if isinstance(exercises, dict) else ():
+                items = [e for e in items if isinstance(e, dict)] if isinstance(items, list) else []
+                if items:
+                    for name in names:
+                        self.exercises[(name, difficulty)] = items
+            for name in names:
+                self.level_numbers[name] = sorted(numbers)
+
+    def level(self, module: str, level) -> Optional[Dict]:
+        """The definition of exactly ``level`` in ``module``, or None."""
+        return self.levels.get((module, _level_number(level)))
+
+    def exercise_pool(self, module: str, difficulty: str) -> List[Dict]:
+        return self.exercises.get((module, difficulty), [])
+
+    def progress(self, module: str, level) -> Dict:
+        """The definitions that apply at ``level`` and the next one up (None when absent)."""
+        numbers = self.level_numbers.get(module, [])
+        level = _level_number(level)
+        if level is None:
+            level = 0
+        i = bisect_right(numbers, level)
+        current = numbers[i - 1] if i > 0 else None
+        upcoming = numbers[i] if i < len(numbers) else None
+        return {
+            "level": level,
+            "current": self.levels[(module, current)] if current is not None else None,
+            "next_level": upcoming,
+            "next": self.levels[(module, upcoming)] if upcoming is not None else None,
+        }
+
+    def progress_for(self, module_levels: Dict[str, int]) -> Dict[str, Dict]:
+        """``progress`` for every (module, level) of a user's ``module_levels``.
+
+        Modules without level definitions are left out.
+        """
+        return {module: self.progress(module, level)
+                for module, level in module_levels.items()
+                if self.level_numbers.get(module)}
+
+
+def build_level_tables(kb) -> LevelTables:
+    """Level and exercise tables of a KnowledgeBase's current modules."""
+    modules, declared = {}, {}
+    for module in kb.module_names():
+        modules[module] = (kb.get(module, "level_definitions", default={}),
+                           kb.get(module, "progressive_exercises", default={}))
+        declared[module] = kb.get(module, "module")
+    return LevelTables(modules, declared)
@@ -0,0 +1,81 @@
+"""
+Self-Mastery OS - Knowledge-Base Schema
+Structural checks for ``*_masters.json`` module files, run whenever a file
+is compiled or (re)loaded so a malformed edit is reported instead of being
+served or silently dropped.
+
+Only the fields the app reads are checked; unknown fields are allowed.
+"""
+from typing import Any, Dict, List
+
+# Field -> allowed types, at module level
+MODULE_FIELDS = {
+    "module": (str,),
+    "masters": (list,),
+    "daily_insights": (list,),
+    "skill_challenges": (list,),
+    "level_definitions": (dict,),
+    "progressive_exercises": (dict,),
+    "cross_module_connections": (list,),
+}
+
+# Field -> allowed types, on each master (``name`` is also required)
+MASTER_FIELDS = {
+    "name": (str,),
+    "expertise": (str,),
+    "key_principles": (list,),
+    "daily_practices": (list,),
+    "worked_examples": (list,),
+    "scripts_templates": (list, dict),
+    "resources": (dict,),
+}
+
+# Problems reported per file before the rest are summarised
+MAX_PROBLEMS = 20
+
+
+def _type_names(types) -> str:
+    return " or ".join({dict: "object", list: "array", str: "string"}.get(t, t.__name__) for t in types)
+
+
+def _check_fields(value: Dict, fields: Dict, where: str, problems: List[str]):
+    for field, types in fields.items():
+        if field in value and not isinstance(value[field], types):
+            problems.append(f"{where}{field}: expected {_type_names(types)}")
+
+
+def validate_module(data: Any) -> List[str]:
+    """Problems found in one parsed module file (empty when it is valid)."""
+    if not isinstance(data, dict):
+        return ["top level: expected object"]
+    problems: List[str] = []
+    _check_fields(data, MODULE_FIELDS, "", problems)
+
+    for i, master in enumerate(data.get("masters") if isinstance(data.get("masters"), list) else []):
+        if not isinstance(master, dict):
+            problems.append(f"masters[{i}]: expected object")
+            continue
+        if not isinstance(master.get("name"), str) or not master["name"].strip():
+            problems.append(f"masters[{i}].name: missing")
+        _check_fields(master, MASTER_FIELDS, f"masters[{i}].", problems)
+
+    levels = data.get("level_definitions")
+    for key, definition in levels.items() if isinstance(levels, dict) else ():
+        if not key.isdigit():
+            problems.append(f"level_definitions.{key}: level must be a number")
+        elif not isinstance(definition, dict):
+            problems.append(f"level_definitions.{key}: expected object")
+
+    exercises = data.get("progressive_exercises")
+    for difficulty, items in exercises.items() if isinstance(exercises, dict) else ():
+        if not isinstance(items, list):
+            problems.append(f"progressive_exercises.{difficulty}: expected array")
+
+    connections = data.get("cross_module_connections")
+    for i, connection in enumerate(connections if isinstance(connections, list) else []):
+        if not isinstance(connection, dict):
+            problems.append(f"cross_module_connections[{i}]: expected object")
+
+    if len(problems) > MAX_PROBLEMS:
+        problems = problems[:MAX_PROBLEMS] + [f"... and {len(problems) - MAX_PROBLEMS} more"]
+    return problems
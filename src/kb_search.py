@@ -0,0 +1,350 @@
+"""
+Self-Mastery OS - Knowledge-Base Search
+BM25-ranked full-text search over the masters' key principles, daily
+practices, worked examples, script templates and each module's daily
+insights.
+
+The inverted index is compiled next to the snapshot (see kb_snapshot) as
+knowledge_base/build/search.kbi and rebuilt when the source files change:
+
+    header    magic "SMKBSRCH", version u32, meta length u32
+    meta      JSON: sources, errors, modules, docs, doc lengths, term table
+    postings  u32 pairs (doc id, term frequency), one run per term
+
+Only the meta block is parsed when the index is opened; each query reads
+just the postings runs for its own terms.
+
+Usage:
+    python src/kb_search.py "cold calling objections" [--module sales]
+"""
+import json
+import math
+import heapq
+import os
+import re
+import struct
+import sys
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from kb_intern import compact
+from kb_schema import validate_module
+from kb_snapshot import source_stamps
+
+SEARCH_NAME = "search.kbi"
+MAGIC = b"SMKBSRCH"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sII")
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+# Characters of document text kept for result snippets
+SNIPPET_CHARS = 240
+
+# Master fields indexed, with the document kind they produce
+MASTER_FIELDS = {
+    "key_principles": "principle",
+    "daily_practices": "practice",
+    "worked_examples": "example",
+    "scripts_templates": "template",
+}
+
+# Keys tried (in order) for a structured item's display title
+TITLE_KEYS = ("title", "name", "principle", "practice", "insight", "scenario")
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset("""
+a an and are as at be but by for from has have i if in into is it its me my
+not of on or our so than that the their them then there these they this to
+up was we were what when which who will with you your
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case word tokens without stopwords or single characters."""
+    text = text.lower().replace("'", "").replace("’", "")
+    return [t for t in _TOKEN_RE.findall(text) if len(t) > 1 and t not in STOPWORDS]
+
+
+def _flatten(value) -> List[str]:
+    """Every string inside a JSON value (dict values and list items, recursively)."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, list):
+        return []
+    return [s for item in value for s in _flatten(item)]
+
+
+def _items(value) -> Iterable[Tuple[object, object]]:
+    """(key, item) pairs of a list or dict field."""
+    if isinstance(value, list):
+        return enumerate(value)
+    if isinstance(value, dict):
+        return value.items()
+    return ()
+
+
+def _title(item, text: str) -> str:
+    if isinstance(item, dict):
+        for key in TITLE_KEYS:
+            if isinstance(item.get(key), str):
+                return item[key]
+    return text[:SNIPPET_CHARS]
+
+
+def iter_documents(modules: Dict[str, Dict]):
+    """Yield ``(module, kind, master, title, text, path)`` for every searchable item.
+
+    ``path`` locates the item in its module (usable with KnowledgeBase.get).
+    """
+    for module in sorted(modules):
+        data = modules[module]
+        if not isinstance(data, dict):
+            continue
+        for i, master in enumerate(data.get("masters", [])):
+            if not isinstance(master, dict):
+                continue
+            name = master.get("name", "")
+            for field, kind in MASTER_FIELDS.items():
+                for key, item in _items(master.get(field)):
+                    text = " ".join(" ".join(_flatten(item)).split())
+                    if text:
+                        yield module, kind, name, _title(item, text), text, ["masters", i, field, key]
+        for key, item in _items(data.get("daily_insights")):
+            text = " ".join(" ".join(_flatten(item)).split())
+            if text:
+                source = item.get("source", "") if isinstance(item, dict) else ""
+                yield module, "insight", source, _title(item, text), text, ["daily_insights", key]
+
+
+def build_search_index(masters_path: Path, path: Path) -> Dict:
+    """Compile the inverted index for every module file into ``path`` (written atomically)."""
+    masters_path, path = Path(masters_path), Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    stamps = source_stamps(masters_path)
+    modules, sources, errors = {}, {}, {}
+    for module, stamp in stamps.items():
+        try:
+            with open(masters_path / f"{module}_masters.json", 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            errors[module] = list(stamp)
+            continue
+        if validate_module(data):
+            errors[module] = list(stamp)
+            continue
+        modules[module] = data
+        sources[module] = list(stamp)
+
+    module_ids = {m: i for i, m in enumerate(sorted(modules))}
+    docs, lengths = [], []
+    postings: Dict[str, List[Tuple[int, int]]] = {}
+    for module, kind, master, title, text, doc_path in iter_documents(modules):
+        doc_id = len(docs)
+        tokens = tokenize(text)
+        docs.append([module_ids[module], kind, master, title,
+                     text[:SNIPPET_CHARS], doc_path])
+        lengths.append(len(tokens))
+        for term, tf in Counter(tokens).items():
+            postings.setdefault(term, []).append((doc_id, tf))
+
+    blob = array("I")
+    terms = {}
+    for term in sorted(postings):
+        terms[term] = [len(blob) // 2, len(postings[term])]
+        for doc_id, tf in postings[term]:
+            blob.append(doc_id)
+            blob.append(tf)
+    if sys.byteorder != "little":
+        blob.byteswap()
+
+    meta = json.dumps({
+        "sources": sources, "errors": errors, "modules": sorted(modules),
+        "docs": docs, "lengths": lengths, "terms": terms,
+    }, separators=(',', ':'), ensure_ascii=False).encode("utf-8")
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(_HEADER.pack(MAGIC, VERSION, len(meta)) + meta + blob.tobytes())
+    os.replace(tmp, path)
+    return {"path": str(path), "docs": len(docs), "terms": len(terms),
+            "bytes": _HEADER.size + len(meta) + len(blob) * 4}
+
+
+class SearchIndex:
+    """Read-only BM25 index loaded from a compiled ``search.kbi`` file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        data = self.path.read_bytes()
+        try:
+            magic, version, meta_len = _HEADER.unpack_from(data, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{self.path} is not a version {VERSION} search index")
+            meta = json.loads(data[_HEADER.size:_HEADER.size + meta_len])
+            postings = memoryview(data)[_HEADER.size + meta_len:].cast("I")
+        except (struct.error, json.JSONDecodeError, UnicodeDecodeError, TypeError) as e:
+            raise ValueError(f"{self.path} is truncated or corrupt") from e
+        self.sources = {m: tuple(st) for m, st in meta["sources"].items()}
+        self.errors = {m: tuple(st) for m, st in meta["errors"].items()}
+        self.modules: List[str] = meta["modules"]
+        # Kinds, master names and path keys repeat across documents (see kb_intern)
+        self.docs: List[List] = compact(meta["docs"])
+        self.terms: Dict[str, List[int]] = meta["terms"]
+        self._postings = postings
+        if sys.byteorder != "little":
+            self._postings = array("I", self._postings)
+            self._postings.byteswap()
+
+        lengths = meta["lengths"]
+        avgdl = (sum(lengths) / len(lengths) if lengths else 0) or 1.0
+        # BM25 length normalisation per document, precomputed once
+        self._norm = [BM25_K1 * (1 - BM25_B + BM25_B * dl / avgdl) for dl in lengths]
+        self._doc_modules = array("H", (doc[0] for doc in self.docs))
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def postings(self, term: str) -> Iterator[Tuple[int, int]]:
+        """``(doc id, term frequency)`` pairs of the documents containing ``term``."""
+        entry = self.terms.get(term)
+        if entry is None:
+            return iter(())
+        start, df = entry
+        run = self._postings[2 * start:2 * (start + df)]
+        return zip(run[0::2], run[1::2])
+
+    def idf(self, term: str) -> float:
+        entry = self.terms.get(term)
+        if entry is None:
+            return 0.0
+        n, df = len(self.docs), entry[1]
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, modules: Optional[Iterable[str]] = None,
+               kinds: Optional[Iterable[str]] = None, limit: int = DEFAULT_LIMIT) -> List[Dict]:
+        """Top ``limit`` documents for ``query`` by BM25, optionally within ``modules``
+        and document ``kinds`` (principle, practice, example, template, insight).
+
+        Raises ValueError for an unknown module.
+        """
+        allowed = None
+        if modules:
+            allowed = set()
+            for module in modules:
+                if module not in self.modules:
+                    raise ValueError(f"Unknown module: {module}")
+                allowed.add(self.modules.index(module))
+        kinds = set(kinds) if kinds else None
+        limit = max(1, min(int(limit), MAX_LIMIT))
+
+        scores: Dict[int, float] = {}
+        postings, norm, doc_modules = self._postings, self._norm, self._doc_modules
+        k1 = BM25_K1 + 1
+        for term in set(tokenize(query)):
+            entry = self.terms.get(term)
+            if entry is None:
+                continue
+            idf = self.idf(term)
+            start, df = entry
+            run = postings[2 * start:2 * (start + df)]
+            for i in range(0, 2 * df, 2):
+                doc_id = run[i]
+                if allowed is not None and doc_modules[doc_id] not in allowed:
+                    continue
+                if kinds is not None and self.docs[doc_id][1] not in kinds:
+                    continue
+                tf = run[i + 1]
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * k1 / (tf + norm[doc_id])
+
+        results = []
+        for doc_id, score in heapq.nlargest(limit, scores.items(), key=lambda kv: (kv[1], -kv[0])):
+            module_id, kind, master, title, text, doc_path = self.docs[doc_id]
+            results.append({
+                "module": self.modules[module_id],
+                "kind": kind,
+                "master": master,
+                "title": title,
+                "snippet": text,
+                "path": doc_path,
+                "score": round(score, 4),
+            })
+        return results
+
+
+    def distinctive_terms(self, min_df: int = 3, min_share: float = 0.6,
+                          per_module: int = 40) -> Dict[str, List[Tuple[str, float]]]:
+        """Terms concentrated in one module, as ``{module: [(term, share), ...]}``.
+
+        A term qualifies when it occurs in at least ``min_df`` documents and
+        at least ``min_share`` of them belong to one module; each module keeps
+        its ``per_module`` most frequent qualifying terms.
+        """
+        found: Dict[str, List[Tuple[int, str, float]]] = {m: [] for m in self.modules}
+        for term, (start, df) in self.terms.items():
+            if df < min_df:
+                continue
+            counts = Counter(self._doc_modules[self._postings[2 * i]] for i in range(start, start + df))
+            module_id, count = counts.most_common(1)[0]
+            if count / df >= min_share:
+                found[self.modules[module_id]].append((count, term, count / df))
+        return {
+            module: [(term, share) for _, term, share in sorted(terms, key=lambda t: (-t[0], t[1]))[:per_module]]
+            for module, terms in found.items()
+        }
+
+
+def search_path_for(masters_path: Path) -> Path:
+    """Default index location: ``knowledge_base/build/search.kbi``."""
+    return Path(masters_path).parent / "build" / SEARCH_NAME
+
+
+def open_search_index(masters_path: Path, path: Optional[Path] = None, force: bool = False,
+                      stamps: Optional[Dict[str, Tuple[int, int]]] = None) -> Optional[SearchIndex]:
+    """Open the index for ``masters_path``, rebuilding it first if any source changed.
+
+    Returns None when no usable index can be written.
+    """
+    masters_path = Path(masters_path)
+    path = Path(path) if path else search_path_for(masters_path)
+    if not force:
+        try:
+            index = SearchIndex(path)
+        except (OSError, ValueError):
+            index = None
+        if index is not None:
+            if stamps is None:
+                stamps = source_stamps(masters_path)
+            if dict(index.sources, **index.errors) == stamps:
+                return index
+    try:
+        build_search_index(masters_path, path)
+        return SearchIndex(path)
+    except (OSError, ValueError):
+        return None
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    modules = []
+    while "--module" in args:
+        i = args.index("--module")
+        modules.extend(args[i + 1:i + 2])
+        del args[i:i + 2]
+    if not args:
+        print('Usage: python src/kb_search.py "<query>" [--module <name>]')
+        sys.exit(1)
+    index = open_search_index(Path(__file__).parent.parent / "knowledge_base" / "masters")
+    for hit in index.search(" ".join(args), modules=modules):
+        source = f"{hit['master']}: " if hit['master'] else ""
+        print(f"{hit['score']:6.2f}  [{hit['module']}/{hit['kind']}] {source}{hit['title']}")
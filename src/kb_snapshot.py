@@ -0,0 +1,372 @@
+"""
+Self-Mastery OS - Compiled Knowledge-Base Snapshot
+Compiles knowledge_base/masters/*_masters.json into one compact binary file
+that is memory-mapped and decoded lazily, so a process can read one master's
+principles without parsing the other ~660 KB of JSON.
+
+File layout (all integers little-endian, offsets absolute):
+
+    header   magic "SMKBSNAP", version u32, strings offset u32, index offset u32
+    values   tagged values, children written before their container
+    strings  count u32, (count + 1) u32 end offsets, UTF-8 blob
+    index    a value: {"sources", "errors", "problems", "modules", "masters"}
+
+Every distinct string (keys included) is stored once and referenced by id.
+Containers hold offset tables, so a dict key or list item is found without
+decoding its siblings. The index maps each module, and each master by name,
+to its offset. The snapshot records the (mtime_ns, size) of every source
+file it was built from and is rebuilt when they no longer match. Files that
+are not valid JSON or fail the schema (see kb_schema) are left out and
+their problems recorded.
+
+Usage:
+    python src/kb_snapshot.py          # Build if sources changed
+    python src/kb_snapshot.py --force  # Always rebuild
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from kb_schema import validate_module
+
+SNAPSHOT_NAME = "masters.kbs"
+MAGIC = b"SMKBSNAP"
+VERSION = 2
+
+_HEADER = struct.Struct("<8sIII")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_PAIR = struct.Struct("<II")
+
+# Value tags
+_NULL, _TRUE, _FALSE, _INT, _FLOAT, _STR, _LIST, _DICT = b"NTFIRSLD"
+
+_MISSING = object()
+
+
+def source_stamps(masters_path: Path) -> Dict[str, Tuple[int, int]]:
+    """(mtime_ns, size) of every ``*_masters.json`` file, keyed by module."""
+    stamps = {}
+    try:
+        entries = sorted(os.scandir(masters_path), key=lambda e: e.name)
+    except OSError:
+        return stamps
+    # Same files as glob("*_masters.json"), without pathlib's per-call overhead
+    for entry in entries:
+        if entry.name.startswith(".") or not entry.name.endswith("_masters.json"):
+            continue
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        stamps[entry.name[:-len(".json")].replace("_masters", "")] = (st.st_mtime_ns, st.st_size)
+    return stamps
+
+
+def snapshot_path_for(masters_path: Path) -> Path:
+    """Default snapshot location: ``knowledge_base/build/masters.kbs``."""
+    return Path(masters_path).parent / "build" / SNAPSHOT_NAME
+
+
+class _Writer:
+    """Post-order encoder: ``add`` returns the offset of the encoded value."""
+
+    def __init__(self):
+        self.buf = bytearray(_HEADER.size)
+        self.strings: Dict[str, int] = {}
+
+    def string_id(self, s: str) -> int:
+        sid = self.strings.get(s)
+        if sid is None:
+            sid = self.strings[s] = len(self.strings)
+        return sid
+
+    def add(self, value: Any) -> int:
+        if isinstance(value, dict):
+            pairs = [(self.string_id(str(k)), self.add(v)) for k, v in value.items()]
+            offset = len(self.buf)
+            self.buf.append(_DICT)
+            self.buf += _U32.pack(len(pairs))
+            for pair in pairs:
+                self.buf += _PAIR.pack(*pair)
+            return offset
+        if isinstance(value, (list, tuple)):
+            items = [self.add(v) for v in value]
+            offset = len(self.buf)
+            self.buf.append(_LIST)
+            self.buf += _U32.pack(len(items))
+            for item in items:
+                self.buf += _U32.pack(item)
+            return offset
+
+        offset = len(self.buf)
+        if value is None:
+            self.buf.append(_NULL)
+        elif value is True:
+            self.buf.append(_TRUE)
+        elif value is False:
+            self.buf.append(_FALSE)
+        elif isinstance(value, int):
+            self.buf.append(_INT)
+            self.buf += _I64.pack(value)
+        elif isinstance(value, float):
+            self.buf.append(_FLOAT)
+            self.buf += _F64.pack(value)
+        elif isinstance(value, str):
+            self.buf.append(_STR)
+            self.buf += _U32.pack(self.string_id(value))
+        else:
+            raise TypeError(f"Cannot encode {type(value).__name__} in a snapshot")
+        return offset
+
+    def master_offsets(self, module_offset: int, data: Any) -> Dict[str, int]:
+        """Offsets of a just-encoded module's masters, keyed by master name."""
+        masters = data.get("masters") if isinstance(data, dict) else None
+        if not isinstance(masters, list):
+            return {}
+        key_id = self.strings["masters"]
+        count = _U32.unpack_from(self.buf, module_offset + 1)[0]
+        for i in range(count):
+            kid, list_offset = _PAIR.unpack_from(self.buf, module_offset + 5 + 8 * i)
+            if kid == key_id:
+                break
+        else:
+            return {}
+        offsets = {}
+        for i, master in enumerate(masters):
+            if isinstance(master, dict) and isinstance(master.get("name"), str):
+                offsets.setdefault(master["name"], _U32.unpack_from(self.buf, list_offset + 5 + 4 * i)[0])
+        return offsets
+
+    def finish(self, index: Dict) -> bytes:
+        index_offset = self.add(index)
+        strings_offset = len(self.buf)
+        encoded = [s.encode("utf-8") for s in self.strings]
+        self.buf += _U32.pack(len(encoded))
+        end = 0
+        self.buf += _U32.pack(0)
+        for data in encoded:
+            end += len(data)
+            self.buf += _U32.pack(end)
+        for data in encoded:
+            self.buf += data
+        self.buf[:_HEADER.size] = _HEADER.pack(MAGIC, VERSION, strings_offset, index_offset)
+        return bytes(self.buf)
+
+
+def build_snapshot(masters_path: Path, path: Optional[Path] = None) -> Dict:
+    """Compile every module file into a snapshot (written atomically).
+
+    Invalid files (bad JSON or schema problems) are recorded under ``errors``
+    so readers can tell them from missing modules, with their messages under
+    ``problems``. Returns a summary of what was written.
+    """
+    masters_path = Path(masters_path)
+    path = Path(path) if path else snapshot_path_for(masters_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    writer = _Writer()
+    stamps = source_stamps(masters_path)
+    sources, errors, problems, modules, masters = {}, {}, {}, {}, {}
+    for module, stamp in stamps.items():
+        try:
+            with open(masters_path / f"{module}_masters.json", 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            errors[module], problems[module] = list(stamp), [f"invalid JSON: {e}"]
+            continue
+        invalid = validate_module(data)
+        if invalid:
+            errors[module], problems[module] = list(stamp), invalid
+            continue
+        sources[module] = list(stamp)
+        modules[module] = writer.add(data)
+        masters[module] = writer.master_offsets(modules[module], data)
+
+    body = writer.finish({"sources": sources, "errors": errors, "problems": problems,
+                          "modules": modules, "masters": masters})
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(body)
+    os.replace(tmp, path)
+    return {
+        "path": str(path),
+        "bytes": len(body),
+        "strings": len(writer.strings),
+        "modules": sorted(modules),
+        "errors": sorted(errors),
+    }
+
+
+class Snapshot:
+    """Read-only, memory-mapped view of a snapshot file.
+
+    Only the small index is decoded on open; values are decoded on request
+    and strings are decoded (and interned) at most once each. Decoded values
+    are fresh Python objects the caller may keep.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, self._strings_offset, index_offset = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{self.path} is not a version {VERSION} snapshot")
+            self._string_count = _U32.unpack_from(self._mm, self._strings_offset)[0]
+            self._blob_offset = self._strings_offset + 4 * (self._string_count + 2)
+            self._strings: List[Optional[str]] = [None] * self._string_count
+            # Decode the small parts of the index now; per-master tables on demand
+            index = {self.string(kid): value for kid, value in self._pairs(index_offset)}
+            sources = self.decode(index["sources"])
+            errors = self.decode(index["errors"])
+            problems = self.decode(index["problems"])
+            modules = self.decode(index["modules"])
+        except (struct.error, IndexError) as e:
+            self._mm.close()
+            raise ValueError(f"{self.path} is truncated or corrupt") from e
+        except ValueError:
+            self._mm.close()
+            raise
+        self.sources = {m: tuple(st) for m, st in sources.items()}
+        self.errors = {m: tuple(st) for m, st in errors.items()}
+        self.problems: Dict[str, List[str]] = problems
+        self._modules: Dict[str, int] = modules
+        self._masters_offset = index["masters"]
+        self._masters: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self._mm)
+
+    def close(self):
+        self._mm.close()
+
+    def string(self, sid: int) -> str:
+        s = self._strings[sid]
+        if s is None:
+            table = self._strings_offset + 4 + 4 * sid
+            start, end = _PAIR.unpack_from(self._mm, table)
+            s = self._strings[sid] = sys.intern(
+                self._mm[self._blob_offset + start:self._blob_offset + end].decode("utf-8"))
+        return s
+
+    def _pairs(self, offset: int):
+        """(key id, value offset) pairs of the dict at ``offset``."""
+        count = _U32.unpack_from(self._mm, offset + 1)[0]
+        return _PAIR.iter_unpack(self._mm[offset + 5:offset + 5 + _PAIR.size * count])
+
+    def decode(self, offset: int) -> Any:
+        """Fully decode the value at ``offset``."""
+        mm = self._mm
+        tag = mm[offset]
+        if tag == _STR:
+            return self.string(_U32.unpack_from(mm, offset + 1)[0])
+        if tag == _DICT:
+            return {self.string(kid): self.decode(value) for kid, value in self._pairs(offset)}
+        if tag == _LIST:
+            count = _U32.unpack_from(mm, offset + 1)[0]
+            return [self.decode(item) for item in struct.unpack_from(f"<{count}I", mm, offset + 5)]
+        if tag == _INT:
+            return _I64.unpack_from(mm, offset + 1)[0]
+        if tag == _FLOAT:
+            return _F64.unpack_from(mm, offset + 1)[0]
+        if tag == _NULL:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        raise ValueError(f"Bad value tag {tag!r} at offset {offset}")
+
+    def child(self, offset: int, key: Any) -> Optional[int]:
+        """Offset of ``key`` (dict key or list index) inside the container at ``offset``."""
+        mm = self._mm
+        tag = mm[offset]
+        count = _U32.unpack_from(mm, offset + 1)[0] if tag in (_DICT, _LIST) else 0
+        if tag == _DICT and isinstance(key, str):
+            for kid, value in self._pairs(offset):
+                if self.string(kid) == key:
+                    return value
+        elif tag == _LIST and isinstance(key, int) and -count <= key < count:
+            return _U32.unpack_from(mm, offset + 5 + 4 * (key % count))[0]
+        return None
+
+    def modules(self) -> List[str]:
+        return list(self._modules)
+
+    def module(self, module: str) -> Optional[Dict]:
+        offset = self._modules.get(module)
+        return None if offset is None else self.decode(offset)
+
+    def get(self, module: str, *path, default: Any = None) -> Any:
+        """Decode only the value at ``path`` (dict keys / list indexes) within a module."""
+        offset = self._modules.get(module)
+        for key in path:
+            if offset is None:
+                break
+            offset = self.child(offset, key)
+        return default if offset is None else self.decode(offset)
+
+    def _master_table(self, module: str) -> Dict[str, int]:
+        table = self._masters.get(module)
+        if table is None:
+            offset = self.child(self._masters_offset, module)
+            table = self._masters[module] = self.decode(offset) if offset is not None else {}
+        return table
+
+    def master_names(self, module: str) -> List[str]:
+        return list(self._master_table(module))
+
+    def master(self, module: str, name: str) -> Optional[Dict]:
+        """Decode one master record by exact name, without touching the rest of the module."""
+        offset = self._master_table(module).get(name)
+        return None if offset is None else self.decode(offset)
+
+
+def open_snapshot(masters_path: Path, path: Optional[Path] = None, force: bool = False,
+                  stamps: Optional[Dict[str, Tuple[int, int]]] = None) -> Optional[Snapshot]:
+    """Open the snapshot for ``masters_path``, rebuilding it first if any source changed.
+
+    ``stamps`` may pass a fresh ``source_stamps`` result to skip re-scanning.
+    Returns None when no usable snapshot can be written (e.g. a read-only
+    install); callers then read the JSON sources directly.
+    """
+    masters_path = Path(masters_path)
+    path = Path(path) if path else snapshot_path_for(masters_path)
+    if not force:
+        try:
+            snapshot = Snapshot(path)
+        except (OSError, ValueError):
+            snapshot = None
+        if snapshot is not None:
+            if stamps is None:
+                stamps = source_stamps(masters_path)
+            built = dict(snapshot.sources, **snapshot.errors)
+            if built == stamps:
+                return snapshot
+            snapshot.close()
+    try:
+        build_snapshot(masters_path, path)
+        return Snapshot(path)
+    except (OSError, ValueError):
+        return None
+
+
+if __name__ == "__main__":
+    masters = Path(__file__).parent.parent / "knowledge_base" / "masters"
+    if "--force" in sys.argv:
+        build_snapshot(masters)
+    snap = open_snapshot(masters)
+    if snap is None:
+        print("Could not write the snapshot")
+        sys.exit(1)
+    print(f"Snapshot {snap.path} ({snap.size / 1024:.1f} KB, {len(snap.sources)} modules, "
+          f"{snap._string_count} strings)")
+    for module, problems in snap.problems.items():
+        print(f"  skipped {module}: {'; '.join(problems)}")
@@ -0,0 +1,183 @@
+"""
+Self-Mastery OS - Teaching Vectors
+TF-IDF vectors over the masters' key principles, daily practices and daily
+insights, for matching free text (evening reflections) to the teachings
+most similar to it.
+
+The vectors are derived from the compiled search index (see kb_search), so
+nothing is re-read or re-tokenized: each term's postings become one
+column of an L2-normalised, term-major sparse matrix. A batch of queries is
+scored against every teaching with one matrix product when NumPy is
+installed; without it the same columns are accumulated in pure Python.
+Both paths return the same ranking.
+
+Usage:
+    python src/kb_vectors.py "I keep getting distracted by email" ["another reflection" ...]
+"""
+import hashlib
+import heapq
+import json
+import math
+import sys
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from kb_search import SearchIndex, open_search_index, tokenize
+
+try:
+    import numpy as np
+except ImportError:  # optional: pure-Python scoring below
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Document kinds that count as teachings
+VECTOR_KINDS = ("principle", "practice", "insight")
+
+DEFAULT_K = 5
+
+# Queries scored per matrix product (bounds the dense slab's size)
+QUERY_BATCH = 64
+
+
+def _weight(tf: int, idf: float) -> float:
+    """Sublinear term frequency times inverse document frequency."""
+    return (1.0 + math.log(tf)) * idf
+
+
+class VectorIndex:
+    """Term-major TF-IDF matrix over the teachings of one search index."""
+
+    def __init__(self, docs: List[Dict], columns: Dict[str, Tuple[int, int, float]],
+                 doc_ids: array, weights: array, signature: str = "",
+                 use_numpy: Optional[bool] = None):
+        """``columns`` maps term -> (start, end, idf) into ``doc_ids``/``weights``."""
+        self.docs = docs
+        self.columns = columns
+        self.signature = signature
+        self._doc_ids = doc_ids
+        self._weights = weights
+        self.use_numpy = HAS_NUMPY if use_numpy is None else bool(use_numpy and HAS_NUMPY)
+        if self.use_numpy:
+            self._np_doc_ids = np.frombuffer(doc_ids, dtype=np.uint32).astype(np.intp)
+            self._np_weights = np.frombuffer(weights, dtype=np.float64)
+
+    @classmethod
+    def from_search_index(cls, index: SearchIndex, kinds: Iterable[str] = VECTOR_KINDS,
+                          use_numpy: Optional[bool] = None) -> "VectorIndex":
+        """Build the matrix from ``index``'s postings, keeping documents of ``kinds``."""
+        kinds = set(kinds)
+        remap, docs = {}, []
+        for doc_id, (module_id, kind, master, title, text, path) in enumerate(index.docs):
+            if kind in kinds:
+                remap[doc_id] = len(docs)
+                docs.append({"module": index.modules[module_id], "kind": kind, "master": master,
+                             "title": title, "snippet": text, "path": path})
+
+        # Postings restricted to teachings, then TF-IDF weights and per-document norms
+        runs: Dict[str, List[Tuple[int, int]]] = {}
+        for term in index.terms:
+            run = [(remap[doc], tf) for doc, tf in index.postings(term) if doc in remap]
+            if run:
+                runs[term] = run
+        n = len(docs)
+        norms = [0.0] * n
+        idfs = {}
+        for term, run in runs.items():
+            idf = idfs[term] = math.log((1 + n) / (1 + len(run))) + 1.0
+            for doc, tf in run:
+                norms[doc] += _weight(tf, idf) ** 2
+        norms = [math.sqrt(x) or 1.0 for x in norms]
+
+        columns, doc_ids, weights = {}, array("I"), array("d")
+        for term in sorted(runs):
+            idf = idfs[term]
+            columns[term] = (len(doc_ids), len(doc_ids) + len(runs[term]), idf)
+            for doc, tf in runs[term]:
+                doc_ids.append(doc)
+                weights.append(_weight(tf, idf) / norms[doc])
+
+        signature = hashlib.sha1(json.dumps(sorted(index.sources.items())).encode()).hexdigest()[:12]
+        return cls(docs, columns, doc_ids, weights, signature=signature, use_numpy=use_numpy)
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def vectorize(self, text: str) -> Dict[str, float]:
+        """L2-normalised TF-IDF vector of ``text`` over the index vocabulary."""
+        vector = {term: _weight(tf, self.columns[term][2])
+                  for term, tf in Counter(tokenize(text)).items() if term in self.columns}
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        return {term: w / norm for term, w in vector.items()} if norm else {}
+
+    def top_k(self, queries: List[str], k: int = DEFAULT_K) -> List[List[Tuple[int, float]]]:
+        """``(doc id, cosine)`` pairs of the ``k`` closest teachings for each query, best first."""
+        vectors = [self.vectorize(q) for q in queries]
+        if self.use_numpy:
+            return [hits for i in range(0, len(vectors), QUERY_BATCH)
+                    for hits in self._top_k_numpy(vectors[i:i + QUERY_BATCH], k)]
+        return [self._top_k_python(v, k) for v in vectors]
+
+    def _top_k_numpy(self, vectors: List[Dict[str, float]], k: int) -> List[List[Tuple[int, float]]]:
+        terms = sorted({t for v in vectors for t in v})
+        if not terms or not self.docs:
+            return [[] for _ in vectors]
+        row = {t: i for i, t in enumerate(terms)}
+        queries = np.zeros((len(vectors), len(terms)))
+        for i, vector in enumerate(vectors):
+            for term, w in vector.items():
+                queries[i, row[term]] = w
+        # Dense slab of just the columns the batch touches: (terms x docs)
+        slab = np.zeros((len(terms), len(self.docs)))
+        for i, term in enumerate(terms):
+            start, end, _ = self.columns[term]
+            slab[i, self._np_doc_ids[start:end]] = self._np_weights[start:end]
+        scores = queries @ slab
+
+        k = max(1, min(k, len(self.docs)))
+        results = []
+        for row_scores in scores:
+            # Everything tied with the k-th best score competes, then score
+            # desc / doc id asc picks the same k as the pure-Python path
+            kth = -np.partition(-row_scores, k - 1)[k - 1]
+            top = np.flatnonzero(row_scores >= kth)
+            top = top[np.lexsort((top, -row_scores[top]))[:k]]
+            results.append([(int(d), float(row_scores[d])) for d in top if row_scores[d] > 0])
+        return results
+
+    def _top_k_python(self, vector: Dict[str, float], k: int) -> List[Tuple[int, float]]:
+        scores: Dict[int, float] = {}
+        doc_ids, weights = self._doc_ids, self._weights
+        for term, w in vector.items():
+            start, end, _ = self.columns[term]
+            for i in range(start, end):
+                doc = doc_ids[i]
+                scores[doc] = scores.get(doc, 0.0) + w * weights[i]
+        return heapq.nlargest(k, ((d, s) for d, s in scores.items() if s > 0),
+                              key=lambda ds: (ds[1], -ds[0]))
+
+    def similar(self, queries: List[str], k: int = DEFAULT_K) -> List[List[Dict]]:
+        """Teachings closest to each query, as search-style hits with a ``score``."""
+        return [[dict(self.docs[doc], score=round(score, 4)) for doc, score in hits]
+                for hits in self.top_k(queries, k)]
+
+
+def build_vector_index(kb) -> Optional[VectorIndex]:
+    """Vector index for a KnowledgeBase's current search index (None if unavailable)."""
+    index = kb.search_index()
+    return VectorIndex.from_search_index(index) if index is not None else None
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print('Usage: python src/kb_vectors.py "<reflection>" ["<reflection>" ...]')
+        sys.exit(1)
+    index = open_search_index(Path(__file__).parent.parent / "knowledge_base" / "masters")
+    vectors = VectorIndex.from_search_index(index)
+    for query, hits in zip(sys.argv[1:], vectors.similar(sys.argv[1:])):
+        print(f"\n{query}")
+        for hit in hits:
+            source = f"{hit['master']}: " if hit['master'] else ""
+            print(f"  {hit['score']:.3f}  [{hit['module']}/{hit['kind']}] {source}{hit['title']}")
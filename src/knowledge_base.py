@@ -0,0 +1,580 @@
+"""
+Self-Mastery OS - Knowledge Base Index
+Read-only, in-memory views over the masters knowledge base, built once and
+shared, so list views never re-read or re-serialize whole module files.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from metrics import REGISTRY
+from kb_intern import compact
+from kb_schema import validate_module
+from kb_search import DEFAULT_LIMIT, SearchIndex, open_search_index
+from kb_snapshot import Snapshot, open_snapshot, source_stamps
+from kb_graph import ConnectionGraph, build_connection_graph
+from kb_levels import LevelTables, build_level_tables
+from kb_vectors import VectorIndex, build_vector_index
+
+# Fields returned when the caller does not ask for specific ones
+DEFAULT_MASTER_FIELDS = ("name", "expertise")
+
+# Page size bounds for paginated queries
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Seconds between source-file checks for a shared KnowledgeBase
+KB_CHECK_INTERVAL = 2.0
+
+# Seconds a prefetch thread pauses before each non-priority module, leaving
+# the interpreter to foreground threads
+PREFETCH_PAUSE = 0.005
+
+_KB_RELOAD_SECONDS = REGISTRY.histogram(
+    "kb_reload_seconds", "Time to build, validate and swap in a knowledge-base generation"
+)
+_KB_RELOAD_ERRORS = REGISTRY.counter(
+    "kb_reload_errors_total", "Knowledge-base reloads that failed (the previous generation stays)"
+)
+_KB_VALIDATION_ERRORS = REGISTRY.counter(
+    "kb_validation_errors_total", "Module files rejected as invalid JSON or by the schema", ("module",)
+)
+_KB_GENERATION = REGISTRY.gauge("kb_generation", "Knowledge-base generation being served")
+_KB_INVALID_MODULES = REGISTRY.gauge("kb_invalid_modules", "Module files currently failing validation")
+
+
+def load_modules(masters_path: Path) -> Dict[str, Dict]:
+    """Read every valid ``*_masters.json`` file, keyed by module (file stem).
+
+    Content repeated across the files is stored once (see kb_intern).
+    """
+    modules, memo = {}, {}
+    for file in sorted(Path(masters_path).glob("*_masters.json")):
+        try:
+            with open(file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            continue
+        if not validate_module(data):
+            modules[file.stem.replace("_masters", "")] = compact(data, memo)
+    return modules
+
+
+class MastersIndex:
+    """Flat, read-only index of every master with field projection and paging."""
+
+    def __init__(self, modules: Dict[str, Dict]):
+        self.modules = tuple(sorted(modules))
+        self._records: List[Dict] = []
+        self._by_module: Dict[str, List[int]] = {m: [] for m in self.modules}
+
+        for module in self.modules:
+            for master in modules[module].get("masters", []):
+                self._by_module[module].append(len(self._records))
+                self._records.append({"module": module, **master})
+
+        self.fields = tuple(sorted({k for r in self._records for k in r}))
+
+    @classmethod
+    def from_directory(cls, masters_path: Path) -> "MastersIndex":
+        return cls(load_modules(masters_path))
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def query(self, module: Optional[str] = None, fields: Optional[Iterable[str]] = None,
+              limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Dict:
+        """Return one page of masters.
+
+        ``fields`` selects which master keys to return (``module`` and ``name``
+        are always included; ``["*"]`` returns everything). ``cursor`` is the
+        opaque ``next_cursor`` of the previous page. Raises ValueError for an
+        unknown module or a malformed cursor.
+        """
+        if module is None:
+            positions = range(len(self._records))
+        elif module in self._by_module:
+            positions = self._by_module[module]
+        else:
+            raise ValueError(f"Unknown module: {module}")
+
+        try:
+            offset = int(cursor) if cursor else 0
+        except ValueError:
+            raise ValueError(f"Invalid cursor: {cursor}")
+        if offset < 0:
+            raise ValueError(f"Invalid cursor: {cursor}")
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+
+        wanted = tuple(fields) if fields else DEFAULT_MASTER_FIELDS
+        page = positions[offset:offset + limit]
+        if "*" in wanted:
+            items = [dict(self._records[i]) for i in page]
+        else:
+            keys = ("module", "name") + tuple(f for f in wanted if f not in ("module", "name"))
+            items = [
+                {k: self._records[i][k] for k in keys if k in self._records[i]}
+                for i in page
+            ]
+
+        end = offset + len(page)
+        return {
+            "items": items,
+            "total": len(positions),
+            "next_cursor": str(end) if end < len(positions) else None,
+        }
+
+
+def build_master_directory(kb: "KnowledgeBase") -> Dict[str, List[Dict]]:
+    """Name and expertise of every master, by module (modules without masters
+    left out). Read value by value, through the snapshot when it is current,
+    so no module file is parsed."""
+    directory = {}
+    for module in kb.module_names():
+        entries = []
+        while True:
+            name = kb.get(module, "masters", len(entries), "name")
+            if not isinstance(name, str):
+                break
+            expertise = kb.get(module, "masters", len(entries), "expertise", default="")
+            entries.append({"name": name, "expertise": expertise})
+        if entries:
+            directory[module] = entries
+    return directory
+
+
+class Generation:
+    """One immutable version of the knowledge base.
+
+    ``stamps`` are the source files it was built from and ``errors`` the
+    ones that failed to parse or validate (a failed file's last valid version,
+    if any, stays in ``modules``). Parsed modules and derived values are
+    filled in lazily but never change once set.
+    """
+
+    def __init__(self, id: int, stamps: Dict[str, Tuple[int, int]], snapshot: Optional[Snapshot],
+                 modules: Dict[str, Dict], errors: Dict[str, List[str]]):
+        self.id = id
+        self.stamps = stamps
+        self.snapshot = snapshot
+        self.modules = modules
+        self.errors = errors
+        # key -> value, and key -> the function that built it (to prebuild the next generation)
+        self.derived: Dict[str, Any] = {}
+        self.builders: Dict[str, Callable[["KnowledgeBase"], Any]] = {}
+
+
+class KnowledgeBase:
+    """Process-wide, read-only masters modules for one directory.
+
+    Modules are parsed lazily on first use, or ahead of it by a ``prefetch``
+    thread, and shared by every caller (e.g. all WisdomEngine instances);
+    treat the returned dicts as read-only.
+    Source files are re-checked (one stat per file) at most every
+    ``check_interval`` seconds, or by a ``watch`` thread. A changed, added or
+    removed file builds a new ``Generation`` - validated (see kb_schema),
+    with its snapshot and derived indexes - that is swapped in atomically;
+    dicts handed out earlier stay intact, and a file that fails validation
+    keeps serving its last valid version. Threads inside ``pin`` keep reading
+    the generation they started on.
+
+    ``get`` and ``master`` read single values through the compiled snapshot
+    (see kb_snapshot) when it matches the sources, so they do not parse
+    whole modules; the snapshot is rebuilt whenever the sources change.
+    ``search`` loads the compiled BM25 index (see kb_search) on first use;
+    it and other indexes built from the modules are cached per generation
+    with ``derived``.
+    """
+
+    _shared: Dict[Path, "KnowledgeBase"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, masters_path: Path, check_interval: float = KB_CHECK_INTERVAL,
+                 snapshot: bool = True):
+        self.masters_path = Path(masters_path)
+        self.check_interval = check_interval
+        self.use_snapshot = snapshot
+        self.last_error: Optional[str] = None
+        self._gen = Generation(0, {}, None, {}, {})
+        self._local = threading.local()
+        # ("module" | "derived", name) -> lock held while that one value loads
+        self._key_locks: Dict[Tuple[str, str], threading.RLock] = {}
+        self._checked = float("-inf")
+        self._watching = False
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self.refresh(force=True)
+
+    @classmethod
+    def shared(cls, masters_path: Path) -> "KnowledgeBase":
+        """The process-wide instance for ``masters_path`` (created on first use)."""
+        key = Path(masters_path).resolve()
+        kb = cls._shared.get(key)
+        if kb is None:
+            with cls._shared_lock:
+                kb = cls._shared.get(key)
+                if kb is None:
+                    kb = cls._shared[key] = cls(key)
+        return kb
+
+    def _key_lock(self, kind: str, name: str) -> threading.RLock:
+        """The lock serialising loads of one module or derived value, so a
+        reader waits only for the value it needs."""
+        lock = self._key_locks.get((kind, name))
+        if lock is None:
+            with self._lock:
+                lock = self._key_locks.setdefault((kind, name), threading.RLock())
+        return lock
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        return source_stamps(self.masters_path)
+
+    def _current(self) -> Generation:
+        return getattr(self._local, "generation", None) or self._gen
+
+    @property
+    def generation(self) -> int:
+        """Id of the generation this thread reads."""
+        return self._current().id
+
+    @property
+    def _modules(self) -> Dict[str, Dict]:
+        return self._current().modules
+
+    @property
+    def _stamps(self) -> Dict[str, Tuple[int, int]]:
+        return self._current().stamps
+
+    @contextmanager
+    def pin(self, generation: Optional[Generation] = None):
+        """Read one generation in this thread until the block exits.
+
+        Request handlers wrap themselves in this so a reload swapped in
+        mid-request does not mix two versions of the knowledge base. Nested
+        pins keep the outer generation.
+        """
+        previous = getattr(self._local, "generation", None)
+        self._local.generation = previous or generation or self._gen
+        try:
+            yield self._local.generation
+        finally:
+            self._local.generation = previous
+
+    def refresh(self, force: bool = False) -> bool:
+        """Re-check source files and reload if they changed. Returns True if a
+        new generation was swapped in.
+
+        Checks are throttled to ``check_interval`` unless ``force``, skipped
+        entirely (unless forced) while a ``watch`` thread does them, and never
+        run inside ``pin``.
+        """
+        if getattr(self._local, "generation", None) is not None:
+            return False
+        now = time.monotonic()
+        if not force and (self._watching or now - self._checked < self.check_interval):
+            return False
+        self._checked = now
+        stamps = self._scan()
+        if stamps == self._gen.stamps:
+            return False
+        return self.reload(stamps)
+
+    def reload(self, stamps: Optional[Dict[str, Tuple[int, int]]] = None) -> bool:
+        """Build a generation from the source files and swap it in.
+
+        Runs the snapshot rebuild, validation and every derived index the
+        current generation had built before the swap, so readers never wait
+        for them. Returns False if nothing changed or the build failed (the
+        current generation stays; see ``last_error``).
+        """
+        with self._reload_lock:
+            old = self._gen
+            if stamps is None:
+                stamps = self._scan()
+            if stamps == old.stamps:
+                return False
+            start = time.perf_counter()
+            try:
+                new = self._build(old, stamps)
+                self._prebuild(old, new)
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                _KB_RELOAD_ERRORS.inc()
+                return False
+            self._gen = new
+            self.last_error = None
+            _KB_RELOAD_SECONDS.observe(time.perf_counter() - start)
+            _KB_GENERATION.set(new.id)
+            _KB_INVALID_MODULES.set(len(new.errors))
+            return True
+
+    def _build(self, old: Generation, stamps: Dict[str, Tuple[int, int]]) -> Generation:
+        snapshot = open_snapshot(self.masters_path, stamps=stamps) if self.use_snapshot and stamps else None
+        # Unchanged files keep their parsed data (and their errors)
+        modules = {m: d for m, d in old.modules.items() if stamps.get(m) == old.stamps.get(m)}
+        errors = {m: p for m, p in old.errors.items() if stamps.get(m) == old.stamps.get(m)}
+        if snapshot is not None:
+            errors.update((m, p) for m, p in snapshot.problems.items() if snapshot.errors.get(m) == stamps.get(m))
+        elif old.stamps:
+            # No snapshot to validate through: check changed files now, not on first read
+            for module, stamp in stamps.items():
+                if stamp != old.stamps.get(module):
+                    data, problems = self._parse(module, stamp, None)
+                    if problems:
+                        errors[module] = problems
+                    else:
+                        modules[module] = data
+
+        for module, problems in errors.items():
+            if stamps[module] != old.stamps.get(module) or module not in old.errors:
+                _KB_VALIDATION_ERRORS.inc(module=module)
+            if module not in modules and module in old.stamps:
+                last_valid = self._read(old, module)
+                if last_valid:
+                    modules[module] = last_valid
+        return Generation(old.id + 1, stamps, snapshot, modules, errors)
+
+    def _prebuild(self, old: Generation, new: Generation):
+        with self.pin(new):
+            for key, build in list(old.builders.items()):
+                if key in new.derived:
+                    continue
+                try:
+                    new.derived[key] = build(self)
+                    new.builders[key] = build
+                except Exception:
+                    continue  # built (and raised) again on first use
+
+    def _parse(self, module: str, stamp: Tuple[int, int],
+               snapshot: Optional[Snapshot]) -> Tuple[Dict, List[str]]:
+        """A module file parsed, validated and compacted (see kb_intern):
+        (data, problems), with ``{}`` as data when there are problems.
+
+        If the file no longer matches ``stamp`` and ``snapshot`` holds that
+        version, it is decoded from the snapshot instead.
+        """
+        try:
+            with open(self.masters_path / f"{module}_masters.json", 'r', encoding='utf-8') as f:
+                st = os.fstat(f.fileno())
+                if snapshot is not None and (st.st_mtime_ns, st.st_size) != stamp:
+                    return compact(snapshot.module(module)), []
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            return {}, [f"invalid JSON: {e}"]
+        except IOError as e:
+            return {}, [f"unreadable: {e}"]
+        problems = validate_module(data)
+        return ({} if problems else compact(data)), problems
+
+    def _read(self, gen: Generation, module: str) -> Dict:
+        """``module`` as of ``gen`` (parsed, from its snapshot, or {} if invalid there)."""
+        data = gen.modules.get(module)
+        if data is not None:
+            return data
+        snapshot = self._snapshot_for(module, gen)
+        if snapshot is not None:
+            return compact(snapshot.module(module) or {})
+        if module in gen.errors or module not in gen.stamps:
+            return {}
+        data, problems = self._parse(module, gen.stamps[module], None)
+        return {} if problems else data
+
+    def errors(self) -> Dict[str, List[str]]:
+        """Modules whose current file failed to parse or validate, with the problems found."""
+        self.refresh()
+        return dict(self._current().errors)
+
+    def watch(self, interval: Optional[float] = None,
+              on_reload: Optional[Callable[[], Any]] = None) -> threading.Event:
+        """Check the sources every ``interval`` seconds (default ``check_interval``)
+        from a daemon thread, so reloads happen off the request path. Set the
+        returned event to stop.
+
+        ``on_reload()`` runs on that thread after each new generation is
+        swapped in, for state derived from the same sources; if it raises,
+        the error is recorded in ``last_error`` and the watch carries on.
+        """
+        interval = self.check_interval if interval is None else interval
+        stop = threading.Event()
+
+        def loop():
+            while not stop.wait(interval):
+                if self.refresh(force=True) and on_reload is not None:
+                    try:
+                        on_reload()
+                    except Exception as e:
+                        self.last_error = f"{type(e).__name__}: {e}"
+                        _KB_RELOAD_ERRORS.inc()
+            self._watching = False
+
+        self._watching = True
+        threading.Thread(target=loop, name="kb-watch", daemon=True).start()
+        return stop
+
+    def prefetch(self, first: Iterable[str] = (),
+                 load: Optional[Callable[["KnowledgeBase", str], Any]] = None) -> threading.Thread:
+        """Load modules from a daemon thread: ``first`` in order, then the rest
+        at low priority (pausing ``PREFETCH_PAUSE`` before each).
+
+        ``load(kb, module)`` does the loading (default: parse the module), so
+        callers can also warm what they derive per module. A reader that needs
+        a module the thread is loading waits for that module only; failures
+        are left for the reader to hit.
+        """
+        load = load or KnowledgeBase.module
+
+        def run():
+            names = self.module_names()
+            priority = [m for m in dict.fromkeys(first) if m in names]
+            for i, module in enumerate(priority + [m for m in names if m not in priority]):
+                if i >= len(priority):
+                    time.sleep(PREFETCH_PAUSE)
+                try:
+                    load(self, module)
+                except Exception:
+                    continue
+
+        thread = threading.Thread(target=run, name="kb-prefetch", daemon=True)
+        thread.start()
+        return thread
+
+    def module_names(self) -> List[str]:
+        """Modules with a source file (including ones that fail to parse), sorted."""
+        self.refresh()
+        return list(self._current().stamps)
+
+    def has_module(self, module: str) -> bool:
+        self.refresh()
+        return module in self._current().stamps
+
+    def module(self, module: str) -> Dict:
+        """Parsed module data, or ``{}`` if missing or invalid (and never valid before)."""
+        self.refresh()
+        gen = self._current()
+        data = gen.modules.get(module)
+        if data is not None:
+            return data
+        stamp = gen.stamps.get(module)
+        if stamp is None or module in gen.errors:
+            return {}
+        with self._key_lock("module", module):
+            data = gen.modules.get(module)
+            if data is not None:
+                return data
+            if module in gen.errors:
+                return {}
+            data, problems = self._parse(module, stamp, self._snapshot_for(module, gen))
+            with self._lock:
+                if problems:
+                    gen.errors = dict(gen.errors, **{module: problems})
+                else:
+                    gen.modules = dict(gen.modules, **{module: data})
+            if problems:
+                _KB_VALIDATION_ERRORS.inc(module=module)
+                return {}
+            return data
+
+    def modules(self) -> Dict[str, Dict]:
+        """Every valid module, keyed by name (loads any not yet parsed)."""
+        for name in self.module_names():
+            self.module(name)
+        return self._current().modules
+
+    def _snapshot_for(self, module: str, gen: Optional[Generation] = None) -> Optional[Snapshot]:
+        """The snapshot, if it holds the generation's version of ``module``."""
+        gen = gen or self._current()
+        snapshot = gen.snapshot
+        stamp = gen.stamps.get(module)
+        if snapshot is not None and stamp is not None and snapshot.sources.get(module) == stamp:
+            return snapshot
+        return None
+
+    def get(self, module: str, *path, default: Any = None) -> Any:
+        """The value at ``path`` (dict keys / list indexes) in a module, or ``default``.
+
+        Modules already parsed are read in place; otherwise only the requested
+        value is decoded from the snapshot.
+        """
+        self.refresh()
+        gen = self._current()
+        data = gen.modules.get(module)
+        if data is None:
+            snapshot = self._snapshot_for(module, gen)
+            if snapshot is not None:
+                return snapshot.get(module, *path, default=default)
+            data = self.module(module)
+            if not data:
+                return default
+        for key in path:
+            try:
+                data = data[key]
+            except (KeyError, IndexError, TypeError):
+                return default
+        return data
+
+    def master(self, module: str, name: str) -> Optional[Dict]:
+        """One master's record by name (case-insensitive), or None."""
+        self.refresh()
+        gen = self._current()
+        wanted = name.lower()
+        snapshot = None if module in gen.modules else self._snapshot_for(module, gen)
+        if snapshot is not None:
+            for candidate in snapshot.master_names(module):
+                if candidate.lower() == wanted:
+                    return snapshot.master(module, candidate)
+            return None
+        for master in self.module(module).get("masters", []):
+            if master.get("name", "").lower() == wanted:
+                return master
+        return None
+
+    def derived(self, key: str, build: Callable[["KnowledgeBase"], Any]) -> Any:
+        """``build(self)``, computed once per generation and shared by every caller."""
+        self.refresh()
+        gen = self._current()
+        try:
+            return gen.derived[key]
+        except KeyError:
+            pass
+        with self._key_lock("derived", key):
+            if key not in gen.derived:
+                with self.pin(gen):
+                    gen.derived[key] = build(self)
+                gen.builders[key] = build
+            return gen.derived[key]
+
+    def search_index(self) -> Optional[SearchIndex]:
+        """The compiled search index for the current sources (None if unavailable)."""
+        return self.derived("search", lambda kb: open_search_index(kb.masters_path, stamps=kb._stamps))
+
+    def vector_index(self) -> Optional[VectorIndex]:
+        """TF-IDF vectors of the current teachings (None if unavailable)."""
+        return self.derived("vectors", build_vector_index)
+
+    def connection_graph(self) -> ConnectionGraph:
+        """Modules linked by their cross-module connections."""
+        return self.derived("graph", build_connection_graph)
+
+    def level_tables(self) -> LevelTables:
+        """Level definitions and progressive exercises keyed by (module, level / difficulty)."""
+        return self.derived("levels", build_level_tables)
+
+    def masters_index(self) -> MastersIndex:
+        """Every valid module's masters, paged; shares its records' contents with ``modules``."""
+        return self.derived("masters_index", lambda kb: MastersIndex(kb.modules()))
+
+    def master_directory(self) -> Dict[str, List[Dict]]:
+        """Name and expertise of every master by module, built without parsing modules."""
+        return self.derived("master_directory", build_master_directory)
+
+    def search(self, query: str, modules: Optional[Iterable[str]] = None,
+               kinds: Optional[Iterable[str]] = None, limit: int = DEFAULT_LIMIT) -> List[Dict]:
+        """BM25-ranked teachings matching ``query``; raises ValueError for an unknown module."""
+        index = self.search_index()
+        if index is None:
+            return []
+        return index.search(query, modules=modules, kinds=kinds, limit=limit)
@@ -0,0 +1,120 @@
+"""
+Self-Mastery OS - Byte-Budgeted LRU Cache
+Thread-safe LRU bounded by entry count and by the approximate in-memory size
+of the cached (parsed) objects. Shared by server.py's file cache and the
+DataManager read cache.
+"""
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+_MISSING = object()
+
+
+def approx_size(obj: Any, _depth: int = 0) -> int:
+    """Approximate deep size in bytes of JSON-like data (dicts, lists, strings, numbers)."""
+    size = sys.getsizeof(obj)
+    if _depth > 32:
+        return size
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += approx_size(key, _depth + 1) + approx_size(value, _depth + 1)
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            size += approx_size(item, _depth + 1)
+    return size
+
+
+class LRUCache:
+    """LRU mapping limited to ``max_bytes`` (approximate) and ``max_entries``.
+
+    Entries may carry a ``stamp`` (e.g. a file's mtime and size); ``get`` with
+    a stamp only hits when the stored stamp matches, so stale entries are
+    never returned. Values are shared, not copied: treat them as read-only.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, max_entries: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+        self._bytes = 0
+        # key -> (value, stamp, size)
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable, stamp: Any = None, default: Any = None) -> Any:
+        """Return the cached value (marking it recently used), or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING or (stamp is not None and entry[1] != stamp):
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, stamp: Any = None, size: Optional[int] = None) -> bool:
+        """Store a value, evicting least recently used entries to fit.
+
+        Values larger than the whole budget are not cached. Returns True if stored.
+        """
+        if size is None:
+            size = approx_size(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            if size > self.max_bytes:
+                return False
+            self._entries[key] = (value, stamp, size)
+            self._bytes += size
+            while self._entries and (
+                self._bytes > self.max_bytes
+                or (self.max_entries is not None and len(self._entries) > self.max_entries)
+            ):
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+                self.evicted_bytes += evicted
+            return True
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop one entry. Returns True if it was cached."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._bytes -= entry[2]
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "evicted_bytes": self.evicted_bytes,
+            }
@@ -9,6 +9,7 @@ Usage:
     python main.py pm           # Quick evening reflection
     python main.py week         # Weekly review
     python main.py status       # Show status dashboard
+    python main.py search cold calling --module sales
 """
 import sys
 import os
@@ -23,12 +24,13 @@ from daily_checkin import morning_checkin, evening_reflection
 from weekly_review import weekly_review, show_progress_dashboard
 from action_planner import ActionPlanner
 from coaching import Coach
+from nightly import run_nightly, print_nightly
 from wisdom_engine import WisdomEngine
 from utils import (
     clear_screen, print_header, print_subheader, print_success,
     print_info, print_warning, print_error, print_coach,
-    get_input, get_int_input, get_yes_no, get_choice,
-    MODULE_NAMES, Colors, pause
+    get_input, get_int_input, get_yes_no, get_choice, get_page,
+    MODULE_NAMES, PAGE_SIZE, Colors, Screen, pause
 )
 
 # Get the base path (parent of src directory)
@@ -84,16 +86,37 @@ def main():
             return
 
         elif cmd in ["masters", "mentors"]:
+            # Load modules while the library menu (names only) waits for a pick
+            WisdomEngine(dm).prefetch()
             if needs_onboarding(dm):
                 run_onboarding(dm)
             show_masters_library(dm)
             return
 
+        elif cmd in ["search", "find"]:
+            args = sys.argv[2:]
+            modules = []
+            while "--module" in args:
+                i = args.index("--module")
+                modules.extend(args[i + 1:i + 2])
+                del args[i:i + 2]
+            if not args:
+                print_error("Usage: python main.py search <query> [--module <name>]")
+                return
+            print_search_results(dm, " ".join(args), modules)
+            return
+
+        elif cmd == "nightly":
+            print_nightly(run_nightly(dm))
+            return
+
         elif cmd in ["help", "-h", "--help"]:
             print_help()
             return
 
-    # Run main menu
+    # Run main menu, loading the focus modules (then the rest) while it is up.
+    # Commands that need them at once (wisdom) gain nothing from a prefetch
+    WisdomEngine(dm).prefetch()
     run_main_menu(dm)
 
 
@@ -506,32 +529,52 @@ def view_knowledge_base(dm: DataManager):
 
 
 def show_masters_library(dm: DataManager):
-    """Browse the masters library - teachings from world-class experts."""
+    """Browse the masters library - teachings from world-class experts.
+
+    Screens list names and expertise from the knowledge base's master
+    directory; a master's full record is only loaded in show_master_detail.
+    """
     wisdom = WisdomEngine(dm)
+    page = 0
 
     while True:
-        clear_screen()
-        print_header("MASTERS LIBRARY")
-
-        print("Learn from the world's best in each domain:\n")
-
-        # Get all masters organized by module
-        modules_with_masters = []
-        for module in MODULE_NAMES.keys():
-            masters = wisdom.get_module_masters(module)
-            if masters:
-                modules_with_masters.append((module, masters))
-
-        # Display modules
-        for i, (module, masters) in enumerate(modules_with_masters, 1):
-            module_name = MODULE_NAMES.get(module, module.title())
-            master_names = ", ".join([m["name"] for m in masters[:3]])
-            print(f"  [{i}] {module_name}")
-            print(f"      {Colors.DIM}{master_names}{Colors.ENDC}")
+        directory = wisdom.kb.master_directory()
+        modules_with_masters = [(m, directory[m]) for m in MODULE_NAMES if m in directory]
+        shown, page, pages = get_page(modules_with_masters, page)
+
+        screen = Screen()
+        screen.header("MASTERS LIBRARY")
+        screen.add("Learn from the world's best in each domain:\n")
+        for i, (module, masters) in enumerate(shown, page * PAGE_SIZE + 1):
+            master_names = ", ".join(m["name"] for m in masters[:3])
+            screen.add(f"  [{i}] {MODULE_NAMES.get(module, module.title())}")
+            screen.add(f"      {Colors.DIM}{master_names}{Colors.ENDC}")
+
+        if pages > 1:
+            screen.add(f"\n  Page {page + 1}/{pages}   [N] Next   [P] Previous")
+        screen.add(f"\n  [S] Search all teachings")
+        screen.add(f"  [C] Connected modules & learning paths")
+        screen.add(f"  [0] Back to menu")
+        screen.render()
+
+        choice = get_input(f"\nSelect module (0-{len(modules_with_masters)}, S, C)")
+        command = choice.strip().lower()
+
+        if command in ("n", "p"):
+            page += 1 if command == "n" else -1
+            continue
 
-        print(f"\n  [0] Back to menu")
+        if command == "c":
+            show_module_connections(dm)
+            continue
 
-        choice = get_input(f"\nSelect module (0-{len(modules_with_masters)})")
+        if command == "s":
+            query = get_input("Search for")
+            if query.strip():
+                clear_screen()
+                print_search_results(dm, query)
+                pause()
+            continue
 
         try:
             choice = int(choice)
@@ -546,20 +589,70 @@ def show_masters_library(dm: DataManager):
             browse_module_masters(dm, module, masters)
 
 
+def show_module_connections(dm: DataManager):
+    """Modules related to the user's strongest areas, and learning paths between modules."""
+    graph = WisdomEngine(dm).kb.connection_graph()
+    levels = (dm.get_user_profile() or {}).get("module_levels", {})
+    label = lambda m: MODULE_NAMES.get(graph.names[m], m.replace("_", " ").title())  # noqa: E731
+
+    clear_screen()
+    print_header("CONNECTED MODULES")
+    print("Where your strongest areas lead next:\n")
+    for i, hit in enumerate(graph.related(levels), 1):
+        via = ", ".join(label(m) for m in hit["via"][:3])
+        print(f"  [{i}] {label(hit['module'])}")
+        print(f"      {Colors.DIM}via {via}{Colors.ENDC}")
+
+    start = get_input("\nLearning path from module (Enter to go back)").strip()
+    if not start:
+        return
+    goal = get_input("To module").strip()
+    try:
+        result = graph.learning_path(start, goal)
+    except ValueError as e:
+        print_error(str(e))
+        pause()
+        return
+
+    if result is None:
+        print_info("These modules are not connected.")
+    else:
+        print_subheader(" -> ".join(label(m) for m in result["path"]))
+        for step in result["steps"]:
+            connection = step["connections"][0]
+            print(f"  {Colors.BOLD}{label(step['from'])} -> {label(step['to'])}{Colors.ENDC}")
+            print(f"      {connection['insight']}")
+            if connection["exercise"]:
+                print(f"      {Colors.GREEN}Try:{Colors.ENDC} {connection['exercise']}")
+            print()
+    pause()
+
+
 def browse_module_masters(dm: DataManager, module: str, masters: list):
-    """Browse masters within a specific module."""
+    """Browse masters within a specific module (``masters``: name and expertise)."""
+    module_name = MODULE_NAMES.get(module, module.title())
+    page = 0
+
     while True:
-        clear_screen()
-        module_name = MODULE_NAMES.get(module, module.title())
-        print_header(f"{module_name.upper()} MASTERS")
+        shown, page, pages = get_page(masters, page)
 
-        for i, master in enumerate(masters, 1):
-            print(f"  [{i}] {master['name']}")
-            print(f"      {Colors.DIM}{master.get('expertise', '')}{Colors.ENDC}")
+        screen = Screen()
+        screen.header(f"{module_name.upper()} MASTERS")
+        for i, master in enumerate(shown, page * PAGE_SIZE + 1):
+            screen.add(f"  [{i}] {master['name']}")
+            screen.add(f"      {Colors.DIM}{master.get('expertise', '')}{Colors.ENDC}")
 
-        print(f"\n  [0] Back")
+        if pages > 1:
+            screen.add(f"\n  Page {page + 1}/{pages}   [N] Next   [P] Previous")
+        screen.add(f"\n  [0] Back")
+        screen.render()
 
         choice = get_input(f"\nSelect master (0-{len(masters)})")
+        command = choice.strip().lower()
+
+        if command in ("n", "p"):
+            page += 1 if command == "n" else -1
+            continue
 
         try:
             choice = int(choice)
@@ -570,30 +663,60 @@ def browse_module_masters(dm: DataManager, module: str, masters: list):
             break
 
         if 1 <= choice <= len(masters):
-            show_master_detail(masters[choice - 1])
+            show_master_detail(dm, module, masters[choice - 1]["name"])
 
 
-def show_master_detail(master: dict):
-    """Show detailed view of a single master."""
-    clear_screen()
+def show_master_detail(dm: DataManager, module: str, name: str):
+    """Show detailed view of a single master, loading only that master's record."""
+    master = WisdomEngine(dm).kb.master(module, name)
+    if master is None:
+        print_error(f"Master '{name}' not found in {module}")
+        pause()
+        return
 
-    print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*60}")
-    print(f"  {master['name'].upper()}")
-    print(f"{'='*60}{Colors.ENDC}")
-    print(f"\n{Colors.YELLOW}Expertise:{Colors.ENDC} {master.get('expertise', 'N/A')}")
+    screen = Screen()
+    screen.add(f"\n{Colors.BOLD}{Colors.CYAN}{'='*60}")
+    screen.add(f"  {master['name'].upper()}")
+    screen.add(f"{'='*60}{Colors.ENDC}")
+    screen.add(f"\n{Colors.YELLOW}Expertise:{Colors.ENDC} {master.get('expertise', 'N/A')}")
 
-    print(f"\n{Colors.BOLD}KEY PRINCIPLES:{Colors.ENDC}")
+    screen.add(f"\n{Colors.BOLD}KEY PRINCIPLES:{Colors.ENDC}")
     for i, principle in enumerate(master.get("key_principles", []), 1):
-        print(f"\n  {i}. \"{principle}\"")
+        screen.add(f"\n  {i}. \"{principle}\"")
 
-    print(f"\n{Colors.BOLD}DAILY PRACTICES:{Colors.ENDC}")
+    screen.add(f"\n{Colors.BOLD}DAILY PRACTICES:{Colors.ENDC}")
     for practice in master.get("daily_practices", []):
-        print(f"  - {practice}")
+        screen.add(f"  - {practice}")
 
-    print(f"\n{Colors.CYAN}{'='*60}{Colors.ENDC}")
+    screen.add(f"\n{Colors.CYAN}{'='*60}{Colors.ENDC}")
+    screen.render()
     pause()
 
 
+def print_search_results(dm: DataManager, query: str, modules: list = None):
+    """Print BM25-ranked teachings matching a query."""
+    wisdom = WisdomEngine(dm)
+    try:
+        results = wisdom.kb.search(query, modules=modules)
+    except ValueError as e:
+        print_error(str(e))
+        return
+
+    print_subheader(f'SEARCH: "{query}"')
+    if not results:
+        print_info("No matching teachings found.")
+        return
+
+    for i, hit in enumerate(results, 1):
+        module_name = MODULE_NAMES.get(hit["module"], hit["module"].replace("_", " ").title())
+        source = f" - {hit['master']}" if hit["master"] else ""
+        print(f"  [{i}] {Colors.BOLD}{hit['title']}{Colors.ENDC}")
+        print(f"      {Colors.DIM}{module_name} / {hit['kind']}{source}{Colors.ENDC}")
+        if hit["snippet"] != hit["title"]:
+            print(f"      {hit['snippet'][:160]}")
+        print()
+
+
 def print_help():
     """Print help information."""
     print(f"""
@@ -608,8 +731,10 @@ Commands:
   week, review    Run weekly review
   wisdom, daily   Show today's wisdom & insights
   masters         Browse masters library
+  search <query>  Search teachings (add --module <name> to filter)
   status, dash    Show progress dashboard
   patterns        Show pattern analysis
+  nightly         Run the nightly precompute jobs (for cron)
   help            Show this help message
 
 Examples:
@@ -617,6 +742,7 @@ Examples:
   python main.py am           # Quick morning check-in
   python main.py wisdom       # Get today's wisdom
   python main.py masters      # Browse expert teachings
+  python main.py search fear of rejection
 """)
 
 
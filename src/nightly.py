@@ -0,0 +1,94 @@
+"""
+Self-Mastery OS - Nightly Jobs
+Work precomputed once a night so daytime views only read stored results.
+Schedule it with cron (``15 3 * * * python /path/to/src/nightly.py``) or
+Windows Task Scheduler, let the dashboard server run it
+(``python server.py --nightly 03:15``), or run ``python src/main.py
+nightly`` by hand.
+
+Usage:
+    python src/nightly.py
+"""
+import os
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from data_manager import DataManager
+from wisdom_batch import pregenerate_all
+from wisdom_engine import WisdomEngine
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def match_reflections(dm: DataManager) -> Dict:
+    """Match every evening reflection to its closest teachings."""
+    return WisdomEngine(dm).precompute_reflection_teachings()
+
+
+def pregenerate_wisdom(dm: DataManager) -> Dict:
+    """Store today's and tomorrow's wisdom for the owner and every tenant."""
+    return pregenerate_all(dm)
+
+
+# Jobs run in order: (name, job(dm) -> summary dict)
+JOBS: List[Tuple[str, Callable[[DataManager], Dict]]] = [
+    ("reflection_teachings", match_reflections),
+    ("wisdom_packages", pregenerate_wisdom),
+]
+
+
+def run_nightly(dm: DataManager) -> Dict[str, Dict]:
+    """Run every nightly job; a failing job is reported and does not stop the rest."""
+    results = {}
+    for name, job in JOBS:
+        start = time.perf_counter()
+        try:
+            summary = dict(job(dm) or {})
+        except Exception as e:
+            summary = {"error": f"{type(e).__name__}: {e}"}
+        summary["seconds"] = round(time.perf_counter() - start, 3)
+        results[name] = summary
+    return results
+
+
+def seconds_until(at: str, now: Optional[datetime] = None) -> float:
+    """Seconds from ``now`` to the next ``at`` (HH:MM, local time); ValueError if malformed."""
+    hour, minute = (int(part) for part in at.split(":"))
+    now = now or datetime.now()
+    target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+
+def schedule_nightly(at: str) -> threading.Event:
+    """Run this script every day at ``at`` (HH:MM) from a daemon thread.
+
+    Each run is a separate process, so it is safe alongside forked server
+    workers and never holds the server's locks. Set the returned event to stop.
+    """
+    seconds_until(at)  # validate before starting the thread
+    stop = threading.Event()
+
+    def loop():
+        while not stop.wait(seconds_until(at)):
+            subprocess.run([sys.executable, os.path.abspath(__file__)])
+
+    threading.Thread(target=loop, name="nightly", daemon=True).start()
+    return stop
+
+
+def print_nightly(results: Dict[str, Dict]):
+    for name, summary in results.items():
+        details = ", ".join(f"{k}={v}" for k, v in summary.items())
+        print(f"{name}: {details}")
+
+
+if __name__ == "__main__":
+    results = run_nightly(DataManager(BASE_PATH))
+    print_nightly(results)
+    sys.exit(1 if any("error" in r for r in results.values()) else 0)
@@ -0,0 +1,80 @@
+"""
+Self-Mastery OS - Rotation
+No-repeat rotation through a pool of n items (a user's teachings, insights
+or challenges): day ``d`` shows item ``perm_c(d mod n)``, where ``c = d // n``
+is the cycle and ``perm_c`` a pseudo-random permutation of ``range(n)``
+keyed by the user, the pool and the cycle.
+
+Every item is therefore shown exactly once per n consecutive days, in a
+fresh shuffled order each cycle. The permutation is a small Feistel network
+(cycle-walked down to ``range(n)``), so a pick costs O(1) and the whole
+rotation state is (key, n, day): nothing is stored per user, and any
+process - the CLI, a server worker or the nightly pre-generation - picks
+the same item for the same day.
+"""
+import hashlib
+from datetime import date as _date
+from functools import lru_cache
+
+FEISTEL_ROUNDS = 4
+
+
+def day_number(date: str) -> int:
+    """Day index of a YYYY-MM-DD date (consecutive dates give consecutive numbers).
+
+    Parsed with ``date.fromisoformat``: ``strptime`` imports and compiles its
+    regexes on first use, a few ms on a cold start.
+    """
+    return _date.fromisoformat(date).toordinal()
+
+
+def _key64(text: str) -> int:
+    return int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+
+
+class KeyedPermutation:
+    """Pseudo-random bijection on ``range(n)``; ``perm[i]`` is O(1) expected."""
+
+    def __init__(self, n: int, key: int):
+        if n < 1:
+            raise ValueError("Permutation needs at least one item")
+        self.n = n
+        # Balanced Feistel over 2 * half_bits >= bits(n - 1); the domain is < 4n,
+        # so cycle-walking takes fewer than 4 steps on average
+        self.half_bits = max(1, ((n - 1).bit_length() + 1) // 2)
+        self.mask = (1 << self.half_bits) - 1
+        self.round_keys = [(key >> (16 * r)) & 0xFFFF | (r << 16) for r in range(FEISTEL_ROUNDS)]
+
+    def _round(self, x: int, round_key: int) -> int:
+        x = ((x ^ round_key) * 0x9E3779B1) & 0xFFFFFFFF
+        x ^= x >> 15
+        x = (x * 0x85EBCA77) & 0xFFFFFFFF
+        return (x ^ (x >> 13)) & self.mask
+
+    def _encrypt(self, x: int) -> int:
+        left, right = x >> self.half_bits, x & self.mask
+        for round_key in self.round_keys:
+            left, right = right, left ^ self._round(right, round_key)
+        return (left << self.half_bits) | right
+
+    def __getitem__(self, i: int) -> int:
+        if not 0 <= i < self.n:
+            raise IndexError(i)
+        x = self._encrypt(i)
+        while x >= self.n:
+            x = self._encrypt(x)
+        return x
+
+    def __len__(self) -> int:
+        return self.n
+
+
+@lru_cache(maxsize=256)
+def _cycle_permutation(key: str, n: int, cycle: int) -> KeyedPermutation:
+    return KeyedPermutation(n, _key64(f"{key}|{n}|{cycle}"))
+
+
+def rotation_index(key: str, n: int, day: int) -> int:
+    """Index of the pool item shown on ``day`` for the rotation named ``key``."""
+    cycle, position = divmod(day, n)
+    return _cycle_permutation(key, n, cycle)[position]
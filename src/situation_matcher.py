@@ -0,0 +1,170 @@
+"""
+Self-Mastery OS - Situation Matcher
+Maps a free-text situation ("I keep procrastinating on my sales calls") to
+the knowledge-base modules it is about.
+
+All patterns (hand-picked keywords per module plus terms mined from each
+module's own text) are compiled into one Aho-Corasick automaton, so every
+module is scored in a single pass over the input, however many patterns
+there are.
+"""
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Seed keywords per module. Patterns match whole words; a trailing "*"
+# matches any word starting with the prefix ("procrastinat*").
+MODULE_KEYWORDS = {
+    "money": ["money", "income", "salary", "wealth", "earn*", "rich", "broke", "raise", "paid",
+              "side hustle", "net worth"],
+    "sales": ["sell*", "sales", "close", "closing", "pitch*", "client*", "deal*", "reject*",
+              "cold call*", "outreach", "prospect*", "quota", "objection*", "lead*"],
+    "finance": ["save", "saving*", "invest*", "budget*", "debt*", "expense*", "retire*", "loan*",
+                "credit card*", "spending", "emergency fund"],
+    "social": ["social", "date", "dating", "friend*", "relationship*", "confidence", "approach*",
+               "talk to", "partner", "girlfriend", "boyfriend", "wife", "husband", "lonely", "flirt*"],
+    "mindset": ["fear*", "anxiety", "anxious", "stress*", "doubt*", "mindset", "belief*", "mental*",
+                "stuck", "overthink*", "negative thought*", "imposter", "failure"],
+    "productivity": ["focus*", "distract*", "procrastinat*", "productiv*", "time", "busy", "work",
+                     "deadline*", "to-do", "todo", "task*", "email*", "meetings"],
+    "business": ["business*", "startup*", "idea*", "launch*", "customer*", "product*", "founder*",
+                 "company", "market*", "competitor*"],
+    "lifestyle": ["habit*", "routine*", "environment", "clutter*", "phone", "social media", "declutter*",
+                  "screen time", "scroll*", "minimalis*", "apartment"],
+    "health": ["sleep*", "tired", "exhausted", "energy", "exercise*", "workout*", "diet*", "weight",
+               "health*", "gym", "caffeine", "insomnia", "fitness"],
+    "communication": ["speak*", "presentation*", "public speaking", "listen*", "conversation*",
+                      "communicat*", "interrupt*", "feedback", "difficult conversation*", "storytelling"],
+    "emotional_intelligence": ["emotion*", "angry", "anger", "upset", "frustrat*", "overwhelm*",
+                               "feeling*", "empathy", "jealous*", "resent*", "mood*", "triggered"],
+    "critical_thinking": ["decision*", "decide*", "bias*", "think clearly", "problem solving", "logic*",
+                          "evaluate", "choose between", "trade-off*", "tradeoff*", "reasoning"],
+}
+
+SEED_WEIGHT = 1.0
+# Mined terms count for less than seeds, scaled by how concentrated they are
+MINED_WEIGHT = 0.5
+MIN_MINED_LENGTH = 4
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum()
+
+
+class AhoCorasick:
+    """Multi-pattern matcher: finds every occurrence of every pattern in one pass."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        for pattern in patterns:
+            self._add(pattern)
+        self._link()
+
+    def _add(self, pattern: str):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(len(self.patterns))
+        self.patterns.append(pattern)
+
+    def _link(self):
+        """Breadth-first failure links; each node inherits its fail node's outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def finditer(self, text: str) -> Iterable[Tuple[int, int]]:
+        """Yield ``(start, pattern index)`` for every match in ``text``."""
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        node = 0
+        for end, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for index in out[node]:
+                yield end - len(patterns[index]) + 1, index
+
+
+class SituationMatcher:
+    """Scores modules for a situation from seed keywords and mined KB terms."""
+
+    def __init__(self, weights: Dict[str, Dict[str, float]], prefixes: Iterable[str] = (),
+                 order: Iterable[str] = ()):
+        """``weights`` maps pattern -> {module: weight}; ``prefixes`` may end mid-word."""
+        self.weights = weights
+        self.prefixes = frozenset(prefixes)
+        self.order = {m: i for i, m in enumerate(order)}
+        self._automaton = AhoCorasick(weights)
+        self._prefix_flags = [p in self.prefixes for p in self._automaton.patterns]
+
+    @classmethod
+    def build(cls, modules: Iterable[str],
+              mined: Optional[Dict[str, List[Tuple[str, float]]]] = None) -> "SituationMatcher":
+        """Matcher for ``modules`` from MODULE_KEYWORDS plus ``mined`` (term, share) lists."""
+        modules = list(modules)
+        weights: Dict[str, Dict[str, float]] = {}
+        prefixes = set()
+
+        def add(pattern, module, weight):
+            slot = weights.setdefault(pattern, {})
+            slot[module] = max(slot.get(module, 0.0), weight)
+
+        for module in modules:
+            for keyword in MODULE_KEYWORDS.get(module, []):
+                pattern = keyword.rstrip("*")
+                if keyword.endswith("*"):
+                    prefixes.add(pattern)
+                add(pattern, module, SEED_WEIGHT)
+            for term, share in (mined or {}).get(module, []):
+                if len(term) < MIN_MINED_LENGTH or not term.isalpha():
+                    continue
+                # Accept the singular and plural forms of mined terms
+                forms = {term, term[:-1]} if term.endswith("s") and not term.endswith("ss") else {term, term + "s"}
+                for form in forms:
+                    add(form, module, MINED_WEIGHT * share)
+        return cls(weights, prefixes, order=modules)
+
+    def scores(self, situation: str) -> List[Tuple[str, float]]:
+        """Modules with a positive score, best first (each pattern counts once)."""
+        text = situation.lower()
+        matched = set()
+        for start, index in self._automaton.finditer(text):
+            if index in matched or (start > 0 and _is_word_char(text[start - 1])):
+                continue
+            end = start + len(self._automaton.patterns[index])
+            if not self._prefix_flags[index] and end < len(text) and _is_word_char(text[end]):
+                continue
+            matched.add(index)
+
+        totals: Dict[str, float] = {}
+        for index in matched:
+            for module, weight in self.weights[self._automaton.patterns[index]].items():
+                totals[module] = totals.get(module, 0.0) + weight
+        return sorted(totals.items(), key=lambda mw: (-mw[1], self.order.get(mw[0], len(self.order))))
+
+    def best(self, situation: str) -> Optional[str]:
+        scores = self.scores(situation)
+        return scores[0][0] if scores else None
+
+
+def build_matcher(kb) -> SituationMatcher:
+    """Matcher for a KnowledgeBase's modules, mining terms from its search index."""
+    index = kb.search_index()
+    mined = index.distinctive_terms() if index is not None else None
+    return SituationMatcher.build(kb.module_names(), mined)
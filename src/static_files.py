@@ -0,0 +1,194 @@
+"""
+Self-Mastery OS - Static File Cache
+Keeps open file descriptors and stat results for static assets so the server
+can stream them with os.sendfile (zero-copy) and answer Range requests.
+"""
+import os
+import select
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate
+from typing import Optional, Tuple
+
+# Platforms without os.sendfile (e.g. Windows) open the file per request instead
+HAS_SENDFILE = hasattr(os, "sendfile")
+
+
+class StaticFile:
+    """An open, immutable snapshot of one file (fd + stat-derived headers)."""
+
+    def __init__(self, path: str, st: os.stat_result):
+        self.path = path
+        self.size = st.st_size
+        self.mtime_ns = st.st_mtime_ns
+        self.inode = (st.st_dev, st.st_ino)
+        self.etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        self.last_modified = formatdate(st.st_mtime, usegmt=True)
+        self.fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0)) if HAS_SENDFILE else None
+        self.checked = time.monotonic()
+        self._refs = 0
+        self._retired = False
+        self._lock = threading.Lock()
+
+    def matches(self, st: os.stat_result) -> bool:
+        return (st.st_mtime_ns, st.st_size, (st.st_dev, st.st_ino)) == \
+            (self.mtime_ns, self.size, self.inode)
+
+    def acquire(self):
+        with self._lock:
+            self._refs += 1
+
+    def release(self):
+        with self._lock:
+            self._refs -= 1
+            close = self._retired and self._refs == 0
+        if close:
+            self._close()
+
+    def retire(self):
+        """Mark stale; the fd is closed once the last in-flight response releases it."""
+        with self._lock:
+            self._retired = True
+            close = self._refs == 0
+        if close:
+            self._close()
+
+    def _close(self):
+        if self.fd is not None:
+            try:
+                os.close(self.fd)
+            except OSError:
+                pass
+            self.fd = None
+
+
+class StaticFileCache:
+    """LRU of open StaticFiles, re-validated against ``os.stat`` at most every ``ttl`` seconds."""
+
+    def __init__(self, max_files: int = 64, ttl: float = 1.0):
+        self.max_files = max_files
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._files: "OrderedDict[str, StaticFile]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def open(self, path: str) -> Optional[StaticFile]:
+        """Return an acquired StaticFile for ``path`` (caller must ``release()``), or None."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._files.get(path)
+            if entry is not None and now - entry.checked < self.ttl:
+                self._files.move_to_end(path)
+                entry.acquire()
+                self.hits += 1
+                return entry
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.invalidate(path)
+            return None
+        if not os.path.isfile(path):
+            return None
+
+        with self._lock:
+            entry = self._files.get(path)
+            if entry is not None and entry.matches(st):
+                entry.checked = now
+                self._files.move_to_end(path)
+                entry.acquire()
+                self.hits += 1
+                return entry
+
+            self.misses += 1
+            try:
+                fresh = StaticFile(path, st)
+            except OSError:
+                return None
+            if entry is not None:
+                entry.retire()
+            self._files[path] = fresh
+            self._files.move_to_end(path)
+            while len(self._files) > self.max_files:
+                _, evicted = self._files.popitem(last=False)
+                evicted.retire()
+            fresh.acquire()
+            return fresh
+
+    def invalidate(self, path: Optional[str] = None):
+        """Drop one path (or everything) from the cache."""
+        with self._lock:
+            if path is None:
+                entries = list(self._files.values())
+                self._files.clear()
+            else:
+                entry = self._files.pop(path, None)
+                entries = [entry] if entry else []
+        for entry in entries:
+            entry.retire()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"open_files": len(self._files), "hits": self.hits, "misses": self.misses}
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single ``bytes=`` range into an inclusive ``(start, end)``.
+
+    Returns None when the header should be ignored (absent, malformed, or
+    multiple ranges) and raises ValueError when it is unsatisfiable.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    start_s, sep, end_s = header[6:].strip().partition("-")
+    if not sep:
+        return None
+    try:
+        start = int(start_s) if start_s else None
+        end = int(end_s) if end_s else None
+    except ValueError:
+        return None
+
+    if start is None:
+        # Suffix range: the last N bytes
+        if end is None:
+            return None
+        if end == 0 or size == 0:
+            raise ValueError("range not satisfiable")
+        return max(size - end, 0), size - 1
+    if end is None:
+        end = size - 1
+    elif end < start:
+        return None
+    if start >= size:
+        raise ValueError("range not satisfiable")
+    return start, min(end, size - 1)
+
+
+def send_file(sock, entry: StaticFile, offset: int, count: int) -> int:
+    """Stream ``count`` bytes of ``entry`` from ``offset`` to a socket. Returns bytes sent."""
+    sent = 0
+    if HAS_SENDFILE and entry.fd is not None:
+        out = sock.fileno()
+        while sent < count:
+            try:
+                n = os.sendfile(out, entry.fd, offset + sent, count - sent)
+            except BlockingIOError:
+                select.select([], [out], [])
+                continue
+            if n == 0:
+                break
+            sent += n
+        return sent
+
+    with open(entry.path, "rb") as f:
+        f.seek(offset)
+        while sent < count:
+            chunk = f.read(min(64 * 1024, count - sent))
+            if not chunk:
+                break
+            sock.sendall(chunk)
+            sent += len(chunk)
+    return sent
@@ -0,0 +1,150 @@
+"""
+Self-Mastery OS - Tenants
+Per-user data directories for a shared dashboard server: each user gets a
+live DataManager with its own bounded read cache, kept in an LRU pool so a
+server for a whole team holds only recently active users in memory. All
+tenants share one knowledge base.
+"""
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from data_manager import DataManager
+from lru_cache import LRUCache
+
+# Valid user ids (also the directory name under the tenants root)
+USER_ID_RE = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+# Environment override for the tenants root (default: ~/.self_mastery/tenants,
+# outside the app directory the dashboard server serves from)
+TENANTS_PATH_ENV = 'SELF_MASTERY_TENANTS_PATH'
+DEFAULT_TENANTS_PATH = os.path.join('~', '.self_mastery', 'tenants')
+
+# Default budgets: at most 64 live users x 4 MB of parsed files each
+DEFAULT_MAX_TENANTS = 64
+DEFAULT_TENANT_CACHE_BYTES = 4 * 1024 * 1024
+
+
+def tenants_root(base_path: Path) -> Path:
+    """Directory holding one data directory per user.
+
+    ``base_path`` (the app directory) is not used by the default, which is
+    kept outside it so user data is never under the server's docroot.
+    """
+    return Path(os.environ.get(TENANTS_PATH_ENV) or os.path.expanduser(DEFAULT_TENANTS_PATH))
+
+
+def list_users(root: Path) -> List[str]:
+    """User ids with a data directory under ``root``, sorted."""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return []
+    with entries:
+        return sorted(e.name for e in entries if e.is_dir() and USER_ID_RE.match(e.name))
+
+
+class Tenant:
+    """Live state for one user: DataManager, its read cache and today's wisdom."""
+
+    def __init__(self, user_id: str, base_path: Path, kb_path: Optional[Path] = None,
+                 cache: Optional[LRUCache] = None,
+                 cache_bytes: int = DEFAULT_TENANT_CACHE_BYTES):
+        self.user_id = user_id
+        self.cache = cache if cache is not None else LRUCache(max_bytes=cache_bytes, max_entries=256)
+        self.dm = DataManager(base_path, cache=self.cache, kb_path=kb_path)
+        self.wisdom = None
+        self.wisdom_date = None
+        # Data version last seen (stamp = version file inode/mtime/size)
+        self._seen_stamp = None
+        self._seen_version = None
+
+    def reset_wisdom(self):
+        self.wisdom = None
+        self.wisdom_date = None
+
+    def sync_version(self) -> bool:
+        """Drop the read cache and wisdom if this user's data version changed.
+
+        Another process (a pre-fork worker) may have written this user's
+        files; returns True when state was dropped. Costs one stat() while
+        the version file is unchanged.
+        """
+        try:
+            st = os.stat(self.dm.data_path / "data_version.json")
+        except OSError:
+            return False
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)  # each write replaces the file
+        if stamp == self._seen_stamp:
+            return False
+        version = self.dm.get_data_version()
+        changed = self._seen_version is not None and version != self._seen_version
+        self._seen_stamp, self._seen_version = stamp, version
+        if changed:
+            self.cache.clear()
+            self.reset_wisdom()
+        return changed
+
+
+class TenantPool:
+    """LRU pool of Tenants for users with a directory under ``root``.
+
+    Unknown users are never created implicitly (``get`` returns None), so a
+    request cannot make the server create directories.
+    """
+
+    def __init__(self, root: Path, kb_path: Path, max_tenants: int = DEFAULT_MAX_TENANTS,
+                 cache_bytes: int = DEFAULT_TENANT_CACHE_BYTES):
+        self.root = Path(root)
+        self.kb_path = Path(kb_path)
+        self.max_tenants = max_tenants
+        self.cache_bytes = cache_bytes
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+        self._tenants: "OrderedDict[str, Tenant]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def get(self, user_id: str) -> Optional[Tenant]:
+        """Return the live Tenant for ``user_id``, loading it if needed; None if unknown."""
+        if not isinstance(user_id, str) or not USER_ID_RE.match(user_id):
+            return None
+        with self._lock:
+            tenant = self._tenants.get(user_id)
+            if tenant is not None:
+                self._tenants.move_to_end(user_id)
+                self.hits += 1
+                return tenant
+
+            base = self.root / user_id
+            if not base.is_dir():
+                return None
+            tenant = Tenant(user_id, base, kb_path=self.kb_path, cache_bytes=self.cache_bytes)
+            self._tenants[user_id] = tenant
+            self.loads += 1
+            while len(self._tenants) > self.max_tenants:
+                self._tenants.popitem(last=False)
+                self.evictions += 1
+            return tenant
+
+    def cache_bytes_in_use(self) -> int:
+        with self._lock:
+            return sum(t.cache.bytes for t in self._tenants.values())
+
+    def stats(self) -> Dict:
+        with self._lock:
+            live = len(self._tenants)
+        return {
+            "tenants": live,
+            "max_tenants": self.max_tenants,
+            "hits": self.hits,
+            "loads": self.loads,
+            "evictions": self.evictions,
+            "cache_bytes": self.cache_bytes_in_use(),
+        }
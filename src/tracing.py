@@ -0,0 +1,215 @@
+"""
+Self-Mastery OS - Request Tracing
+Records nested, monotonic-clock spans for a request (read / compute /
+serialize / compress / write) and appends finished traces to a JSON-lines
+file of Chrome trace events. Spans are no-ops unless a trace is active.
+
+Usage:
+    python src/tracing.py logs/traces.jsonl > trace.json
+    # then open trace.json in chrome://tracing or https://ui.perfetto.dev
+"""
+import contextvars
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+# Request header that forces a trace for one request (if the tracer allows it)
+TRACE_HEADER = "X-Trace"
+
+# Size at which the trace file is rotated to <file>.1 (the previous .1 is dropped)
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+_current: contextvars.ContextVar = contextvars.ContextVar("trace", default=None)
+
+
+class Trace:
+    """Spans recorded for a single request."""
+
+    def __init__(self, name: str):
+        self.id = uuid.uuid4().hex[:16]
+        self.name = name
+        self.start_ns = time.monotonic_ns()
+        self.end_ns = None
+        self.tid = threading.get_ident()
+        self.forced = False
+        self.spans: List[Dict] = []
+        self._stack = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.monotonic_ns()
+        return (end - self.start_ns) / 1e6
+
+    @contextmanager
+    def span(self, name: str, **args):
+        stack = getattr(self._stack, "spans", None)
+        if stack is None:
+            stack = self._stack.spans = []
+        record = {
+            "name": name,
+            "start_ns": time.monotonic_ns(),
+            "tid": threading.get_ident(),
+            "parent": stack[-1]["name"] if stack else None,
+        }
+        if args:
+            record["args"] = args
+        stack.append(record)
+        try:
+            yield record
+        finally:
+            stack.pop()
+            record["end_ns"] = time.monotonic_ns()
+            with self._lock:
+                self.spans.append(record)
+
+    def chrome_events(self, pid: int) -> List[Dict]:
+        """Complete ("X") events in microseconds, as read by the Chrome trace viewer."""
+        events = [{
+            "name": self.name, "cat": "request", "ph": "X", "pid": pid,
+            "tid": self.tid,
+            "ts": self.start_ns / 1000, "dur": ((self.end_ns or self.start_ns) - self.start_ns) / 1000,
+            "args": {"trace_id": self.id},
+        }]
+        for span in sorted(self.spans, key=lambda s: s["start_ns"]):
+            event = {
+                "name": span["name"], "cat": "span", "ph": "X", "pid": pid, "tid": span["tid"],
+                "ts": span["start_ns"] / 1000, "dur": (span["end_ns"] - span["start_ns"]) / 1000,
+                "args": dict(span.get("args", {}), trace_id=self.id),
+            }
+            events.append(event)
+        return events
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, **args):
+    """Context manager timing ``name`` within the active trace (no-op if none)."""
+    trace = _current.get()
+    if trace is None:
+        return _NULL_SPAN
+    return trace.span(name, **args)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current.get()
+
+
+def bind(fn):
+    """Wrap ``fn`` so it records into the caller's trace when run on another thread."""
+    if _current.get() is None:
+        return fn
+    ctx = contextvars.copy_context()
+    return lambda *a, **kw: ctx.run(fn, *a, **kw)
+
+
+class Tracer:
+    """Decides which requests to trace and writes finished traces.
+
+    A request is traced when ``always`` is set or, if ``allow_requests``,
+    when it carries ``X-Trace: 1`` (both always exported), or when it falls
+    in the ``sample_rate`` fraction watched by the slow-request log
+    (exported only if it took at least ``slow_ms``). The export file is
+    rotated to ``<path>.1`` once it would grow past ``max_bytes``.
+    """
+
+    def __init__(self, path: str, always: bool = False, slow_ms: Optional[float] = None,
+                 sample_rate: float = 1.0, allow_requests: bool = False,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.always = always
+        self.slow_ms = slow_ms
+        self.sample_rate = sample_rate
+        self.allow_requests = allow_requests
+        self.max_bytes = max_bytes
+        self.exported = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, default_path: str) -> "Tracer":
+        """Configure from SELF_MASTERY_TRACE, _TRACE_REQUESTS, _TRACE_SLOW_MS,
+        _TRACE_SAMPLE, _TRACE_FILE and _TRACE_MAX_BYTES.
+        """
+        slow = os.environ.get("SELF_MASTERY_TRACE_SLOW_MS")
+        return cls(
+            path=os.environ.get("SELF_MASTERY_TRACE_FILE", default_path),
+            always=os.environ.get("SELF_MASTERY_TRACE", "0") == "1",
+            slow_ms=float(slow) if slow else None,
+            sample_rate=float(os.environ.get("SELF_MASTERY_TRACE_SAMPLE", "1.0")),
+            allow_requests=os.environ.get("SELF_MASTERY_TRACE_REQUESTS", "0") == "1",
+            max_bytes=int(os.environ.get("SELF_MASTERY_TRACE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+        )
+
+    def start(self, name: str, requested: bool = False):
+        """Begin a trace for the current request, or return None if it is not traced.
+
+        ``requested`` (the client sent ``X-Trace: 1``) counts only with
+        ``allow_requests``. Returns ``(trace, token)``; pass both to ``finish``.
+        """
+        forced = (requested and self.allow_requests) or self.always
+        if not forced and (self.slow_ms is None or random.random() >= self.sample_rate):
+            return None
+        trace = Trace(name)
+        trace.forced = forced
+        return trace, _current.set(trace)
+
+    def finish(self, started) -> bool:
+        """End a trace started by ``start``. Returns True if it was exported."""
+        trace, token = started
+        _current.reset(token)
+        trace.end_ns = time.monotonic_ns()
+        if not trace.forced and trace.duration_ms < self.slow_ms:
+            return False
+        self.export(trace)
+        return True
+
+    def export(self, trace: Trace):
+        """Append a trace's events to the JSON-lines file (one per line), rotating it when full."""
+        lines = "".join(json.dumps(e, separators=(',', ':')) + "\n" for e in trace.chrome_events(os.getpid()))
+        data = lines.encode("utf-8")
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            try:
+                size = os.path.getsize(self.path)
+            except OSError:
+                size = 0
+            if size and size + len(data) > self.max_bytes:
+                os.replace(self.path, self.path + ".1")
+            with open(self.path, "ab") as f:
+                f.write(data)
+            self.exported += 1
+
+
+def to_chrome_trace(jsonl_path: str) -> Dict:
+    """Load a JSON-lines trace log as a Chrome trace-viewer document."""
+    events = []
+    with open(jsonl_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                events.append(json.loads(line))
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python src/tracing.py <traces.jsonl> > trace.json")
+        sys.exit(1)
+    json.dump(to_chrome_trace(sys.argv[1]), sys.stdout)
@@ -2,9 +2,10 @@
 Self-Mastery OS - Utility Functions
 """
 import os
+import sys
 import json
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Color codes for terminal output
 class Colors:
@@ -59,6 +60,41 @@ def print_menu(options: List[str], title: str = "Options"):
         print(f"  [{i}] {option}")
     print()
 
+# Rows per page in paged list screens
+PAGE_SIZE = 10
+
+class Screen:
+    """Buffered terminal screen: lines are collected, then cleared and written
+    in one call instead of one print (and a ``clear`` process) per line."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def add(self, text: str = ""):
+        self.lines.append(text)
+
+    def header(self, text: str):
+        rule = f"{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.ENDC}"
+        self.lines += ["", rule, f"{Colors.BOLD}{Colors.CYAN}  {text}{Colors.ENDC}", rule, ""]
+
+    def render(self, clear: bool = True):
+        """Write the screen, clearing the terminal first (ANSI, except on Windows)."""
+        prefix = ""
+        if clear:
+            if os.name == 'nt':
+                clear_screen()
+            else:
+                prefix = "\033[2J\033[H"
+        sys.stdout.write(prefix + "\n".join(self.lines) + "\n")
+        sys.stdout.flush()
+        self.lines = []
+
+def get_page(items: List, page: int, page_size: int = PAGE_SIZE) -> Tuple[List, int, int]:
+    """The items on ``page`` (clamped to the valid range), that page and the page count."""
+    pages = max(1, -(-len(items) // page_size))
+    page = min(max(page, 0), pages - 1)
+    return items[page * page_size:(page + 1) * page_size], page, pages
+
 def get_input(prompt: str, default: str = "") -> str:
     """Get user input with optional default."""
     if default:
@@ -5,6 +5,7 @@ Handles weekly review and planning flows.
 from datetime import datetime, timedelta
 from typing import Dict, List
 from data_manager import DataManager
+from wisdom_engine import WisdomEngine
 from utils import (
     clear_screen, print_header, print_subheader, print_success,
     print_info, print_warning, print_coach, print_score,
@@ -378,4 +379,17 @@ def show_progress_dashboard(dm: DataManager):
             print(f"    {Colors.DIM}Goal: {data.get('goal', 'Not set')}{Colors.ENDC}")
             print()
 
+    # ==================== Level Progress ====================
+    level_progress = WisdomEngine(dm).get_level_progress(profile.get("module_levels", {}))
+    if level_progress:
+        print_subheader("LEVEL PROGRESS")
+
+        for module, progress in level_progress.items():
+            name = MODULE_NAMES.get(module, module.title())
+            current = (progress["current"] or {}).get("name", "Not started")
+            print(f"  {name}: {progress['level']}/10 - {current}")
+            if progress["next"]:
+                print(f"    {Colors.DIM}Next (level {progress['next_level']}): "
+                      f"{progress['next'].get('name', '')} - {progress['next'].get('milestone', '')}{Colors.ENDC}")
+
     pause()
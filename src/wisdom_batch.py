@@ -0,0 +1,112 @@
+"""
+Self-Mastery OS - Wisdom Pre-generation
+Generates daily wisdom packages ahead of time for a range of dates and
+every user (the server owner plus each tenant), so the first dashboard hit
+after midnight reads a stored package instead of loading the knowledge
+base.
+
+Packages land in each user's wisdom cache (data/wisdom_cache, keyed by
+date and seed; see WisdomEngine.get_daily_wisdom), which is exactly where
+/api/wisdom and the CLI look first. Each worker loads the knowledge base
+once and serves all of its users from it; with many users the work is
+split across a process pool.
+
+Usage:
+    python src/wisdom_batch.py [--start YYYY-MM-DD] [--days N] [--workers N]
+"""
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from data_manager import DataManager
+from tenants import list_users, tenants_root
+from wisdom_engine import WisdomEngine
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Today and tomorrow: the nightly run covers the next midnight rollover
+DEFAULT_DAYS = 2
+
+# Below this many users a process pool costs more to start than it saves
+POOL_MIN_USERS = 16
+
+
+def wisdom_targets(base_path: Path) -> List[Tuple[str, str]]:
+    """``(user_id, data base path)`` for the owner ("default") and every tenant."""
+    root = tenants_root(base_path)
+    return [("default", str(base_path))] + [(user, str(root / user)) for user in list_users(root)]
+
+
+def _generate(kb_path: str, targets: List[Tuple[str, str]], dates: List[str]) -> Dict:
+    """Fill each target's wisdom cache for ``dates`` (runs in a worker process)."""
+    generated = cached = 0
+    errors = {}
+    for user_id, base in targets:
+        try:
+            engine = WisdomEngine(DataManager(base, kb_path=kb_path), user_id)
+            for date in dates:
+                if engine.dm.get_cached_wisdom(date, engine.daily_seed(date)) is None:
+                    engine.get_daily_wisdom(date)
+                    generated += 1
+                else:
+                    cached += 1
+        except Exception as e:
+            errors[user_id] = f"{type(e).__name__}: {e}"
+    return {"generated": generated, "cached": cached, "errors": errors}
+
+
+def pregenerate(targets: List[Tuple[str, str]], kb_path: Path, start: Optional[str] = None,
+                days: int = DEFAULT_DAYS, workers: Optional[int] = None) -> Dict:
+    """Generate missing packages for ``days`` dates from ``start`` (default today).
+
+    Returns counts of generated and already-cached packages plus per-user errors.
+    """
+    first = datetime.strptime(start, "%Y-%m-%d") if start else datetime.now()
+    dates = [(first + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(max(0, days))]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(targets) or 1))
+    if workers > 1 and len(targets) >= POOL_MIN_USERS:
+        chunks = [targets[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_generate, repeat(str(kb_path)), chunks, repeat(dates)))
+    else:
+        workers = 1
+        parts = [_generate(str(kb_path), targets, dates)]
+
+    summary = {"users": len(targets), "dates": len(dates), "workers": workers,
+               "generated": 0, "cached": 0, "errors": {}}
+    for part in parts:
+        summary["generated"] += part["generated"]
+        summary["cached"] += part["cached"]
+        summary["errors"].update(part["errors"])
+    return summary
+
+
+def pregenerate_all(dm: DataManager, start: Optional[str] = None, days: int = DEFAULT_DAYS,
+                    workers: Optional[int] = None) -> Dict:
+    """Pre-generate for ``dm``'s owner and every tenant (see tenants_root)."""
+    return pregenerate(wisdom_targets(dm.base_path), dm.kb_path, start, days, workers)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    options = {}
+    for flag in ("--start", "--days", "--workers"):
+        if flag in args:
+            i = args.index(flag)
+            options[flag] = args[i + 1] if i + 1 < len(args) else None
+            del args[i:i + 2]
+    if args or None in options.values():
+        print("Usage: python src/wisdom_batch.py [--start YYYY-MM-DD] [--days N] [--workers N]")
+        sys.exit(1)
+    summary = pregenerate_all(
+        DataManager(BASE_PATH),
+        start=options.get("--start"),
+        days=int(options.get("--days", DEFAULT_DAYS)),
+        workers=int(options["--workers"]) if "--workers" in options else None,
+    )
+    print(", ".join(f"{k}={v}" for k, v in summary.items()))
+    sys.exit(1 if summary["errors"] else 0)
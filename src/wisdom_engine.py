@@ -3,140 +3,216 @@ Self-Mastery OS - Proactive Wisdom Engine
 Delivers daily insights, teachings, and skill challenges from world-class masters.
 """
 import os
-import json
+import hashlib
 import random
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from data_manager import DataManager
+from kb_search import MAX_LIMIT
+from kb_snapshot import source_stamps
+from knowledge_base import KnowledgeBase
+from rotation import day_number, rotation_index
+from situation_matcher import build_matcher
+from wisdom_pools import Sampler, module_pool, sampler
 from utils import Colors, MODULE_NAMES, print_header, print_subheader, print_coach
 
+# Evening-reflection fields matched against the teachings
+REFLECTION_FIELDS = ("challenges", "lessons", "improvement_for_tomorrow")
+REFLECTION_DAYS = 7
+# Teachings stored per reflection by the nightly precompute
+TEACHINGS_PER_REFLECTION = 10
+
+def _teaching_text(item, default: str = "") -> str:
+    """Display text for a principle or practice stored as a string or a dict."""
+    if isinstance(item, str):
+        return item
+    if isinstance(item, dict):
+        for key in ("principle", "practice", "title", "name"):
+            if isinstance(item.get(key), str):
+                detail = item.get("explanation") or item.get("description")
+                return f"{item[key]}: {detail}" if isinstance(detail, str) else item[key]
+    return default or str(item)
+
+
+def _reflection_text(reflection) -> str:
+    """The free text of an evening reflection that teachings are matched against."""
+    if not isinstance(reflection, dict):
+        return ""
+    parts = []
+    for field in REFLECTION_FIELDS:
+        value = reflection.get(field)
+        parts.extend(value if isinstance(value, list) else [value])
+    return " ".join(p.strip() for p in parts if isinstance(p, str) and p.strip())
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+def wisdom_seed(date: str, user_id: str, modules: List[str]) -> str:
+    """Seed for one user's daily wisdom: same date, user and module set, same package."""
+    key = f"{date}|{user_id}|{','.join(sorted(set(modules)))}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
 class WisdomEngine:
     """Proactive wisdom delivery from world-class masters."""
 
-    def __init__(self, dm: DataManager):
+    def __init__(self, dm: DataManager, user_id: str = "default"):
         self.dm = dm
+        self.user_id = user_id
         self.base_path = Path(dm.base_path)
-        self.masters_path = self.base_path / "knowledge_base" / "masters"
+        self.masters_path = Path(dm.kb_path) / "masters"
         self.profile = dm.get_user_profile() or {}
-        self._masters_data = {}  # Lazy-load cache
-        self._loaded_modules = set()  # Track which modules are loaded
+        self._kb: Optional[KnowledgeBase] = None
+
+    @property
+    def kb(self) -> KnowledgeBase:
+        """Shared, lazily parsed masters data (see knowledge_base.KnowledgeBase).
+
+        Opened on first use, so answering from the wisdom cache never touches it.
+        """
+        if self._kb is None:
+            self._kb = KnowledgeBase.shared(self.masters_path)
+        return self._kb
+
+    def prefetch(self) -> threading.Thread:
+        """Start loading the knowledge base in the background, focus modules first.
+
+        Each module's wisdom pool is built as it loads, so the first
+        get_daily_wisdom or library view finds it ready instead of parsing.
+        """
+        return self.kb.prefetch(self._focus_modules(), module_pool)
 
     def _load_module(self, module: str) -> Dict:
-        """Lazy-load a single module's master data."""
-        if module in self._loaded_modules:
-            return self._masters_data.get(module, {})
-
-        file_path = self.masters_path / f"{module}_masters.json"
-        if file_path.exists():
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self._masters_data[module] = data
-                    self._loaded_modules.add(module)
-                    return data
-            except (json.JSONDecodeError, IOError):
-                pass
-        return {}
+        """Get a single module's master data from the shared knowledge base."""
+        return self.kb.module(module)
 
     @property
     def masters_data(self) -> Dict:
-        """Get all masters data (loads all modules on first access for backward compatibility)."""
-        # Lazy load all modules on first access
-        if not self._masters_data and self.masters_path.exists():
-            for file in sorted(self.masters_path.glob("*_masters.json")):
-                module = file.stem.replace("_masters", "")
-                if module not in self._loaded_modules:
-                    self._load_module(module)
-        return self._masters_data
-
-    def get_daily_wisdom(self) -> Dict:
-        """Generate comprehensive daily wisdom package."""
-        focus_modules = self.profile.get("focus_modules", list(self.masters_data.keys())[:3])
-
-        wisdom = {
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "master_teaching": self._get_master_teaching(focus_modules),
-            "daily_insight": self._get_daily_insight(focus_modules),
-            "skill_challenge": self._get_skill_challenge(focus_modules),
-            "power_question": self._get_power_question(),
-            "mindset_shift": self._get_mindset_shift()
+        """Get all masters data (every module, parsed once per process)."""
+        return self.kb.modules()
+
+    def get_daily_wisdom(self, date: Optional[str] = None) -> Dict:
+        """Generate comprehensive daily wisdom package.
+
+        Picks are seeded by date, user and focus-module set (see wisdom_seed),
+        so every process produces the same package; it is stored in
+        data/wisdom_cache and later calls answer from there. Teachings,
+        insights and challenges rotate (see rotation): each is shown once
+        before any repeats.
+        """
+        date = date or datetime.now().strftime("%Y-%m-%d")
+        focus_modules = self._focus_modules()
+        seed = wisdom_seed(date, self.user_id, focus_modules)
+        cached = self.dm.get_cached_wisdom(date, seed)
+        if cached is not None:
+            return cached
+
+        wisdom = self.build_daily_wisdom(date, focus_modules, seed)
+        self.dm.save_cached_wisdom(date, seed, wisdom)
+        return wisdom
+
+    def build_daily_wisdom(self, date: str, focus_modules: List[str], seed: str) -> Dict:
+        """The daily wisdom package for ``date``, computed without the cache."""
+        rng = random.Random(int(seed, 16))
+        focus_modules = sorted(set(focus_modules))
+        day = day_number(date)
+        return {
+            "date": date,
+            "master_teaching": self._get_master_teaching(focus_modules, rng, day),
+            "daily_insight": self._get_daily_insight(focus_modules, rng, day),
+            "skill_challenge": self._get_skill_challenge(focus_modules, rng, day),
+            "power_question": self._get_power_question(rng),
+            "mindset_shift": self._get_mindset_shift(rng)
         }
 
-        return wisdom
+    def _focus_modules(self) -> List[str]:
+        return self.profile.get("focus_modules") or list(source_stamps(self.masters_path))[:3]
+
+    def daily_seed(self, date: str) -> str:
+        """The wisdom_seed of this user's package for ``date``."""
+        return wisdom_seed(date, self.user_id, self._focus_modules())
 
-    def _get_master_teaching(self, focus_modules: List[str]) -> Dict:
-        """Get a teaching from a master in focus areas."""
+    def _pick(self, pool: Sampler, rng, day: Optional[int], pool_name: str, modules: List[str]):
+        """Today's item of this user's ``pool_name`` rotation, or a random one without a ``day``."""
+        if day is None:
+            return pool.pick(rng)
+        key = f"{self.user_id}|{pool_name}|{','.join(modules)}"
+        return pool.at(rotation_index(key, len(pool), day))
+
+    def _get_master_teaching(self, focus_modules: List[str], rng=random,
+                             day: Optional[int] = None) -> Dict:
+        """Get a teaching from a master in focus areas (rotating through every
+        principle of those modules when ``day`` is given)."""
         available_modules = []
         for m in focus_modules:
-            if (self.masters_path / f"{m}_masters.json").exists():
+            if self.kb.has_module(m):
                 available_modules.append(m)
 
         if not available_modules:
             # Fall back to any available module
-            if self.masters_path.exists():
-                available_modules = [f.stem.replace("_masters", "") for f in self.masters_path.glob("*_masters.json")]
+            available_modules = self.kb.module_names()
 
         if not available_modules:
             return {"master": "Unknown", "teaching": "No teachings available.", "module": "general"}
 
-        module = random.choice(available_modules)
-        module_data = self._load_module(module)
-        masters = module_data.get("masters", [])
+        if day is not None:
+            principles = sampler(self.kb, "principle", available_modules)
+            if principles is not None:
+                module, i, principle = self._pick(principles, rng, day, "teachings", available_modules)
+                return self._teaching(module, i, principle, rng)
 
-        if not masters:
+        module = rng.choice(available_modules)
+        pool = module_pool(self.kb, module)
+        if not pool.masters:
             return {"master": "Unknown", "teaching": "No masters found.", "module": module}
 
-        master = random.choice(masters)
-        principles = master.get("key_principles", [])
-        daily_practices = master.get("daily_practices", ["Apply this today."])
+        i = rng.randrange(len(pool.masters))
+        principles = pool.master_items("principle", i)
+        return self._teaching(module, i, rng.choice(principles) if principles else "No teaching available.", rng)
 
+    def _teaching(self, module: str, master_index: int, principle, rng) -> Dict:
+        pool = module_pool(self.kb, module)
+        master = pool.masters[master_index]
+        daily_practices = pool.master_items("practice", master_index)
         return {
             "master": master.get("name", "Unknown"),
             "expertise": master.get("expertise", ""),
-            "teaching": random.choice(principles) if principles else "No teaching available.",
-            "practice": random.choice(daily_practices) if daily_practices else "Apply this today.",
+            "teaching": principle,
+            "practice": rng.choice(daily_practices) if daily_practices else "Apply this today.",
             "module": module
         }
 
-    def _get_daily_insight(self, focus_modules: List[str]) -> str:
-        """Get a daily insight from focus modules."""
-        all_insights = []
-
-        # Only load focus modules
-        for module in focus_modules:
-            module_data = self._load_module(module)
-            insights = module_data.get("daily_insights", [])
-            all_insights.extend(insights)
-
-        # Add some cross-module insights (still lazy-loaded)
-        if all_insights:
-            return random.choice(all_insights)
-
-        # Fallback: load one additional module for insights
-        available_modules = [f.stem.replace("_masters", "") for f in self.masters_path.glob("*_masters.json")]
-        if available_modules:
-            module = random.choice(available_modules)
-            module_data = self._load_module(module)
-            insights = module_data.get("daily_insights", [])
-            if insights:
-                return random.choice(insights)
+    def _get_daily_insight(self, focus_modules: List[str], rng=random,
+                           day: Optional[int] = None) -> str:
+        """Get a daily insight from focus modules (rotating when ``day`` is given)."""
+        insights = sampler(self.kb, "insight", focus_modules)
+        if insights is None:
+            # Fallback: insights from any module
+            insights = sampler(self.kb, "insight", self.kb.module_names())
+        if insights is not None:
+            return self._pick(insights, rng, day, "insights", focus_modules)[2]
 
         return "Show up. Do the work. Repeat."
 
-    def _get_skill_challenge(self, focus_modules: List[str]) -> Dict:
-        """Get a skill challenge for today."""
-        # Prioritize focus modules
-        module = random.choice(focus_modules) if focus_modules else "productivity"
-
-        if module in self.masters_data:
-            challenges = self.masters_data[module].get("skill_challenges", [])
-            if challenges:
-                return {
-                    "module": module,
-                    "module_name": MODULE_NAMES.get(module, module.title()),
-                    "challenge": random.choice(challenges)
-                }
+    def _get_skill_challenge(self, focus_modules: List[str], rng=random,
+                             day: Optional[int] = None) -> Dict:
+        """Get a skill challenge for today (rotating through every focus-module
+        challenge when ``day`` is given)."""
+        # Prioritize focus modules; random picks give each an equal chance
+        modules = focus_modules or ["productivity"]
+        weights = None if day is not None else dict.fromkeys(modules, 1.0)
+        challenges = sampler(self.kb, "challenge", modules, weights)
+        if challenges is not None:
+            module, _, challenge = self._pick(challenges, rng, day, "challenges", modules)
+            return {
+                "module": module,
+                "module_name": MODULE_NAMES.get(module, module.title()),
+                "challenge": challenge
+            }
 
         return {
             "module": "productivity",
@@ -144,7 +220,7 @@ class WisdomEngine:
             "challenge": "Complete your #1 priority before noon."
         }
 
-    def _get_power_question(self) -> str:
+    def _get_power_question(self, rng=random) -> str:
         """Get a power question for self-reflection."""
         questions = [
             "What would the best version of me do right now?",
@@ -168,9 +244,9 @@ class WisdomEngine:
             "If I had 6 months to live, would I be doing this?",
             "What's the smallest step I can take right now?"
         ]
-        return random.choice(questions)
+        return rng.choice(questions)
 
-    def _get_mindset_shift(self) -> Dict:
+    def _get_mindset_shift(self, rng=random) -> Dict:
         """Get a mindset reframe for the day."""
         shifts = [
             {"from": "I don't have time", "to": "It's not a priority", "why": "Own your choices. If it mattered, you'd find time."},
@@ -186,50 +262,128 @@ class WisdomEngine:
             {"from": "It's too hard", "to": "It's supposed to be hard", "why": "Hard is what makes it valuable."},
             {"from": "I'm not talented enough", "to": "I haven't practiced enough", "why": "Talent is overrated. Reps are underrated."}
         ]
-        return random.choice(shifts)
+        return rng.choice(shifts)
 
     def get_master_advice_for_situation(self, situation: str) -> str:
         """Get relevant master advice for a specific situation."""
-        situation_lower = situation.lower()
-
-        # Map situations to modules
-        module_keywords = {
-            "money": ["money", "income", "salary", "wealth", "earn", "rich", "broke"],
-            "sales": ["sell", "close", "pitch", "client", "deal", "reject", "cold call", "outreach"],
-            "finance": ["save", "invest", "budget", "debt", "expense", "retire"],
-            "dating": ["social", "date", "friend", "relationship", "confidence", "approach", "talk to"],
-            "mindset": ["fear", "anxiety", "stress", "doubt", "mindset", "belief", "mental", "stuck"],
-            "productivity": ["focus", "distract", "procrastinate", "productive", "time", "busy", "work"],
-            "business": ["business", "startup", "idea", "launch", "customer", "product"],
-            "lifestyle": ["habit", "routine", "environment", "clutter", "phone", "social media"]
-        }
-
-        # Find relevant module
-        relevant_module = None
-        for module, keywords in module_keywords.items():
-            if any(kw in situation_lower for kw in keywords):
-                relevant_module = module
-                break
+        # Score every module in one pass (see situation_matcher)
+        relevant_module = self.kb.derived("situation_matcher", build_matcher).best(situation)
 
         if not relevant_module:
-            if self.masters_data:
-                relevant_module = random.choice(list(self.masters_data.keys()))
+            available_modules = self.kb.module_names()
+            if available_modules:
+                relevant_module = random.choice(available_modules)
             else:
                 return "Take action despite uncertainty. Clarity comes from doing, not thinking."
 
-        # Get advice from that module's masters
-        module_data = self.masters_data.get(relevant_module, {})
-        masters = module_data.get("masters", [])
+        # Most relevant principle in that module, with a practice from the same master
+        try:
+            principles = self.kb.search(situation, modules=[relevant_module], kinds=["principle"], limit=1)
+            practices = self.kb.search(situation, modules=[relevant_module], kinds=["practice"],
+                                       limit=MAX_LIMIT)
+        except ValueError:
+            principles = practices = []
+
+        if principles:
+            hit = principles[0]
+            master_index = hit["path"][1]
+            master = self.kb.get(relevant_module, "masters", master_index, default={})
+            principle = _teaching_text(self.kb.get(relevant_module, *hit["path"]), hit["title"])
+            practice = next(
+                (_teaching_text(self.kb.get(relevant_module, *p["path"]), p["title"])
+                 for p in practices if p["path"][1] == master_index),
+                None,
+            )
+            if practice is None:
+                own = master.get("daily_practices") or ["Take action now."]
+                practice = _teaching_text(own[0], "Take action now.")
+            return f'{master.get("name", hit["master"])} says: "{principle}"\n\nApply it: {practice}'
+
+        # Nothing in the module matches the wording: fall back to any of its masters
+        masters = self.kb.get(relevant_module, "masters", default=[])
 
         if masters:
             master = random.choice(masters)
-            principle = random.choice(master.get("key_principles", ["Keep pushing forward."]))
-            practice = random.choice(master.get("daily_practices", ["Take action now."]))
+            principle = random.choice(master.get("key_principles") or ["Keep pushing forward."])
+            practice = random.choice(master.get("daily_practices") or ["Take action now."])
 
-            return f'{master["name"]} says: "{principle}"\n\nApply it: {practice}'
+            return f'{master["name"]} says: "{_teaching_text(principle)}"\n\nApply it: {_teaching_text(practice)}'
 
         return "Take action despite uncertainty. Clarity comes from doing, not thinking."
 
+    def precompute_reflection_teachings(self) -> Dict:
+        """Match every saved reflection to its closest teachings (the nightly job).
+
+        Only new or edited reflections are scored, in one batch; everything is
+        rescored when the knowledge base changed since the last run.
+        """
+        index = self.kb.vector_index()
+        if index is None:
+            return {"computed": 0, "cached": 0}
+        store = self.dm.get_reflection_teachings()
+        if store.get("kb") != index.signature:
+            store = {"kb": index.signature, "reflections": {}}
+        entries = store.setdefault("reflections", {})
+
+        pending = []
+        for date in self.dm.get_log_dates():
+            log = self.dm.get_daily_log(date) or {}
+            text = _reflection_text(log.get("pm_reflection"))
+            if not text:
+                entries.pop(date, None)
+            elif entries.get(date, {}).get("hash") != _text_hash(text):
+                pending.append((date, text))
+
+        for (date, text), hits in zip(pending, index.similar([t for _, t in pending],
+                                                              TEACHINGS_PER_REFLECTION)):
+            entries[date] = {
+                "hash": _text_hash(text),
+                "teachings": [{k: v for k, v in hit.items() if k != "snippet"} for hit in hits],
+            }
+        store["updated_at"] = datetime.now().isoformat()
+        self.dm.save_reflection_teachings(store)
+        return {"computed": len(pending), "cached": len(entries) - len(pending)}
+
+    def get_reflection_teachings(self, days: int = REFLECTION_DAYS, k: int = 5,
+                                 precomputed_only: bool = False) -> List[Dict]:
+        """Teachings most relevant to the last ``days`` evening reflections.
+
+        Reads the nightly matches; reflections written since the last run are
+        scored on the fly, unless ``precomputed_only`` (which never loads the
+        knowledge base) skips them. Each teaching's score is the sum of its
+        similarity to every reflection, and ``dates`` lists the reflections
+        it matched.
+        """
+        entries = self.dm.get_reflection_teachings().get("reflections", {})
+        matches, pending = [], []
+        for log in self.dm.get_recent_logs(days):
+            text = _reflection_text(log.get("pm_reflection"))
+            if not text:
+                continue
+            entry = entries.get(log.get("date"))
+            if entry and entry.get("hash") == _text_hash(text):
+                matches.append((log.get("date"), entry.get("teachings", [])))
+            else:
+                pending.append((log.get("date"), text))
+
+        if pending and not precomputed_only:
+            index = self.kb.vector_index()
+            if index is not None:
+                hits = index.similar([t for _, t in pending], TEACHINGS_PER_REFLECTION)
+                matches.extend((date, found) for (date, _), found in zip(pending, hits))
+
+        combined: Dict[Tuple, Dict] = {}
+        for date, teachings in matches:
+            for hit in teachings:
+                key = (hit["module"], tuple(hit["path"]))
+                slot = combined.setdefault(key, {
+                    "module": hit["module"], "kind": hit["kind"], "master": hit["master"],
+                    "title": hit["title"], "path": hit["path"], "score": 0.0, "dates": [],
+                })
+                slot["score"] = round(slot["score"] + hit["score"], 4)
+                slot["dates"].append(date)
+        return sorted(combined.values(), key=lambda t: (-t["score"], t["module"], t["title"]))[:k]
+
     def print_daily_wisdom(self):
         """Print today's complete wisdom package."""
         wisdom = self.get_daily_wisdom()
@@ -267,13 +421,21 @@ class WisdomEngine:
         print(f'{Colors.GREEN}TO:{Colors.ENDC} "{shift["to"]}"')
         print(f'{Colors.DIM}Why: {shift["why"]}{Colors.ENDC}')
 
+        # Teachings the nightly job matched to recent reflections (the package
+        # itself may come from the wisdom cache, so do not load the KB here)
+        reflections = self.get_reflection_teachings(k=3, precomputed_only=True)
+        if reflections:
+            print(f"\n{Colors.BOLD}[FROM YOUR LAST {REFLECTION_DAYS} REFLECTIONS]{Colors.ENDC}")
+            for teaching in reflections:
+                source = f"{Colors.YELLOW}{teaching['master']}{Colors.ENDC}: " if teaching["master"] else ""
+                print(f"- {source}{teaching['title']}")
+
         print(f"\n{Colors.BOLD}{Colors.CYAN}================================================================{Colors.ENDC}")
         print(f"{Colors.DIM}Execute. Review. Improve. Repeat.{Colors.ENDC}\n")
 
     def get_module_masters(self, module: str) -> List[Dict]:
         """Get all masters for a specific module."""
-        module_data = self.masters_data.get(module, {})
-        return module_data.get("masters", [])
+        return self.kb.module(module).get("masters", [])
 
     def print_master_profile(self, module: str, master_name: str):
         """Print detailed profile of a specific master."""
@@ -301,73 +463,48 @@ class WisdomEngine:
 
     def get_all_masters_list(self) -> List[Dict]:
         """Get list of all available masters."""
-        all_masters = []
-        for module, data in self.masters_data.items():
-            for master in data.get("masters", []):
-                all_masters.append({
-                    "name": master["name"],
-                    "module": module,
-                    "expertise": master.get("expertise", "")
-                })
-        return all_masters
+        return [{"name": master["name"], "module": module, "expertise": master["expertise"]}
+                for module, masters in self.kb.master_directory().items() for master in masters]
 
-    def get_worked_example(self, module: str = None) -> Optional[Dict]:
-        """Get a random worked example from a module or focus modules."""
+    def _random_master_item(self, kind: str, module: Optional[str]) -> Optional[Dict]:
+        """A random worked example or script template, tagged with its master and module."""
         if module:
             modules_to_check = [module]
         else:
-            modules_to_check = self.profile.get("focus_modules", list(self.masters_data.keys()))
-
-        all_examples = []
-        for mod in modules_to_check:
-            if mod in self.masters_data:
-                for master in self.masters_data[mod].get("masters", []):
-                    examples = master.get("worked_examples", [])
-                    for ex in examples:
-                        all_examples.append({
-                            **ex,
-                            "master": master["name"],
-                            "module": mod
-                        })
-
-        return random.choice(all_examples) if all_examples else None
+            modules_to_check = self.profile.get("focus_modules", self.kb.module_names())
+
+        items = sampler(self.kb, kind, [m for m in modules_to_check if self.kb.has_module(m)])
+        if items is None:
+            return None
+        mod, i, item = items.pick(random)
+        return {
+            **item,
+            "master": module_pool(self.kb, mod).masters[i]["name"],
+            "module": mod
+        }
+
+    def get_worked_example(self, module: str = None) -> Optional[Dict]:
+        """Get a random worked example from a module or focus modules."""
+        return self._random_master_item("example", module)
 
     def get_script_template(self, module: str = None) -> Optional[Dict]:
         """Get a random script/template from a module or focus modules."""
-        if module:
-            modules_to_check = [module]
-        else:
-            modules_to_check = self.profile.get("focus_modules", list(self.masters_data.keys()))
-
-        all_templates = []
-        for mod in modules_to_check:
-            if mod in self.masters_data:
-                for master in self.masters_data[mod].get("masters", []):
-                    templates = master.get("scripts_templates", [])
-                    for tmpl in templates:
-                        all_templates.append({
-                            **tmpl,
-                            "master": master["name"],
-                            "module": mod
-                        })
-
-        return random.choice(all_templates) if all_templates else None
+        return self._random_master_item("template", module)
 
     def get_level_definition(self, module: str, level: int) -> Optional[Dict]:
         """Get level definition for a module at a specific level."""
-        if module not in self.masters_data:
-            return None
+        return self.kb.level_tables().level(module, level)
 
-        level_defs = self.masters_data[module].get("level_definitions", {})
-        return level_defs.get(str(level), None)
+    def get_level_progress(self, module_levels: Optional[Dict[str, int]] = None) -> Dict[str, Dict]:
+        """Current and next level definitions for every module in ``module_levels``
+        (default: the profile's), keyed by module; see LevelTables.progress."""
+        if module_levels is None:
+            module_levels = self.profile.get("module_levels", {})
+        return self.kb.level_tables().progress_for(module_levels)
 
     def get_progressive_exercise(self, module: str, difficulty: str = "beginner") -> Optional[Dict]:
         """Get a progressive exercise from a module at specified difficulty."""
-        if module not in self.masters_data:
-            return None
-
-        exercises = self.masters_data[module].get("progressive_exercises", {})
-        difficulty_exercises = exercises.get(difficulty, [])
+        difficulty_exercises = self.kb.level_tables().exercise_pool(module, difficulty)
 
         if not difficulty_exercises:
             return None
@@ -381,23 +518,13 @@ class WisdomEngine:
 
     def get_cross_module_connection(self, module: str) -> Optional[Dict]:
         """Get a cross-module connection insight for a module."""
-        if module not in self.masters_data:
-            return None
-
-        connections = self.masters_data[module].get("cross_module_connections", [])
+        connections = self.kb.get(module, "cross_module_connections")
         return random.choice(connections) if connections else None
 
     def get_master_resources(self, module: str, master_name: str) -> Optional[Dict]:
         """Get resources (books, podcasts) for a specific master."""
-        if module not in self.masters_data:
-            return None
-
-        masters = self.masters_data[module].get("masters", [])
-        for master in masters:
-            if master["name"].lower() == master_name.lower():
-                return master.get("resources", None)
-
-        return None
+        master = self.kb.master(module, master_name)
+        return master.get("resources", None) if master else None
 
     def print_worked_example(self, example: Dict):
         """Print a formatted worked example."""
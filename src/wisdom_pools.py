@@ -0,0 +1,176 @@
+"""
+Self-Mastery OS - Wisdom Pools
+Flat, pre-indexed arrays of every principle, practice, daily insight,
+skill challenge, worked example and script template, so WisdomEngine picks
+never rebuild lists per call.
+
+Each module's items are flattened once per knowledge-base generation
+(``ModulePool``, cached with KnowledgeBase.derived); master-level items are
+stored grouped by master with their ranges recorded. A ``Sampler`` over a
+set of modules (optionally weighted per module) is also cached and picks in
+O(1): Vose's alias table chooses the module, then one uniform index inside
+its range. ``Sampler.at(i)`` gives the i-th item of the concatenated pool
+for the no-repeat rotation.
+"""
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Pool kind -> field on each master
+MASTER_POOLS = {
+    "principle": "key_principles",
+    "practice": "daily_practices",
+    "example": "worked_examples",
+    "template": "scripts_templates",
+}
+# Pool kind -> field on the module
+MODULE_POOLS = {
+    "insight": "daily_insights",
+    "challenge": "skill_challenges",
+}
+POOL_KINDS = tuple(MASTER_POOLS) + tuple(MODULE_POOLS)
+
+# Cached samplers per knowledge-base generation (one per kind/modules/weights)
+MAX_SAMPLERS = 1024
+
+# (module, master index or None, item)
+PoolItem = Tuple[str, Optional[int], object]
+
+
+def _template_items(value) -> List[Dict]:
+    """Script templates as a flat list of dicts.
+
+    Stored as a list of templates, a dict of named templates, or a dict of
+    named template lists.
+    """
+    if isinstance(value, list):
+        return [t for t in value if isinstance(t, dict)]
+    items = []
+    if isinstance(value, dict):
+        for key, entry in value.items():
+            if isinstance(entry, dict):
+                items.append(entry if "title" in entry or "name" in entry
+                             else {"title": key.replace("_", " ").title(), **entry})
+            elif isinstance(entry, list):
+                items.extend(t for t in entry if isinstance(t, dict))
+    return items
+
+
+class ModulePool:
+    """Every sampleable item of one module, flattened per kind."""
+
+    def __init__(self, module: str, data: Dict):
+        self.module = module
+        self.masters: List[Dict] = list(data.get("masters") or []) if isinstance(data, dict) else []
+        self.items: Dict[str, List[Tuple[Optional[int], object]]] = {kind: [] for kind in POOL_KINDS}
+        # kind -> master index -> (start, end) into items[kind]
+        self.master_ranges: Dict[str, Dict[int, Tuple[int, int]]] = {kind: {} for kind in MASTER_POOLS}
+
+        for i, master in enumerate(self.masters):
+            if not isinstance(master, dict):
+                continue
+            for kind, field in MASTER_POOLS.items():
+                value = master.get(field)
+                values = _template_items(value) if kind == "template" else value
+                if not isinstance(values, list) or not values:
+                    continue
+                if kind == "example":
+                    values = [v for v in values if isinstance(v, dict)]
+                items = self.items[kind]
+                start = len(items)
+                items.extend((i, v) for v in values)
+                self.master_ranges[kind][i] = (start, len(items))
+        for kind, field in MODULE_POOLS.items():
+            values = data.get(field) if isinstance(data, dict) else None
+            if isinstance(values, list):
+                self.items[kind].extend((None, v) for v in values)
+
+    def count(self, kind: str) -> int:
+        return len(self.items[kind])
+
+    def master_items(self, kind: str, master_index: int) -> List[object]:
+        """One master's items of ``kind`` (e.g. their daily practices)."""
+        start, end = self.master_ranges[kind].get(master_index, (0, 0))
+        return [v for _, v in self.items[kind][start:end]]
+
+
+class Sampler:
+    """O(1) picks from the concatenated items of several module pools."""
+
+    def __init__(self, parts: List[Tuple[str, List]], weights: Optional[List[float]] = None):
+        """``parts`` are (module, items) with items non-empty; ``weights`` are per
+        part (default: proportional to size, i.e. uniform over items)."""
+        self._parts = parts
+        self._offsets = []
+        total = 0
+        for _, items in parts:
+            self._offsets.append(total)
+            total += len(items)
+        self.total = total
+        if weights is None:
+            weights = [len(items) for _, items in parts]
+        self._prob, self._alias = self._alias_table(weights)
+
+    @staticmethod
+    def _alias_table(weights: List[float]) -> Tuple[List[float], List[int]]:
+        """Vose's alias method: column i keeps prob[i] for itself, the rest goes to alias[i]."""
+        n = len(weights)
+        total = float(sum(weights))
+        if total <= 0:
+            weights, total = [1.0] * n, float(n)
+        scaled = [w * n / total for w in weights]
+        prob, alias = [1.0] * n, list(range(n))
+        small = [i for i, w in enumerate(scaled) if w < 1.0]
+        large = [i for i, w in enumerate(scaled) if w >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s], alias[s] = scaled[s], l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        return prob, alias
+
+    def __len__(self) -> int:
+        return self.total
+
+    def at(self, index: int) -> PoolItem:
+        """The ``index``-th item of the concatenated pool."""
+        part = bisect_right(self._offsets, index) - 1
+        module, items = self._parts[part]
+        master_index, value = items[index - self._offsets[part]]
+        return module, master_index, value
+
+    def pick(self, rng) -> PoolItem:
+        """One weighted random item (``rng`` is a random.Random or the random module)."""
+        column = int(rng.random() * len(self._prob))
+        part = column if rng.random() < self._prob[column] else self._alias[column]
+        module, items = self._parts[part]
+        master_index, value = items[int(rng.random() * len(items))]
+        return module, master_index, value
+
+
+def module_pool(kb, module: str) -> ModulePool:
+    """The flattened pool of ``module`` for the KnowledgeBase's current generation."""
+    return kb.derived(f"pool:{module}", lambda kb: ModulePool(module, kb.module(module)))
+
+
+def sampler(kb, kind: str, modules: Iterable[str],
+            weights: Optional[Dict[str, float]] = None) -> Optional[Sampler]:
+    """Cached Sampler over ``kind`` items of ``modules`` (None when they have none).
+
+    ``weights`` maps module -> relative weight (e.g. 1.0 each for an equal
+    chance per module); by default every item is equally likely.
+    """
+    modules = tuple(modules)
+    key = (kind, modules, tuple(weights.get(m, 0.0) for m in modules) if weights else None)
+    cache = kb.derived("samplers", lambda kb: {})
+    if key in cache:
+        return cache[key]
+    parts, part_weights = [], []
+    for module in modules:
+        items = module_pool(kb, module).items[kind]
+        if items and (not weights or weights.get(module, 0.0) > 0):
+            parts.append((module, items))
+            part_weights.append(weights[module] if weights else len(items))
+    if len(cache) >= MAX_SAMPLERS:
+        cache.clear()
+    cache[key] = result = Sampler(parts, part_weights) if parts else None
+    return result
@@ -0,0 +1,167 @@
+"""
+Self-Mastery OS - Single-Writer Write Queue
+Funnels every data mutation through one background thread and coalesces bursts,
+so many rapid changes to the same file become a single load/modify/save cycle.
+"""
+import copy
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+
+
+class WriteQueue:
+    """Single background writer that batches mutations per target file.
+
+    Callers submit ``(key, load, save, mutate)``. The writer waits up to
+    ``coalesce_window`` seconds after the first item of a burst, groups the
+    queued items by ``key``, calls ``load()`` once per key, applies every
+    ``mutate(data)`` in submission order, then calls ``save(data)`` once.
+    ``load()`` must return an object no reader shares (e.g. not a cached
+    one): mutations are applied to it before ``save`` succeeds. When a key
+    has several items each mutation runs on a copy that is kept only if it
+    returns, so a failing caller's half-applied edit is never saved.
+    After each batch ``on_flush()`` runs (e.g. to bump the data version) and
+    every future resolves to ``(mutate_result, flush_result)``.
+
+    ``submit(..., flush=fn)`` overrides ``on_flush`` for that item (e.g. one
+    data version per user); each distinct flush runs once per batch.
+
+    ``lock`` (optional) is a context-manager factory held around each batch,
+    e.g. an inter-process file lock when several server processes write.
+    """
+
+    def __init__(self, coalesce_window: float = 0.02,
+                 on_flush: Optional[Callable[[], Any]] = None,
+                 lock: Optional[Callable[[], ContextManager]] = None):
+        self.coalesce_window = coalesce_window
+        self.on_flush = on_flush
+        self.lock = lock
+        self.batches_written = 0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the writer thread (idempotent)."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="write-queue", daemon=True
+                )
+                self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Flush pending writes and stop the writer thread."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def submit(self, key: str, load: Callable[[], Dict],
+               save: Callable[[Dict], bool],
+               mutate: Callable[[Dict], Any],
+               flush: Optional[Callable[[], Any]] = None) -> Future:
+        """Queue a mutation of the data identified by ``key``."""
+        future = Future()
+        self._queue.put((key, load, save, mutate, future, flush or self.on_flush))
+        self.start()
+        return future
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.coalesce_window
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    nxt = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                batch.append(nxt)
+
+            try:
+                with self.lock() if self.lock is not None else nullcontext():
+                    self._write_batch(batch)
+            except Exception as e:
+                # e.g. the lock could not be taken: fail this batch, keep the writer alive
+                for item in batch:
+                    if not item[4].done():
+                        item[4].set_exception(e)
+            if stop:
+                return
+
+    def _write_batch(self, batch: List[Tuple]):
+        """Apply one coalesced batch: one load and one save per key."""
+        groups: Dict[str, List[Tuple]] = {}
+        for item in batch:
+            groups.setdefault(item[0], []).append(item)
+
+        done = []
+        for key, items in groups.items():
+            _, load, save, _, _, _ = items[0]
+            try:
+                data = load()
+            except Exception as e:
+                for item in items:
+                    item[4].set_exception(e)
+                continue
+
+            results = []
+            for _, _, _, mutate, future, flush in items:
+                draft = copy.deepcopy(data) if len(items) > 1 else data
+                try:
+                    results.append((future, mutate(draft), None, flush))
+                except Exception as e:
+                    results.append((future, None, e, flush))
+                else:
+                    data = draft
+
+            if all(error is not None for _, _, error, _ in results):
+                # Nothing changed; skip the write entirely
+                for future, _, error, _ in results:
+                    future.set_exception(error)
+                continue
+
+            try:
+                saved = save(data)
+            except Exception as e:
+                saved = e
+            if saved is not True:
+                error = saved if isinstance(saved, Exception) else IOError(f"Failed to save {key}")
+                for future, _, _, _ in results:
+                    future.set_exception(error)
+                continue
+
+            done.extend(results)
+
+        # One flush per distinct callback that had a successful mutation
+        flush_results = {}
+        for _, _, error, flush in done:
+            if error is None and flush is not None and flush not in flush_results:
+                try:
+                    flush_results[flush] = flush()
+                except Exception:
+                    flush_results[flush] = None
+        if done:
+            self.batches_written += 1
+
+        for future, result, error, flush in done:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result((result, flush_results.get(flush)))
@@ -0,0 +1,44 @@
+"""
+Situations with the knowledge-base module advice should come from, used by
+the situation matcher tests and benchmarks/bench_situation_matcher.py.
+"""
+
+SITUATION_CORPUS = [
+  ("I need to earn more money", "money"),
+  ("How do I ask my boss for a raise in salary", "money"),
+  ("I want to build wealth and stop living paycheck to paycheck", "money"),
+  ("struggling to close deals", "sales"),
+  ("my cold calls keep getting rejected", "sales"),
+  ("prospects ghost me after the pitch", "sales"),
+  ("I can't handle objections on sales calls", "sales"),
+  ("I'm drowning in credit card debt", "finance"),
+  ("should I invest in index funds or pay off my loans", "finance"),
+  ("I never stick to a budget", "finance"),
+  ("I'm too nervous to talk to women at bars", "social"),
+  ("my girlfriend and I keep fighting", "social"),
+  ("I have no friends in this new city and feel lonely", "social"),
+  ("I'm paralysed by fear of failure", "mindset"),
+  ("constant self doubt and negative thoughts", "mindset"),
+  ("I feel like an imposter at my job", "mindset"),
+  ("I procrastinate too much", "productivity"),
+  ("I keep getting distracted and can't focus on deep work", "productivity"),
+  ("my to-do list never gets done", "productivity"),
+  ("I have a startup idea but don't know how to launch", "business"),
+  ("how do I find my first customers", "business"),
+  ("competitors are undercutting our product", "business"),
+  ("I waste hours scrolling my phone every night", "lifestyle"),
+  ("my apartment is full of clutter", "lifestyle"),
+  ("I want to build a morning routine and better habits", "lifestyle"),
+  ("I'm always tired and can't sleep", "health"),
+  ("I want to lose weight and start going to the gym", "health"),
+  ("too much caffeine and no energy in the afternoon", "health"),
+  ("I'm terrified of public speaking", "communication"),
+  ("people say I interrupt and don't listen", "communication"),
+  ("I need to have a difficult conversation with my cofounder", "communication"),
+  ("I get angry and frustrated at small things", "emotional_intelligence"),
+  ("I feel overwhelmed by my emotions", "emotional_intelligence"),
+  ("I'm jealous of my colleague's success", "emotional_intelligence"),
+  ("I can't make a decision between two job offers", "critical_thinking"),
+  ("how do I avoid confirmation bias", "critical_thinking"),
+  ("help me think clearly about this trade-off", "critical_thinking"),
+]
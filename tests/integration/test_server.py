@@ -0,0 +1,171 @@
+"""
+Test suite for server.py
+Runs the dashboard handler on a free local port and covers static-file
+exposure across tenants, validation of API request bodies, client-requested
+tracing and ETag revalidation.
+"""
+import json
+import threading
+from pathlib import Path
+from http.server import ThreadingHTTPServer
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+import pytest
+import server
+from src.tenants import TENANTS_PATH_ENV, tenants_root
+
+
+@pytest.fixture
+def dashboard(tmp_path, monkeypatch):
+  """Base URL of a live server whose tenants root holds alice and bob."""
+  for user in ("alice", "bob"):
+    (tmp_path / user / "data").mkdir(parents=True)
+    with open(tmp_path / user / "data" / "user_profile.json", "w") as f:
+      json.dump({"name": user.title()}, f)
+    with open(tmp_path / user / "data" / "habits.json", "w") as f:
+      json.dump({"habits": [{"id": "read", "name": "Read"}], "completions": {}}, f)
+  monkeypatch.setattr(server, "_tenants", server.TenantPool(tmp_path, kb_path=server.dm.kb_path))
+  httpd = ThreadingHTTPServer(("127.0.0.1", 0), server.DashboardHandler)
+  threading.Thread(target=httpd.serve_forever, daemon=True).start()
+  yield f"http://127.0.0.1:{httpd.server_address[1]}"
+  httpd.shutdown()
+  httpd.server_close()
+  server._write_queue.stop()  # started by the first POST
+
+
+def get(url, headers=None):
+  """(status, body) of a GET, including error responses."""
+  try:
+    with urlopen(Request(url, headers=headers or {})) as response:
+      return response.status, response.read()
+  except HTTPError as e:
+    return e.code, e.read()
+
+
+def post(url, body):
+  """(status, parsed JSON or None) of a POST with a JSON (or raw string) body."""
+  data = (body if isinstance(body, str) else json.dumps(body)).encode()
+  try:
+    with urlopen(Request(url, data=data, headers={"Content-Type": "application/json"})) as response:
+      return response.status, json.loads(response.read())
+  except HTTPError as e:
+    return e.code, None
+
+
+# ==================== Static File Tests (3) ====================
+
+def test_other_tenants_files_are_not_served(dashboard, tmp_path, monkeypatch):
+  """Test a user cannot read another tenant's data through static paths."""
+  monkeypatch.setattr(server, "BASE_PATH", str(tmp_path.parent))  # tenants root under the docroot
+  for path in (f"/{tmp_path.name}/bob/data/user_profile.json",
+               f"/u/alice/{tmp_path.name}/bob/data/user_profile.json",
+               "/tenants/bob/data/user_profile.json"):
+    assert get(dashboard + path)[0] == 404
+  status, body = get(dashboard + "/u/bob/data/user_profile.json")
+  assert status == 200 and json.loads(body) == {"name": "Bob"}
+
+
+def test_only_allowlisted_static_files_are_served(dashboard):
+  """Test server data, logs, build output and sources 404 while dashboard assets load."""
+  for path in ("/data/wisdom_cache/", "/logs/traces.jsonl", "/knowledge_base/build/manifest.json",
+               "/server.py", "/src/tenants.py", "/icons/../server.py", "/icons/%2e%2e/server.py", "/icons/"):
+    assert get(dashboard + path)[0] == 404, path
+  for path in ("/", "/u/alice/dashboard.html", "/manifest.json", "/icons/icon-192.svg"):
+    assert get(dashboard + path)[0] == 200, path
+
+
+def test_default_tenants_root_is_outside_the_app(monkeypatch):
+  """Test the default tenants root is not under the directory the server serves."""
+  monkeypatch.delenv(TENANTS_PATH_ENV, raising=False)
+  root = tenants_root(server.BASE_PATH).resolve()
+  assert Path(server.BASE_PATH).resolve() not in (root, *root.parents)
+
+
+# ==================== API Validation Tests (2) ====================
+
+def test_habit_completed_must_be_a_boolean(dashboard, tmp_path):
+  """Test truthy non-booleans are rejected instead of marking the habit done."""
+  url = dashboard + "/u/alice/api/habits"
+  for completed in ("false", 0.0001, 1, [], {}):
+    assert post(url, {"habit_id": "read", "completed": completed})[0] == 400
+  assert json.loads((tmp_path / "alice" / "data" / "habits.json").read_text())["completions"] == {}
+  status, result = post(url, {"habit_id": "read", "completed": None})
+  assert status == 200 and result["completed"] is True
+  status, result = post(url, {"habit_id": "read", "completed": False})
+  assert status == 200 and result["completed"] is False
+
+
+def test_metric_values_must_be_finite(dashboard, tmp_path):
+  """Test NaN, Infinity and overflowing sums never reach the daily log."""
+  url = dashboard + "/u/alice/api/metrics"
+  for raw in ('{"metric": "sleep_hours", "value": NaN}', '{"metric": "steps", "value": -Infinity}'):
+    assert post(url, raw)[0] == 400
+  assert post(url, {"metric": "steps", "value": 1e308})[0] == 200
+  assert post(url, {"metric": "steps", "value": 1e308, "add": True})[0] == 400
+  logs = list((tmp_path / "alice" / "data").rglob("*.json"))
+  assert all("Infinity" not in p.read_text() and "NaN" not in p.read_text() for p in logs)
+
+
+# ==================== Tracing Tests (1) ====================
+
+def test_trace_header_needs_server_opt_in(dashboard, tmp_path, monkeypatch):
+  """Test clients cannot force trace exports unless the server allows X-Trace."""
+  path = tmp_path / "traces.jsonl"
+  monkeypatch.setattr(server, "_tracer", server.tracing.Tracer(str(path)))
+  with urlopen(Request(dashboard + "/api/kb/manifest", headers={"X-Trace": "1"})) as response:
+    assert response.headers.get("X-Trace-Id") is None
+  assert not path.exists()
+
+  monkeypatch.setattr(server, "_tracer", server.tracing.Tracer(str(path), allow_requests=True))
+  with urlopen(Request(dashboard + "/api/kb/manifest", headers={"X-Trace": "1"})) as response:
+    assert response.headers.get("X-Trace-Id")
+
+
+# ==================== KB Bundle Tests (1) ====================
+
+def test_requests_only_read_the_kb_bundle(dashboard, monkeypatch):
+  """Test KB requests never rebuild the bundle; the watch's reload callback does."""
+  builds = []
+  build_all = server.kb_bundle.build_all
+  monkeypatch.setattr(server.kb_bundle, "build_all", lambda *args: builds.append(1) or build_all(*args))
+  server.get_kb_bundle()
+  builds.clear()
+  for _ in range(3):
+    status, body = get(dashboard + "/api/kb/manifest")
+    assert status == 200
+  assert builds == []
+  assert server.rebuild_kb_bundle()["manifest"]["hash"] == json.loads(body)["hash"]
+  assert builds == [1]
+
+
+# ==================== ETag Tests (2) ====================
+
+def test_if_none_match_compares_whole_tags():
+  """Test If-None-Match is parsed as a list: exact tags (weak or strong) and * match."""
+  tag = 'W/"abc"'
+  assert server.etag_matches('"abc"', tag)
+  assert server.etag_matches('"x", W/"abc"', tag)
+  assert server.etag_matches(' * ', tag)
+  assert server.etag_matches('W/"abc"', '"abc"')
+  assert not server.etag_matches('"abcd"', tag)
+  assert not server.etag_matches('"xabc"', tag)
+  assert not server.etag_matches('W/"abc', tag)
+  assert not server.etag_matches(None, tag)
+
+
+def test_bootstrap_revalidates_without_building(dashboard, monkeypatch):
+  """Test an unchanged bootstrap answers 304 without being built; a write changes its ETag."""
+  builds = []
+  build_bootstrap = server.build_bootstrap
+  monkeypatch.setattr(server, "build_bootstrap", lambda *args: builds.append(1) or build_bootstrap(*args))
+  url = dashboard + "/u/alice/api/bootstrap?exclude=masters,wisdom"
+  with urlopen(url) as response:
+    tag = response.headers["ETag"]
+
+  assert get(url, {"If-None-Match": tag})[0] == 304
+  assert len(builds) == 1
+
+  assert post(dashboard + "/u/alice/api/habits", {"habit_id": "read"})[0] == 200
+  with urlopen(Request(url, headers={"If-None-Match": tag})) as response:
+    assert response.status == 200 and response.headers["ETag"] != tag
+  assert len(builds) == 2
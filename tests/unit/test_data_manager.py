@@ -4,13 +4,16 @@ Target: 100% code coverage for src/data_manager.py
 """
 import os
 import json
+import threading
 import pytest
 from pathlib import Path
 from datetime import datetime, timedelta
 from src.data_manager import DataManager
+from src.lru_cache import LRUCache
+from src.write_queue import WriteQueue
 
 
-# ==================== Initialization Tests (4) ====================
+# ==================== Initialization Tests (5) ====================
 
 def test_init_with_custom_path(temp_dir):
   """Test initialization with custom base path."""
@@ -22,6 +25,13 @@ def test_init_with_custom_path(temp_dir):
   assert dm.kb_path == Path(temp_dir) / "knowledge_base"
 
 
+def test_init_with_shared_kb_path(temp_dir, tmp_path):
+  """Test kb_path points the knowledge base outside the user's base path."""
+  dm = DataManager(base_path=temp_dir, kb_path=tmp_path / "shared_kb")
+  assert dm.kb_path == tmp_path / "shared_kb"
+  assert dm.data_path == Path(temp_dir) / "data"
+
+
 def test_init_with_default_path():
   """Test initialization with default path (None)."""
   dm = DataManager()
@@ -47,7 +57,7 @@ def test_ensure_directories_idempotent(data_manager):
   assert data_manager.reviews_path.exists()
 
 
-# ==================== JSON I/O Tests (7) ====================
+# ==================== JSON I/O Tests (9) ====================
 
 def test_read_json_existing_file(data_manager):
   """Test reading existing JSON file."""
@@ -132,6 +142,38 @@ def test_write_json_io_error(data_manager, capsys, monkeypatch):
   assert "Error writing" in captured.out
 
 
+def test_write_json_replaces_file_atomically(data_manager):
+  """Test a concurrent reader never sees a truncated file while it is rewritten."""
+  test_file = data_manager.data_path / "habits.json"
+  data_manager._write_json(test_file, {"habits": []})
+  stop, seen = threading.Event(), []
+
+  def reader():
+    while not stop.is_set():
+      with open(test_file, "r", encoding="utf-8") as f:
+        seen.append(json.load(f)["habits"])
+  thread = threading.Thread(target=reader)
+  thread.start()
+  try:
+    for i in range(200):
+      assert data_manager._write_json(test_file, {"habits": [{"id": str(n)} for n in range(i % 50)]})
+  finally:
+    stop.set()
+    thread.join()
+  assert seen
+  assert list(data_manager.data_path.glob("*.tmp")) == []
+
+
+def test_write_json_failure_keeps_previous_contents(data_manager):
+  """Test data that cannot be serialised leaves the old file and no temp file behind."""
+  test_file = data_manager.data_path / "output.json"
+  data_manager._write_json(test_file, {"key": "old"})
+  with pytest.raises(TypeError):
+    data_manager._write_json(test_file, {"key": object()})
+  assert data_manager._read_json(test_file) == {"key": "old"}
+  assert list(data_manager.data_path.glob("*.tmp")) == []
+
+
 # ==================== User Profile Tests (6) ====================
 
 def test_get_user_profile_existing(data_manager, sample_user_profile):
@@ -322,7 +364,7 @@ def test_weekly_review_default_week(data_manager, freeze_time):
   assert saved["week"] == week
 
 
-# ==================== Habits Tests (15) - CRITICAL ====================
+# ==================== Habits Tests (13) - CRITICAL ====================
 
 def test_get_habits_existing(data_manager):
   """Test getting existing habits data."""
@@ -460,6 +502,16 @@ def test_record_habit_completion_initializes_completions(data_manager):
   assert "2024-01-15" in habits["completions"]
 
 
+def test_apply_habit_completion_is_idempotent(data_manager):
+  """Test apply_habit_completion only counts real state changes."""
+  habits_data = {"habits": [{"id": "morning", "name": "Morning"}], "completions": {}}
+  data_manager.apply_habit_completion(habits_data, "morning", "2024-01-15", True)
+  data_manager.apply_habit_completion(habits_data, "morning", "2024-01-15", True)
+  assert habits_data["habits"][0]["total_completions"] == 1
+  data_manager.apply_habit_completion(habits_data, "morning", "2024-01-16", False)
+  assert habits_data["habits"][0]["total_completions"] == 1
+
+
 def test_calculate_streak_empty(data_manager):
   """Test _calculate_streak with no dates returns 0."""
   result = data_manager._calculate_streak([])
@@ -489,6 +541,135 @@ def test_calculate_streak_broken_streak(data_manager, freeze_time):
   assert result == 2
 
 
+# ==================== Metrics & Data Version Tests (5) ====================
+
+def test_apply_metric_sets_and_adds(data_manager):
+  """Test apply_metric sets a value and accumulates with add=True."""
+  log = data_manager.get_or_create_daily_log("2024-01-15")
+  assert data_manager.apply_metric(log, "steps", 5000) == 5000
+  assert data_manager.apply_metric(log, "steps", 2500, add=True) == 7500
+  assert log["metrics"]["steps"] == 7500
+
+
+def test_apply_metric_rejects_unknown_metric(data_manager):
+  """Test apply_metric raises ValueError for unknown metric keys."""
+  with pytest.raises(ValueError):
+    data_manager.apply_metric({}, "push_ups", 10)
+
+
+def test_apply_metric_rejects_non_finite_values(data_manager):
+  """Test NaN, infinities and sums that overflow are refused and nothing is stored."""
+  log = {"metrics": {"steps": 1e308}}
+  for value in (float("nan"), float("inf"), -float("inf"), 10 ** 400):
+    with pytest.raises(ValueError):
+      data_manager.apply_metric(log, "sleep_hours", value)
+  with pytest.raises(ValueError):
+    data_manager.apply_metric(log, "steps", 1e308, add=True)
+  assert log["metrics"] == {"steps": 1e308}
+
+
+def test_get_data_version_defaults_to_zero(data_manager):
+  """Test data version is 0 before any write batch."""
+  assert data_manager.get_data_version() == 0
+
+
+def test_bump_data_version_increments(data_manager):
+  """Test bump_data_version persists an incrementing counter."""
+  assert data_manager.bump_data_version() == 1
+  assert data_manager.bump_data_version() == 2
+  assert data_manager.get_data_version() == 2
+
+
+# ==================== Read Cache Tests (5) ====================
+
+def test_cached_reads_skip_disk(temp_dir):
+  """Test a cached DataManager serves repeat reads from the cache."""
+  cache = LRUCache()
+  dm = DataManager(base_path=temp_dir, cache=cache)
+  dm.save_goals({"quarterly_goals": {"q1": "ship"}})
+
+  first = dm.get_goals()
+  second = dm.get_goals()
+
+  assert first is second
+  assert cache.stats()["hits"] == 1
+
+
+def test_cached_reads_see_writes(temp_dir):
+  """Test saving through the DataManager invalidates the cached copy."""
+  dm = DataManager(base_path=temp_dir, cache=LRUCache())
+  dm.save_goals({"quarterly_goals": {"q1": "ship"}})
+  dm.get_goals()
+
+  dm.save_goals({"quarterly_goals": {"q1": "scale"}})
+
+  assert dm.get_goals()["quarterly_goals"] == {"q1": "scale"}
+
+
+def test_cached_reads_see_external_changes(temp_dir):
+  """Test files changed behind the DataManager's back are re-read (mtime/size check)."""
+  dm = DataManager(base_path=temp_dir, cache=LRUCache())
+  dm.save_goals({"quarterly_goals": {}})
+  dm.get_goals()
+
+  path = dm.data_path / "goals.json"
+  path.write_text(json.dumps({"quarterly_goals": {"q2": "hire"}}))
+  st = path.stat()
+  os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+  assert dm.get_goals()["quarterly_goals"] == {"q2": "hire"}
+
+
+def test_failed_queued_save_leaves_cache_untouched(temp_dir, monkeypatch):
+  """Test a write-queue mutation whose save fails never shows up in cached reads."""
+  dm = DataManager(base_path=temp_dir, cache=LRUCache())
+  dm.save_habits({"habits": [{"id": "read", "name": "Read"}], "completions": {}})
+  cached = dm.get_habits()
+  monkeypatch.setattr(dm, "_write_json", lambda path, data: False)
+
+  wq = WriteQueue(coalesce_window=0)
+  future = wq.submit("habits", lambda: dm.get_habits(private=True), dm.save_habits,
+                     lambda data: dm.apply_habit_completion(data, "read", "2024-01-15", True))
+  with pytest.raises(IOError):
+    future.result(timeout=5)
+  wq.stop()
+
+  assert cached["completions"] == {}
+  assert dm.get_habits() is cached
+
+
+def test_cached_reader_runs_alongside_queued_writes(temp_dir):
+  """Test readers iterating cached habits never see a write in progress."""
+  dm = DataManager(base_path=temp_dir, cache=LRUCache())
+  dm.save_habits({"habits": [{"id": "read", "name": "Read"}], "completions": {}})
+  wq = WriteQueue(coalesce_window=0)
+  errors, stop = [], threading.Event()
+
+  def reader():
+    while not stop.is_set():
+      try:
+        for date, done in dm.get_habits()["completions"].items():
+          list(done)
+      except Exception as e:
+        errors.append(e)
+  thread = threading.Thread(target=reader)
+  thread.start()
+  try:
+    dates = [(datetime(2024, 1, 1) + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(60)]
+    futures = [wq.submit("habits", lambda: dm.get_habits(private=True), dm.save_habits,
+                         lambda data, d=d: dm.apply_habit_completion(data, "read", d, True))
+               for d in dates]
+    for future in futures:
+      future.result(timeout=5)
+  finally:
+    stop.set()
+    thread.join()
+    wq.stop()
+
+  assert errors == []
+  assert len(dm.get_habits()["completions"]) == 60
+
+
 # ==================== Goals Tests (3) ====================
 
 def test_get_goals_existing(data_manager, sample_goals):
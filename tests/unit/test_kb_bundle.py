@@ -0,0 +1,148 @@
+"""
+Test suite for kb_bundle.py
+Covers bundle compilation, manifest hashing, staleness and masters-data.js generation.
+"""
+import os
+import json
+import time
+import pytest
+from pathlib import Path
+from src import kb_bundle
+
+
+@pytest.fixture
+def kb_dirs(tmp_path):
+  """Masters source dir with two modules plus an empty build dir."""
+  masters = tmp_path / "knowledge_base" / "masters"
+  masters.mkdir(parents=True)
+  for module, name in [("money", "Naval Ravikant"), ("social", "Dale Carnegie")]:
+    with open(masters / f"{module}_masters.json", "w", encoding="utf-8") as f:
+      json.dump({
+        "module": module,
+        "masters": [{
+          "name": name,
+          "expertise": "Testing",
+          "key_principles": ["Principle \"quoted\""],
+          "daily_practices": ["Practice"]
+        }]
+      }, f, indent=2)
+  return masters, tmp_path / "knowledge_base" / "build"
+
+
+# ==================== Build Tests (4) ====================
+
+def test_build_bundle_writes_hashed_bundle_and_manifest(kb_dirs):
+  """Test build produces masters.<hash>.json and a manifest listing every module."""
+  masters, build = kb_dirs
+  manifest = kb_bundle.build_bundle(masters, build)
+
+  assert manifest["bundle"] == f"masters.{manifest['hash']}.json"
+  assert set(manifest["modules"]) == {"money", "social"}
+  bundle = json.loads((build / manifest["bundle"]).read_bytes())
+  assert bundle["modules"]["money"]["masters"][0]["name"] == "Naval Ravikant"
+
+
+def test_bundle_is_minified(kb_dirs):
+  """Test the bundle contains no pretty-print whitespace."""
+  masters, build = kb_dirs
+  manifest = kb_bundle.build_bundle(masters, build)
+  body = (build / manifest["bundle"]).read_bytes()
+  assert b"\n" not in body
+  assert b'": ' not in body
+
+
+def test_module_hash_changes_only_for_edited_module(kb_dirs):
+  """Test per-module hashes track content independently."""
+  masters, build = kb_dirs
+  first = kb_bundle.build_bundle(masters, build)
+
+  data = json.loads((masters / "money_masters.json").read_text())
+  data["masters"][0]["expertise"] = "Leverage"
+  (masters / "money_masters.json").write_text(json.dumps(data))
+  second = kb_bundle.build_bundle(masters, build)
+
+  assert second["hash"] != first["hash"]
+  assert second["modules"]["money"]["hash"] != first["modules"]["money"]["hash"]
+  assert second["modules"]["social"]["hash"] == first["modules"]["social"]["hash"]
+  assert (build / first["bundle"]).exists()  # still served until pruned
+  assert kb_bundle.prune_bundles(build, second["bundle"]) == [first["bundle"]]
+  assert not (build / first["bundle"]).exists()
+  assert not list(build.glob("*.tmp"))
+
+
+def test_invalid_module_is_reported_not_fatal(kb_dirs):
+  """Test malformed JSON is skipped and listed under errors."""
+  masters, build = kb_dirs
+  (masters / "broken_masters.json").write_text("{not json")
+  manifest = kb_bundle.build_bundle(masters, build)
+  assert "broken" in manifest["errors"]
+  assert "broken" not in manifest["modules"]
+
+
+# ==================== Staleness Tests (2) ====================
+
+def test_ensure_bundle_skips_rebuild_when_fresh(kb_dirs):
+  """Test ensure_bundle reuses the manifest when sources are unchanged."""
+  masters, build = kb_dirs
+  first = kb_bundle.ensure_bundle(masters, build)
+  assert not kb_bundle.bundle_is_stale(masters, build)
+  assert kb_bundle.ensure_bundle(masters, build)["built_at"] == first["built_at"]
+
+
+def test_bundle_is_stale_after_source_edit(kb_dirs):
+  """Test a newer source file marks the bundle stale."""
+  masters, build = kb_dirs
+  kb_bundle.build_bundle(masters, build)
+  future = time.time() + 10
+  os.utime(masters / "money_masters.json", (future, future))
+  assert kb_bundle.bundle_is_stale(masters, build)
+
+
+# ==================== masters-data.js Tests (3) ====================
+
+def test_write_masters_js_replaces_generated_block(kb_dirs, tmp_path):
+  """Test only the marked block is rewritten and dating maps to social."""
+  masters, build = kb_dirs
+  manifest = kb_bundle.build_bundle(masters, build)
+  modules = json.loads((build / manifest["bundle"]).read_bytes())["modules"]
+  js = tmp_path / "masters-data.js"
+  js.write_text(f"// header\n{kb_bundle.JS_BEGIN}\n{kb_bundle.JS_END}\n\nconst other = 1;\n")
+
+  assert kb_bundle.write_masters_js(js, modules, manifest["hash"]) is True
+  text = js.read_text()
+  assert text.startswith("// header\n")
+  assert text.endswith("const other = 1;\n")
+  assert 'dating: [' in text
+  assert '"Dale Carnegie"' in text
+  assert '"Principle \\"quoted\\""' in text
+  assert kb_bundle.write_masters_js(js, modules, manifest["hash"]) is False
+
+
+def test_write_masters_js_requires_markers(kb_dirs, tmp_path):
+  """Test generation refuses to touch a file without markers."""
+  js = tmp_path / "masters-data.js"
+  js.write_text("const mastersData = {};\n")
+  with pytest.raises(ValueError):
+    kb_bundle.write_masters_js(js, {}, "abc")
+
+
+def test_build_all_prunes_old_bundle_after_js_points_at_new(kb_dirs, tmp_path, monkeypatch):
+  """Test a rebuild keeps the old bundle until masters-data.js names the new one."""
+  masters, build = kb_dirs
+  (tmp_path / "data").mkdir()
+  js = tmp_path / "data" / "masters-data.js"
+  js.write_text(f"{kb_bundle.JS_BEGIN}\n{kb_bundle.JS_END}\n")
+  first = kb_bundle.build_all(tmp_path)
+
+  seen = []
+  write_masters_js = kb_bundle.write_masters_js
+  def record(*args):
+    seen.append((build / first["bundle"]).exists())
+    return write_masters_js(*args)
+  monkeypatch.setattr(kb_bundle, "write_masters_js", record)
+  (masters / "money_masters.json").write_text(json.dumps({"module": "money", "masters": []}))
+  second = kb_bundle.build_all(tmp_path, force=True)
+
+  assert seen == [True]
+  assert second["hash"] in js.read_text()
+  assert [p.name for p in build.glob("masters.*.json")] == [second["bundle"]]
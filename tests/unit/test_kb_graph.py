@@ -0,0 +1,105 @@
+"""
+Test suite for kb_graph.py
+Covers compiling cross-module connections from their different spellings,
+shortest learning paths, level-weighted related modules and memoization.
+"""
+from pathlib import Path
+import pytest
+from src.kb_graph import ConnectionGraph
+from src.knowledge_base import KnowledgeBase
+
+
+REAL_KB = Path(__file__).resolve().parents[2] / "knowledge_base" / "masters"
+
+CONNECTIONS = {
+  "sales": [{"connected_module": "money", "insight": "Selling raises income.", "combined_exercise": "Pitch 5 people."},
+            {"connected_module": "dating", "insight": "Rapport works everywhere."}],
+  "money": [{"connected_module": "sales", "insight": "Income needs sales."}],
+  "social": [{"connected_module": "mindset", "insight": "Confidence is social."}],
+  "critical_thinking": [{"from": "critical_thinking", "to": "money_masters.json", "connection_type": "foundation",
+                         "description": "Think before you invest."},
+                        {"from": "critical_thinking", "to": "career_development", "description": "Not a module."}],
+  "communication": [{"target_module": "social", "connection_type": "bidirectional",
+                     "description": "Conversation is the core social skill.", "recommended_practice": "Ask more."}],
+  "mindset": [],
+  "health": []
+}
+
+
+@pytest.fixture
+def graph():
+  return ConnectionGraph(CONNECTIONS, {"social": "dating"})
+
+
+# ==================== Graph Build Tests (2) ====================
+
+def test_connection_spellings_resolve_to_modules(graph):
+  """Test connected_module, target_module, to: file names and declared aliases become edges."""
+  assert graph.neighbors("sales") == ["money", "social"]
+  assert graph.resolve("dating") == graph.resolve("social_masters.json") == "social"
+  assert graph.neighbors("critical_thinking") == ["money"]
+  assert graph.unresolved == {"critical_thinking": ["career_development"]}
+  assert graph.weight("sales", "money") == 2 and graph.weight("money", "health") == 0
+  assert graph.edge_count() == 5
+
+  edge = graph.connections("communication", "dating")[0]
+  assert edge == {"from": "communication", "to": "social", "type": "bidirectional",
+                  "insight": "Conversation is the core social skill.", "exercise": "Ask more."}
+
+
+def test_real_knowledge_base_graph():
+  """Test every real module is a node and connections compile without unknown spellings."""
+  graph = KnowledgeBase(REAL_KB).connection_graph()
+  assert len(graph) == len(KnowledgeBase(REAL_KB).module_names())
+  assert graph.resolve("dating") == "social"
+  assert "critical_thinking" in graph.neighbors("money")
+  assert graph.shortest_path("sales", "emotional_intelligence")[-1] == "emotional_intelligence"
+
+
+# ==================== Learning Path Tests (2) ====================
+
+def test_shortest_path_and_steps(graph):
+  """Test the fewest-hop chain is returned with each step's own connection first."""
+  assert graph.shortest_path("critical_thinking", "mindset") == [
+    "critical_thinking", "money", "sales", "social", "mindset"]
+  assert graph.shortest_path("money", "money") == ["money"]
+  assert graph.shortest_path("health", "sales") is None
+
+  result = graph.learning_path("money", "dating")
+  assert result["path"] == ["money", "sales", "social"]
+  assert [s["connections"][0]["insight"] for s in result["steps"]] == [
+    "Income needs sales.", "Rapport works everywhere."]
+
+
+def test_unknown_modules_raise(graph):
+  """Test unknown module names raise ValueError instead of returning empty results."""
+  with pytest.raises(ValueError):
+    graph.shortest_path("sales", "astrology")
+  with pytest.raises(ValueError):
+    graph.related({}, module="astrology")
+
+
+# ==================== Related Module Tests (2) ====================
+
+def test_related_is_weighted_by_module_levels(graph):
+  """Test strong modules pull their neighbours up and mastered modules rank lower."""
+  related = graph.related({"sales": 9, "money": 2, "dating": 2, "mindset": 8, "critical_thinking": 1}, k=3)
+  assert [r["module"] for r in related] == ["money", "social", "critical_thinking"]
+  assert related[0]["via"] == ["sales", "critical_thinking"]
+
+  around = graph.related({"sales": 3}, module="sales")
+  assert [r["module"] for r in around] == ["money", "social"]
+  assert all(r["via"] == ["sales"] for r in around)
+
+
+def test_results_are_memoized(graph):
+  """Test repeated queries reuse the memo and callers cannot mutate it."""
+  first = graph.related({"sales": 5}, k=2)
+  first[0]["via"].append("tampered")
+  assert graph.related({"sales": 5}, k=2)[0]["via"] == ["sales"]
+  assert len(graph._related) == 1
+
+  graph.shortest_path("money", "mindset")
+  tree = graph._trees["money"]
+  graph.shortest_path("money", "critical_thinking")
+  assert graph._trees["money"] is tree
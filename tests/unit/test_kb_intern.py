@@ -0,0 +1,71 @@
+"""
+Test suite for kb_intern.py
+Covers string interning and sub-object deduplication of parsed knowledge-base
+JSON, and that the KnowledgeBase loads modules through it.
+"""
+import json
+from src.kb_intern import compact
+from src.knowledge_base import KnowledgeBase, load_modules
+
+
+def parse(value):
+  """A fresh parse, so no objects are shared with ``value`` or other parses."""
+  return json.loads(json.dumps(value))
+
+
+# ==================== Compact Tests (3) ====================
+
+def test_equal_strings_and_containers_become_one_object():
+  """Test repeated strings, lists and dicts are shared and the value is unchanged."""
+  data = parse({
+    "a": {"difficulty": "beginner", "tags": ["focus", "sales"]},
+    "b": {"difficulty": "beginner", "tags": ["focus", "sales"]},
+    "c": [["focus", "sales"], "beginner"],
+  })
+  result = compact(data)
+  assert result == data
+  assert result["a"] is result["b"]
+  assert result["c"][0] is result["a"]["tags"]
+  assert result["c"][1] is result["a"]["difficulty"]
+
+
+def test_distinct_values_stay_apart():
+  """Test equal-comparing but different scalars and key orders are not merged."""
+  result = compact(parse([[1], [1.0], [True], {"x": 1, "y": 2}, {"y": 2, "x": 1}, [], {}]))
+  assert [type(v[0]) for v in result[:3]] == [int, float, bool]
+  assert result[3] is not result[4]
+  assert result[5] == [] and result[6] == {}
+
+
+def test_shared_memo_dedups_across_values():
+  """Test calls sharing a memo share content; separate calls do not."""
+  practice = {"title": "Daily review", "steps": ["Plan", "Do", "Review"]}
+  memo = {}
+  first, second = compact(parse(practice), memo), compact(parse(practice), memo)
+  assert first is second
+  assert compact(parse(practice)) is not first
+
+
+# ==================== Loading Tests (2) ====================
+
+def module_with(practice):
+  return {"masters": [{"name": "A", "daily_practices": [practice]},
+                      {"name": "B", "daily_practices": [practice]}]}
+
+
+def test_knowledge_base_modules_are_compacted(tmp_path):
+  """Test modules loaded with or without a snapshot share their repeated content."""
+  with open(tmp_path / "sales_masters.json", "w") as f:
+    json.dump(module_with("Make ten calls before noon"), f)
+  for snapshot in (True, False):
+    masters = KnowledgeBase(tmp_path, snapshot=snapshot).module("sales")["masters"]
+    assert masters[0]["daily_practices"] is masters[1]["daily_practices"]
+
+
+def test_load_modules_shares_content_across_files(tmp_path):
+  """Test one load dedups content repeated in different module files."""
+  for module in ("sales", "money"):
+    with open(tmp_path / f"{module}_masters.json", "w") as f:
+      json.dump(module_with("Track every dollar"), f)
+  modules = load_modules(tmp_path)
+  assert modules["sales"]["masters"][0]["daily_practices"] is modules["money"]["masters"][1]["daily_practices"]
@@ -0,0 +1,86 @@
+"""
+Test suite for kb_levels.py
+Covers the (module, level) and (module, difficulty) lookup tables, sparse
+level progress and WisdomEngine's batch level-progress API.
+"""
+import json
+import pytest
+from src.kb_levels import LevelTables
+from src.data_manager import DataManager
+from src.knowledge_base import KnowledgeBase
+from src.wisdom_engine import WisdomEngine
+
+
+LEVELS = {"1": {"name": "Beginner"}, "5": {"name": "Intermediate"}, "10": {"name": "Master"}}
+EXERCISES = {"beginner": [{"title": "Time Audit"}, "not an exercise"], "advanced": []}
+
+
+@pytest.fixture
+def tables():
+  return LevelTables({"productivity": (dict(LEVELS, x={"name": "Bad"}), EXERCISES),
+                      "social": ({"3": {"name": "Warm"}}, {}), "money": ({}, None)}, {"social": "dating"})
+
+
+# ==================== Lookup Table Tests (2) ====================
+
+def test_lookups_by_module_and_level_or_difficulty(tables):
+  """Test direct lookups accept int or str levels and skip malformed entries."""
+  assert tables.level("productivity", 5) == {"name": "Intermediate"}
+  assert tables.level("productivity", "10") == {"name": "Master"}
+  assert tables.level("productivity", 2) is None
+  assert tables.level("productivity", "x") is None
+  assert tables.level("dating", 3) is tables.level("social", 3)
+  assert tables.exercise_pool("productivity", "beginner") == [{"title": "Time Audit"}]
+  assert tables.exercise_pool("productivity", "advanced") == []
+  assert tables.exercise_pool("nonexistent", "beginner") == []
+
+
+def test_tables_build_from_snapshot_without_parsing_modules(tmp_path):
+  """Test the KnowledgeBase tables read through the snapshot and follow file changes."""
+  masters = tmp_path / "knowledge_base" / "masters"
+  masters.mkdir(parents=True)
+  path = masters / "productivity_masters.json"
+  with open(path, "w") as f:
+    json.dump({"module": "productivity", "level_definitions": LEVELS, "progressive_exercises": EXERCISES}, f)
+  kb = KnowledgeBase(masters)
+  assert kb.level_tables().level("productivity", 1) == {"name": "Beginner"}
+  assert kb.level_tables() is kb.level_tables()
+  assert kb._modules == {}
+
+  with open(path, "w") as f:
+    json.dump({"level_definitions": {"1": {"name": "Novice"}}}, f)
+  kb.refresh(force=True)
+  assert kb.level_tables().level("productivity", 1) == {"name": "Novice"}
+
+
+# ==================== Level Progress Tests (3) ====================
+
+def test_progress_uses_nearest_defined_levels(tables):
+  """Test sparse levels resolve to the highest at or below and the lowest above."""
+  assert tables.progress("productivity", 7) == {
+    "level": 7, "current": {"name": "Intermediate"}, "next_level": 10, "next": {"name": "Master"}}
+  assert tables.progress("productivity", 10)["next"] is None
+  assert tables.progress("productivity", 0)["current"] is None
+  assert tables.progress("productivity", 0)["next_level"] == 1
+
+
+def test_progress_for_all_module_levels(tables):
+  """Test one call covers every module with definitions, including declared names."""
+  progress = tables.progress_for({"productivity": 1, "dating": 4, "money": 5, "nonexistent": 2})
+  assert set(progress) == {"productivity", "dating"}
+  assert progress["productivity"]["next"] == {"name": "Intermediate"}
+  assert progress["dating"]["current"] == {"name": "Warm"} and progress["dating"]["next"] is None
+
+
+def test_engine_level_progress_defaults_to_profile(tmp_path):
+  """Test get_level_progress reads module_levels from the profile when not given."""
+  masters = tmp_path / "knowledge_base" / "masters"
+  masters.mkdir(parents=True)
+  with open(masters / "productivity_masters.json", "w") as f:
+    json.dump({"level_definitions": LEVELS}, f)
+  (tmp_path / "data").mkdir()
+  with open(tmp_path / "data" / "user_profile.json", "w") as f:
+    json.dump({"module_levels": {"productivity": 5}}, f)
+  engine = WisdomEngine(DataManager(base_path=str(tmp_path)))
+  assert engine.get_level_progress()["productivity"]["current"] == {"name": "Intermediate"}
+  assert engine.get_level_progress({"productivity": 1})["productivity"]["next_level"] == 5
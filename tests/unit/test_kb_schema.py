@@ -0,0 +1,50 @@
+"""
+Test suite for kb_schema.py
+Covers structural validation of module files, including every real one.
+"""
+import json
+from pathlib import Path
+from src.kb_schema import MAX_PROBLEMS, validate_module
+
+
+REAL_KB = Path(__file__).resolve().parents[2] / "knowledge_base" / "masters"
+
+
+# ==================== Validation Tests (3) ====================
+
+def test_real_module_files_are_valid():
+  """Test every shipped module file passes the schema."""
+  files = sorted(REAL_KB.glob("*_masters.json"))
+  assert files
+  for path in files:
+    with open(path, encoding="utf-8") as f:
+      assert validate_module(json.load(f)) == [], path.name
+
+
+def test_problems_name_the_offending_field():
+  """Test wrong types and missing master names are reported by path."""
+  assert validate_module([]) == ["top level: expected object"]
+  assert validate_module({"masters": [{"name": "A", "scripts_templates": {}}], "extra": 1}) == []
+  assert validate_module({
+    "module": 3,
+    "masters": [{"name": " "}, "B", {"name": "C", "key_principles": "one"}],
+    "level_definitions": {"one": {}, "2": "two"},
+    "progressive_exercises": {"beginner": {}},
+    "cross_module_connections": ["sales"],
+  }) == [
+    "module: expected string",
+    "masters[0].name: missing",
+    "masters[1]: expected object",
+    "masters[2].key_principles: expected array",
+    "level_definitions.one: level must be a number",
+    "level_definitions.2: expected object",
+    "progressive_exercises.beginner: expected array",
+    "cross_module_connections[0]: expected object",
+  ]
+
+
+def test_problem_list_is_capped():
+  """Test a badly broken file reports a bounded number of problems."""
+  problems = validate_module({"masters": [{}] * (MAX_PROBLEMS + 5)})
+  assert len(problems) == MAX_PROBLEMS + 1
+  assert problems[-1] == "... and 5 more"
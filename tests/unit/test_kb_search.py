@@ -0,0 +1,143 @@
+"""
+Test suite for kb_search.py
+Covers tokenization, document extraction from heterogeneous modules, BM25
+ranking, module filters, staleness rebuilds and KnowledgeBase.search.
+"""
+import os
+import json
+import pytest
+from src.kb_search import (
+  SearchIndex, build_search_index, iter_documents, open_search_index, tokenize, MAX_LIMIT
+)
+from src.knowledge_base import KnowledgeBase
+
+
+MODULES = {
+  "sales": {
+    "masters": [{
+      "name": "Jordan Belfort",
+      "key_principles": ["Objections are requests for more information.", "Tonality sells."],
+      "daily_practices": ["Handle 10 objections out loud daily"],
+      "worked_examples": [{"title": "Cold call", "scenario": "A cold call to a busy CEO", "step_by_step": ["Open", "Qualify"]}],
+      "scripts_templates": {"opener": {"name": "Cold Call Opening Script", "template": "Hey [NAME]..."}}
+    }],
+    "daily_insights": ["Every conversation is a sale."]
+  },
+  "emotional_intelligence": {
+    "masters": [{
+      "name": "Susan David",
+      "key_principles": [{"principle": "Emotions are data", "explanation": "Objections you feel are signals"}]
+    }],
+    "daily_insights": [{"insight": "Name it to tame it.", "source": "Dan Siegel"}]
+  }
+}
+
+
+@pytest.fixture
+def masters(tmp_path):
+  """Masters source dir with a plain and a structured module."""
+  path = tmp_path / "knowledge_base" / "masters"
+  path.mkdir(parents=True)
+  for module, data in MODULES.items():
+    with open(path / f"{module}_masters.json", "w") as f:
+      json.dump(data, f)
+  return path
+
+
+# ==================== Indexing Tests (4) ====================
+
+def test_tokenize_drops_stopwords_and_punctuation():
+  """Test tokens are lower-cased words without stopwords, apostrophes or 1-char tokens."""
+  assert tokenize("Don't fear the Cold-Call, it's a game!") == ["dont", "fear", "cold", "call", "game"]
+
+
+def test_documents_cover_every_field_shape():
+  """Test list, dict-of-dict and structured items all become documents with paths."""
+  docs = list(iter_documents(MODULES))
+  kinds = [(d[0], d[1]) for d in docs]
+  assert kinds.count(("sales", "principle")) == 2
+  assert ("sales", "template") in kinds and ("sales", "example") in kinds
+
+  template = next(d for d in docs if d[1] == "template")
+  assert template[3] == "Cold Call Opening Script"
+  assert template[5] == ["masters", 0, "scripts_templates", "opener"]
+
+  insight = next(d for d in docs if d[0] == "emotional_intelligence" and d[1] == "insight")
+  assert insight[2] == "Dan Siegel"
+  assert insight[3] == "Name it to tame it."
+
+
+def test_build_writes_compact_index(masters, tmp_path):
+  """Test the index records doc and term counts and reopens from disk."""
+  summary = build_search_index(masters, tmp_path / "search.kbi")
+  index = SearchIndex(tmp_path / "search.kbi")
+  assert summary["docs"] == len(index) == 8
+  assert summary["terms"] == len(index.terms)
+  assert os.path.getsize(tmp_path / "search.kbi") == summary["bytes"]
+
+
+def test_postings_list_documents_and_term_frequencies(masters):
+  """Test a term's postings name each document containing it, with its count."""
+  index = open_search_index(masters)
+  postings = list(index.postings("objections"))
+  assert len(postings) == index.terms["objections"][1]
+  assert {index.docs[doc][3] for doc, _ in postings} >= {"Handle 10 objections out loud daily"}
+  assert all(tf >= 1 for _, tf in postings)
+  assert list(index.postings("zebra")) == []
+
+
+# ==================== Query Tests (4) ====================
+
+def test_bm25_ranks_best_match_first(masters):
+  """Test the document matching more (and rarer) query terms ranks first."""
+  index = open_search_index(masters)
+  results = index.search("handle objections")
+  assert results[0]["title"] == "Handle 10 objections out loud daily"
+  assert results[0]["score"] > results[1]["score"]
+  assert {r["module"] for r in results} == {"sales", "emotional_intelligence"}
+
+
+def test_module_filter_and_limit(masters):
+  """Test results stay within the requested modules and the limit is clamped."""
+  index = open_search_index(masters)
+  results = index.search("objections", modules=["emotional_intelligence"])
+  assert [r["master"] for r in results] == ["Susan David"]
+  assert len(index.search("cold call", limit=1)) == 1
+  assert len(index.search("cold call", limit=10_000)) <= MAX_LIMIT
+
+
+def test_unknown_terms_and_modules(masters):
+  """Test unmatched queries return nothing and unknown modules raise ValueError."""
+  index = open_search_index(masters)
+  assert index.search("zebra quantum") == []
+  assert index.search("the and of") == []
+  with pytest.raises(ValueError):
+    index.search("cold", modules=["nope"])
+
+
+def test_result_path_resolves_in_knowledge_base(masters):
+  """Test each hit's path fetches the original item through KnowledgeBase.get."""
+  kb = KnowledgeBase(masters)
+  hit = kb.search("tonality")[0]
+  assert kb.get(hit["module"], *hit["path"]) == "Tonality sells."
+
+
+# ==================== Freshness Tests (2) ====================
+
+def test_index_rebuilds_when_sources_change(masters):
+  """Test editing a module is picked up by the next open."""
+  open_search_index(masters)
+  data = dict(MODULES["sales"], daily_insights=["Follow up five times."])
+  with open(masters / "sales_masters.json", "w") as f:
+    json.dump(data, f)
+  st = os.stat(masters / "sales_masters.json")
+  os.utime(masters / "sales_masters.json", ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+  assert open_search_index(masters).search("follow")[0]["title"] == "Follow up five times."
+
+
+def test_knowledge_base_search_follows_generations(masters):
+  """Test KnowledgeBase.search reopens the index after a reload."""
+  kb = KnowledgeBase(masters, check_interval=0)
+  assert kb.search("pipeline") == []
+  (masters / "pipeline_masters.json").write_text(json.dumps({"daily_insights": ["Fill the pipeline daily."]}))
+  assert kb.search("pipeline")[0]["module"] == "pipeline"
@@ -0,0 +1,128 @@
+"""
+Test suite for kb_snapshot.py
+Covers the binary encoding round trip, lazy path lookups, the per-master
+offset table, string interning and staleness-driven rebuilds.
+"""
+import os
+import sys
+import json
+import pytest
+from src.kb_snapshot import Snapshot, build_snapshot, open_snapshot
+
+
+MODULES = {
+  "money": {
+    "module": "money",
+    "version": 2,
+    "weight": 0.5,
+    "flags": [True, False, None],
+    "masters": [
+      {"name": "Naval Ravikant", "expertise": "Leverage", "key_principles": ["Seek wealth", "Play long games"]},
+      {"name": "Morgan Housel", "expertise": "Behavior", "key_principles": ["Play long games"]}
+    ],
+    "level_definitions": {"1": {"title": "Début ✓"}}
+  },
+  "social": {"module": "dating", "masters": []}
+}
+
+
+@pytest.fixture
+def masters(tmp_path):
+  """Masters source dir with two modules."""
+  path = tmp_path / "knowledge_base" / "masters"
+  path.mkdir(parents=True)
+  for module, data in MODULES.items():
+    with open(path / f"{module}_masters.json", "w", encoding="utf-8") as f:
+      json.dump(data, f, ensure_ascii=False)
+  return path
+
+
+def bump(path):
+  """Touch a file with a strictly newer mtime."""
+  st = os.stat(path)
+  os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+
+# ==================== Encoding Tests (4) ====================
+
+def test_round_trip_matches_json(masters):
+  """Test every module decodes to exactly what json.load returns."""
+  snap = open_snapshot(masters)
+  assert snap.path == masters.parent / "build" / "masters.kbs"
+  assert snap.modules() == ["money", "social"]
+  for module, data in MODULES.items():
+    assert snap.module(module) == data
+  assert snap.module("missing") is None
+
+
+def test_get_decodes_only_the_requested_path(masters):
+  """Test path lookups across dicts and lists, including negative indexes and misses."""
+  snap = open_snapshot(masters)
+  assert snap.get("money", "masters", 0, "key_principles") == ["Seek wealth", "Play long games"]
+  assert snap.get("money", "masters", -1, "name") == "Morgan Housel"
+  assert snap.get("money", "level_definitions", "1", "title") == "Début ✓"
+  assert snap.get("money", "masters", 2, default="x") == "x"
+  assert snap.get("money", "masters", "0") is None
+  assert snap.get("missing", "masters") is None
+
+
+def test_master_offset_table(masters):
+  """Test one master is fetched by name from the index."""
+  snap = open_snapshot(masters)
+  assert snap.master_names("money") == ["Naval Ravikant", "Morgan Housel"]
+  assert snap.master("money", "Morgan Housel") == MODULES["money"]["masters"][1]
+  assert snap.master("money", "Nobody") is None
+  assert snap.master_names("social") == []
+
+
+def test_strings_are_stored_once_and_interned(masters):
+  """Test repeated strings share one table entry and decode to the same object."""
+  summary = build_snapshot(masters)
+  body = (masters.parent / "build" / "masters.kbs").read_bytes()
+  assert body.count(b"Play long games") == 1
+  assert summary["strings"] < 40
+
+  snap = Snapshot(summary["path"])
+  first = snap.get("money", "masters", 0, "key_principles", 1)
+  second = snap.get("money", "masters", 1, "key_principles", 0)
+  assert first is second
+  assert first is sys.intern("Play long games")
+
+
+# ==================== Staleness Tests (4) ====================
+
+def test_open_reuses_current_snapshot(masters):
+  """Test an up-to-date snapshot is opened without rebuilding."""
+  first = open_snapshot(masters)
+  mtime = os.stat(first.path).st_mtime_ns
+  second = open_snapshot(masters)
+  assert os.stat(second.path).st_mtime_ns == mtime
+
+
+def test_rebuilds_when_source_is_newer(masters):
+  """Test editing a source file triggers a rebuild with the new content."""
+  open_snapshot(masters)
+  data = dict(MODULES["social"], module="social")
+  with open(masters / "social_masters.json", "w") as f:
+    json.dump(data, f)
+  bump(masters / "social_masters.json")
+  assert open_snapshot(masters).get("social", "module") == "social"
+
+
+def test_invalid_json_is_recorded_as_error(masters):
+  """Test a corrupt source is listed under errors, not modules, and stays current."""
+  (masters / "broken_masters.json").write_text("{not json")
+  snap = open_snapshot(masters)
+  assert "broken" in snap.errors
+  assert snap.module("broken") is None
+  assert open_snapshot(masters).errors == snap.errors
+
+
+def test_corrupt_snapshot_is_rebuilt(masters):
+  """Test a truncated or foreign snapshot file is replaced, and unwritable builds give None."""
+  path = open_snapshot(masters).path
+  path.write_bytes(b"garbage")
+  with pytest.raises(ValueError):
+    Snapshot(path)
+  assert open_snapshot(masters).module("social") == MODULES["social"]
+  assert open_snapshot(masters, path=masters / "missing_dir" / "x" / "\0bad") is None
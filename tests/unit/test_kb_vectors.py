@@ -0,0 +1,186 @@
+"""
+Test suite for kb_vectors.py
+Covers the TF-IDF teaching vectors (NumPy and pure-Python scoring), the
+nightly reflection -> teachings precompute and the nightly job runner.
+"""
+import json
+from array import array
+from datetime import datetime, timedelta
+import pytest
+from src.kb_search import open_search_index
+from src.kb_vectors import HAS_NUMPY, VectorIndex
+from src.data_manager import DataManager
+from src.wisdom_engine import WisdomEngine
+from src import nightly
+
+
+MODULES = {
+  "sales": {
+    "masters": [{
+      "name": "Jordan Belfort",
+      "key_principles": ["Objections are requests for more information.", "Tonality sells."],
+      "daily_practices": ["Handle 10 objections out loud daily"],
+      "scripts_templates": {"opener": {"name": "Objection Script", "template": "Handle objections..."}}
+    }],
+    "daily_insights": ["Every conversation is a sale."]
+  },
+  "productivity": {
+    "masters": [{
+      "name": "Cal Newport",
+      "key_principles": ["Deep work is focus without distraction.", "Email fragments attention."],
+      "daily_practices": ["Check email twice a day", "Schedule deep work blocks"]
+    }],
+    "daily_insights": [{"insight": "Protect your mornings from email.", "source": "Cal Newport"}]
+  }
+}
+
+
+def _days_ago(n):
+  return (datetime.now() - timedelta(days=n)).strftime("%Y-%m-%d")
+
+
+@pytest.fixture
+def base(tmp_path):
+  """App base dir with a small knowledge base."""
+  masters = tmp_path / "knowledge_base" / "masters"
+  masters.mkdir(parents=True)
+  for module, data in MODULES.items():
+    with open(masters / f"{module}_masters.json", "w") as f:
+      json.dump(data, f)
+  return tmp_path
+
+
+@pytest.fixture
+def vectors(base):
+  return VectorIndex.from_search_index(open_search_index(base / "knowledge_base" / "masters"))
+
+
+def _reflect(dm, date, challenges, lessons=()):
+  log = dm.get_or_create_daily_log(date)
+  log["pm_reflection"] = {"wins": ["Shipped it"], "challenges": list(challenges), "lessons": list(lessons),
+                          "improvement_for_tomorrow": "", "day_score": 7}
+  dm.save_daily_log(log, date)
+
+
+# ==================== Vector Tests (5) ====================
+
+def test_only_teachings_are_vectorized(vectors):
+  """Test principles, practices and insights are indexed but templates are not."""
+  assert {d["kind"] for d in vectors.docs} == {"principle", "practice", "insight"}
+  assert len(vectors) == 9
+
+
+def test_cosine_ranks_closest_teaching_first(vectors):
+  """Test a teaching's own text scores 1.0 and related teachings rank by overlap."""
+  hits = vectors.similar(["Handle 10 objections out loud daily"], k=3)[0]
+  assert hits[0]["title"] == "Handle 10 objections out loud daily"
+  assert hits[0]["score"] == pytest.approx(1.0)
+  assert hits[1]["title"] == "Objections are requests for more information."
+  assert all(h["score"] > 0 for h in hits)
+
+
+def test_batch_returns_one_result_list_per_query(vectors):
+  """Test each query in a batch gets its own hits, empty when nothing overlaps."""
+  results = vectors.similar(["distracted by email", "zebra quantum", "objections"], k=2)
+  assert len(results) == 3
+  assert results[0][0]["module"] == "productivity"
+  assert results[1] == []
+  assert [h["kind"] for h in results[2]] == ["principle", "practice"]
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+def test_numpy_and_python_scoring_agree(base):
+  """Test the NumPy matrix product and the pure-Python fallback rank identically."""
+  index = open_search_index(base / "knowledge_base" / "masters")
+  fast = VectorIndex.from_search_index(index, use_numpy=True)
+  slow = VectorIndex.from_search_index(index, use_numpy=False)
+  queries = ["email distraction during deep work", "objections on a sales call", "focus", "nothing here"]
+  fast_hits, slow_hits = fast.top_k(queries, k=4), slow.top_k(queries, k=4)
+  assert [[d for d, _ in hits] for hits in fast_hits] == [[d for d, _ in hits] for hits in slow_hits]
+  for a, b in zip(fast_hits, slow_hits):
+    assert [s for _, s in a] == pytest.approx([s for _, s in b])
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+def test_ties_at_the_kth_score_break_by_doc_id():
+  """Test both paths keep the lowest doc ids among teachings tied at the k-th score."""
+  weights = [0.5] * 10
+  weights[5] = 0.9
+  args = ([{} for _ in weights], {"focus": (0, 10, 1.0)}, array("I", range(10)), array("d", weights))
+  for use_numpy in (True, False):
+    hits = VectorIndex(*args, use_numpy=use_numpy).top_k(["focus"], k=3)[0]
+    assert [d for d, _ in hits] == [5, 0, 1]
+
+
+# ==================== Reflection Tests (4) ====================
+
+def test_precompute_scores_only_new_or_edited_reflections(base):
+  """Test the nightly precompute stores matches and skips unchanged reflections."""
+  dm = DataManager(base_path=str(base))
+  _reflect(dm, _days_ago(1), ["Got distracted by email all morning"])
+  _reflect(dm, _days_ago(2), ["Froze on objections during a sales call"])
+  engine = WisdomEngine(dm)
+
+  assert engine.precompute_reflection_teachings() == {"computed": 2, "cached": 0}
+  stored = dm.get_reflection_teachings()["reflections"]
+  assert stored[_days_ago(2)]["teachings"][0]["module"] == "sales"
+  assert "snippet" not in stored[_days_ago(2)]["teachings"][0]
+
+  assert engine.precompute_reflection_teachings() == {"computed": 0, "cached": 2}
+  _reflect(dm, _days_ago(1), ["Skipped my deep work block"])
+  assert engine.precompute_reflection_teachings() == {"computed": 1, "cached": 1}
+
+
+def test_recent_teachings_combine_stored_and_new_reflections(base):
+  """Test the last-7-days view reads stored matches and scores unsaved ones on the fly."""
+  dm = DataManager(base_path=str(base))
+  _reflect(dm, _days_ago(1), ["Email kept breaking my focus"])
+  _reflect(dm, _days_ago(20), ["Objections objections objections"])
+  engine = WisdomEngine(dm)
+  engine.precompute_reflection_teachings()
+  _reflect(dm, _days_ago(3), ["Checked email constantly"], ["Batch email"])
+
+  teachings = engine.get_reflection_teachings(k=3)
+  assert {t["module"] for t in teachings} == {"productivity"}
+  assert teachings[0]["score"] >= teachings[1]["score"] >= teachings[2]["score"]
+  assert any(len(t["dates"]) == 2 for t in teachings)
+
+
+def test_no_reflections_means_no_teachings(base, capsys):
+  """Test users without reflections get an empty list and no extra wisdom section."""
+  engine = WisdomEngine(DataManager(base_path=str(base)))
+  assert engine.get_reflection_teachings() == []
+  engine.print_daily_wisdom()
+  assert "REFLECTIONS]" not in capsys.readouterr().out
+
+
+def test_daily_wisdom_shows_only_nightly_matches(base, capsys, monkeypatch):
+  """Test printing wisdom never vectorises the KB: unmatched reflections are left out."""
+  dm = DataManager(base_path=str(base))
+  engine = WisdomEngine(dm)
+  engine.get_daily_wisdom()
+  _reflect(dm, _days_ago(1), ["Email kept breaking my focus"])
+
+  def no_vectors():
+    raise AssertionError("vector index built while printing wisdom")
+  monkeypatch.setattr(engine.kb, "vector_index", no_vectors)
+  engine.print_daily_wisdom()
+  assert "REFLECTIONS]" not in capsys.readouterr().out
+
+  monkeypatch.undo()
+  engine.precompute_reflection_teachings()
+  engine.print_daily_wisdom()
+  assert "REFLECTIONS]" in capsys.readouterr().out
+
+
+# ==================== Nightly Tests (1) ====================
+
+def test_nightly_reports_failures_and_keeps_going(base, monkeypatch):
+  """Test a failing job is reported with its error while later jobs still run."""
+  def broken(dm):
+    raise RuntimeError("boom")
+  monkeypatch.setattr(nightly, "JOBS", [("broken", broken)] + nightly.JOBS)
+  results = nightly.run_nightly(DataManager(base_path=str(base)))
+  assert results["broken"]["error"] == "RuntimeError: boom"
+  assert results["reflection_teachings"]["computed"] == 0
+  assert "seconds" in results["reflection_teachings"]
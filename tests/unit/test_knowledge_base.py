@@ -0,0 +1,416 @@
+"""
+Test suite for knowledge_base.py
+Covers the read-only masters index (projection, filtering, pagination) and
+the shared, hot-reloading KnowledgeBase with validated generations and
+background prefetch, and the lightweight master directory.
+"""
+import json
+import os
+import threading
+import time
+import pytest
+from src import knowledge_base
+from src.knowledge_base import KnowledgeBase, MastersIndex, load_modules, MAX_PAGE_SIZE
+
+
+def make_module(module, count):
+  """Module dict with ``count`` masters carrying heavy optional fields."""
+  return {
+    "module": module,
+    "masters": [
+      {
+        "name": f"{module.title()} Master {i}",
+        "expertise": f"{module} expertise {i}",
+        "key_principles": [f"{module} principle {i}"],
+        "worked_examples": [{"title": "Example", "scenario": "x" * 500}],
+        "resources": {"books": ["Book"]}
+      }
+      for i in range(count)
+    ]
+  }
+
+
+@pytest.fixture
+def index():
+  """Index over two modules: 3 money masters and 2 sales masters."""
+  return MastersIndex({"sales": make_module("sales", 2), "money": make_module("money", 3)})
+
+
+# ==================== Build Tests (3) ====================
+
+def test_index_counts_all_masters(index):
+  """Test every master from every module is indexed."""
+  assert len(index) == 5
+  assert index.modules == ("money", "sales")
+
+
+def test_index_lists_available_fields(index):
+  """Test the index reports the union of master fields."""
+  assert "worked_examples" in index.fields
+  assert "module" in index.fields
+
+
+def test_from_directory_skips_invalid_files(tmp_path):
+  """Test loading from disk ignores malformed module files."""
+  (tmp_path / "money_masters.json").write_text(json.dumps(make_module("money", 1)))
+  (tmp_path / "broken_masters.json").write_text("{nope")
+  assert list(load_modules(tmp_path)) == ["money"]
+  assert len(MastersIndex.from_directory(tmp_path)) == 1
+
+
+# ==================== Projection Tests (3) ====================
+
+def test_default_projection_is_lightweight(index):
+  """Test list queries return only identity fields by default."""
+  item = index.query()["items"][0]
+  assert set(item) == {"module", "name", "expertise"}
+
+
+def test_explicit_fields_projection(index):
+  """Test requested fields are returned alongside module and name."""
+  item = index.query(fields=["resources", "unknown"])["items"][0]
+  assert set(item) == {"module", "name", "resources"}
+
+
+def test_star_returns_full_records(index):
+  """Test fields=* returns complete master records."""
+  item = index.query(module="money", fields=["*"])["items"][0]
+  assert item["worked_examples"][0]["title"] == "Example"
+
+
+# ==================== Pagination Tests (4) ====================
+
+def test_cursor_walks_all_pages(index):
+  """Test following next_cursor visits every master exactly once."""
+  names, cursor = [], None
+  while True:
+    page = index.query(limit=2, cursor=cursor)
+    names.extend(item["name"] for item in page["items"])
+    cursor = page["next_cursor"]
+    if cursor is None:
+      break
+  assert len(names) == 5
+  assert len(set(names)) == 5
+
+
+def test_module_filter(index):
+  """Test module filter restricts results and total."""
+  page = index.query(module="sales")
+  assert page["total"] == 2
+  assert {item["module"] for item in page["items"]} == {"sales"}
+
+
+def test_limit_is_clamped(index):
+  """Test limit is clamped to [1, MAX_PAGE_SIZE]."""
+  assert len(index.query(limit=0)["items"]) == 1
+  assert len(index.query(limit=MAX_PAGE_SIZE * 10)["items"]) == 5
+
+
+def test_invalid_module_and_cursor_raise(index):
+  """Test unknown modules and malformed cursors raise ValueError."""
+  with pytest.raises(ValueError):
+    index.query(module="nonexistent")
+  with pytest.raises(ValueError):
+    index.query(cursor="abc")
+  with pytest.raises(ValueError):
+    index.query(cursor="-1")
+
+
+# ==================== Shared KnowledgeBase Tests (8) ====================
+
+@pytest.fixture
+def masters_dir(tmp_path):
+  """Masters directory with money and sales modules."""
+  masters = tmp_path / "masters"
+  masters.mkdir()
+  for module, count in (("money", 2), ("sales", 1)):
+    with open(masters / f"{module}_masters.json", "w") as f:
+      json.dump(make_module(module, count), f)
+  return masters
+
+
+def bump(path, data):
+  """Rewrite a file and move its mtime forward so the change is always visible."""
+  with open(path, "w") as f:
+    json.dump(data, f)
+  st = os.stat(path)
+  os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+
+def test_shared_instance_per_directory(masters_dir, tmp_path_factory):
+  """Test one instance is shared per directory."""
+  other = tmp_path_factory.mktemp("other")
+  assert KnowledgeBase.shared(masters_dir) is KnowledgeBase.shared(masters_dir)
+  assert KnowledgeBase.shared(masters_dir) is not KnowledgeBase.shared(other)
+
+
+def test_modules_load_lazily_and_once(masters_dir):
+  """Test modules are parsed on first use and then returned as the same object."""
+  kb = KnowledgeBase(masters_dir)
+  assert kb.module_names() == ["money", "sales"]
+  assert kb._modules == {}
+
+  money = kb.module("money")
+  assert len(money["masters"]) == 2
+  assert kb.module("money") is money
+  assert kb.module("missing") == {}
+
+
+def test_invalid_module_is_listed_but_empty(masters_dir):
+  """Test a corrupt file counts as a module name but yields no data."""
+  (masters_dir / "broken_masters.json").write_text("{not json")
+  kb = KnowledgeBase(masters_dir)
+
+  assert kb.has_module("broken")
+  assert kb.module("broken") == {}
+  assert sorted(kb.modules()) == ["money", "sales"]
+
+
+def test_changed_file_is_reloaded(masters_dir):
+  """Test editing a source file starts a new generation with fresh data."""
+  kb = KnowledgeBase(masters_dir, check_interval=0)
+  old_money, sales = kb.module("money"), kb.module("sales")
+  generation = kb.generation
+
+  bump(masters_dir / "money_masters.json", make_module("money", 5))
+
+  assert len(kb.module("money")["masters"]) == 5
+  assert kb.module("sales") is sales
+  assert len(old_money["masters"]) == 2
+  assert kb.generation == generation + 1
+
+
+def test_reload_is_throttled(masters_dir):
+  """Test source files are not re-checked within the check interval."""
+  kb = KnowledgeBase(masters_dir, check_interval=3600)
+  kb.module("money")
+  bump(masters_dir / "money_masters.json", make_module("money", 5))
+
+  assert len(kb.module("money")["masters"]) == 2
+  assert kb.refresh(force=True) is True
+  assert len(kb.module("money")["masters"]) == 5
+
+
+def test_get_and_master_read_from_snapshot(masters_dir):
+  """Test single values come from the compiled snapshot without parsing modules."""
+  kb = KnowledgeBase(masters_dir)
+  assert (masters_dir.parent / "build" / "masters.kbs").is_file()
+
+  name = kb.get("money", "masters", 1, "name")
+  assert name == make_module("money", 2)["masters"][1]["name"]
+  assert kb.master("money", name.upper())["name"] == name
+  assert kb.get("money", "masters", 5, "name", default="none") == "none"
+  assert kb.master("money", "Nobody") is None
+  assert kb._modules == {}
+
+
+def test_get_sees_edits_and_parsed_modules(masters_dir):
+  """Test get follows source edits and reads already-parsed modules in place."""
+  kb = KnowledgeBase(masters_dir, check_interval=0)
+  data = make_module("sales", 1)
+  data["masters"][0]["name"] = "Edited"
+  bump(masters_dir / "sales_masters.json", data)
+  assert kb.get("sales", "masters", 0, "name") == "Edited"
+
+  kb.modules()["sales"]["masters"][0]["name"] = "In memory"
+  assert kb.get("sales", "masters", 0, "name") == "In memory"
+
+
+def test_derived_values_are_cached_per_generation(masters_dir):
+  """Test derived indexes are built once and rebuilt only after a reload."""
+  kb = KnowledgeBase(masters_dir, check_interval=0)
+  builds = []
+  build = lambda k: builds.append(k.generation) or len(builds)
+  assert kb.derived("count", build) == kb.derived("count", build) == 1
+
+  bump(masters_dir / "sales_masters.json", make_module("sales", 3))
+  assert kb.derived("count", build) == 2
+  assert builds == [1, 2]
+
+
+# ==================== Reload & Validation Tests (7) ====================
+
+def metric(name, *labels):
+  """Current value of one of knowledge_base's metrics."""
+  return knowledge_base.REGISTRY.get(name).values().get(tuple(labels), 0)
+
+
+def test_invalid_edit_keeps_last_valid_version(masters_dir):
+  """Test a malformed edit is reported and the module keeps serving its previous data."""
+  kb = KnowledgeBase(masters_dir, check_interval=0)
+  name = kb.get("money", "masters", 0, "name")
+  rejected = metric("kb_validation_errors_total", "money")
+
+  bump(masters_dir / "money_masters.json", {"masters": [{"expertise": "no name"}]})
+  assert kb.errors() == {"money": ["masters[0].name: missing"]}
+  assert kb.get("money", "masters", 0, "name") == name
+  assert len(kb.module("money")["masters"]) == 2
+  assert metric("kb_validation_errors_total", "money") == rejected + 1
+  assert metric("kb_invalid_modules") == 1
+
+  (masters_dir / "money_masters.json").write_text("{truncated")
+  assert kb.errors()["money"][0].startswith("invalid JSON")
+  assert len(kb.module("money")["masters"]) == 2
+
+  bump(masters_dir / "money_masters.json", make_module("money", 4))
+  assert kb.errors() == {}
+  assert len(kb.module("money")["masters"]) == 4
+  assert metric("kb_generation") == kb.generation
+
+
+def test_invalid_file_without_snapshot_is_rejected(masters_dir):
+  """Test validation also runs when modules are parsed straight from the JSON files."""
+  (masters_dir / "broken_masters.json").write_text(json.dumps({"masters": "not a list"}))
+  kb = KnowledgeBase(masters_dir, check_interval=0, snapshot=False)
+  assert kb.module("broken") == {}
+  assert kb.errors() == {"broken": ["masters: expected array"]}
+
+  kb.module("sales")
+  bump(masters_dir / "sales_masters.json", {"masters": [3]})
+  assert kb.errors()["sales"] == ["masters[0]: expected object"]
+  assert len(kb.module("sales")["masters"]) == 1
+
+
+def test_pinned_readers_finish_on_their_generation(masters_dir):
+  """Test a reload swapped in mid-request is not seen until the request ends."""
+  kb = KnowledgeBase(masters_dir, check_interval=0)
+  with kb.pin() as generation:
+    bump(masters_dir / "sales_masters.json", make_module("sales", 3))
+    assert kb.reload() is True
+    assert kb.generation == generation.id
+    assert len(kb.module("sales")["masters"]) == 1
+    assert kb.get("sales", "masters", 2, "name") is None
+  assert kb.generation == generation.id + 1
+  assert len(kb.module("sales")["masters"]) == 3
+
+
+def test_reload_prebuilds_derived_values(masters_dir):
+  """Test derived indexes are rebuilt during the reload, before the swap."""
+  kb = KnowledgeBase(masters_dir, check_interval=3600)
+  builds = []
+  kb.derived("masters", lambda k: builds.append(k.generation) or len(k.module("sales")["masters"]))
+
+  bump(masters_dir / "sales_masters.json", make_module("sales", 3))
+  assert kb.refresh(force=True) is True
+  assert builds == [1, 2]
+  assert kb.derived("masters", lambda k: builds.append("late")) == 3
+  assert builds == [1, 2]
+
+
+def test_failed_reload_keeps_current_generation(masters_dir, monkeypatch):
+  """Test an exception while building a generation is counted and nothing is swapped."""
+  kb = KnowledgeBase(masters_dir, check_interval=0)
+  generation, failures = kb.generation, metric("kb_reload_errors_total")
+
+  def broken(*args):
+    raise RuntimeError("disk on fire")
+  monkeypatch.setattr(kb, "_build", broken)
+  bump(masters_dir / "sales_masters.json", make_module("sales", 3))
+  assert kb.reload() is False
+  assert kb.generation == generation
+  assert kb.last_error == "RuntimeError: disk on fire"
+  assert metric("kb_reload_errors_total") == failures + 1
+
+
+def test_watch_reloads_off_the_request_path(masters_dir):
+  """Test the watcher thread swaps in edits while readers stop checking files."""
+  kb = KnowledgeBase(masters_dir, check_interval=0)
+  stop = kb.watch(interval=0.01)
+  try:
+    assert kb.refresh() is False
+    bump(masters_dir / "sales_masters.json", make_module("sales", 2))
+    deadline = time.monotonic() + 5
+    while len(kb.module("sales")["masters"]) != 2 and time.monotonic() < deadline:
+      time.sleep(0.01)
+    assert len(kb.module("sales")["masters"]) == 2
+  finally:
+    stop.set()
+
+
+def test_watch_calls_on_reload_after_each_new_generation(masters_dir):
+  """Test derived state is rebuilt from the watch thread only when a reload happens."""
+  kb = KnowledgeBase(masters_dir, check_interval=0)
+  kb.module("sales")
+  calls = []
+
+  def on_reload():
+    calls.append(kb.generation)
+    if len(calls) == 1:
+      raise RuntimeError("bundle build failed")
+
+  stop = kb.watch(interval=0.01, on_reload=on_reload)
+  try:
+    time.sleep(0.05)
+    assert calls == []
+    bump(masters_dir / "sales_masters.json", make_module("sales", 2))
+    deadline = time.monotonic() + 5
+    while kb.last_error is None and time.monotonic() < deadline:
+      time.sleep(0.01)
+    assert kb.last_error == "RuntimeError: bundle build failed"
+    bump(masters_dir / "sales_masters.json", make_module("sales", 3))
+    while len(calls) < 2 and time.monotonic() < deadline:
+      time.sleep(0.01)
+    assert calls == [calls[0], kb.generation] and calls[0] < calls[1]
+  finally:
+    stop.set()
+
+
+# ==================== Prefetch Tests (2) ====================
+
+def test_prefetch_loads_priority_modules_first(masters_dir):
+  """Test the priority modules load in order, then the rest, through the load callback."""
+  with open(masters_dir / "health_masters.json", "w") as f:
+    json.dump(make_module("health", 1), f)
+  kb = KnowledgeBase(masters_dir)
+  order = []
+
+  def load(kb, module):
+    order.append(module)
+    return kb.module(module)
+  kb.prefetch(["sales", "unknown", "sales"], load).join(timeout=5)
+  assert order == ["sales", "health", "money"]
+  assert set(kb._modules) == {"health", "money", "sales"}
+
+
+def test_readers_wait_only_for_their_module(masters_dir, monkeypatch):
+  """Test a reader is not queued behind another module's load and shares an in-flight one."""
+  kb = KnowledgeBase(masters_dir)
+  started, release, parsed = threading.Event(), threading.Event(), []
+  parse = kb._parse
+
+  def slow_parse(module, *args):
+    parsed.append(module)
+    if module == "money":
+      started.set()
+      release.wait(5)
+    return parse(module, *args)
+  monkeypatch.setattr(kb, "_parse", slow_parse)
+
+  prefetch = kb.prefetch(["money"])
+  assert started.wait(5)
+  assert len(kb.module("sales")["masters"]) == 1
+  result = []
+  waiter = threading.Thread(target=lambda: result.append(kb.module("money")))
+  waiter.start()
+  waiter.join(0.05)
+  assert waiter.is_alive()
+
+  release.set()
+  waiter.join(5)
+  prefetch.join(5)
+  assert result[0] is kb.module("money")
+  assert parsed.count("money") == 1
+
+
+# ==================== Master Directory Tests (1) ====================
+
+def test_master_directory_reads_names_without_parsing(masters_dir):
+  """Test the directory lists name and expertise per module from the snapshot alone."""
+  (masters_dir / "empty_masters.json").write_text(json.dumps({"masters": []}))
+  kb = KnowledgeBase(masters_dir)
+  directory = kb.master_directory()
+  assert list(directory) == ["money", "sales"]
+  assert directory["money"] == [{"name": "Money Master 0", "expertise": "money expertise 0"},
+                                {"name": "Money Master 1", "expertise": "money expertise 1"}]
+  assert kb._modules == {}
+  assert kb.master("money", directory["money"][1]["name"])["key_principles"] == ["money principle 1"]
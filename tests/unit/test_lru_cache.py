@@ -0,0 +1,107 @@
+"""
+Test suite for lru_cache.py
+Covers byte/entry budgets, LRU ordering, stamp validation and statistics.
+"""
+import threading
+import pytest
+from src.lru_cache import LRUCache, approx_size
+
+
+# ==================== Size Estimation Tests (2) ====================
+
+def test_approx_size_grows_with_content():
+  """Test nested data is counted deeply."""
+  small = {"habits": []}
+  large = {"habits": [{"id": f"h{i}", "name": "x" * 100} for i in range(50)]}
+  assert approx_size(large) > approx_size(small) + 50 * 100
+
+
+def test_approx_size_scalars():
+  """Test scalars cost at least their object size."""
+  assert approx_size("abc") > 0
+  assert approx_size(1) > 0
+
+
+# ==================== Cache Behaviour Tests (6) ====================
+
+def test_get_put_and_stats():
+  """Test basic hit/miss accounting."""
+  cache = LRUCache()
+  assert cache.get("a") is None
+  cache.put("a", {"x": 1}, size=10)
+  assert cache.get("a") == {"x": 1}
+
+  stats = cache.stats()
+  assert (stats["hits"], stats["misses"], stats["entries"], stats["bytes"]) == (1, 1, 1, 10)
+
+
+def test_stamp_mismatch_is_a_miss():
+  """Test entries are only returned for a matching stamp."""
+  cache = LRUCache()
+  cache.put("f.json", "old", stamp=(1, 10), size=1)
+  assert cache.get("f.json", (2, 10)) is None
+  assert cache.get("f.json", (1, 10)) == "old"
+
+
+def test_byte_budget_evicts_least_recently_used():
+  """Test inserting past max_bytes evicts the oldest untouched entries."""
+  cache = LRUCache(max_bytes=100)
+  cache.put("a", "A", size=40)
+  cache.put("b", "B", size=40)
+  cache.get("a")
+  cache.put("c", "C", size=40)
+
+  assert "b" not in cache
+  assert "a" in cache and "c" in cache
+  assert cache.bytes == 80
+  assert cache.stats()["evictions"] == 1
+  assert cache.stats()["evicted_bytes"] == 40
+
+
+def test_entry_budget_evicts():
+  """Test max_entries bounds the entry count independently of bytes."""
+  cache = LRUCache(max_entries=2)
+  for key in "abc":
+    cache.put(key, key, size=1)
+  assert len(cache) == 2
+  assert "a" not in cache
+
+
+def test_oversized_value_is_not_cached():
+  """Test values bigger than the whole budget are rejected without evicting others."""
+  cache = LRUCache(max_bytes=100)
+  cache.put("a", "A", size=10)
+  assert cache.put("big", "B", size=101) is False
+  assert "a" in cache and "big" not in cache
+
+
+def test_replace_and_invalidate_track_bytes():
+  """Test replacing or dropping an entry keeps the byte total exact."""
+  cache = LRUCache()
+  cache.put("a", 1, size=30)
+  cache.put("a", 2, size=50)
+  assert cache.bytes == 50
+  assert cache.invalidate("a") is True
+  assert cache.invalidate("a") is False
+  assert cache.bytes == 0
+
+
+# ==================== Concurrency Tests (1) ====================
+
+def test_concurrent_puts_respect_budget():
+  """Test the budget holds under concurrent writers."""
+  cache = LRUCache(max_bytes=1000)
+
+  def writer(n):
+    for i in range(500):
+      cache.put(f"{n}-{i}", i, size=7)
+      cache.get(f"{n}-{i // 2}")
+
+  threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+  for t in threads:
+    t.start()
+  for t in threads:
+    t.join()
+
+  assert cache.bytes <= 1000
+  assert cache.bytes == 7 * len(cache)
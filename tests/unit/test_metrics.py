@@ -0,0 +1,112 @@
+"""
+Test suite for metrics.py
+Covers counters, gauges, histograms, the disabled fast path and text exposition.
+"""
+import pytest
+from src.metrics import Registry
+
+
+@pytest.fixture
+def registry():
+  """A fresh, enabled registry."""
+  return Registry()
+
+
+# ==================== Counter & Gauge Tests (4) ====================
+
+def test_counter_accumulates_per_label_set(registry):
+  """Test counters add up independently for each label combination."""
+  requests = registry.counter("requests_total", "Requests", ("route",))
+  requests.inc(route="/a")
+  requests.inc(2, route="/a")
+  requests.inc(route="/b")
+
+  assert requests.values() == {("/a",): 3, ("/b",): 1}
+
+
+def test_counter_rejects_wrong_labels(registry):
+  """Test label names must match the declaration."""
+  requests = registry.counter("requests_total", "Requests", ("route",))
+  with pytest.raises(ValueError):
+    requests.inc(path="/a")
+
+
+def test_gauge_set_inc_and_function(registry):
+  """Test gauges support set/inc/dec and values computed at read time."""
+  size = registry.gauge("cache_entries", "Entries", ("cache",))
+  size.set(5, cache="file")
+  size.dec(cache="file")
+  items = [1, 2, 3]
+  size.set_function(lambda: len(items), cache="gzip")
+  items.append(4)
+
+  assert size.values() == {("file",): 4, ("gzip",): 4}
+
+
+def test_registry_get_or_create(registry):
+  """Test registering the same name twice returns the same metric."""
+  first = registry.counter("hits_total", "Hits")
+  assert registry.counter("hits_total", "Hits") is first
+  with pytest.raises(ValueError):
+    registry.gauge("hits_total", "Hits")
+
+
+# ==================== Histogram Tests (3) ====================
+
+def test_histogram_buckets_are_cumulative(registry):
+  """Test observations land in the first bucket that fits, reported cumulatively."""
+  latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+  for value in (0.05, 0.5, 0.7, 5.0):
+    latency.observe(value)
+
+  state = latency.values()[()]
+  assert state["buckets"] == [1, 3]
+  assert state["count"] == 4
+  assert state["sum"] == pytest.approx(6.25)
+
+
+def test_histogram_time_context_manager(registry):
+  """Test time() records one observation per block."""
+  latency = registry.histogram("latency_seconds", "Latency", ("op",))
+  with latency.time(op="read"):
+    pass
+
+  assert latency.values()[("read",)]["count"] == 1
+
+
+def test_disabled_registry_records_nothing():
+  """Test updates are no-ops when the registry is disabled."""
+  registry = Registry(enabled=False)
+  hits = registry.counter("hits_total", "Hits")
+  latency = registry.histogram("latency_seconds", "Latency")
+  hits.inc()
+  latency.observe(0.1)
+  with latency.time():
+    pass
+
+  assert hits.values() == {}
+  assert latency.values() == {}
+
+
+# ==================== Exposition Tests (2) ====================
+
+def test_render_counter_text_format(registry):
+  """Test the Prometheus text format for a labelled counter."""
+  registry.counter("requests_total", "Requests handled", ("route",)).inc(route='/a"b')
+
+  assert registry.render() == (
+    "# HELP requests_total Requests handled\n"
+    "# TYPE requests_total counter\n"
+    'requests_total{route="/a\\"b"} 1\n'
+  )
+
+
+def test_render_histogram_series(registry):
+  """Test histograms render _bucket (with +Inf), _sum and _count series."""
+  registry.histogram("io_seconds", "IO", ("op",), buckets=(0.5,)).observe(0.25, op="read")
+  lines = registry.render().splitlines()
+
+  assert 'io_seconds_bucket{op="read",le="0.5"} 1' in lines
+  assert 'io_seconds_bucket{op="read",le="+Inf"} 1' in lines
+  assert 'io_seconds_sum{op="read"} 0.25' in lines
+  assert 'io_seconds_count{op="read"} 1' in lines
@@ -0,0 +1,94 @@
+"""
+Test suite for rotation.py
+Covers the keyed permutation, no-repeat day rotation and WisdomEngine's
+rotating teachings, insights and challenges over the real knowledge base.
+"""
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+import pytest
+from src.rotation import KeyedPermutation, day_number, rotation_index
+from src.data_manager import DataManager
+from src.knowledge_base import KnowledgeBase
+from src.wisdom_engine import WisdomEngine
+
+
+REAL_KB = Path(__file__).resolve().parents[2] / "knowledge_base"
+
+
+def _cycle_days(n, date="2026-01-01"):
+  """The n days of the rotation cycle containing ``date``."""
+  start = day_number(date) // n * n
+  return range(start, start + n)
+
+
+# ==================== Permutation Tests (3) ====================
+
+def test_permutation_is_a_bijection():
+  """Test every size maps range(n) onto itself exactly once."""
+  for n in (1, 2, 3, 7, 16, 17, 250):
+    for key in (0, 1, 2 ** 63 + 12345):
+      perm = KeyedPermutation(n, key)
+      assert sorted(perm[i] for i in range(n)) == list(range(n))
+  with pytest.raises(ValueError):
+    KeyedPermutation(0, 1)
+
+
+def test_each_cycle_shows_every_item_once_in_a_new_order():
+  """Test n consecutive days cover the pool and the next cycle reshuffles it."""
+  n = 40
+  first = [rotation_index("alice|teachings", n, d) for d in range(5 * n, 6 * n)]
+  second = [rotation_index("alice|teachings", n, d) for d in range(6 * n, 7 * n)]
+  assert sorted(first) == sorted(second) == list(range(n))
+  assert first != second
+
+
+def test_rotation_depends_on_key():
+  """Test users (keys) walk the same pool in different orders."""
+  alice = [rotation_index("alice|insights", 30, d) for d in range(30)]
+  bob = [rotation_index("bob|insights", 30, d) for d in range(30)]
+  assert alice != bob and sorted(alice) == sorted(bob)
+
+
+# ==================== Engine Rotation Tests (2) ====================
+
+def test_full_module_pools_before_any_repeat(tmp_path):
+  """Test each real module's principles, insights and challenges all appear once per cycle."""
+  (tmp_path / "data").mkdir()
+  engine = WisdomEngine(DataManager(base_path=str(tmp_path), kb_path=str(REAL_KB)), "alice")
+  kb = KnowledgeBase.shared(REAL_KB / "masters")
+  for module in kb.module_names():
+    masters = kb.get(module, "masters", default=[])
+    principles = [(m["name"], json.dumps(p)) for m in masters for p in m.get("key_principles") or []]
+    days = _cycle_days(len(principles))
+    seen = [engine._get_master_teaching([module], day=d) for d in days]
+    assert sorted((t["master"], json.dumps(t["teaching"])) for t in seen) == sorted(principles), module
+
+    insights = kb.get(module, "daily_insights", default=[])
+    if insights:
+      seen = [engine._get_daily_insight([module], day=d) for d in _cycle_days(len(insights))]
+      assert sorted(map(json.dumps, seen)) == sorted(map(json.dumps, insights)), module
+
+    challenges = kb.get(module, "skill_challenges", default=[])
+    if challenges:
+      seen = [engine._get_skill_challenge([module], day=d)["challenge"] for d in _cycle_days(len(challenges))]
+      assert sorted(map(json.dumps, seen)) == sorted(map(json.dumps, challenges)), module
+
+
+def test_daily_wisdom_does_not_repeat_within_a_cycle(tmp_path):
+  """Test consecutive days of get_daily_wisdom walk the focus modules' pool without repeats."""
+  masters = tmp_path / "knowledge_base" / "masters"
+  masters.mkdir(parents=True)
+  with open(masters / "sales_masters.json", "w") as f:
+    json.dump({"masters": [{"name": "A", "key_principles": ["a1", "a2", "a3"]},
+                           {"name": "B", "key_principles": ["b1", "b2"]}],
+               "daily_insights": ["i1", "i2", "i3", "i4", "i5"]}, f)
+  (tmp_path / "data").mkdir()
+  with open(tmp_path / "data" / "user_profile.json", "w") as f:
+    json.dump({"focus_modules": ["sales"]}, f)
+  engine = WisdomEngine(DataManager(base_path=str(tmp_path)))
+
+  start = datetime.fromordinal(_cycle_days(5)[0])
+  packages = [engine.get_daily_wisdom((start + timedelta(days=i)).strftime("%Y-%m-%d")) for i in range(5)]
+  assert sorted(p["master_teaching"]["teaching"] for p in packages) == ["a1", "a2", "a3", "b1", "b2"]
+  assert sorted(p["daily_insight"] for p in packages) == ["i1", "i2", "i3", "i4", "i5"]
@@ -0,0 +1,84 @@
+"""
+Test suite for situation_matcher.py
+Covers the Aho-Corasick automaton, word-boundary rules, module scoring and
+a corpus of situations checked against the real knowledge base.
+"""
+import json
+from pathlib import Path
+import pytest
+from src.situation_matcher import AhoCorasick, SituationMatcher, build_matcher
+from src.knowledge_base import KnowledgeBase
+from src.data_manager import DataManager
+from src.wisdom_engine import WisdomEngine
+from tests.fixtures.mock_situations import SITUATION_CORPUS
+
+
+REAL_MASTERS = Path(__file__).resolve().parents[2] / "knowledge_base" / "masters"
+
+
+# ==================== Automaton Tests (2) ====================
+
+def test_aho_corasick_finds_overlapping_patterns():
+  """Test every occurrence is reported, including patterns inside other patterns."""
+  ac = AhoCorasick(["he", "she", "his", "hers", "cold call"])
+  found = sorted((start, ac.patterns[i]) for start, i in ac.finditer("ushers cold calls"))
+  assert found == [(1, "she"), (2, "he"), (2, "hers"), (7, "cold call")]
+
+
+def test_aho_corasick_without_patterns():
+  """Test an empty automaton matches nothing."""
+  assert list(AhoCorasick([]).finditer("anything")) == []
+
+
+# ==================== Scoring Tests (3) ====================
+
+def test_whole_words_and_prefixes():
+  """Test plain patterns need whole words while "*" patterns match word prefixes."""
+  matcher = SituationMatcher.build(["money", "productivity"])
+  assert matcher.best("I need to earn more") == "money"
+  assert matcher.best("learning to code") is None
+  assert matcher.best("I keep procrastinating") == "productivity"
+  assert matcher.best("teamwork") is None
+
+
+def test_every_module_scored_in_one_pass():
+  """Test matches for several modules add up and sort best first."""
+  matcher = SituationMatcher.build(["sales", "productivity", "health"])
+  scores = dict(matcher.scores("I procrastinate on cold calls and my sales pipeline is stuck"))
+  assert set(scores) == {"sales", "productivity"}
+  assert matcher.scores("cold calls, sales quota and deadlines")[0][0] == "sales"
+
+
+def test_mined_terms_extend_seed_keywords():
+  """Test mined terms (both singular and plural forms) score below seeds."""
+  matcher = SituationMatcher.build(["money", "health"], {"money": [("mortgages", 1.0)], "health": []})
+  assert matcher.best("refinancing my mortgage") == "money"
+  assert dict(matcher.scores("mortgage money"))["money"] == pytest.approx(1.5)
+  assert matcher.best("mortgage") == "money"
+
+
+# ==================== Knowledge Base Tests (2) ====================
+
+def test_corpus_matches_expected_modules():
+  """Test each corpus situation is routed to its expected module using the real KB."""
+  matcher = build_matcher(KnowledgeBase.shared(REAL_MASTERS))
+  misses = [(text, matcher.scores(text)[:2]) for text, module in SITUATION_CORPUS if matcher.best(text) != module]
+  assert misses == []
+
+
+def test_advice_uses_most_relevant_principle(tmp_path):
+  """Test advice comes from the best-matching principle and the same master's practice."""
+  masters = tmp_path / "knowledge_base" / "masters"
+  masters.mkdir(parents=True)
+  with open(masters / "sales_masters.json", "w") as f:
+    json.dump({"masters": [
+      {"name": "Zig Ziglar", "key_principles": ["Serve first."], "daily_practices": ["Thank a customer"]},
+      {"name": "Jeb Blount", "key_principles": ["Fanatical prospecting fills the pipeline.", "Follow up."],
+       "daily_practices": ["Block an hour for prospecting calls", "Review the CRM"]}
+    ]}, f)
+  (tmp_path / "data").mkdir()
+  engine = WisdomEngine(DataManager(base_path=str(tmp_path)))
+
+  advice = engine.get_master_advice_for_situation("my sales pipeline is empty, how do I start prospecting?")
+  assert advice == ('Jeb Blount says: "Fanatical prospecting fills the pipeline."\n\n'
+                    'Apply it: Block an hour for prospecting calls')
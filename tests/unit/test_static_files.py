@@ -0,0 +1,141 @@
+"""
+Test suite for static_files.py
+Covers Range parsing, the open-file cache and socket streaming.
+"""
+import os
+import socket
+import pytest
+from src.static_files import StaticFileCache, parse_range, send_file
+
+
+@pytest.fixture
+def asset(tmp_path):
+  """A 100-byte static file."""
+  path = tmp_path / "app.js"
+  path.write_bytes(bytes(range(100)))
+  return str(path)
+
+
+# ==================== Range Parsing Tests (6) ====================
+
+def test_parse_range_absent_or_malformed_is_ignored():
+  """Test missing, non-bytes and garbage headers fall back to a full response."""
+  assert parse_range("", 100) is None
+  assert parse_range("items=0-5", 100) is None
+  assert parse_range("bytes=a-b", 100) is None
+  assert parse_range("bytes=5", 100) is None
+
+
+def test_parse_range_explicit_and_open_ended():
+  """Test start-end and start- ranges."""
+  assert parse_range("bytes=10-19", 100) == (10, 19)
+  assert parse_range("bytes=90-", 100) == (90, 99)
+
+
+def test_parse_range_clamps_end_to_size():
+  """Test an end past EOF is clamped to the last byte."""
+  assert parse_range("bytes=50-500", 100) == (50, 99)
+
+
+def test_parse_range_suffix():
+  """Test bytes=-N returns the last N bytes (or the whole file)."""
+  assert parse_range("bytes=-10", 100) == (90, 99)
+  assert parse_range("bytes=-500", 100) == (0, 99)
+
+
+def test_parse_range_unsatisfiable_raises():
+  """Test ranges starting past EOF raise ValueError."""
+  with pytest.raises(ValueError):
+    parse_range("bytes=100-", 100)
+  with pytest.raises(ValueError):
+    parse_range("bytes=-0", 100)
+
+
+def test_parse_range_multiple_ranges_ignored():
+  """Test multi-range requests are served as a full response."""
+  assert parse_range("bytes=0-1,5-6", 100) is None
+
+
+# ==================== Cache Tests (5) ====================
+
+def test_cache_reuses_open_entry(asset):
+  """Test a second open within the TTL is a hit on the same entry."""
+  cache = StaticFileCache(ttl=60)
+  first = cache.open(asset)
+  first.release()
+  second = cache.open(asset)
+  second.release()
+
+  assert first is second
+  assert cache.stats() == {"open_files": 1, "hits": 1, "misses": 1}
+  assert first.size == 100
+
+
+def test_cache_revalidates_changed_file(asset):
+  """Test a modified file gets a fresh entry and a new ETag."""
+  cache = StaticFileCache(ttl=0)
+  old = cache.open(asset)
+  old.release()
+
+  with open(asset, "ab") as f:
+    f.write(b"more")
+  fresh = cache.open(asset)
+  fresh.release()
+
+  assert fresh is not old
+  assert fresh.size == 104
+  assert fresh.etag != old.etag
+
+
+def test_cache_missing_file_returns_none(tmp_path):
+  """Test missing files and directories are not cached."""
+  cache = StaticFileCache()
+  assert cache.open(str(tmp_path / "missing.js")) is None
+  assert cache.open(str(tmp_path)) is None
+
+
+def test_retired_entry_stays_open_until_released(asset):
+  """Test invalidation defers closing the fd for in-flight responses."""
+  cache = StaticFileCache()
+  entry = cache.open(asset)
+  cache.invalidate(asset)
+
+  assert cache.stats()["open_files"] == 0
+  if entry.fd is not None:
+    os.fstat(entry.fd)  # still valid
+  entry.release()
+  assert entry.fd is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+  """Test the cache keeps at most max_files descriptors open."""
+  cache = StaticFileCache(max_files=2)
+  paths = []
+  for i in range(3):
+    path = tmp_path / f"f{i}.css"
+    path.write_text("x")
+    paths.append(str(path))
+    cache.open(str(path)).release()
+
+  assert cache.stats()["open_files"] == 2
+  assert cache.open(paths[0]) is not None
+  assert cache.stats()["misses"] == 4
+
+
+# ==================== Streaming Tests (1) ====================
+
+def test_send_file_streams_requested_slice(asset):
+  """Test send_file writes exactly the requested byte range."""
+  cache = StaticFileCache()
+  entry = cache.open(asset)
+  left, right = socket.socketpair()
+  try:
+    sent = send_file(left, entry, 10, 20)
+    left.close()
+    received = right.recv(1024)
+  finally:
+    entry.release()
+    right.close()
+
+  assert sent == 20
+  assert received == bytes(range(10, 30))
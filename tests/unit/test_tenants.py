@@ -0,0 +1,112 @@
+"""
+Test suite for tenants.py
+Covers user id validation, lazy loading and LRU eviction of the tenant pool,
+and per-tenant data version tracking.
+"""
+import json
+import pytest
+from src.data_manager import DataManager
+from src.tenants import TenantPool, USER_ID_RE
+
+
+@pytest.fixture
+def tenants_root(tmp_path):
+  """Tenants root with three provisioned users and a shared knowledge base."""
+  for user in ("alice", "bob", "carol"):
+    (tmp_path / "tenants" / user / "data").mkdir(parents=True)
+    with open(tmp_path / "tenants" / user / "data" / "user_profile.json", "w") as f:
+      json.dump({"name": user.title()}, f)
+  (tmp_path / "knowledge_base" / "masters").mkdir(parents=True)
+  return tmp_path
+
+
+@pytest.fixture
+def pool(tenants_root):
+  return TenantPool(tenants_root / "tenants", kb_path=tenants_root / "knowledge_base", max_tenants=2)
+
+
+# ==================== Lookup Tests (4) ====================
+
+def test_get_loads_user_data(pool):
+  """Test a provisioned user gets a DataManager over their own data directory."""
+  tenant = pool.get("alice")
+  assert tenant.user_id == "alice"
+  assert tenant.dm.get_user_profile() == {"name": "Alice"}
+
+
+def test_unknown_user_is_not_created(pool, tenants_root):
+  """Test users without a directory are rejected and nothing is created."""
+  assert pool.get("mallory") is None
+  assert not (tenants_root / "tenants" / "mallory").exists()
+
+
+def test_invalid_user_ids_rejected(pool):
+  """Test ids that could escape the tenants root are rejected."""
+  for user_id in ("..", "../alice", "a/b", "", "x" * 65, None):
+    assert pool.get(user_id) is None
+  assert USER_ID_RE.match("team-member_01")
+
+
+def test_tenants_share_knowledge_base_but_not_caches(pool, tenants_root):
+  """Test every tenant points at the shared KB and owns a separate read cache."""
+  alice, bob = pool.get("alice"), pool.get("bob")
+  assert alice.dm.kb_path == bob.dm.kb_path == tenants_root / "knowledge_base"
+  assert alice.cache is not bob.cache
+  assert alice.dm.data_path != bob.dm.data_path
+
+
+# ==================== Pool Tests (2) ====================
+
+def test_repeat_lookup_returns_live_tenant(pool):
+  """Test the same Tenant (and its warm cache) is reused."""
+  assert pool.get("alice") is pool.get("alice")
+  assert pool.stats()["hits"] == 1
+  assert pool.stats()["loads"] == 1
+
+
+def test_pool_evicts_least_recently_used(pool):
+  """Test the pool holds at most max_tenants users."""
+  alice = pool.get("alice")
+  pool.get("bob")
+  pool.get("alice")
+  pool.get("carol")
+
+  assert len(pool) == 2
+  assert pool.stats()["evictions"] == 1
+  assert pool.get("alice") is alice
+  assert pool.stats()["loads"] == 3
+
+
+# ==================== Version Sync Tests (2) ====================
+
+def test_sync_version_drops_state_after_another_writer(pool, tenants_root):
+  """Test a version bump by another process clears that tenant's cache and wisdom."""
+  alice = pool.get("alice")
+  alice.dm.get_user_profile()
+  alice.wisdom, alice.wisdom_date = {"quote": "x"}, "2026-01-01"
+  assert alice.sync_version() is False  # no version file yet
+
+  other = DataManager(tenants_root / "tenants" / "alice", kb_path=tenants_root / "knowledge_base")
+  other.bump_data_version()
+  assert alice.sync_version() is False  # first sighting only records it
+  alice.wisdom = {"quote": "x"}
+  other.bump_data_version()
+
+  assert alice.sync_version() is True
+  assert alice.wisdom is None and alice.cache.stats()["entries"] == 0
+  assert alice.sync_version() is False
+
+
+def test_sync_version_is_per_tenant(pool, tenants_root):
+  """Test one user's writes leave other tenants' caches alone."""
+  alice, bob = pool.get("alice"), pool.get("bob")
+  for tenant in (alice, bob):
+    tenant.dm.bump_data_version()
+    tenant.sync_version()
+  bob.dm.get_user_profile()
+  bob.wisdom = {"quote": "x"}
+
+  DataManager(tenants_root / "tenants" / "alice").bump_data_version()
+  assert alice.sync_version() is True
+  assert bob.sync_version() is False
+  assert bob.wisdom == {"quote": "x"} and bob.cache.stats()["entries"] > 0
@@ -0,0 +1,136 @@
+"""
+Test suite for tracing.py
+Covers span recording, opt-in/slow-request sampling, Chrome trace export and
+export file rotation.
+"""
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src import tracing
+from src.tracing import Tracer, span, to_chrome_trace
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+  return str(tmp_path / "traces.jsonl")
+
+
+# ==================== Span Tests (3) ====================
+
+def test_span_is_noop_without_trace():
+  """Test spans outside a traced request record nothing."""
+  assert tracing.current_trace() is None
+  with span("read") as record:
+    assert record is None
+
+
+def test_nested_spans_record_parent_and_order(trace_file):
+  """Test nested spans record their parent and monotonic timestamps."""
+  tracer = Tracer(trace_file, allow_requests=True)
+  started = tracer.start("GET /api/data", requested=True)
+  with span("compute"):
+    with span("read", file="habits.json"):
+      pass
+  with span("serialize"):
+    pass
+  trace = started[0]
+  tracer.finish(started)
+
+  names = {s["name"]: s for s in trace.spans}
+  assert names["read"]["parent"] == "compute"
+  assert names["read"]["args"] == {"file": "habits.json"}
+  assert names["compute"]["start_ns"] <= names["read"]["start_ns"]
+  assert names["read"]["end_ns"] <= names["compute"]["end_ns"]
+  assert names["serialize"]["parent"] is None
+  assert tracing.current_trace() is None
+
+
+def test_bind_records_spans_from_worker_threads(trace_file):
+  """Test bind() carries the active trace into executor threads."""
+  tracer = Tracer(trace_file, allow_requests=True)
+  started = tracer.start("GET /api/bootstrap", requested=True)
+
+  def work():
+    with span("read"):
+      return threading.get_ident()
+
+  with ThreadPoolExecutor(max_workers=1) as pool:
+    worker_tid = pool.submit(tracing.bind(work)).result()
+  tracer.finish(started)
+
+  assert [s["tid"] for s in started[0].spans] == [worker_tid]
+
+
+# ==================== Sampling Tests (4) ====================
+
+def test_untraced_by_default(trace_file):
+  """Test requests are not traced without the header or configuration."""
+  assert Tracer(trace_file).start("GET /") is None
+
+
+def test_trace_header_ignored_unless_allowed(trace_file):
+  """Test X-Trace requests are traced only when the tracer allows them."""
+  assert Tracer(trace_file).start("GET /", requested=True) is None
+  tracer = Tracer(trace_file, allow_requests=True)
+  assert tracer.finish(tracer.start("GET /", requested=True)) is True
+
+
+def test_slow_log_exports_only_slow_requests(trace_file):
+  """Test sampled requests are exported only when over the threshold."""
+  fast = Tracer(trace_file, slow_ms=10_000)
+  assert fast.finish(fast.start("GET /fast")) is False
+
+  slow = Tracer(trace_file, slow_ms=0)
+  assert slow.finish(slow.start("GET /slow")) is True
+  assert slow.exported == 1
+
+
+def test_sample_rate_zero_skips_slow_log(trace_file):
+  """Test a zero sample rate traces nothing unless explicitly requested."""
+  tracer = Tracer(trace_file, slow_ms=0, sample_rate=0.0, allow_requests=True)
+  assert tracer.start("GET /") is None
+  started = tracer.start("GET /", requested=True)
+  assert started is not None
+  tracer.finish(started)
+
+
+# ==================== Export Tests (3) ====================
+
+def test_export_writes_chrome_complete_events(trace_file):
+  """Test each line is a Chrome "X" event in microseconds tagged with the trace id."""
+  tracer = Tracer(trace_file, allow_requests=True)
+  started = tracer.start("GET /api/data", requested=True)
+  with span("write", bytes=10):
+    pass
+  tracer.finish(started)
+
+  with open(trace_file) as f:
+    events = [json.loads(line) for line in f]
+  assert [e["name"] for e in events] == ["GET /api/data", "write"]
+  assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+  assert events[1]["args"] == {"bytes": 10, "trace_id": started[0].id}
+  assert events[0]["ts"] <= events[1]["ts"]
+
+
+def test_to_chrome_trace_wraps_events(trace_file):
+  """Test the JSON-lines log converts to a traceEvents document."""
+  tracer = Tracer(trace_file, allow_requests=True)
+  for _ in range(2):
+    tracer.finish(tracer.start("GET /", requested=True))
+
+  doc = to_chrome_trace(trace_file)
+  assert len(doc["traceEvents"]) == 2
+  assert doc["displayTimeUnit"] == "ms"
+
+
+def test_export_rotates_full_file(trace_file):
+  """Test a full trace file moves to .1 (replacing the old backup) and a new one starts."""
+  tracer = Tracer(trace_file, always=True, max_bytes=600)
+  for _ in range(20):
+    tracer.finish(tracer.start("GET /"))
+  sizes = [os.path.getsize(trace_file), os.path.getsize(trace_file + ".1")]
+  assert all(0 < size <= 600 for size in sizes)
+  assert not os.path.exists(trace_file + ".2")
+  assert to_chrome_trace(trace_file)["traceEvents"][0]["name"] == "GET /"
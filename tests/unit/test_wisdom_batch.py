@@ -0,0 +1,100 @@
+"""
+Test suite for wisdom_batch.py
+Covers batch pre-generation for the owner and tenants, the process-pool
+path, per-user error reporting and the nightly schedule helper.
+"""
+import json
+from datetime import datetime, timedelta
+import pytest
+from src import wisdom_batch
+from src.wisdom_batch import pregenerate, wisdom_targets
+from src.data_manager import DataManager
+from src.wisdom_engine import WisdomEngine
+from src.nightly import schedule_nightly, seconds_until
+
+
+MODULES = {
+  "sales": {
+    "masters": [{"name": "Zig Ziglar", "key_principles": ["Serve first.", "Ask for the close."],
+                 "daily_practices": ["Thank a customer"]}],
+    "daily_insights": ["Every no gets you closer to yes."],
+    "skill_challenges": ["Make 5 follow-up calls"]
+  },
+  "health": {
+    "masters": [{"name": "Peter Attia", "key_principles": ["Zone 2 builds the base."]}],
+    "daily_insights": ["Sleep is the foundation."],
+    "skill_challenges": ["Walk 10k steps"]
+  }
+}
+
+
+TOMORROW = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+DAY_AFTER = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
+
+
+@pytest.fixture
+def base(tmp_path, monkeypatch):
+  """Owner data dir, a knowledge base and two tenants (tenants root under base)."""
+  monkeypatch.setenv("SELF_MASTERY_TENANTS_PATH", str(tmp_path / "tenants"))
+  masters = tmp_path / "knowledge_base" / "masters"
+  masters.mkdir(parents=True)
+  for module, data in MODULES.items():
+    with open(masters / f"{module}_masters.json", "w") as f:
+      json.dump(data, f)
+  for user, focus in (("alice", ["sales"]), ("bob", ["health", "sales"])):
+    (tmp_path / "tenants" / user / "data").mkdir(parents=True)
+    with open(tmp_path / "tenants" / user / "data" / "user_profile.json", "w") as f:
+      json.dump({"name": user, "focus_modules": focus}, f)
+  return tmp_path
+
+
+# ==================== Pre-generation Tests (3) ====================
+
+def test_pregenerate_fills_every_users_cache(base):
+  """Test packages are stored for each user and date and later served without the KB."""
+  targets = wisdom_targets(base)
+  assert [user for user, _ in targets] == ["default", "alice", "bob"]
+
+  summary = pregenerate(targets, base / "knowledge_base", start=TOMORROW, days=3)
+  assert summary["generated"] == 9 and summary["cached"] == 0 and summary["errors"] == {}
+  assert pregenerate(targets, base / "knowledge_base", start=TOMORROW, days=3)["cached"] == 9
+
+  engine = WisdomEngine(DataManager(str(base / "tenants" / "bob"), kb_path=str(base / "knowledge_base")), "bob")
+  wisdom = engine.get_daily_wisdom(DAY_AFTER)
+  assert wisdom["date"] == DAY_AFTER
+  assert engine._kb is None
+
+
+def test_process_pool_matches_serial_output(base, monkeypatch):
+  """Test the pooled run produces the same packages as a single process."""
+  monkeypatch.setattr(wisdom_batch, "POOL_MIN_USERS", 2)
+  summary = pregenerate(wisdom_targets(base), base / "knowledge_base", start=TOMORROW, days=2, workers=2)
+  assert summary["workers"] == 2 and summary["generated"] == 6
+
+  dm = DataManager(str(base / "tenants" / "alice"), kb_path=str(base / "knowledge_base"))
+  pooled = dm.get_cached_wisdom(TOMORROW, WisdomEngine(dm, "alice").daily_seed(TOMORROW))
+  assert pooled is not None
+  import shutil
+  shutil.rmtree(dm.wisdom_cache_path)
+  assert WisdomEngine(dm, "alice").get_daily_wisdom(TOMORROW) == pooled
+
+
+def test_user_errors_are_reported_not_raised(base):
+  """Test a broken tenant is listed in errors while the others still get packages."""
+  (base / "tenants" / "carol").mkdir()
+  (base / "tenants" / "carol" / "data").write_text("not a directory")
+  summary = pregenerate(wisdom_targets(base), base / "knowledge_base", start=TOMORROW, days=1)
+  assert list(summary["errors"]) == ["carol"]
+  assert summary["generated"] == 3
+
+
+# ==================== Schedule Tests (1) ====================
+
+def test_seconds_until_next_run():
+  """Test the next run is later today or tomorrow, and bad times are rejected."""
+  now = datetime(2026, 5, 1, 2, 0)
+  assert seconds_until("03:15", now) == 75 * 60
+  assert seconds_until("01:00", now) == 23 * 3600
+  assert seconds_until("02:00", now) == 24 * 3600
+  with pytest.raises(ValueError):
+    schedule_nightly("3am")
@@ -10,7 +10,7 @@ from unittest.mock import Mock, MagicMock, patch
 from io import StringIO
 from datetime import datetime
 
-from src.wisdom_engine import WisdomEngine
+from src.wisdom_engine import WisdomEngine, wisdom_seed
 from src.data_manager import DataManager
 
 
@@ -303,6 +303,47 @@ def test_get_daily_wisdom_deterministic_with_seed(wisdom_engine):
   assert wisdom1["daily_insight"] == wisdom2["daily_insight"]
 
 
+# ============================================================
+# Seeded Daily Wisdom Tests (4 tests)
+# ============================================================
+
+def test_daily_wisdom_reproducible_across_processes(wisdom_engine, data_manager_mock):
+  """Test a fresh engine with no cache rebuilds the identical package from the seed."""
+  wisdom1 = wisdom_engine.get_daily_wisdom("2026-03-01")
+  import shutil
+  shutil.rmtree(data_manager_mock.wisdom_cache_path)
+  random.seed(7)
+  wisdom2 = WisdomEngine(data_manager_mock).get_daily_wisdom("2026-03-01")
+  assert wisdom1 == wisdom2
+
+
+def test_wisdom_seed_inputs():
+  """Test the seed depends on date, user and module set but not module order."""
+  seed = wisdom_seed("2026-03-01", "default", ["sales", "money"])
+  assert seed == wisdom_seed("2026-03-01", "default", ["money", "sales", "money"])
+  assert seed != wisdom_seed("2026-03-02", "default", ["sales", "money"])
+  assert seed != wisdom_seed("2026-03-01", "alice", ["sales", "money"])
+  assert seed != wisdom_seed("2026-03-01", "default", ["sales"])
+
+
+def test_cached_wisdom_skips_knowledge_base(wisdom_engine, data_manager_mock):
+  """Test a second process answers from the on-disk cache without opening the KB."""
+  wisdom = wisdom_engine.get_daily_wisdom()
+  engine = WisdomEngine(data_manager_mock)
+  assert engine.get_daily_wisdom() == wisdom
+  assert engine._kb is None
+
+
+def test_wisdom_cache_drops_old_packages(data_manager_mock):
+  """Test saving a package removes cached packages older than a week."""
+  data_manager_mock.save_cached_wisdom("2020-01-01", "abc", {"date": "2020-01-01"})
+  today = datetime.now().strftime("%Y-%m-%d")
+  data_manager_mock.save_cached_wisdom(today, "abc", {"date": today})
+  assert data_manager_mock.get_cached_wisdom("2020-01-01", "abc") is None
+  assert data_manager_mock.get_cached_wisdom(today, "abc") == {"date": today}
+  assert data_manager_mock.get_cached_wisdom(today, "other") is None
+
+
 # ============================================================
 # Master Teaching Tests (6 tests)
 # ============================================================
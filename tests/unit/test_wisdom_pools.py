@@ -0,0 +1,135 @@
+"""
+Test suite for wisdom_pools.py
+Covers the flattened module pools, script-template normalization, indexed
+and alias-weighted sampling, and sampler caching per knowledge-base generation.
+"""
+import json
+import random
+from collections import Counter
+import pytest
+from src.wisdom_pools import ModulePool, Sampler, _template_items, module_pool, sampler
+from src.data_manager import DataManager
+from src.knowledge_base import KnowledgeBase
+from src.wisdom_engine import WisdomEngine
+
+
+MODULES = {
+  "sales": {
+    "masters": [
+      {"name": "Zig Ziglar", "key_principles": ["z1", "z2"], "daily_practices": ["Thank a customer"],
+       "scripts_templates": {"follow_up": {"script": "Just checking in"},
+                             "objections": [{"title": "Price", "script": "Compared to what?"}]}},
+      {"name": "No Principles"},
+      {"name": "Grant Cardone", "key_principles": ["g1"],
+       "worked_examples": [{"title": "10X call"}, "not an example"]}
+    ],
+    "daily_insights": ["s-i1", "s-i2"]
+  },
+  "health": {
+    "masters": [{"name": "Peter Attia", "key_principles": ["p1", "p2", "p3"]}],
+    "daily_insights": ["h-i1"]
+  },
+  "money": {"masters": []}
+}
+
+
+@pytest.fixture
+def kb(tmp_path):
+  masters = tmp_path / "knowledge_base" / "masters"
+  masters.mkdir(parents=True)
+  for module, data in MODULES.items():
+    with open(masters / f"{module}_masters.json", "w") as f:
+      json.dump(data, f)
+  return KnowledgeBase(masters)
+
+
+# ==================== Module Pool Tests (3) ====================
+
+def test_template_shapes_are_normalized():
+  """Test list, dict-of-template and dict-of-list script templates all flatten to dicts."""
+  assert _template_items([{"title": "A"}, "skip"]) == [{"title": "A"}]
+  assert _template_items({"cold_call": {"script": "Hi"}}) == [{"title": "Cold Call", "script": "Hi"}]
+  assert _template_items({"x": [{"title": "B"}], "y": {"name": "C"}}) == [{"title": "B"}, {"name": "C"}]
+  assert _template_items("nothing") == []
+
+
+def test_module_pool_records_master_ranges(kb):
+  """Test items are grouped by master with ranges that skip masters without any."""
+  pool = ModulePool("sales", MODULES["sales"])
+  assert pool.items["principle"] == [(0, "z1"), (0, "z2"), (2, "g1")]
+  assert pool.master_ranges["principle"] == {0: (0, 2), 2: (2, 3)}
+  assert pool.master_items("practice", 0) == ["Thank a customer"]
+  assert pool.master_items("practice", 1) == []
+  assert pool.items["example"] == [(2, {"title": "10X call"})]
+  assert pool.items["insight"] == [(None, "s-i1"), (None, "s-i2")]
+  assert pool.count("template") == 2
+
+
+def test_module_pool_is_cached_per_generation(kb):
+  """Test the pool is built once and shared until the knowledge base changes."""
+  assert module_pool(kb, "sales") is module_pool(kb, "sales")
+  assert module_pool(kb, "money").count("principle") == 0
+
+
+# ==================== Sampler Tests (4) ====================
+
+def test_at_walks_the_concatenated_pool(kb):
+  """Test at(i) indexes modules in order, then their items in order."""
+  principles = sampler(kb, "principle", ["sales", "health"])
+  assert len(principles) == 6
+  assert [principles.at(i) for i in range(6)] == [
+    ("sales", 0, "z1"), ("sales", 0, "z2"), ("sales", 2, "g1"),
+    ("health", 0, "p1"), ("health", 0, "p2"), ("health", 0, "p3")]
+
+
+def test_default_pick_is_uniform_over_items():
+  """Test unweighted picks follow pool sizes and zero weights are never picked."""
+  parts = [("a", [(None, 1)]), ("b", [(None, 2), (None, 3), (None, 4)]), ("c", [(None, 5)])]
+  rng = random.Random(7)
+  counts = Counter(Sampler(parts).pick(rng)[0] for _ in range(8000))
+  assert 0.17 < counts["a"] / 8000 < 0.23 and 0.57 < counts["b"] / 8000 < 0.63
+  assert 0.17 < counts["c"] / 8000 < 0.23
+
+  counts = Counter(Sampler(parts, [1.0, 1.0, 0.0]).pick(rng)[0] for _ in range(4000))
+  assert set(counts) == {"a", "b"} and 0.45 < counts["a"] / 4000 < 0.55
+
+
+def test_module_weights_and_empty_pools(kb):
+  """Test per-module weights give each module an equal chance; no items gives None."""
+  rng = random.Random(3)
+  equal = sampler(kb, "principle", ["sales", "health"], {"sales": 1.0, "health": 1.0})
+  counts = Counter(equal.pick(rng)[0] for _ in range(4000))
+  assert 0.45 < counts["sales"] / 4000 < 0.55
+  assert sampler(kb, "principle", ["money"]) is None
+  assert sampler(kb, "challenge", ["sales", "health"]) is None
+
+
+def test_samplers_are_cached_until_the_kb_changes(kb, tmp_path):
+  """Test repeated lookups reuse the sampler and a changed file rebuilds it."""
+  first = sampler(kb, "insight", ["sales", "health"])
+  assert sampler(kb, "insight", ["sales", "health"]) is first
+  assert sampler(kb, "insight", ["health", "sales"]) is not first
+
+  path = tmp_path / "knowledge_base" / "masters" / "health_masters.json"
+  with open(path, "w") as f:
+    json.dump({"masters": [], "daily_insights": ["h-i1", "h-i2"]}, f)
+  kb.refresh(force=True)
+  assert len(sampler(kb, "insight", ["sales", "health"])) == 4
+
+
+# ==================== Engine Pool Tests (1) ====================
+
+def test_script_templates_stored_as_dicts(tmp_path):
+  """Test get_script_template handles dict-shaped templates and tags the master."""
+  masters = tmp_path / "knowledge_base" / "masters"
+  masters.mkdir(parents=True)
+  with open(masters / "sales_masters.json", "w") as f:
+    json.dump(MODULES["sales"], f)
+  (tmp_path / "data").mkdir()
+  engine = WisdomEngine(DataManager(base_path=str(tmp_path)))
+  for _ in range(20):
+    template = engine.get_script_template("sales")
+    assert template["master"] == "Zig Ziglar" and template["module"] == "sales"
+    assert template["title"] in ("Follow Up", "Price")
+  assert engine.get_worked_example("sales")["master"] == "Grant Cardone"
+  assert engine.get_script_template("health") is None
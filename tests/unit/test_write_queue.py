@@ -0,0 +1,208 @@
+"""
+Test suite for write_queue.py
+Covers batching, coalescing and error propagation of the single-writer queue.
+"""
+import threading
+import pytest
+from src.write_queue import WriteQueue
+
+
+class FakeStore:
+  """In-memory load/save pair that counts disk writes."""
+
+  def __init__(self, ok=True):
+    self.data = {"items": []}
+    self.saves = 0
+    self.ok = ok
+
+  def load(self):
+    return {"items": list(self.data["items"])}
+
+  def save(self, data):
+    self.saves += 1
+    if self.ok:
+      self.data = data
+    return self.ok
+
+
+def append(value):
+  def mutate(data):
+    data["items"].append(value)
+    return len(data["items"])
+  return mutate
+
+
+# ==================== Coalescing Tests (4) ====================
+
+def test_burst_is_written_once():
+  """Test a burst of mutations to one key becomes a single save."""
+  store = FakeStore()
+  wq = WriteQueue(coalesce_window=0.2)
+  futures = [wq.submit("k", store.load, store.save, append(i)) for i in range(20)]
+  results = [f.result(timeout=5) for f in futures]
+  wq.stop()
+
+  assert store.saves == 1
+  assert store.data["items"] == list(range(20))
+  assert [r[0] for r in results] == list(range(1, 21))
+
+
+def test_on_flush_result_is_returned():
+  """Test every future carries the on_flush result of its batch."""
+  store = FakeStore()
+  versions = iter(range(1, 100))
+  wq = WriteQueue(coalesce_window=0.1, on_flush=lambda: next(versions))
+  futures = [wq.submit("k", store.load, store.save, append(i)) for i in range(5)]
+  assert {f.result(timeout=5)[1] for f in futures} == {1}
+  wq.stop()
+
+
+def test_keys_are_saved_independently():
+  """Test mutations for different keys are loaded and saved separately."""
+  a, b = FakeStore(), FakeStore()
+  wq = WriteQueue(coalesce_window=0.1)
+  fa = wq.submit("a", a.load, a.save, append("x"))
+  fb = wq.submit("b", b.load, b.save, append("y"))
+  fa.result(timeout=5)
+  fb.result(timeout=5)
+  wq.stop()
+
+  assert a.data["items"] == ["x"]
+  assert b.data["items"] == ["y"]
+
+
+def test_per_item_flush_runs_once_per_callback():
+  """Test submit(flush=...) overrides on_flush and each callback runs once per batch."""
+  stores = {"a": FakeStore(), "b": FakeStore()}
+  calls = []
+  flushes = {k: (lambda k=k: calls.append(k) or k.upper()) for k in stores}
+  wq = WriteQueue(coalesce_window=0.2, on_flush=lambda: calls.append("default"))
+  futures = [
+    wq.submit(k, stores[k].load, stores[k].save, append(i), flush=flushes[k])
+    for i in range(3) for k in stores
+  ]
+  results = [f.result(timeout=5)[1] for f in futures]
+  wq.stop()
+
+  assert sorted(calls) == ["a", "b"]
+  assert results == ["A", "B"] * 3
+
+
+# ==================== Error Handling Tests (4) ====================
+
+def test_failing_mutation_does_not_block_others():
+  """Test one failing mutation raises for its caller only."""
+  store = FakeStore()
+
+  def boom(data):
+    raise KeyError("bad")
+
+  wq = WriteQueue(coalesce_window=0.1)
+  bad = wq.submit("k", store.load, store.save, boom)
+  good = wq.submit("k", store.load, store.save, append(1))
+  with pytest.raises(KeyError):
+    bad.result(timeout=5)
+  assert good.result(timeout=5)[0] == 1
+  wq.stop()
+
+
+def test_all_failing_mutations_skip_save():
+  """Test a batch where every mutation fails never touches disk."""
+  store = FakeStore()
+  flushes = []
+
+  def boom(data):
+    raise ValueError("bad")
+
+  wq = WriteQueue(coalesce_window=0.05, on_flush=lambda: flushes.append(1))
+  with pytest.raises(ValueError):
+    wq.submit("k", store.load, store.save, boom).result(timeout=5)
+  wq.stop()
+
+  assert store.saves == 0
+  assert flushes == []
+
+
+def test_failed_mutation_edits_are_not_saved():
+  """Test a mutation that raises midway leaves no trace in what the batch saves."""
+  store = FakeStore()
+
+  def half_applied(data):
+    data["items"].append("partial")
+    raise ValueError("bad input")
+
+  wq = WriteQueue(coalesce_window=0.2)
+  futures = [wq.submit("k", store.load, store.save, m) for m in (append(1), half_applied, append(2))]
+  assert futures[0].result(timeout=5)[0] == 1
+  with pytest.raises(ValueError):
+    futures[1].result(timeout=5)
+  assert futures[2].result(timeout=5)[0] == 2
+  wq.stop()
+
+  assert store.data["items"] == [1, 2]
+
+
+def test_failed_save_propagates_io_error():
+  """Test a save returning False fails every future in the group."""
+  store = FakeStore(ok=False)
+  wq = WriteQueue(coalesce_window=0.05)
+  future = wq.submit("k", store.load, store.save, append(1))
+  with pytest.raises(IOError):
+    future.result(timeout=5)
+  wq.stop()
+
+
+# ==================== Locking Tests (2) ====================
+
+def test_lock_is_held_around_each_batch():
+  """Test the optional lock wraps load, save and on_flush of a batch."""
+  store = FakeStore()
+  events = []
+
+  class Lock:
+    def __enter__(self):
+      events.append("acquire")
+
+    def __exit__(self, *exc):
+      events.append("release")
+
+  wq = WriteQueue(coalesce_window=0.1, on_flush=lambda: events.append("flush"), lock=Lock)
+  futures = [wq.submit("k", store.load, store.save, append(i)) for i in range(3)]
+  for f in futures:
+    f.result(timeout=5)
+  wq.stop()
+
+  assert events == ["acquire", "flush", "release"]
+
+
+def test_lock_failure_fails_batch_and_keeps_writer():
+  """Test a lock that cannot be taken fails that batch's futures and later batches still run."""
+  store = FakeStore()
+  attempts = []
+
+  def lock():
+    attempts.append(1)
+    if len(attempts) == 1:
+      raise OSError("lock unavailable")
+    return threading.Lock()
+
+  wq = WriteQueue(coalesce_window=0.05, lock=lock)
+  with pytest.raises(OSError):
+    wq.submit("k", store.load, store.save, append(1)).result(timeout=5)
+  assert wq.submit("k", store.load, store.save, append(2)).result(timeout=5)[0] == 1
+  wq.stop()
+
+  assert store.data["items"] == [2]
+
+
+# ==================== Lifecycle Tests (1) ====================
+
+def test_stop_flushes_pending_writes():
+  """Test stop() drains queued work before the thread exits."""
+  store = FakeStore()
+  wq = WriteQueue(coalesce_window=1.0)
+  future = wq.submit("k", store.load, store.save, append(1))
+  wq.stop()
+  assert future.done()
+  assert store.data["items"] == [1]
+  assert not any(t.name == "write-queue" for t in threading.enumerate())